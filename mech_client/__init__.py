@@ -37,42 +37,103 @@ instead of ``crypto``:
 
 __version__ = "0.21.3"
 
-# Signing
-from mech_client.domain.signing import LocalSigner, Signer
-
-# Domain models
-from mech_client.domain.tools.models import (
-    ToolInfo,
-    ToolSchema,
-    ToolsForMarketplaceMech,
-)
-
-# Configuration
-from mech_client.infrastructure.config.loader import get_mech_config
-from mech_client.infrastructure.config.payment_config import PaymentType
-from mech_client.services.deposit_service import DepositService
-
-# Services - Main entry points for library users
-from mech_client.services.marketplace_service import MarketplaceService
-from mech_client.services.setup_service import SetupService
-from mech_client.services.subscription_service import SubscriptionService
-from mech_client.services.tool_service import ToolService
-
-# Exceptions
-from mech_client.utils.errors.exceptions import (
-    AgentModeError,
-    ConfigurationError,
-    ContractError,
-    DeliveryTimeoutError,
-    IPFSError,
-    MechClientError,
-    PaymentError,
-    RpcError,
-    SubgraphError,
-    ToolError,
-    TransactionError,
-    ValidationError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    # Signing
+    from mech_client.domain.signing import LocalSigner, Signer
+
+    # Domain models
+    from mech_client.domain.tools.models import (
+        ToolInfo,
+        ToolSchema,
+        ToolsForMarketplaceMech,
+    )
+
+    # Configuration
+    from mech_client.infrastructure.config.loader import get_mech_config
+    from mech_client.infrastructure.config.payment_config import PaymentType
+    from mech_client.services.deposit_service import DepositService
+
+    # Services - Main entry points for library users
+    from mech_client.services.marketplace_service import MarketplaceService
+    from mech_client.services.setup_service import SetupService
+    from mech_client.services.subscription_service import SubscriptionService
+    from mech_client.services.tool_service import ToolService
+
+    # Exceptions
+    from mech_client.utils.errors.exceptions import (
+        AgentModeError,
+        ConfigurationError,
+        ContractError,
+        DeliveryTimeoutError,
+        IPFSError,
+        MechClientError,
+        PaymentError,
+        RpcError,
+        SubgraphError,
+        ToolError,
+        TransactionError,
+        ValidationError,
+    )
+
+_EXCEPTIONS = "mech_client.utils.errors.exceptions"
+
+# Public attributes and the modules they are imported from on first access
+# (PEP 562), so importing the package (e.g. for the CLI) stays cheap
+_LAZY_ATTRIBUTES = {
+    "MarketplaceService": "mech_client.services.marketplace_service",
+    "ToolService": "mech_client.services.tool_service",
+    "DepositService": "mech_client.services.deposit_service",
+    "SetupService": "mech_client.services.setup_service",
+    "SubscriptionService": "mech_client.services.subscription_service",
+    "get_mech_config": "mech_client.infrastructure.config.loader",
+    "PaymentType": "mech_client.infrastructure.config.payment_config",
+    "Signer": "mech_client.domain.signing",
+    "LocalSigner": "mech_client.domain.signing",
+    "ToolInfo": "mech_client.domain.tools.models",
+    "ToolsForMarketplaceMech": "mech_client.domain.tools.models",
+    "ToolSchema": "mech_client.domain.tools.models",
+    "MechClientError": _EXCEPTIONS,
+    "RpcError": _EXCEPTIONS,
+    "SubgraphError": _EXCEPTIONS,
+    "ContractError": _EXCEPTIONS,
+    "ValidationError": _EXCEPTIONS,
+    "ConfigurationError": _EXCEPTIONS,
+    "TransactionError": _EXCEPTIONS,
+    "IPFSError": _EXCEPTIONS,
+    "ToolError": _EXCEPTIONS,
+    "AgentModeError": _EXCEPTIONS,
+    "PaymentError": _EXCEPTIONS,
+    "DeliveryTimeoutError": _EXCEPTIONS,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public attribute on first access.
+
+    :param name: Attribute name
+    :return: The attribute
+    :raises AttributeError: If the package has no such attribute
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package's attributes, including those not imported yet.
+
+    :return: Attribute names
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
 
 __all__ = [
     # Version
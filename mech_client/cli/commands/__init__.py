@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,22 +17,74 @@
 #
 # ------------------------------------------------------------------------------
 
-"""CLI command modules."""
+"""CLI command modules.
 
-from mech_client.cli.commands.deposit_cmd import deposit
-from mech_client.cli.commands.ipfs_cmd import ipfs
-from mech_client.cli.commands.mech_cmd import mech
-from mech_client.cli.commands.request_cmd import request
-from mech_client.cli.commands.setup_cmd import setup
-from mech_client.cli.commands.subscription_cmd import subscription
-from mech_client.cli.commands.tool_cmd import tool
+Commands are imported on first access; ``mechx`` itself loads them through
+:class:`mech_client.cli.lazy_group.LazyGroup`.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mech_client.cli.commands.broadcast_cmd import broadcast
+    from mech_client.cli.commands.deliveries_cmd import deliveries
+    from mech_client.cli.commands.deposit_cmd import deposit
+    from mech_client.cli.commands.index_cmd import index
+    from mech_client.cli.commands.ipfs_cmd import ipfs
+    from mech_client.cli.commands.mech_cmd import mech
+    from mech_client.cli.commands.request_cmd import request
+    from mech_client.cli.commands.setup_cmd import setup
+    from mech_client.cli.commands.subscription_cmd import subscription
+    from mech_client.cli.commands.tool_cmd import tool
+
+_LAZY_ATTRIBUTES = {
+    "broadcast": "mech_client.cli.commands.broadcast_cmd",
+    "deliveries": "mech_client.cli.commands.deliveries_cmd",
+    "deposit": "mech_client.cli.commands.deposit_cmd",
+    "index": "mech_client.cli.commands.index_cmd",
+    "ipfs": "mech_client.cli.commands.ipfs_cmd",
+    "mech": "mech_client.cli.commands.mech_cmd",
+    "request": "mech_client.cli.commands.request_cmd",
+    "setup": "mech_client.cli.commands.setup_cmd",
+    "subscription": "mech_client.cli.commands.subscription_cmd",
+    "tool": "mech_client.cli.commands.tool_cmd",
+}
 
 __all__ = [
     "setup",
     "request",
+    "broadcast",
+    "deliveries",
     "mech",
     "tool",
+    "index",
     "deposit",
     "subscription",
     "ipfs",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a command on first access (PEP 562).
+
+    :param name: Attribute name
+    :return: The attribute
+    :raises AttributeError: If the package has no such attribute
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package's attributes, including those not imported yet.
+
+    :return: Attribute names
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
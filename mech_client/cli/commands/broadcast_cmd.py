@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Broadcast command for sending pre-signed request transactions."""
+
+import asyncio
+from typing import Optional
+
+import click
+from click import ClickException
+from mech_client.cli.formatting import format_delivery_output
+from mech_client.cli.validators import validate_chain_config
+from mech_client.infrastructure.blockchain.presigned import read_presigned
+from mech_client.infrastructure.config.constants import BROADCAST_BATCH_SIZE
+from mech_client.services.broadcast_service import BroadcastService
+from mech_client.utils.errors.handlers import handle_cli_errors
+from mech_client.utils.validators import validate_timeout
+
+
+@click.command()
+@click.argument(
+    "presigned_file",
+    type=click.Path(exists=True, dir_okay=False),
+    metavar="<file>",
+)
+@click.option(
+    "--chain-config",
+    required=True,
+    help="Chain configuration name (gnosis, base, polygon, optimism).",
+)
+@click.option(
+    "--rate",
+    type=float,
+    help="Maximum transactions broadcast per second (default: no limit).",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=BROADCAST_BATCH_SIZE,
+    show_default=True,
+    help="Transactions per eth_sendRawTransaction batch.",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    help="Timeout in seconds to wait for deliveries.",
+)
+@click.option(
+    "--no-watch",
+    is_flag=True,
+    default=False,
+    help="Stop after the transactions are mined; do not wait for deliveries.",
+)
+@handle_cli_errors
+# pylint: disable=too-many-arguments
+def broadcast(
+    presigned_file: str,
+    chain_config: str,
+    rate: Optional[float],
+    batch_size: int,
+    timeout: Optional[float],
+    no_watch: bool,
+) -> None:
+    """Broadcast pre-signed request transactions.
+
+    Streams a file written by 'mechx request --presign-to' to the network
+    at a controlled rate, waits for the transactions to be mined and then
+    watches the requests for delivery. No key is needed; the transactions
+    are already signed. Re-running on the same file is safe: transactions
+    the node already holds count as sent.
+
+    Example: mechx broadcast requests.jsonl --chain-config gnosis --rate 5
+
+    :param presigned_file: JSONL file of pre-signed transactions.
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param rate: Maximum transactions broadcast per second.
+    :param batch_size: Transactions per JSON-RPC batch.
+    :param timeout: Timeout (seconds) waiting for deliveries.
+    :param no_watch: Skip waiting for deliveries.
+    """
+    validated_chain = validate_chain_config(chain_config)
+    if timeout is not None:
+        timeout = validate_timeout(timeout)
+    if rate is not None and rate <= 0:
+        raise ClickException(f"--rate must be positive, got {rate}")
+
+    transactions = read_presigned(presigned_file)
+    if not transactions:
+        raise ClickException(f"No transactions found in {presigned_file}")
+
+    service = BroadcastService(validated_chain)
+    click.echo(f"\nBroadcasting {len(transactions)} transaction(s)...")
+    result = asyncio.run(
+        service.broadcast(
+            transactions,
+            rate=rate,
+            batch_size=batch_size,
+            timeout=timeout,
+            watch_deliveries=not no_watch,
+        )
+    )
+
+    for outcome in result["outcomes"]:
+        transaction = outcome.transaction
+        line = (
+            f"{transaction.kind} nonce {transaction.nonce} "
+            f"{transaction.tx_hash}: {outcome.status}"
+        )
+        if outcome.error:
+            line += f" ({outcome.error})"
+        click.echo(("✓ " if outcome.status == "mined" else "✗ ") + line)
+    click.echo(f"\n✓ Request IDs: {result['request_ids']}")
+    if result.get("delivery_results"):
+        click.echo("\n✓ Delivery results:")
+        for request_id, delivery_data in result["delivery_results"].items():
+            click.echo(
+                f"  Request {request_id}: {format_delivery_output(delivery_data)}"
+            )
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Deliveries command for collecting requests sent with --no-wait."""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import click
+from mech_client.cli.formatting import format_delivery_output
+from mech_client.cli.validators import validate_chain_config
+from mech_client.infrastructure.journal import RequestJournal
+from mech_client.services.delivery_service import DeliveryService
+from mech_client.utils.errors.handlers import handle_cli_errors
+from mech_client.utils.validators import validate_timeout
+
+_journal_option = click.option(
+    "--journal",
+    type=click.Path(dir_okay=False),
+    help="Request journal file (default: MECHX_JOURNAL_PATH or "
+    "~/.operate_mech_client/request_journal.jsonl).",
+)
+_chain_option = click.option(
+    "--chain-config",
+    required=True,
+    help="Chain configuration name (gnosis, base, polygon, optimism).",
+)
+_request_ids_option = click.option(
+    "--request-id",
+    "request_ids",
+    multiple=True,
+    help="Only this request ID (repeatable; default: every journaled request).",
+)
+
+
+def _echo_deliveries(deliveries: Dict[str, Any], outstanding: int) -> None:
+    """Print deliveries and how many requests are still outstanding."""
+    if deliveries:
+        click.echo("\n✓ Delivery results:")
+        for request_id, delivery_data in deliveries.items():
+            click.echo(
+                f"  Request {request_id}: {format_delivery_output(delivery_data)}"
+            )
+    else:
+        click.echo("\nNo deliveries yet.")
+    click.echo(f"\n{outstanding} request(s) still awaiting delivery.")
+
+
+@click.group()
+def deliveries() -> None:
+    """Collect deliveries of requests sent with 'mechx request --no-wait'.
+
+    Requests sent without waiting are recorded in a local journal with the
+    block to scan from. These commands resume watching them, possibly in a
+    different process or after a restart, and record the deliveries found.
+    Request transactions the sender never saw mined are looked up by hash,
+    never sent again.
+    """
+
+
+@deliveries.command(name="watch")
+@_chain_option
+@_request_ids_option
+@_journal_option
+@click.option(
+    "--timeout",
+    type=float,
+    help="Timeout in seconds to wait for deliveries.",
+)
+@handle_cli_errors
+def deliveries_watch(
+    chain_config: str,
+    request_ids: Tuple[str, ...],
+    journal: Optional[str],
+    timeout: Optional[float],
+) -> None:
+    """Wait for journaled requests to be delivered.
+
+    Example: mechx deliveries watch --chain-config gnosis --timeout 600
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param request_ids: Request IDs to watch (default: all pending).
+    :param journal: Request journal file.
+    :param timeout: Timeout (seconds) waiting for deliveries.
+    """
+    validated_chain = validate_chain_config(chain_config)
+    if timeout is not None:
+        timeout = validate_timeout(timeout)
+
+    service = DeliveryService(validated_chain, RequestJournal(journal))
+    service.resume_sent()
+    pending = service.pending(request_ids)
+    if not pending:
+        click.echo(f"No pending requests in {service.journal.path}.")
+        return
+    click.echo(f"\nWatching {len(pending)} request(s) for delivery...")
+    results = asyncio.run(service.watch(request_ids, timeout=timeout))
+    _echo_deliveries(results, len(service.pending(request_ids)))
+
+
+@deliveries.command(name="collect")
+@_chain_option
+@_request_ids_option
+@_journal_option
+@handle_cli_errors
+def deliveries_collect(
+    chain_config: str,
+    request_ids: Tuple[str, ...],
+    journal: Optional[str],
+) -> None:
+    """Report journaled deliveries, picking up new ones without waiting.
+
+    Example: mechx deliveries collect --chain-config gnosis
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param request_ids: Request IDs to report (default: every journaled one).
+    :param journal: Request journal file.
+    """
+    validated_chain = validate_chain_config(chain_config)
+    service = DeliveryService(validated_chain, RequestJournal(journal))
+    results = asyncio.run(service.collect(request_ids))
+    _echo_deliveries(results, len(service.pending(request_ids)))
+
+
+@deliveries.command(name="compact")
+@_journal_option
+@click.option(
+    "--keep-deliveries",
+    is_flag=True,
+    default=False,
+    help="Keep the recorded deliveries instead of dropping them.",
+)
+@handle_cli_errors
+def deliveries_compact(journal: Optional[str], keep_deliveries: bool) -> None:
+    """Shrink the journal to the requests that can still be resumed.
+
+    Keeps pending requests (from their last scanned block) and recently sent
+    transactions with no receipt yet; drops everything else. Other mechx
+    processes writing to the journal wait until compaction is done.
+
+    Example: mechx deliveries compact
+
+    :param journal: Request journal file.
+    :param keep_deliveries: Keep the recorded deliveries.
+    """
+    request_journal = RequestJournal(journal)
+    before = len(request_journal.records())
+    after = request_journal.compact(keep_deliveries=keep_deliveries)
+    click.echo(f"✓ Compacted {request_journal.path}: {before} record(s) -> {after}")
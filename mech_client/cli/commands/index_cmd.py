@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Index command for building and querying the local mech index."""
+
+from typing import Optional
+
+import click
+from mech_client.cli.validators import validate_chain_config
+from mech_client.infrastructure.config.payment_config import PaymentType
+from mech_client.infrastructure.index import MechIndex
+from mech_client.services.index_service import IndexService
+from mech_client.utils.errors.handlers import handle_cli_errors
+from tabulate import tabulate  # type: ignore
+
+_index_path_option = click.option(
+    "--index-path",
+    type=click.Path(dir_okay=False),
+    help="Index file (default: MECHX_INDEX_PATH or "
+    "~/.cache/mech_client/mech_index.sqlite3).",
+)
+_chain_option = click.option(
+    "--chain-config",
+    required=True,
+    help="Chain configuration name (gnosis, base, polygon, optimism).",
+)
+
+
+@click.group()
+def index() -> None:
+    """Build and query a local index of marketplace mechs.
+
+    The index keeps every marketplace mech with its tools, price and payment
+    type in a local SQLite file, so choosing a mech for a tool is answered
+    offline instead of through the subgraph, metadata and contract calls.
+    """
+
+
+@index.command(name="refresh")
+@_chain_option
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-read every mech, not only new and outdated ones.",
+)
+@_index_path_option
+@handle_cli_errors
+def index_refresh(chain_config: str, full: bool, index_path: Optional[str]) -> None:
+    """Bring the local mech index up to date.
+
+    Lists the marketplace mechs from the subgraph and reads the tools, price
+    and payment type of mechs that are new or were last read over an hour
+    ago.
+
+    Example: mechx index refresh --chain-config gnosis
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param full: Re-read every mech.
+    :param index_path: Index file (default: MECHX_INDEX_PATH).
+    """
+    validated_chain = validate_chain_config(chain_config)
+    service = IndexService(validated_chain, MechIndex(index_path))
+    indexed, refreshed = service.refresh(full=full)
+    click.echo(
+        f"✓ Indexed {indexed} mech(s) on {validated_chain} "
+        f"({refreshed} read from the network) in {service.index.path}"
+    )
+
+
+@index.command(name="query")
+@_chain_option
+@click.option("--tool", help="Only mechs offering this tool.")
+@click.option(
+    "--max-price",
+    type=click.IntRange(min=0),
+    help="Only mechs charging at most this price per request, in wei.",
+)
+@click.option(
+    "--payment-type",
+    type=click.Choice([payment_type.name.lower() for payment_type in PaymentType]),
+    help="Only mechs accepting this payment type.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Show at most this many mechs.",
+)
+@_index_path_option
+@handle_cli_errors
+def index_query(  # pylint: disable=too-many-arguments
+    chain_config: str,
+    tool: Optional[str],
+    max_price: Optional[int],
+    payment_type: Optional[str],
+    limit: Optional[int],
+    index_path: Optional[str],
+) -> None:
+    """Find mechs in the local index, cheapest first.
+
+    Answers from the index alone, without network access. Run
+    'mechx index refresh' first to build or update it.
+
+    Example: mechx index query --chain-config gnosis --tool prediction-online
+    --max-price 10000000000000000 --payment-type native
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param tool: Only mechs offering this tool.
+    :param max_price: Only mechs charging at most this many wei.
+    :param payment_type: Only mechs accepting this payment type.
+    :param limit: Show at most this many mechs.
+    :param index_path: Index file (default: MECHX_INDEX_PATH).
+    """
+    validated_chain = validate_chain_config(chain_config)
+    service = IndexService(validated_chain, MechIndex(index_path))
+    mechs = service.query(
+        tool=tool,
+        max_price=max_price,
+        payment_type=PaymentType[payment_type.upper()] if payment_type else None,
+        limit=limit,
+    )
+    if not mechs:
+        click.echo("No matching mechs found")
+        return
+
+    headers = [
+        "AI Agent Id",
+        "Mech Address",
+        "Payment Type",
+        "Max Delivery Rate",
+        "Total Deliveries",
+        "Tools",
+    ]
+    data = [
+        (
+            mech.service_id,
+            mech.address,
+            mech.payment_type.lower() if mech.payment_type else None,
+            mech.max_delivery_rate,
+            mech.total_deliveries,
+            len(mech.tools),
+        )
+        for mech in mechs
+    ]
+    click.echo(tabulate(data, headers=headers, tablefmt="grid"))
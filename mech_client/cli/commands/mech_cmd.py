@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -43,25 +43,37 @@ def mech() -> None:
     required=True,
     help="Chain configuration name (gnosis, base, polygon, optimism).",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Sync the local subgraph snapshot before listing.",
+)
 @handle_cli_errors
-def mech_list(chain_config: str) -> None:
+def mech_list(chain_config: str, refresh: bool) -> None:
     """List available mechs on the marketplace.
 
     Fetches information about all mechs from the marketplace subgraph,
     including service IDs, addresses, delivery counts, and metadata links.
 
+    Mechs are read from a local snapshot of the subgraph, which is synced
+    with the mechs changed since its last sync once it is older than
+    MECHX_SUBGRAPH_SYNC_INTERVAL seconds (default 300), or with --refresh.
+
     Uses default subgraph URL from configuration. Can be overridden with
     MECHX_SUBGRAPH_URL environment variable.
 
     Example: mechx mech list --chain-config gnosis
 
     :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
+    :param refresh: Sync the local subgraph snapshot before listing.
     """
     # Validate chain config
     validated_chain = validate_chain_config(chain_config)
 
     # Query subgraph for mechs (uses default from config or MECHX_SUBGRAPH_URL override)
-    mech_list_data = query_mm_mechs_info(chain_config=validated_chain)
+    mech_list_data = query_mm_mechs_info(
+        chain_config=validated_chain, snapshot=True, refresh=refresh
+    )
     if mech_list_data is None:
         click.echo("No mechs found")
         return
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,15 +20,16 @@
 """Request command for sending AI task requests to mechs."""
 
 import asyncio
-import json
 from typing import Any, Dict, List, Optional
 
 import click
 from click import ClickException
 from mech_client.cli.common import common_wallet_options, setup_wallet_command
+from mech_client.cli.formatting import format_delivery_output
 from mech_client.cli.validators import validate_chain_config, validate_ethereum_address
-from mech_client.infrastructure.config import IPFS_URL_TEMPLATE
+from mech_client.infrastructure.blockchain.presigned import write_presigned
 from mech_client.services.marketplace_service import MarketplaceService
+from mech_client.services.selection_service import AUTO_PRIORITY_MECH
 from mech_client.utils.errors.handlers import handle_cli_errors
 from mech_client.utils.validators import (
     validate_batch_sizes_match,
@@ -37,16 +38,6 @@ from mech_client.utils.validators import (
 )
 
 
-def _format_delivery_output(delivery_data: Any) -> str:
-    """Format delivery data for CLI output with parity across delivery modes."""
-    if isinstance(delivery_data, dict):
-        task_result = delivery_data.get("task_result")
-        if isinstance(task_result, str) and task_result:
-            return IPFS_URL_TEMPLATE.format(task_result)
-        return json.dumps(delivery_data, ensure_ascii=True, indent=2, sort_keys=True)
-    return str(delivery_data)
-
-
 @click.command()
 @click.option(
     "--prompts",
@@ -58,7 +49,17 @@ def _format_delivery_output(delivery_data: Any) -> str:
 @click.option(
     "--priority-mech",
     type=str,
-    help="Priority mech address to use for the request (0x...).",
+    help=(
+        "Priority mech address to use for the request (0x...), or 'auto' to "
+        "pick the indexed mech with the lowest expected delivery latency for "
+        "the tools."
+    ),
+)
+@click.option(
+    "--max-price",
+    type=click.IntRange(min=0),
+    help="With --priority-mech auto, only consider mechs charging at most "
+    "this many wei per request.",
 )
 @click.option(
     "--use-prepaid",
@@ -109,6 +110,58 @@ def _format_delivery_output(delivery_data: Any) -> str:
     type=float,
     help="Sleep duration in seconds before retrying the transaction.",
 )
+@click.option(
+    "--presign-to",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "Sign one request transaction per prompt and write them to this "
+        "JSONL file instead of sending (client mode only). Send them later "
+        "with 'mechx broadcast'."
+    ),
+)
+@click.option(
+    "--no-wait",
+    is_flag=True,
+    default=False,
+    help=(
+        "Return once the request transactions are mined and record the "
+        "request IDs in the local journal; collect the deliveries later with "
+        "'mechx deliveries watch|collect'."
+    ),
+)
+@click.option(
+    "--no-journal",
+    is_flag=True,
+    default=False,
+    help=(
+        "Do not record the request in the local journal. Requests are "
+        "journaled by default so that, if this process stops before their "
+        "delivery, 'mechx deliveries watch|collect' can still collect it."
+    ),
+)
+@click.option(
+    "--hedge-after",
+    type=click.FloatRange(min=0, min_open=True),
+    help=(
+        "If the request is not delivered within this many seconds of being "
+        "mined, send it again to a second mech and keep the first delivery. "
+        "Both requests are paid for."
+    ),
+)
+@click.option(
+    "--hedge-mech",
+    type=str,
+    help=(
+        "Mech address to hedge with (0x...), or 'auto' (the default) for the "
+        "next-best indexed mech by expected delivery latency."
+    ),
+)
+@click.option(
+    "--hedge-offchain",
+    is_flag=True,
+    default=False,
+    help="Send the hedge request to the hedge mech's offchain endpoint.",
+)
 @common_wallet_options
 @click.pass_context
 @handle_cli_errors
@@ -127,6 +180,13 @@ def request(
     retries: Optional[int] = None,
     timeout: Optional[float] = None,
     sleep: Optional[float] = None,
+    presign_to: Optional[str] = None,
+    no_wait: bool = False,
+    no_journal: bool = False,
+    max_price: Optional[int] = None,
+    hedge_after: Optional[float] = None,
+    hedge_mech: Optional[str] = None,
+    hedge_offchain: bool = False,
 ) -> None:
     r"""Send an AI task request to a mech on-chain.
 
@@ -144,9 +204,29 @@ def request(
       mechx request --prompts "Prompt 1" --prompts "Prompt 2" \
         --tools tool1 --tools tool2 --use-prepaid --chain-config gnosis
 
+      # Sign now, broadcast later
+      mechx --client-mode request --prompts "Prompt 1" --prompts "Prompt 2" \
+        --tools tool1 --tools tool2 --chain-config gnosis --key key.txt \
+        --presign-to requests.jsonl
+      mechx broadcast requests.jsonl --chain-config gnosis --rate 5
+
+      # Submit now, collect deliveries later (from any process)
+      mechx request --prompts "Prompt 1" --tools tool1 --chain-config gnosis \
+        --no-wait
+      mechx deliveries watch --chain-config gnosis
+
+      # Let the client pick the fastest mech charging at most 0.01 xDAI
+      mechx request --prompts "Prompt 1" --tools tool1 --chain-config gnosis \
+        --priority-mech auto --max-price 10000000000000000
+
+      # Ask another mech too if nothing is delivered within 2 minutes
+      mechx request --prompts "Prompt 1" --tools tool1 --chain-config gnosis \
+        --hedge-after 120
+
     :param ctx: Click context (carries client_mode flag from the parent group).
     :param prompts: One or more prompt strings to send (one per request in a batch).
-    :param priority_mech: Address of the mech to prioritise for the request.
+    :param priority_mech: Address of the mech to prioritise for the request,
+        or ``auto`` to select it by expected delivery latency.
     :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
     :param use_prepaid: Use the marketplace prepaid balance instead of per-request payment.
     :param use_offchain: Route delivery off-chain (auto-discovered URL); implies prepaid.
@@ -157,6 +237,14 @@ def request(
     :param retries: Number of retries when sending a transaction.
     :param timeout: Per-request timeout (seconds) waiting for delivery.
     :param sleep: Sleep duration (seconds) between retry attempts.
+    :param presign_to: Write signed request transactions to this file
+        instead of sending them.
+    :param no_wait: Journal the request IDs instead of waiting for delivery.
+    :param no_journal: Do not journal the request.
+    :param max_price: Price cap (wei) of an automatically selected mech.
+    :param hedge_after: Seconds to wait for the delivery before hedging.
+    :param hedge_mech: Mech to hedge with, or ``auto``.
+    :param hedge_offchain: Send the hedge request offchain.
     """
     # Validate chain config
     validated_chain = validate_chain_config(chain_config)
@@ -193,11 +281,46 @@ def request(
     validate_batch_sizes_match(list(prompts), list(tools))
 
     # Validate priority_mech address
-    if priority_mech:
+    auto_select = (priority_mech or "").lower() == AUTO_PRIORITY_MECH
+    if priority_mech and not auto_select:
         validate_ethereum_address(priority_mech, "Priority mech address")
+    if hedge_after is None and (hedge_mech or hedge_offchain):
+        raise ClickException("--hedge-mech and --hedge-offchain need --hedge-after.")
+    auto_hedge = hedge_after is not None and (
+        (hedge_mech or AUTO_PRIORITY_MECH).lower() == AUTO_PRIORITY_MECH
+    )
+    if hedge_mech and not auto_hedge:
+        validate_ethereum_address(hedge_mech, "Hedge mech address")
+    if max_price is not None and not (auto_select or auto_hedge):
+        raise ClickException(
+            "--max-price only applies to --priority-mech auto or --hedge-mech auto."
+        )
+
+    if hedge_after is not None and (no_wait or presign_to or use_offchain):
+        raise ClickException(
+            "--hedge-after watches an on-chain request for delivery; it cannot "
+            "be combined with --no-wait, --presign-to or --use-offchain."
+        )
+
+    if presign_to and use_offchain:
+        raise ClickException(
+            "--presign-to signs on-chain request transactions; it cannot be "
+            "combined with --use-offchain."
+        )
+
+    if no_wait and use_offchain:
+        raise ClickException(
+            "--no-wait journals on-chain requests; offchain requests are "
+            "delivered over HTTP and must be waited for."
+        )
 
     # Setup wallet command (agent mode detection, key loading, etc.)
     wallet_ctx = setup_wallet_command(ctx, validated_chain, key)
+    if presign_to and wallet_ctx.agent_mode:
+        raise ClickException(
+            "--presign-to is only supported in client mode "
+            "(mechx --client-mode request ...)."
+        )
 
     # Create marketplace service
     service = MarketplaceService(
@@ -206,8 +329,26 @@ def request(
         crypto=wallet_ctx.crypto,
         safe_address=wallet_ctx.safe_address,
         ethereum_client=wallet_ctx.ethereum_client,
+        use_journal=not no_journal,
     )
 
+    if presign_to:
+        click.echo(f"\nPre-signing {len(prompts)} marketplace request(s)...")
+        transactions = service.presign_requests(
+            batch=[((prompt,), (tool,)) for prompt, tool in zip(prompts, tools)],
+            priority_mech=priority_mech,
+            use_prepaid=use_prepaid,
+            extra_attributes=extra_attributes_dict,
+            max_price=max_price,
+        )
+        count = write_presigned(presign_to, transactions)
+        first, last = transactions[0], transactions[-1]
+        click.echo(
+            f"\n✓ Wrote {count} signed transaction(s) to {presign_to} "
+            f"(nonces {first.nonce}-{last.nonce} from {first.sender})"
+        )
+        return
+
     # Send request
     click.echo("\nSending marketplace request...")
     result = asyncio.run(
@@ -220,15 +361,42 @@ def request(
             auto_deposit=auto_deposit,
             extra_attributes=extra_attributes_dict,
             timeout=timeout,
+            wait=not no_wait,
+            max_price=max_price,
+            hedge_after=hedge_after,
+            hedge_mech=hedge_mech,
+            hedge_offchain=hedge_offchain,
         )
     )
 
     # Display results
     click.echo(f"\n✓ Transaction hash: {result['tx_hash']}")
+    if len(result.get("tx_hashes") or []) > 1:
+        click.echo(f"✓ Batch transaction hashes: {result['tx_hashes']}")
     click.echo(f"✓ Request IDs: {result['request_ids']}")
+    hedge = result.get("hedge")
+    if hedge and hedge["mech"]:
+        outcome = {
+            "primary": "first mech delivered first",
+            "hedge": "hedge mech delivered first",
+        }.get(hedge["winner"], "no complete delivery")
+        route = " (offchain)" if hedge["offchain"] else ""
+        click.echo(f"✓ Hedged with {hedge['mech']}{route}: {outcome}")
+        click.echo(
+            f"  First request IDs: {hedge['primary_request_ids']}; "
+            f"hedge request IDs: {hedge['hedge_request_ids']}"
+        )
+    elif hedge and hedge.get("error"):
+        click.echo(f"Not hedged, no hedge mech could be selected: {hedge['error']}")
+    if no_wait:
+        click.echo(
+            f"\n✓ Recorded in {result['journal']}. Collect deliveries with: "
+            f"mechx deliveries watch --chain-config {validated_chain}"
+        )
+        return
     if result.get("delivery_results"):
         click.echo("\n✓ Delivery results:")
         for request_id, delivery_data in result["delivery_results"].items():
             click.echo(
-                f"  Request {request_id}: {_format_delivery_output(delivery_data)}"
+                f"  Request {request_id}: {format_delivery_output(delivery_data)}"
             )
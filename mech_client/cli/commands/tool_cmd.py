@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,7 +19,7 @@
 
 """Tool command for managing and querying mech tools."""
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import click
 from mech_client.cli.validators import validate_chain_config, validate_tool_id
@@ -40,33 +40,65 @@ def tool() -> None:
 
 
 @tool.command(name="list")
-@click.argument("agent_id", type=int, metavar="<agent-id>")
+@click.argument("agent_id", type=int, metavar="[<agent-id>]", required=False)
+@click.option(
+    "--all",
+    "all_mechs",
+    is_flag=True,
+    help="List the tools of every mech on the marketplace.",
+)
 @click.option(
     "--chain-config",
     required=True,
     help="Chain configuration name (gnosis, base, polygon, optimism).",
 )
 @handle_cli_errors
-def tool_list(agent_id: int, chain_config: str) -> None:
+def tool_list(agent_id: Optional[int], all_mechs: bool, chain_config: str) -> None:
     """List all available tools for a mech.
 
     Retrieves and displays all tools provided by a specific marketplace mech,
     including tool names and unique identifiers. The agent ID is the service
     ID of the mech on the Olas service registry.
 
+    With --all, the tools of every mech on the marketplace are listed in one
+    table. Their metadata is read in aggregated on-chain calls and fetched
+    concurrently.
+
     Example: mechx tool list 1 --chain-config gnosis
 
+    Example: mechx tool list --all --chain-config gnosis
+
     :param agent_id: Mech service ID on the Olas service registry.
+    :param all_mechs: List the tools of every marketplace mech.
     :param chain_config: Chain configuration name (gnosis, base, polygon, optimism).
     """
+    if (agent_id is None) == (not all_mechs):
+        raise click.ClickException("Pass either an <agent-id> or --all.")
+
     # Validate chain config
     validated_chain = validate_chain_config(chain_config)
+    tool_service = ToolService(validated_chain)
+
+    if all_mechs:
+        catalogue = tool_service.get_marketplace_tools()
+        rows: List[Tuple[str, ...]] = [
+            (str(service_id), str(tool.tool_name), str(tool.unique_identifier))
+            for service_id, tools_info in catalogue.items()
+            for tool in tools_info.tools
+        ]
+        click.echo(
+            tabulate(
+                rows,
+                headers=["AI Agent Id", "Tool Name", "Unique Identifier"],
+                tablefmt="grid",
+            )
+        )
+        return
 
     # Validate agent ID (service ID)
     agent_id = validate_service_id(agent_id)
 
     # Fetch tools
-    tool_service = ToolService(validated_chain)
     result = tool_service.get_tools_info(agent_id)
 
     # Format and display
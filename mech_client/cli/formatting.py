@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Output formatting shared by CLI commands."""
+
+import json
+from typing import Any
+
+from mech_client.infrastructure.config.constants import IPFS_URL_TEMPLATE
+
+
+def format_delivery_output(delivery_data: Any) -> str:
+    """Format delivery data for CLI output with parity across delivery modes."""
+    if isinstance(delivery_data, dict):
+        task_result = delivery_data.get("task_result")
+        if isinstance(task_result, str) and task_result:
+            return IPFS_URL_TEMPLATE.format(task_result)
+        return json.dumps(delivery_data, ensure_ascii=True, indent=2, sort_keys=True)
+    return str(delivery_data)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Click group whose subcommands are imported on first use."""
+
+import importlib
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+import click
+from click.utils import make_default_short_help
+
+
+class LazyCommand(NamedTuple):
+    """Where a subcommand lives and how ``--help`` lists it.
+
+    Attributes:
+        module: Module defining the command
+        attribute: Name of the command object in the module
+        help: First line of the command's help, shown by ``--help`` without
+            importing the module
+    """
+
+    module: str
+    attribute: str
+    help: str
+
+
+class LazyGroup(click.Group):
+    """Group that imports a subcommand's module only when it is run.
+
+    Each command module pulls in the services and chain libraries it needs,
+    so importing them all up front makes every invocation (even ``--help``)
+    pay for every command. The group lists commands from a registry instead
+    and imports the one that is invoked.
+    """
+
+    def __init__(
+        self,
+        *args: object,
+        lazy_commands: Optional[Mapping[str, LazyCommand]] = None,
+        **kwargs: object,
+    ) -> None:
+        """
+        Initialize the group.
+
+        :param args: Positional arguments for :class:`click.Group`
+        :param lazy_commands: Subcommands by name
+        :param kwargs: Keyword arguments for :class:`click.Group`
+        """
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.lazy_commands: Dict[str, LazyCommand] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Return the names of eager and lazy subcommands.
+
+        :param ctx: Click context
+        :return: Sorted command names
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Return a subcommand, importing its module on first use.
+
+        :param ctx: Click context
+        :param cmd_name: Command name
+        :return: The command, or None if there is no such command
+        """
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """
+        List subcommands without importing the lazy ones.
+
+        :param ctx: Click context
+        :param formatter: Help formatter
+        """
+        rows = []
+        limit = formatter.width - 6 - max(map(len, self.list_commands(ctx)), default=0)
+        for name in self.list_commands(ctx):
+            lazy = self.lazy_commands.get(name)
+            if lazy is not None and name not in self.commands:
+                rows.append((name, make_default_short_help(lazy.help, limit)))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand."""
+        lazy = self.lazy_commands[cmd_name]
+        command = getattr(importlib.import_module(lazy.module), lazy.attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{lazy.module}.{lazy.attribute} is not a click command")
+        return command
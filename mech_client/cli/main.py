@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -25,17 +25,7 @@ import click
 from click import ClickException
 from dotenv import load_dotenv
 from mech_client import __version__
-
-# Import command groups
-from mech_client.cli.commands import (
-    deposit,
-    ipfs,
-    mech,
-    request,
-    setup,
-    subscription,
-    tool,
-)
+from mech_client.cli.lazy_group import LazyCommand, LazyGroup
 from mech_client.utils.logger import setup_logger
 
 # Initialize logging before any commands run
@@ -48,8 +38,60 @@ SETUP_MODE_COMMAND = "setup"
 # Commands that require wallet operations (agent mode or client mode)
 WALLET_COMMANDS = {"request", "deposit", "subscription"}
 
+_COMMANDS_PACKAGE = "mech_client.cli.commands"
+
+# Subcommands, each imported only when it is invoked
+COMMANDS = {
+    "setup": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.setup_cmd",
+        "setup",
+        "Setup agent mode for on-chain interactions via Safe multisig.",
+    ),
+    "request": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.request_cmd",
+        "request",
+        "Send an AI task request to a mech on-chain.",
+    ),
+    "broadcast": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.broadcast_cmd",
+        "broadcast",
+        "Broadcast pre-signed request transactions.",
+    ),
+    "deliveries": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.deliveries_cmd",
+        "deliveries",
+        "Collect deliveries of requests sent with 'mechx request --no-wait'.",
+    ),
+    "mech": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.mech_cmd",
+        "mech",
+        "Manage and query AI mechs on the marketplace.",
+    ),
+    "tool": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.tool_cmd", "tool", "Manage and query mech tools."
+    ),
+    "index": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.index_cmd",
+        "index",
+        "Build and query a local index of marketplace mechs.",
+    ),
+    "deposit": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.deposit_cmd",
+        "deposit",
+        "Manage prepaid balance deposits.",
+    ),
+    "subscription": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.subscription_cmd",
+        "subscription",
+        "Manage Nevermined (NVM) subscriptions.",
+    ),
+    "ipfs": LazyCommand(
+        f"{_COMMANDS_PACKAGE}.ipfs_cmd", "ipfs", "IPFS utility operations."
+    ),
+}
 
-@click.group(name="mechx")
+
+@click.group(name="mechx", cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option(__version__, prog_name="mechx")
 @click.option(
     "--client-mode",
@@ -86,12 +128,3 @@ def cli(ctx: click.Context, client_mode: bool) -> None:
                 f"Setup agent mode using 'mechx setup' command."
             )
 
-
-# Register command groups
-cli.add_command(setup)
-cli.add_command(request)
-cli.add_command(mech)
-cli.add_command(tool)
-cli.add_command(deposit)
-cli.add_command(subscription)
-cli.add_command(ipfs)
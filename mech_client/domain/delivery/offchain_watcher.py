@@ -27,6 +27,7 @@ from typing import Any, Dict, List
 import requests
 from mech_client.domain.delivery.base import DeliveryWatcher
 from mech_client.domain.delivery.constants import WAIT_SLEEP
+from mech_client.infrastructure.http import get_http_registry
 
 logger = logging.getLogger(__name__)
 
@@ -120,10 +121,10 @@ class OffchainDeliveryWatcher(
         :return: Response data if available, None otherwise
         """
         try:
-            # Make synchronous request in async context
-            # Note: Using requests in async is not ideal, but matches historic implementation
-            # For production, consider using aiohttp
-            response = requests.get(
+            # Synchronous request in async context, matching the historic
+            # implementation; the pooled session keeps the connection to the
+            # mech alive across polls.
+            response = get_http_registry().get(
                 self.deliver_url,
                 data={"request_id": request_id},
                 timeout=30,
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -66,6 +66,8 @@ class OnchainDeliveryWatcher(DeliveryWatcher):
         super().__init__(timeout or DEFAULT_TIMEOUT)
         self.marketplace_contract = marketplace_contract
         self.ledger_api = ledger_api
+        # Mech that delivered each request of the last watch, by request ID
+        self.delivered_by: Dict[str, str] = {}
 
     async def watch(
         self, request_ids: List[str], from_block: Optional[int] = None
@@ -82,6 +84,7 @@ class OnchainDeliveryWatcher(DeliveryWatcher):
         """
         # Step 1: Wait for marketplace delivery (get mech addresses)
         request_id_to_mech = await self._wait_for_marketplace_delivery(request_ids)
+        self.delivered_by = request_id_to_mech
 
         if not request_id_to_mech:
             return {}
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,13 +20,22 @@
 """Transaction execution strategies for different modes."""
 
 from mech_client.domain.execution.agent_executor import AgentExecutor
-from mech_client.domain.execution.base import TransactionExecutor
+from mech_client.domain.execution.base import ContractCall, TransactionExecutor
+from mech_client.domain.execution.batch_planner import RequestBatchPlanner
 from mech_client.domain.execution.client_executor import ClientExecutor
 from mech_client.domain.execution.factory import ExecutorFactory
+from mech_client.domain.execution.supervisor import (
+    SupervisedTransaction,
+    TransactionSupervisor,
+)
 
 __all__ = [
+    "ContractCall",
+    "RequestBatchPlanner",
     "TransactionExecutor",
     "ClientExecutor",
     "AgentExecutor",
     "ExecutorFactory",
+    "SupervisedTransaction",
+    "TransactionSupervisor",
 ]
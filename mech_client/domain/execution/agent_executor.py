@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,12 +19,18 @@
 
 """Agent mode transaction executor (Safe multisig)."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
 
 from aea_ledger_ethereum import EthereumApi
-from mech_client.domain.execution.base import TransactionExecutor
+from mech_client.domain.execution.base import ContractCall, TransactionExecutor
 from mech_client.domain.signing import Signer
+from mech_client.infrastructure.blockchain.fee_oracle import get_fee_oracle
+from mech_client.infrastructure.blockchain.gas_model import get_gas_model
+from mech_client.infrastructure.blockchain.nonce_manager import get_nonce_manager
 from mech_client.infrastructure.blockchain.safe_client import SafeClient
+from mech_client.infrastructure.blockchain.safe_nonce_manager import (
+    get_safe_nonce_manager,
+)
 from safe_eth.eth import EthereumClient
 from web3.contract import Contract as Web3Contract
 
@@ -35,8 +41,17 @@ class AgentExecutor(TransactionExecutor):
     In agent mode, transactions are executed through a Gnosis Safe multisig
     wallet. This provides enhanced security and enables agent registration
     in the Olas protocol.
+
+    Several contract calls can be bundled into one Safe transaction with
+    :meth:`execute_batch` (call-only MultiSend).
+
+    Safe nonces and the owner's outer nonces come from process-wide
+    allocators shared by every executor on the chain, so independent
+    requests can be queued through one Safe without waiting for each other.
     """
 
+    supports_batching = True
+
     def __init__(
         self,
         ledger_api: EthereumApi,
@@ -55,7 +70,14 @@ class AgentExecutor(TransactionExecutor):
         super().__init__(ledger_api, signer)
         self.safe_address = safe_address
         self.ethereum_client = ethereum_client
-        self.safe_client = SafeClient(ethereum_client, safe_address)
+        self.safe_client = SafeClient(
+            ethereum_client,
+            safe_address,
+            gas_model=get_gas_model(ledger_api),
+            fee_oracle=get_fee_oracle(ledger_api),
+            safe_nonces=get_safe_nonce_manager(ledger_api),
+            nonce_manager=get_nonce_manager(ledger_api),
+        )
 
     def execute_transaction(
         self,
@@ -77,26 +99,19 @@ class AgentExecutor(TransactionExecutor):
         :return: Transaction hash
         :raises Exception: If transaction fails
         """
-        # Build transaction data
-        function = contract.functions[method_name](**method_args)
         sender_address = tx_args.get("sender_address") or tx_args.get("from")
-        build_tx_args: Dict[str, Any] = {
-            # pylint: disable=protected-access
-            "chainId": int(self.ledger_api._chain_id),
-            "gas": 0,
-            "nonce": self.safe_client.get_nonce(),
-        }
-        if sender_address:
-            build_tx_args["from"] = sender_address
-
-        transaction = function.build_transaction(build_tx_args)
+        tx_data = self._encode_call(
+            ContractCall(contract, method_name, method_args),
+            nonce=self.safe_client.get_nonce(),
+            sender_address=sender_address,
+        )
 
         # Execute through Safe
         value = tx_args.get("value", 0)
         try:
             tx_hash = self.safe_client.send_transaction(
                 to_address=contract.address,
-                tx_data=transaction["data"],
+                tx_data=tx_data,
                 signer=self.signer,
                 value=value,
             )
@@ -105,6 +120,58 @@ class AgentExecutor(TransactionExecutor):
 
         return tx_hash.to_0x_hex()
 
+    def execute_batch(self, calls: Sequence[ContractCall]) -> str:
+        """
+        Execute several contract calls atomically in one Safe transaction.
+
+        The calls run in order from the Safe through the call-only MultiSend
+        library: one inner gas estimate, one outer transaction and one
+        receipt instead of one of each per call.
+
+        :param calls: Calls to execute, in order
+        :return: Transaction hash
+        :raises Exception: If transaction fails
+        """
+        nonce = self.safe_client.get_nonce()
+        encoded = [
+            (call.contract.address, self._encode_call(call, nonce), call.value)
+            for call in calls
+        ]
+        try:
+            tx_hash = self.safe_client.send_multisend(encoded, signer=self.signer)
+        except Exception as e:  # pylint: disable=broad-except
+            raise Exception(
+                f"Failed to execute Safe MultiSend transaction: {e}"
+            ) from e
+
+        return tx_hash.to_0x_hex()
+
+    def _encode_call(
+        self,
+        call: ContractCall,
+        nonce: int,
+        sender_address: Optional[str] = None,
+    ) -> str:
+        """
+        Encode a contract call's calldata.
+
+        :param call: Contract call to encode
+        :param nonce: Safe nonce (stops web3 from fetching one)
+        :param sender_address: Sender of the call, if known
+        :return: Calldata (hex string starting with 0x)
+        """
+        function = call.contract.functions[call.method_name](**call.method_args)
+        build_tx_args: Dict[str, Any] = {
+            # pylint: disable=protected-access
+            "chainId": int(self.ledger_api._chain_id),
+            "gas": 0,
+            "nonce": nonce,
+        }
+        if sender_address:
+            build_tx_args["from"] = sender_address
+
+        return function.build_transaction(build_tx_args)["data"]
+
     def execute_transfer(
         self,
         to_address: str,
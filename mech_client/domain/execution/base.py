@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,20 +20,43 @@
 """Base transaction executor interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence
 
 from aea_ledger_ethereum import EthereumApi
 from mech_client.domain.signing import Signer
 from web3.contract import Contract as Web3Contract
 
 
+@dataclass(frozen=True)
+class ContractCall:
+    """One contract method call, for bundling into a single transaction.
+
+    Attributes:
+        contract: Contract instance to call
+        method_name: Name of the contract method
+        method_args: Arguments for the contract method
+        value: Native token value sent with the call (in wei)
+    """
+
+    contract: Web3Contract
+    method_name: str
+    method_args: Dict[str, Any] = field(default_factory=dict)
+    value: int = 0
+
+
 class TransactionExecutor(ABC):
     """Abstract base class for transaction execution strategies.
 
     Defines the interface for executing transactions in different modes
     (client mode with EOA, agent mode with Safe multisig).
+
+    Executors that set ``supports_batching`` can also execute several
+    contract calls atomically as one transaction via :meth:`execute_batch`.
     """
 
+    supports_batching: bool = False
+
     def __init__(
         self,
         ledger_api: EthereumApi,
@@ -68,6 +91,21 @@ class TransactionExecutor(ABC):
         """
         ...
 
+    def execute_batch(self, calls: Sequence[ContractCall]) -> str:
+        """
+        Execute several contract calls as one atomic transaction.
+
+        Only available when ``supports_batching`` is set; callers fall back
+        to one :meth:`execute_transaction` per call otherwise.
+
+        :param calls: Calls to execute, in order
+        :return: Transaction hash
+        :raises NotImplementedError: If this executor cannot bundle calls
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot bundle contract calls"
+        )
+
     @abstractmethod
     def execute_transfer(
         self,
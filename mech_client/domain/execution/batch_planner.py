@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Chunk planning for marketplace ``requestBatch`` transactions.
+
+A single ``requestBatch`` carrying every prompt of a large batch runs into
+the block gas limit (or the node's transaction size limit) and reverts
+after all the metadata has been uploaded. ``RequestBatchPlanner`` splits
+the data hashes into chunks that fit a share of the block gas limit, using
+a per-item gas figure learned from earlier receipts, and balances the
+chunk sizes so the last one is not a straggler.
+"""
+
+import logging
+from typing import Any, List, Mapping, Optional, Sequence
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.infrastructure.blockchain.gas_model import (
+    GasKey,
+    GasModel,
+    get_gas_model,
+)
+from mech_client.infrastructure.config.constants import (
+    REQUEST_BATCH_GAS_SHARE,
+    REQUEST_BATCH_ITEM_GAS,
+    REQUEST_BATCH_MAX_CALLDATA,
+)
+
+logger = logging.getLogger(__name__)
+
+# ABI words spent on one ``bytes`` element of ``bytes[]`` besides its data:
+# the head offset and the length prefix.
+_ITEM_OVERHEAD_BYTES = 64
+
+
+def request_item_key(marketplace_address: str, payment_type: str) -> GasKey:
+    """
+    Return the gas-model key the per-item ``requestBatch`` gas is filed under.
+
+    :param marketplace_address: Marketplace contract address
+    :param payment_type: Payment type value (hex)
+    :return: Gas-model key
+    """
+    return ("requestBatch-item", marketplace_address.lower(), payment_type)
+
+
+def item_calldata_size(data_hash: str) -> int:
+    """
+    Return the calldata one data hash adds to a ``requestBatch``.
+
+    :param data_hash: Request data (hex string, optionally 0x-prefixed)
+    :return: Encoded size in bytes
+    """
+    data_len = len(data_hash.removeprefix("0x")) // 2
+    return _ITEM_OVERHEAD_BYTES + -(-data_len // 32) * 32
+
+
+class RequestBatchPlanner:
+    """Split marketplace requests into ``requestBatch`` chunks that fit a block.
+
+    The chunk capacity is the smaller of ``gas_share`` of the block gas
+    limit divided by the per-item gas, and ``max_calldata`` divided by the
+    per-item calldata. The per-item gas comes from the shared
+    :class:`GasModel` once a chunk has been mined (``gasUsed`` divided by
+    the chunk size, which folds the fixed overhead in and errs high), and
+    from ``REQUEST_BATCH_ITEM_GAS`` before that.
+    """
+
+    def __init__(
+        self,
+        ledger_api: EthereumApi,
+        gas_model: Optional[GasModel] = None,
+        gas_share: float = REQUEST_BATCH_GAS_SHARE,
+        max_calldata: int = REQUEST_BATCH_MAX_CALLDATA,
+    ) -> None:
+        """
+        Initialize the planner.
+
+        :param ledger_api: Ethereum API for the target chain
+        :param gas_model: Learned gas figures (default: shared per chain)
+        :param gas_share: Fraction of the block gas limit one chunk may use
+        :param max_calldata: Calldata bytes one chunk may carry
+        """
+        self.ledger_api = ledger_api
+        self.gas_model = gas_model or get_gas_model(ledger_api)
+        self.gas_share = gas_share
+        self.max_calldata = max_calldata
+
+    def block_gas_limit(self) -> Optional[int]:
+        """
+        Read the gas limit of the latest block.
+
+        :return: Block gas limit, or None if it cannot be read
+        """
+        try:
+            gas_limit = self.ledger_api.api.eth.get_block("latest")["gasLimit"]
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Could not read the block gas limit: {e}")
+            return None
+        return gas_limit if isinstance(gas_limit, int) and gas_limit > 0 else None
+
+    def item_gas(self, key: GasKey) -> int:
+        """
+        Return the gas budgeted per request in a chunk.
+
+        :param key: Per-item gas-model key
+        :return: Gas per item
+        """
+        learned = self.gas_model.predict(key)
+        return learned if learned is not None else REQUEST_BATCH_ITEM_GAS
+
+    def capacity(self, key: GasKey, item_size: int) -> int:
+        """
+        Return the most requests one chunk may carry.
+
+        :param key: Per-item gas-model key
+        :param item_size: Calldata bytes per item
+        :return: Chunk capacity (at least 1)
+        """
+        limit = self.max_calldata // max(item_size, 1)
+        gas_limit = self.block_gas_limit()
+        if gas_limit is not None:
+            limit = min(limit, int(gas_limit * self.gas_share) // self.item_gas(key))
+        return max(limit, 1)
+
+    def plan(self, data_hashes: Sequence[str], key: GasKey) -> List[List[str]]:
+        """
+        Split data hashes into balanced chunks, preserving their order.
+
+        A single request is returned as one chunk without touching the
+        chain. Larger batches read the latest block's gas limit: the
+        calldata limit alone admits far more requests than a block fits.
+
+        :param data_hashes: Request data hashes, in order
+        :param key: Per-item gas-model key
+        :return: Chunks of data hashes
+        """
+        hashes = list(data_hashes)
+        if len(hashes) <= 1:
+            return [hashes]
+        item_size = max(item_calldata_size(data_hash) for data_hash in hashes)
+        capacity = self.capacity(key, item_size)
+        count = -(-len(hashes) // capacity)
+        base, extra = divmod(len(hashes), count)
+        chunks: List[List[str]] = []
+        start = 0
+        for index in range(count):
+            end = start + base + (1 if index < extra else 0)
+            chunks.append(hashes[start:end])
+            start = end
+        return chunks
+
+    def observe(self, key: GasKey, receipt: Mapping[str, Any], items: int) -> None:
+        """
+        Learn the per-item gas from a mined chunk.
+
+        :param key: Per-item gas-model key
+        :param receipt: Receipt of the chunk's transaction
+        :param items: Requests the chunk carried
+        """
+        gas_used = receipt.get("gasUsed")
+        if receipt.get("status") != 1 or not isinstance(gas_used, int) or items < 1:
+            return
+        self.gas_model.observe(key, -(-gas_used // items))
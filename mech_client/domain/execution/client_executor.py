@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,20 +19,104 @@
 
 """Client mode transaction executor (EOA-based)."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from aea_ledger_ethereum import EthereumApi
 from mech_client.domain.execution.base import TransactionExecutor
+from mech_client.domain.execution.supervisor import TransactionSupervisor
+from mech_client.domain.signing import Signer
+from mech_client.infrastructure.blockchain.fee_oracle import FeeOracle, get_fee_oracle
+from mech_client.infrastructure.blockchain.gas_model import (
+    GasModel,
+    contract_call_key,
+    get_gas_model,
+)
+from mech_client.infrastructure.blockchain.nonce_manager import (
+    NonceManager,
+    get_nonce_manager,
+)
 from web3.contract import Contract as Web3Contract
 
 
+_FEE_FIELDS = ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas")
+
+
 class ClientExecutor(TransactionExecutor):
     """Transaction executor for client mode (EOA-based signing).
 
     In client mode, transactions are built locally and handed to the signer,
     which signs them with the EOA key (locally or in an external signer
     service) and broadcasts them without multisig.
+
+    Nonces come from a process-wide :class:`NonceManager` rather than the
+    node's latest count, so several transactions per key can be in flight
+    without waiting for each receipt. With a :class:`TransactionSupervisor`
+    attached, broadcasts are tracked so stuck transactions can be replaced
+    with bumped fees while their receipt is awaited.
+
+    Gas limits for repeated call shapes are predicted by a shared
+    :class:`GasModel` learned from earlier receipts, which skips the
+    ``eth_estimateGas`` round-trip once a shape has been seen. Fees come
+    from a shared per-block :class:`FeeOracle` instead of being priced for
+    every transaction.
     """
 
+    def __init__(
+        self,
+        ledger_api: EthereumApi,
+        signer: Signer,
+        nonce_manager: Optional[NonceManager] = None,
+        supervisor: Optional[TransactionSupervisor] = None,
+        gas_model: Optional[GasModel] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        gas_fallback: bool = False,
+    ):
+        """
+        Initialize client executor.
+
+        :param ledger_api: Ethereum API for blockchain interactions
+        :param signer: Signer for signing and broadcasting transactions
+        :param nonce_manager: Nonce allocator (default: shared per chain)
+        :param supervisor: Supervisor for fee-bumped replacement (optional)
+        :param gas_model: Learned gas limits (default: shared per chain)
+        :param fee_oracle: Per-block fee cache (default: shared per chain)
+        :param gas_fallback: Use the caller's ``gas`` when estimation fails
+            instead of raising (for transactions simulated against a state
+            that does not yet include their predecessors, e.g. pre-signing)
+        """
+        super().__init__(ledger_api, signer)
+        self.nonce_manager = nonce_manager or get_nonce_manager(ledger_api)
+        self.supervisor = supervisor
+        self.gas_model = gas_model or get_gas_model(ledger_api)
+        self.fee_oracle = fee_oracle or get_fee_oracle(ledger_api)
+        self.gas_fallback = gas_fallback
+
+    def _with_fees(self, tx_args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill fee fields from the oracle unless the caller set or reprices them.
+
+        :param tx_args: Transaction arguments
+        :return: Transaction arguments with fee fields
+        """
+        if tx_args.get("old_price") is not None or any(
+            tx_args.get(fee_field) is not None for fee_field in _FEE_FIELDS
+        ):
+            return tx_args
+        return {**tx_args, **self.fee_oracle.fees()}
+
+    def _send_with_managed_nonce(self, raw_transaction: Dict[str, Any]) -> str:
+        """
+        Send a transaction through the signer with a managed nonce.
+
+        :param raw_transaction: Unsigned transaction
+        :return: Transaction hash
+        """
+        with self.nonce_manager.use(self.signer.address) as nonce:
+            transaction = {**raw_transaction, "nonce": nonce}
+            if self.supervisor is not None:
+                return self.supervisor.submit(transaction)
+            return self.signer.send_transaction(transaction)
+
     def execute_transaction(
         self,
         contract: Web3Contract,
@@ -54,14 +138,78 @@ class ClientExecutor(TransactionExecutor):
         :param tx_args: Transaction arguments (sender, value, gas, etc.)
         :return: Transaction hash
         """
-        raw_transaction = self.ledger_api.build_transaction(
-            contract_instance=contract,
-            method_name=method_name,
-            method_args=method_args,
-            tx_args=tx_args,
-            raise_on_try=True,
+        tx_args = self._with_fees(tx_args)
+        key = contract_call_key(
+            contract.address, method_name, method_args, tx_args.get("value", 0)
+        )
+        predicted_gas = (
+            self.gas_model.predict(key)
+            if self.ledger_api._is_gas_estimation_enabled  # pylint: disable=protected-access
+            and tx_args.get("gas") is None
+            else None
         )
-        return self.signer.send_transaction(raw_transaction)
+        if predicted_gas is None:
+            try:
+                raw_transaction = self.ledger_api.build_transaction(
+                    contract_instance=contract,
+                    method_name=method_name,
+                    method_args=method_args,
+                    tx_args=tx_args,
+                    raise_on_try=True,
+                )
+            except Exception:  # pylint: disable=broad-except
+                if not self.gas_fallback or tx_args.get("gas") is None:
+                    raise
+                raw_transaction = self._build_with_gas(
+                    contract, method_name, method_args, tx_args, tx_args["gas"]
+                )
+        else:
+            raw_transaction = self._build_with_gas(
+                contract, method_name, method_args, tx_args, predicted_gas
+            )
+        tx_hash = self._send_with_managed_nonce(raw_transaction)
+        self.gas_model.track(tx_hash, key)
+        return tx_hash
+
+    def _build_with_gas(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        contract: Web3Contract,
+        method_name: str,
+        method_args: Dict[str, Any],
+        tx_args: Dict[str, Any],
+        gas: int,
+    ) -> Dict[str, Any]:
+        """
+        Build an unsigned transaction with a known gas limit.
+
+        Mirrors ``EthereumApi.build_transaction`` minus the gas estimate and
+        the nonce lookup (the managed nonce is applied on send).
+
+        :param contract: Contract instance to call
+        :param method_name: Name of the contract method
+        :param method_args: Arguments for the contract method
+        :param tx_args: Transaction arguments (sender, value, fees)
+        :param gas: Gas limit to use
+        :return: Unsigned transaction
+        """
+        api = self.ledger_api.api
+        tx_params: Dict[str, Any] = {
+            "from": api.to_checksum_address(tx_args["sender_address"]),
+            "value": tx_args.get("value", 0),
+            "gas": gas,
+        }
+        for fee_field in _FEE_FIELDS:
+            if tx_args.get(fee_field) is not None:
+                tx_params[fee_field] = tx_args[fee_field]
+        if not any(fee_field in tx_params for fee_field in _FEE_FIELDS):
+            gas_data = self.ledger_api.try_get_gas_pricing(
+                old_price=tx_args.get("old_price"), raise_on_try=True
+            )
+            if gas_data:
+                tx_params.update(gas_data)
+        return getattr(contract.functions, method_name)(
+            **method_args
+        ).build_transaction(tx_params)
 
     def execute_transfer(
         self,
@@ -79,14 +227,18 @@ class ClientExecutor(TransactionExecutor):
         :param gas: Gas limit for the transaction
         :return: Transaction hash
         """
+        fees = self.fee_oracle.fees()
         raw_transaction = self.ledger_api.get_transfer_transaction(
             sender_address=self.signer.address,
             destination_address=to_address,
             amount=amount,
             tx_fee=gas,
             tx_nonce="0x",
+            max_fee_per_gas=fees.get("maxFeePerGas"),
+            max_priority_fee_per_gas=fees.get("maxPriorityFeePerGas"),
+            gas_price=fees.get("gasPrice"),
         )
-        return self.signer.send_transaction(raw_transaction)
+        return self._send_with_managed_nonce(raw_transaction)
 
     def get_sender_address(self) -> str:
         """
@@ -98,8 +250,10 @@ class ClientExecutor(TransactionExecutor):
 
     def get_nonce(self) -> int:
         """
-        Get the nonce for the next transaction from the network.
+        Get the nonce the next transaction will use.
+
+        Accounts for transactions already broadcast but not yet mined.
 
         :return: Transaction nonce
         """
-        return self.ledger_api.api.eth.get_transaction_count(self.signer.address)
+        return self.nonce_manager.peek(self.signer.address)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -25,6 +25,7 @@ from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 from mech_client.domain.execution.agent_executor import AgentExecutor
 from mech_client.domain.execution.base import TransactionExecutor
 from mech_client.domain.execution.client_executor import ClientExecutor
+from mech_client.domain.execution.supervisor import create_supervisor
 from mech_client.domain.signing import LocalSigner, Signer
 from safe_eth.eth import EthereumClient
 
@@ -44,6 +45,7 @@ class ExecutorFactory:  # pylint: disable=too-few-public-methods
         safe_address: Optional[str] = None,
         ethereum_client: Optional[EthereumClient] = None,
         signer: Optional[Signer] = None,
+        supervise: bool = False,
     ) -> TransactionExecutor:
         """
         Create transaction executor for given mode.
@@ -57,6 +59,9 @@ class ExecutorFactory:  # pylint: disable=too-few-public-methods
         :param safe_address: Safe address (required for agent mode)
         :param ethereum_client: Ethereum client (required for agent mode)
         :param signer: Signer for externalized signing (alternative to crypto)
+        :param supervise: Attach a fee-bumping supervisor in client mode.
+            Only for callers that await receipts through it and ``forget``
+            each transaction afterwards; others would leak tracked records
         :return: Concrete executor instance
         :raises ValueError: If neither crypto nor signer is provided, or if
             agent mode but Safe address/client not provided
@@ -78,4 +83,5 @@ class ExecutorFactory:  # pylint: disable=too-few-public-methods
                 ethereum_client,
             )
 
-        return ClientExecutor(ledger_api, signer)
+        supervisor = create_supervisor(ledger_api, signer) if supervise else None
+        return ClientExecutor(ledger_api, signer, supervisor=supervisor)
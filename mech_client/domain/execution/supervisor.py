@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Supervision of submitted EOA transactions with fee-bumped replacement."""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.domain.signing import Signer
+from mech_client.infrastructure.blockchain.broadcast import (
+    flush_broadcasts,
+    pop_broadcast_failure,
+)
+from mech_client.infrastructure.blockchain.fee_oracle import get_fee_oracle
+from mech_client.infrastructure.blockchain.gas_model import get_gas_model
+from mech_client.infrastructure.blockchain.receipt_waiter import (
+    estimate_block_time,
+    fetch_receipts,
+)
+from mech_client.infrastructure.config.constants import (
+    GAS_BUMP_BLOCKS,
+    GAS_BUMP_MAX_ATTEMPTS,
+    GAS_BUMP_PERCENT,
+    MIN_REPLACEMENT_BUMP_PERCENT,
+    TRANSACTION_RECEIPT_TIMEOUT,
+)
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+
+logger = logging.getLogger(__name__)
+
+_FEE_FIELDS = ("maxFeePerGas", "maxPriorityFeePerGas", "gasPrice")
+
+
+def bump_fees(
+    tx: Dict[str, Any], percent: int = GAS_BUMP_PERCENT
+) -> Dict[str, Any]:
+    """
+    Return a copy of ``tx`` with every fee field raised by ``percent``.
+
+    Nodes only accept a same-nonce replacement whose fees are at least 10%
+    higher than the pending transaction's, so ``percent`` is clamped to
+    that floor and each field grows by at least one wei.
+
+    :param tx: Transaction with EIP-1559 or legacy fee fields
+    :param percent: Increase in percent (minimum 10)
+    :return: Transaction copy with bumped fees
+    """
+    percent = max(percent, MIN_REPLACEMENT_BUMP_PERCENT)
+    bumped = dict(tx)
+    for fee_field in _FEE_FIELDS:
+        if bumped.get(fee_field) is not None:
+            old = int(bumped[fee_field])
+            # Ceiling division keeps small fees strictly above the 10% floor.
+            bumped[fee_field] = max(old + 1, -(-old * (100 + percent) // 100))
+    if (
+        "maxFeePerGas" in bumped
+        and bumped.get("maxPriorityFeePerGas") is not None
+        and bumped["maxPriorityFeePerGas"] > bumped["maxFeePerGas"]
+    ):
+        bumped["maxFeePerGas"] = bumped["maxPriorityFeePerGas"]
+    return bumped
+
+
+@dataclass
+class SupervisedTransaction:
+    """A submitted transaction and every replacement broadcast for it.
+
+    Attributes:
+        tx: Unsigned transaction last broadcast (nonce and fees filled)
+        hashes: Hashes of every broadcast, oldest first
+        broadcast_block: Block number at the latest broadcast (set on the
+            first poll, so submitting costs no extra RPC call)
+        bumps: Number of fee-bumped replacements sent
+        included_hash: Hash that was mined, once known
+        on_replaced: Callbacks given each replacement hash once it is
+            broadcast (e.g. to journal it before it can be mined)
+    """
+
+    tx: Dict[str, Any]
+    hashes: List[str] = field(default_factory=list)
+    broadcast_block: Optional[int] = None
+    bumps: int = 0
+    included_hash: Optional[str] = None
+    on_replaced: List[Callable[[str], None]] = field(default_factory=list)
+
+    @property
+    def original_hash(self) -> str:
+        """Hash of the first broadcast, used as the tracking key."""
+        return self.hashes[0]
+
+
+class TransactionSupervisor:
+    """Tracks submitted transactions and replaces the ones that get stuck.
+
+    Each transaction is broadcast through the signer with its nonce and fees
+    pinned. While waiting for a receipt, all hashes broadcast for the nonce
+    are polled; if none is mined within ``bump_after_blocks`` blocks of the
+    last broadcast, the transaction is re-signed with fees bumped by
+    ``bump_percent`` and re-broadcast under the same nonce. Whichever
+    version is mined is reported as the included hash.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ledger_api: EthereumApi,
+        signer: Signer,
+        bump_after_blocks: int = GAS_BUMP_BLOCKS,
+        bump_percent: int = GAS_BUMP_PERCENT,
+        max_bumps: int = GAS_BUMP_MAX_ATTEMPTS,
+        max_fee_per_gas_cap: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        :param ledger_api: Ethereum API for fees, block numbers and receipts
+        :param signer: Signer used for the original and replacement broadcasts
+        :param bump_after_blocks: Blocks without inclusion before a replacement
+        :param bump_percent: Fee increase per replacement (minimum 10)
+        :param max_bumps: Maximum replacements per transaction
+        :param max_fee_per_gas_cap: Never bump ``maxFeePerGas``/``gasPrice``
+            above this many wei (default: uncapped)
+        """
+        self.ledger_api = ledger_api
+        self.signer = signer
+        self.bump_after_blocks = bump_after_blocks
+        self.bump_percent = bump_percent
+        self.max_bumps = max_bumps
+        self.max_fee_per_gas_cap = max_fee_per_gas_cap
+        self._tracked: Dict[str, SupervisedTransaction] = {}
+        self._lock = threading.Lock()
+
+    def _block_number(self) -> int:
+        """Return the latest block number."""
+        return int(self.ledger_api.api.eth.block_number)
+
+    def _with_fees(self, tx: Dict[str, Any]) -> Dict[str, Any]:
+        """Pin fee fields so a replacement can be priced against them."""
+        if any(tx.get(fee_field) is not None for fee_field in _FEE_FIELDS):
+            return tx
+        return {**tx, **get_fee_oracle(self.ledger_api).fees()}
+
+    def is_tracking(self, tx_hash: str) -> bool:
+        """
+        Check whether ``tx_hash`` was submitted through this supervisor.
+
+        :param tx_hash: Hash returned by submit
+        :return: True if tracked
+        """
+        return tx_hash in self._tracked
+
+    def get(self, tx_hash: str) -> SupervisedTransaction:
+        """
+        Return the supervision record for a submitted hash.
+
+        :param tx_hash: Hash returned by submit
+        :return: Supervision record
+        """
+        return self._tracked[tx_hash]
+
+    def forget(self, tx_hash: str) -> SupervisedTransaction:
+        """
+        Stop tracking a transaction and return its final record.
+
+        :param tx_hash: Hash returned by submit
+        :return: Supervision record (``included_hash`` set once mined)
+        """
+        with self._lock:
+            return self._tracked.pop(tx_hash)
+
+    def submit(self, unsigned_tx: Dict[str, Any]) -> str:
+        """
+        Broadcast a transaction and start supervising it.
+
+        :param unsigned_tx: Unsigned transaction with ``nonce`` set
+        :return: Hash of the first broadcast (the tracking key)
+        :raises ValueError: If the transaction has no nonce
+        """
+        if unsigned_tx.get("nonce") is None:
+            raise ValueError("Supervised transactions need an explicit nonce")
+        tx = self._with_fees(dict(unsigned_tx))
+        tx_hash = self.signer.send_transaction(tx)
+        record = SupervisedTransaction(tx=tx, hashes=[tx_hash])
+        with self._lock:
+            self._tracked[tx_hash] = record
+        return tx_hash
+
+    def _replace(self, record: SupervisedTransaction, block: int) -> None:
+        """Re-broadcast ``record`` with bumped fees under the same nonce."""
+        replacement = bump_fees(record.tx, self.bump_percent)
+        if self.max_fee_per_gas_cap is not None:
+            for fee_field in ("maxFeePerGas", "gasPrice"):
+                if replacement.get(fee_field, 0) > self.max_fee_per_gas_cap:
+                    logger.warning(
+                        f"Not bumping transaction {record.original_hash}: "
+                        f"{fee_field} would exceed the configured cap."
+                    )
+                    record.bumps = self.max_bumps
+                    return
+        try:
+            new_hash = self.signer.send_transaction(replacement)
+        except Exception as e:  # pylint: disable=broad-except
+            # "nonce too low": an earlier version was just mined; the next
+            # poll picks it up. Anything else: retry on the next window.
+            logger.warning(f"Replacement for {record.original_hash} rejected: {e}")
+            record.broadcast_block = block
+            return
+        record.tx = replacement
+        record.hashes.append(new_hash)
+        record.bumps += 1
+        record.broadcast_block = block
+        logger.info(
+            f"Transaction {record.original_hash} pending for "
+            f"{self.bump_after_blocks}+ blocks; replaced by {new_hash} "
+            f"(bump {record.bumps}/{self.max_bumps})"
+        )
+        for callback in record.on_replaced:
+            try:
+                callback(new_hash)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning(f"Replacement callback for {new_hash} failed: {e}")
+
+    def _drop_rejected(self, record: SupervisedTransaction) -> None:
+        """Flush queued broadcasts and forget replacements the node rejected."""
+        flush_broadcasts(self.ledger_api)
+        for broadcast_hash in list(record.hashes):
+            failure = pop_broadcast_failure(self.ledger_api, broadcast_hash)
+            if failure is None:
+                continue
+            if broadcast_hash == record.original_hash:
+                raise failure
+            logger.warning(f"Replacement {broadcast_hash} rejected: {failure.message}")
+            record.hashes.remove(broadcast_hash)
+
+    def poll(self, tx_hash: str) -> Optional[Dict]:
+        """
+        Check a supervised transaction once, replacing it if it is stuck.
+
+        :param tx_hash: Hash returned by submit
+        :return: Receipt of whichever broadcast was mined, or None
+        :raises BroadcastError: If a queued first broadcast was rejected
+        """
+        record = self._tracked[tx_hash]
+        self._drop_rejected(record)
+        receipts = fetch_receipts(self.ledger_api, list(record.hashes))
+        for broadcast_hash in reversed(record.hashes):
+            if broadcast_hash in receipts:
+                record.included_hash = broadcast_hash
+                receipt = receipts[broadcast_hash]
+                # Gas samples are tracked under the original hash.
+                get_gas_model(self.ledger_api).observe_receipt(tx_hash, receipt)
+                return receipt
+
+        block = self._block_number()
+        get_fee_oracle(self.ledger_api).observe_block(block)
+        if record.broadcast_block is None:
+            record.broadcast_block = block
+        if (
+            self.bump_after_blocks > 0
+            and record.bumps < self.max_bumps
+            and block - record.broadcast_block >= self.bump_after_blocks
+        ):
+            self._replace(record, block)
+        return None
+
+    def _timeout_error(self, tx_hash: str, timeout: float) -> TimeoutError:
+        """Build the TimeoutError raised when no broadcast is mined."""
+        record = self._tracked[tx_hash]
+        return TimeoutError(
+            f"Timeout ({timeout}s) exceeded while waiting for transaction "
+            f"{tx_hash} after {record.bumps} fee bump(s). "
+            f"Broadcast hashes: {', '.join(record.hashes)}"
+        )
+
+    def wait(
+        self, tx_hash: str, timeout: float = TRANSACTION_RECEIPT_TIMEOUT
+    ) -> Dict:
+        """
+        Block until a version of the transaction is mined.
+
+        :param tx_hash: Hash returned by submit
+        :param timeout: Maximum time to wait in seconds
+        :return: Receipt of the included broadcast
+        :raises TimeoutError: If nothing is mined within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        interval = estimate_block_time(self.ledger_api)
+        while True:
+            receipt = self.poll(tx_hash)
+            if receipt is not None:
+                return receipt
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._timeout_error(tx_hash, timeout)
+            time.sleep(min(interval, remaining))
+
+    async def wait_async(
+        self, tx_hash: str, timeout: float = TRANSACTION_RECEIPT_TIMEOUT
+    ) -> Dict:
+        """
+        Wait for a version of the transaction to be mined without blocking.
+
+        :param tx_hash: Hash returned by submit
+        :param timeout: Maximum time to wait in seconds
+        :return: Receipt of the included broadcast
+        :raises TimeoutError: If nothing is mined within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        interval = estimate_block_time(self.ledger_api)
+        while True:
+            receipt = await asyncio.to_thread(self.poll, tx_hash)
+            if receipt is not None:
+                return receipt
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._timeout_error(tx_hash, timeout)
+            await asyncio.sleep(min(interval, remaining))
+
+
+def create_supervisor(
+    ledger_api: EthereumApi, signer: Signer
+) -> Optional[TransactionSupervisor]:
+    """
+    Build the default supervisor, honouring MECHX_GAS_BUMP_BLOCKS.
+
+    :param ledger_api: Ethereum API for fees, block numbers and receipts
+    :param signer: Signer used for broadcasts
+    :return: Supervisor, or None when bumping is disabled (value 0)
+    """
+    bump_after_blocks = EnvironmentConfig.load().mechx_gas_bump_blocks
+    if bump_after_blocks is None:
+        bump_after_blocks = GAS_BUMP_BLOCKS
+    if bump_after_blocks <= 0:
+        return None
+    return TransactionSupervisor(
+        ledger_api, signer, bump_after_blocks=bump_after_blocks
+    )
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,13 +20,14 @@
 """Base payment strategy interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, TYPE_CHECKING
 
 from aea_ledger_ethereum import EthereumApi
 from mech_client.infrastructure.config import PaymentType
 
 if TYPE_CHECKING:
-    from mech_client.domain.execution.base import TransactionExecutor
+    from mech_client.domain.execution.base import ContractCall, TransactionExecutor
 
 
 class PaymentStrategy(ABC):
@@ -75,6 +76,8 @@ class PaymentStrategy(ABC):
         spender_address: str,
         amount: int,
         executor: Optional["TransactionExecutor"] = None,
+        approve_amount: Optional[int] = None,
+        reserved: int = 0,
     ) -> Optional[str]:
         """
         Approve token spending if needed (for token-based payments).
@@ -83,12 +86,60 @@ class PaymentStrategy(ABC):
 
         :param payer_address: Address of the payer
         :param spender_address: Address allowed to spend tokens
-        :param amount: Amount to approve (in wei/smallest unit)
+        :param amount: Amount the spender must be able to pull (in wei/smallest unit)
         :param executor: Transaction executor (handles both agent and client mode)
+        :param approve_amount: Amount to approve when an approval is sent
+            (default: ``amount``); more leaves a standing allowance
+        :param reserved: Allowance already held by other in-flight requests
+            (see :meth:`reserve_allowance`)
         :return: Transaction hash if approval was sent, None otherwise
         """
         ...
 
+    def approval_call(  # pylint: disable=unused-argument
+        self,
+        payer_address: str,
+        spender_address: str,
+        amount: int,
+        approve_amount: Optional[int] = None,
+        reserved: int = 0,
+    ) -> Optional["ContractCall"]:
+        """
+        Build the approval call ``approve_if_needed`` would send, unsent.
+
+        Lets a caller bundle the approval with the call that spends it
+        (see ``TransactionExecutor.execute_batch``). Default implementation
+        returns None (no approval needed); token strategies override it.
+
+        :param payer_address: Address of the payer
+        :param spender_address: Address allowed to spend tokens
+        :param amount: Amount the spender must be able to pull
+        :param approve_amount: Amount to approve (default: ``amount``)
+        :param reserved: Allowance already held by other in-flight requests
+        :return: The approval call, or None if no approval is needed
+        """
+        return None
+
+    @contextmanager
+    def reserve_allowance(  # pylint: disable=unused-argument
+        self,
+        payer_address: str,
+        spender_address: str,
+        amount: int,
+    ) -> Iterator[int]:
+        """
+        Hold ``amount`` of the payer's allowance until it has been spent.
+
+        Default implementation holds nothing (no allowance involved); token
+        strategies override it.
+
+        :param payer_address: Address of the payer
+        :param spender_address: Address allowed to spend tokens
+        :param amount: Amount the request will pull
+        :yield: Allowance held by other requests when this one was reserved
+        """
+        yield 0
+
     @abstractmethod
     def get_balance_tracker_address(self) -> str:
         """
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -69,6 +69,8 @@ class NVMPaymentStrategy(PaymentStrategy):
         spender_address: str,
         amount: int,
         executor: Optional["TransactionExecutor"] = None,
+        approve_amount: Optional[int] = None,
+        reserved: int = 0,
     ) -> Optional[str]:
         """
         No approval needed for NVM subscription payments.
@@ -79,6 +81,8 @@ class NVMPaymentStrategy(PaymentStrategy):
         :param spender_address: Address allowed to spend (ignored)
         :param amount: Amount to approve (ignored)
         :param executor: Transaction executor (ignored)
+        :param approve_amount: Amount to approve (ignored)
+        :param reserved: Allowance held by other requests (ignored)
         :return: None (no approval transaction)
         """
         return None  # NVM subscriptions don't need approval
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,8 +19,11 @@
 
 """ERC20 token payment strategy."""
 
-from typing import Optional, TYPE_CHECKING
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING, Tuple
 
+from mech_client.domain.execution.base import ContractCall
 from mech_client.domain.payment.base import PaymentStrategy
 from mech_client.infrastructure.blockchain.abi_loader import get_abi
 from mech_client.infrastructure.blockchain.contracts import get_contract
@@ -43,6 +46,13 @@ if TYPE_CHECKING:
 # 60k underfunds that proxy. Re-measure if Circle upgrades the implementation.
 _APPROVE_FALLBACK_GAS = 120_000
 
+# Allowance promised to requests whose paying transaction is not mined yet,
+# per (chain ID, token, payer, spender). ERC20 ``approve`` replaces the
+# allowance instead of adding to it, so concurrent requests from one key
+# must each see what the others are about to pull.
+_reserved_allowances: Dict[Tuple[int, str, str, str], int] = {}
+_reserved_allowances_lock = threading.Lock()
+
 
 class TokenPaymentStrategy(PaymentStrategy):
     """Payment strategy for ERC20 token payments (OLAS, USDC).
@@ -72,52 +82,161 @@ class TokenPaymentStrategy(PaymentStrategy):
         balance = token_contract.functions.balanceOf(payer_address).call()
         return balance >= amount
 
+    def get_allowance(self, owner_address: str, spender_address: str) -> int:
+        """
+        Read how much the spender may currently pull from the owner.
+
+        :param owner_address: Token holder (the payer)
+        :param spender_address: Spender (balance tracker)
+        :return: Current allowance (in token's smallest unit)
+        """
+        return int(
+            self._token_contract()
+            .functions.allowance(
+                ensure_checksummed_address(owner_address),
+                ensure_checksummed_address(spender_address),
+            )
+            .call()
+        )
+
     def approve_if_needed(
         self,
         payer_address: str,
         spender_address: str,
         amount: int,
         executor: Optional["TransactionExecutor"] = None,
-    ) -> str:
+        approve_amount: Optional[int] = None,
+        reserved: int = 0,
+    ) -> Optional[str]:
         """
-        Approve token spending for the spender address.
+        Approve token spending for the spender address if the allowance is short.
 
-        Builds and sends an approve transaction for the specified amount.
-        This must be called before the actual token transfer. Always sends
-        a transaction and returns the hash; raises if it cannot.
+        Reads the current ``allowance(payer, spender)`` first and sends no
+        transaction when what is left of it after ``reserved`` already covers
+        ``amount``. Otherwise approves ``reserved + max(amount,
+        approve_amount)``; a larger ``approve_amount`` leaves a standing
+        allowance that later requests spend without approving again.
 
         :param payer_address: Address of the payer
         :param spender_address: Address allowed to spend tokens (balance tracker)
-        :param amount: Amount to approve (in token's smallest unit)
+        :param amount: Amount the spender must be able to pull
+            (in token's smallest unit)
         :param executor: Transaction executor (handles both agent and client mode)
-        :return: Transaction hash of approval transaction
+        :param approve_amount: Amount to approve when an approval is sent
+            (default: ``amount``)
+        :param reserved: Allowance already held by other in-flight requests
+            of this payer (see :meth:`reserve_allowance`)
+        :return: Transaction hash of the approval, or None if the current
+            allowance already suffices
         :raises ValueError: If executor is not provided
         """
         if not executor:
             raise ValueError("Transaction executor required for token approval")
 
-        token_address = self.get_payment_token_address()
-        if not token_address:
-            raise ValueError("Token address not configured for this payment type")
-
-        abi = get_abi("IToken.json")
-        token_contract = get_contract(token_address, abi, self.ledger_api)
+        call = self.approval_call(
+            payer_address, spender_address, amount, approve_amount, reserved
+        )
+        if call is None:
+            return None
 
         tx_args = {
             "sender_address": payer_address,
             "value": 0,
             "gas": _APPROVE_FALLBACK_GAS,
         }
-        method_name = "approve"
-        method_args = {"_to": spender_address, "_value": amount}
 
         return executor.execute_transaction(
-            contract=token_contract,
-            method_name=method_name,
-            method_args=method_args,
+            contract=call.contract,
+            method_name=call.method_name,
+            method_args=call.method_args,
             tx_args=tx_args,
         )
 
+    def approval_call(
+        self,
+        payer_address: str,
+        spender_address: str,
+        amount: int,
+        approve_amount: Optional[int] = None,
+        reserved: int = 0,
+    ) -> Optional[ContractCall]:
+        """
+        Build the ``approve`` call, or None if the allowance already suffices.
+
+        The approved value keeps ``reserved`` on top of this request's share,
+        since ``approve`` overwrites the allowance other requests rely on.
+
+        :param payer_address: Address of the payer
+        :param spender_address: Address allowed to spend tokens (balance tracker)
+        :param amount: Amount the spender must be able to pull
+        :param approve_amount: Amount to approve (default: ``amount``)
+        :param reserved: Allowance already held by other in-flight requests
+        :return: The approval call, or None if no approval is needed
+        """
+        allowance = self.get_allowance(payer_address, spender_address)
+        if allowance - reserved >= amount:
+            return None
+        return ContractCall(
+            contract=self._token_contract(),
+            method_name="approve",
+            method_args={
+                "_to": spender_address,
+                "_value": reserved + max(amount, approve_amount or 0),
+            },
+        )
+
+    @contextmanager
+    def reserve_allowance(
+        self,
+        payer_address: str,
+        spender_address: str,
+        amount: int,
+    ) -> Iterator[int]:
+        """
+        Hold ``amount`` of the payer's allowance until it has been spent.
+
+        Pass the yielded value as ``reserved`` to :meth:`approval_call` or
+        :meth:`approve_if_needed`, send the approval before yielding to other
+        requests, and leave the block once the paying transaction is mined or
+        has failed. Concurrent requests from one key then neither count the
+        same allowance twice nor shrink it with a smaller ``approve``.
+
+        :param payer_address: Address of the payer
+        :param spender_address: Address allowed to spend tokens (balance tracker)
+        :param amount: Amount the request will pull
+        :yield: Allowance held by other requests when this one was reserved
+        """
+        key = (
+            self.chain_id,
+            self.get_payment_token_address() or "",
+            ensure_checksummed_address(payer_address),
+            ensure_checksummed_address(spender_address),
+        )
+        with _reserved_allowances_lock:
+            reserved = _reserved_allowances.get(key, 0)
+            _reserved_allowances[key] = reserved + amount
+        try:
+            yield reserved
+        finally:
+            with _reserved_allowances_lock:
+                remaining = _reserved_allowances.get(key, 0) - amount
+                if remaining > 0:
+                    _reserved_allowances[key] = remaining
+                else:
+                    _reserved_allowances.pop(key, None)
+
+    def _token_contract(self) -> Any:
+        """
+        Get the payment token contract.
+
+        :return: Token contract instance
+        :raises ValueError: If the token is not configured for this payment type
+        """
+        token_address = self.get_payment_token_address()
+        if not token_address:
+            raise ValueError("Token address not configured for this payment type")
+        return get_contract(token_address, get_abi("IToken.json"), self.ledger_api)
+
     def get_balance_tracker_address(self) -> str:
         """
         Get the token balance tracker contract address for this chain.
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Per-mech delivery latency statistics and latency-based ranking.
+
+Every request sent to a priority mech is a :class:`DeliverySample`: how long
+its delivery took, whether another mech stepped in to deliver it, or that it
+timed out. :func:`summarize` reduces a mech's most recent samples to a
+:class:`MechLatency` (p50 / p95 latency, timeout and step-in rates), and
+:func:`rank_mechs` orders candidate mechs by their expected latency.
+
+A timed-out request is charged twice the response timeout: the wait, then a
+resend. Mechs with few samples are pulled towards the typical expected
+latency of the others, so one lucky delivery does not outrank a long record
+and unknown mechs are neither always tried nor never tried.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from mech_client.infrastructure.config.constants import (
+    LATENCY_WINDOW,
+    MECH_RESPONSE_TIMEOUT,
+)
+
+# Samples' worth of weight given to the prior expected latency
+PRIOR_WEIGHT = 3.0
+
+
+@dataclass(frozen=True)
+class DeliverySample:
+    """The outcome of one request sent to a priority mech.
+
+    Attributes:
+        mech: Priority mech address (lower-case)
+        requested_at: Unix time the request was made
+        latency: Seconds until it was delivered (None: it timed out)
+        stepped_in: Whether a mech other than the priority mech delivered it
+    """
+
+    mech: str
+    requested_at: float
+    latency: Optional[float]
+    stepped_in: bool = False
+
+
+@dataclass(frozen=True)
+class MechLatency:  # pylint: disable=too-many-instance-attributes
+    """Delivery statistics of one mech over its recent requests.
+
+    Attributes:
+        mech: Mech address (lower-case)
+        requests: Requests the statistics cover
+        delivered: How many of them were delivered
+        p50: Median delivery latency in seconds (None: nothing delivered)
+        p95: 95th percentile delivery latency in seconds
+        mean: Mean delivery latency in seconds
+        timeout_rate: Share of the requests that timed out
+        step_in_rate: Share of the delivered requests another mech delivered
+    """
+
+    mech: str
+    requests: int
+    delivered: int
+    p50: Optional[float]
+    p95: Optional[float]
+    mean: Optional[float]
+    timeout_rate: float
+    step_in_rate: float
+
+    def expected_latency(
+        self, response_timeout: float = MECH_RESPONSE_TIMEOUT
+    ) -> float:
+        """
+        Return the expected seconds until a request to this mech is delivered.
+
+        :param response_timeout: Response timeout of the requests
+        :return: Mean latency of delivered requests blended with the cost
+            of the timed-out ones
+        """
+        penalty = 2 * response_timeout
+        if self.mean is None:
+            return penalty
+        return (1 - self.timeout_rate) * self.mean + self.timeout_rate * penalty
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Return a percentile of sorted values, interpolating between ranks."""
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(
+    samples: Iterable[DeliverySample], window: int = LATENCY_WINDOW
+) -> Dict[str, MechLatency]:
+    """
+    Compute the statistics of every mech over its latest samples.
+
+    :param samples: Delivery samples, in any order
+    :param window: Most recent samples kept per mech
+    :return: Statistics by mech address (lower-case)
+    """
+    by_mech: Dict[str, List[DeliverySample]] = {}
+    for sample in samples:
+        by_mech.setdefault(sample.mech.lower(), []).append(sample)
+
+    stats: Dict[str, MechLatency] = {}
+    for mech, mech_samples in by_mech.items():
+        recent = sorted(mech_samples, key=lambda s: s.requested_at)[-window:]
+        delivered = [s for s in recent if s.latency is not None]
+        latencies = sorted(max(0.0, s.latency) for s in delivered)  # type: ignore
+        stats[mech] = MechLatency(
+            mech=mech,
+            requests=len(recent),
+            delivered=len(delivered),
+            p50=_percentile(latencies, 0.5) if latencies else None,
+            p95=_percentile(latencies, 0.95) if latencies else None,
+            mean=sum(latencies) / len(latencies) if latencies else None,
+            timeout_rate=(len(recent) - len(delivered)) / len(recent),
+            step_in_rate=(
+                sum(s.stepped_in for s in delivered) / len(delivered)
+                if delivered
+                else 0.0
+            ),
+        )
+    return stats
+
+
+def rank_mechs(
+    candidates: Sequence[str],
+    stats: Dict[str, MechLatency],
+    response_timeout: float = MECH_RESPONSE_TIMEOUT,
+) -> List[str]:
+    """
+    Order candidate mechs by expected delivery latency, lowest first.
+
+    Each mech's expected latency is shrunk towards the median of the
+    candidates with statistics, by :data:`PRIOR_WEIGHT` samples. Ties
+    (e.g. between mechs without any statistics) keep the candidates' order.
+
+    :param candidates: Mech addresses, in fallback order
+    :param stats: Statistics by mech address (lower-case)
+    :param response_timeout: Response timeout of the requests
+    :return: The candidates, fastest expected first
+    """
+    known = sorted(
+        stats[mech.lower()].expected_latency(response_timeout)
+        for mech in candidates
+        if mech.lower() in stats
+    )
+    prior = _percentile(known, 0.5) if known else response_timeout / 2
+
+    def _score(mech: str) -> float:
+        mech_stats = stats.get(mech.lower())
+        if mech_stats is None:
+            return prior
+        weight = mech_stats.requests
+        expected = mech_stats.expected_latency(response_timeout)
+        return (weight * expected + PRIOR_WEIGHT * prior) / (weight + PRIOR_WEIGHT)
+
+    return sorted(candidates, key=_score)
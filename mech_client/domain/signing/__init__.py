@@ -20,9 +20,16 @@
 """Signing abstractions: injectable Signer protocol and local default."""
 
 from mech_client.domain.signing.base import Signer
+from mech_client.domain.signing.batching import BatchingSigner
 from mech_client.domain.signing.local import LocalSigner
+from mech_client.domain.signing.pool import SignerPool, SignerStats
+from mech_client.domain.signing.presigning import PresigningSigner
 
 __all__ = [
     "Signer",
     "LocalSigner",
+    "BatchingSigner",
+    "PresigningSigner",
+    "SignerPool",
+    "SignerStats",
 ]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Signer that defers broadcasts to a batched broadcast queue."""
+
+from typing import Any, Dict, Optional
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.domain.signing.local import LocalSigner
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastQueue,
+    get_broadcast_queue,
+)
+
+
+class BatchingSigner:
+    """:class:`Signer` that signs immediately and broadcasts in batches.
+
+    ``send_transaction`` signs through the wrapped :class:`LocalSigner`,
+    queues the raw transaction on a :class:`BroadcastQueue` and returns its
+    hash right away. The queue goes out as a batched
+    ``eth_sendRawTransaction`` request when a receipt for one of its hashes
+    is awaited (``wait_for_receipt``, ``ReceiptWaiter``, the fee-bump
+    supervisor), when it fills up, or on an explicit ``flush``. A rejected
+    broadcast surfaces as ``BroadcastError`` from the receipt wait.
+
+    Callers that never wait for receipts must call :meth:`flush` (or use
+    the queue's ``batch()`` context manager) before exiting.
+    """
+
+    def __init__(
+        self,
+        signer: LocalSigner,
+        ledger_api: EthereumApi,
+        queue: Optional[BroadcastQueue] = None,
+    ) -> None:
+        """
+        Initialize the batching signer.
+
+        :param signer: Signer able to sign without broadcasting
+        :param ledger_api: Ethereum API for the target chain
+        :param queue: Broadcast queue (default: shared per chain, which is
+            the one receipt waiters flush)
+        :raises TypeError: If the signer cannot sign without broadcasting
+        """
+        if not callable(getattr(signer, "sign_transaction", None)):
+            raise TypeError(
+                f"{type(signer).__name__} cannot sign without broadcasting; "
+                "BatchingSigner needs a signer with sign_transaction()"
+            )
+        self.signer = signer
+        self.queue = queue or get_broadcast_queue(ledger_api)
+
+    @property
+    def address(self) -> str:
+        """The EOA address of the wrapped signer.
+
+        :return: EOA address
+        """
+        return self.signer.address
+
+    def send_transaction(self, unsigned_tx: Dict[str, Any]) -> str:
+        """Sign a transaction and queue it for the next batched broadcast.
+
+        :param unsigned_tx: Unsigned transaction dict
+        :return: Transaction hash (0x-prefixed hex string)
+        """
+        raw_transaction = self.signer.sign_transaction(unsigned_tx)
+        return self.queue.enqueue(
+            raw_transaction, sender=self.address, nonce=unsigned_tx.get("nonce")
+        )
+
+    def flush(self) -> None:
+        """Broadcast everything queued so far."""
+        self.queue.flush()
+
+    def sign_message(self, message: bytes) -> bytes:
+        """Sign ``message`` with the wrapped signer.
+
+        :param message: Message bytes to sign
+        :return: 65-byte signature
+        """
+        return self.signer.sign_message(message)
+
+    def sign_safe_message(
+        self, safe_address: str, chain_id: int, message: bytes
+    ) -> bytes:
+        """Sign the Safe-wrapped ``message`` with the wrapped signer.
+
+        :param safe_address: Safe (verifyingContract) address
+        :param chain_id: Chain ID for the EIP-712 domain
+        :param message: 32-byte digest to wrap and sign
+        :return: 65-byte signature
+        """
+        return self.signer.sign_safe_message(safe_address, chain_id, message)
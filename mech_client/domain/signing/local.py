@@ -25,6 +25,8 @@ from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 from eth_abi import encode as abi_encode
 from eth_account import Account
 from eth_utils import keccak
+from hexbytes import HexBytes
+from mech_client.infrastructure.blockchain.fee_oracle import get_fee_oracle
 from mech_client.utils.validators import ensure_checksummed_address
 
 # EIP-712 typehash constants for Safe v1.3.0+ SafeMessage wrapping (the
@@ -69,31 +71,52 @@ class LocalSigner:
         """
         return str(self.crypto.address)
 
-    def send_transaction(self, unsigned_tx: Dict[str, Any]) -> str:
-        """Sign an EOA transaction with the local key and broadcast it.
-
-        Fills ``nonce``, gas price, and ``gas`` from the connected node when
-        absent, then signs and sends via the ledger API (``raise_on_try=True``
-        propagates build/sign/send failures).
-
-        :param unsigned_tx: Unsigned transaction dict
-        :return: Transaction hash (0x-prefixed hex string)
-        """
+    def _fill_defaults(self, unsigned_tx: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill ``from``, ``nonce``, fees and ``gas`` when absent."""
         tx = dict(unsigned_tx)
         tx.setdefault("from", self.address)
         if tx.get("nonce") is None:
             tx["nonce"] = self.ledger_api.api.eth.get_transaction_count(self.address)
         if "gasPrice" not in tx and "maxFeePerGas" not in tx:
-            tx["gasPrice"] = self.ledger_api.api.eth.gas_price
+            tx.update(get_fee_oracle(self.ledger_api).fees())
         if tx.get("gas") is None:
             tx["gas"] = self.ledger_api.api.eth.estimate_gas(tx)
-        signed_transaction = self.crypto.sign_transaction(tx)
+        return tx
+
+    def send_transaction(self, unsigned_tx: Dict[str, Any]) -> str:
+        """Sign an EOA transaction with the local key and broadcast it.
+
+        Fills ``nonce``, fees (from the shared per-block fee oracle), and
+        ``gas`` from the connected node when absent, then signs and sends via
+        the ledger API (``raise_on_try=True`` propagates build/sign/send
+        failures).
+
+        :param unsigned_tx: Unsigned transaction dict
+        :return: Transaction hash (0x-prefixed hex string)
+        """
+        signed_transaction = self.crypto.sign_transaction(
+            self._fill_defaults(unsigned_tx)
+        )
         transaction_digest = self.ledger_api.send_signed_transaction(
             signed_transaction,
             raise_on_try=True,
         )
         return str(transaction_digest)
 
+    def sign_transaction(self, unsigned_tx: Dict[str, Any]) -> HexBytes:
+        """Sign an EOA transaction without broadcasting it.
+
+        Fills missing fields like :meth:`send_transaction`. Used by
+        :class:`BatchingSigner` to hand raw transactions to a broadcast queue.
+
+        :param unsigned_tx: Unsigned transaction dict
+        :return: Signed raw transaction bytes
+        """
+        signed_transaction = self.crypto.sign_transaction(
+            self._fill_defaults(unsigned_tx)
+        )
+        return HexBytes(signed_transaction["raw_transaction"])
+
     def sign_message(self, message: bytes) -> bytes:
         """Sign ``message`` with the local key.
 
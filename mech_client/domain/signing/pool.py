@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Signer pool sharding transactions across several EOA keys."""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.domain.signing.base import Signer
+
+
+@dataclass
+class SignerStats:
+    """Load and funding snapshot for one key in a :class:`SignerPool`.
+
+    Attributes:
+        address: EOA address of the key
+        pending: Requests currently leased to the key
+        submitted: Transactions broadcast through the key so far
+        balance: Last known native balance in wei (None until refreshed)
+    """
+
+    address: str
+    pending: int = 0
+    submitted: int = 0
+    balance: Optional[int] = None
+
+
+class SignerPool:
+    """:class:`Signer` that spreads work over a pool of keys.
+
+    A single EOA can only move as fast as its nonce sequence, so
+    high-throughput callers shard requests across several keys. The pool
+    leases the least-loaded key (fewest pending requests, then highest known
+    balance) to each request; every signing call made while the lease is
+    held — balance checks, approvals, the request transaction, offchain
+    signatures — goes to that one key.
+
+    Leases are tracked per execution context (``contextvars``), so
+    concurrent ``asyncio`` tasks and threads each see their own key. Outside
+    a lease, each call picks the least-loaded key at call time.
+
+    Client mode only: a Safe in agent mode has exactly one owner key.
+    """
+
+    def __init__(self, signers: Sequence[Signer], min_balance: int = 0) -> None:
+        """
+        Initialize the pool.
+
+        :param signers: Signers to shard across (addresses must be unique)
+        :param min_balance: Skip keys whose known balance is below this (wei)
+        :raises ValueError: If the pool is empty or has duplicate addresses
+        """
+        if not signers:
+            raise ValueError("SignerPool requires at least one signer")
+        addresses = [signer.address.lower() for signer in signers]
+        if len(set(addresses)) != len(addresses):
+            raise ValueError("SignerPool signers must have unique addresses")
+
+        self.signers: List[Signer] = list(signers)
+        self.min_balance = min_balance
+        self._stats: Dict[str, SignerStats] = {
+            key: SignerStats(address=signer.address)
+            for key, signer in zip(addresses, self.signers)
+        }
+        self._lock = threading.Lock()
+        self._current: ContextVar[Optional[Signer]] = ContextVar(
+            f"signer_pool_{id(self)}", default=None
+        )
+
+    def _stats_for(self, signer: Signer) -> SignerStats:
+        """Return the stats entry for a pool member."""
+        return self._stats[signer.address.lower()]
+
+    def _pick(self) -> Signer:
+        """Return the least-loaded eligible signer (lock must be held)."""
+        eligible = [
+            signer
+            for signer in self.signers
+            if (balance := self._stats_for(signer).balance) is None
+            or balance >= self.min_balance
+        ]
+        if not eligible:
+            raise ValueError(
+                f"No signer in the pool holds the minimum balance of "
+                f"{self.min_balance} wei. Fund a key or refresh balances."
+            )
+        return min(
+            eligible,
+            key=lambda signer: (
+                self._stats_for(signer).pending,
+                -(self._stats_for(signer).balance or 0),
+                self._stats_for(signer).submitted,
+            ),
+        )
+
+    @property
+    def current(self) -> Signer:
+        """The signer leased to this context, or the least-loaded one."""
+        leased = self._current.get()
+        if leased is not None:
+            return leased
+        with self._lock:
+            return self._pick()
+
+    @contextmanager
+    def lease(self) -> Iterator[Signer]:
+        """
+        Bind one key to the calling context for the duration of a request.
+
+        Nested leases in the same context reuse the outer key.
+
+        :yield: The leased signer
+        """
+        leased = self._current.get()
+        if leased is not None:
+            yield leased
+            return
+        with self._lock:
+            signer = self._pick()
+            self._stats_for(signer).pending += 1
+        token = self._current.set(signer)
+        try:
+            yield signer
+        finally:
+            self._current.reset(token)
+            with self._lock:
+                self._stats_for(signer).pending -= 1
+
+    def refresh_balances(self, ledger_api: EthereumApi) -> Dict[str, int]:
+        """
+        Re-read every key's native balance.
+
+        :param ledger_api: Ethereum API for the pool's chain
+        :return: Mapping of address to balance in wei
+        """
+        balances = {
+            signer.address: int(ledger_api.get_balance(signer.address) or 0)
+            for signer in self.signers
+        }
+        with self._lock:
+            for address, balance in balances.items():
+                self._stats[address.lower()].balance = balance
+        return balances
+
+    def stats(self) -> List[SignerStats]:
+        """
+        Return a snapshot of per-key load and funding.
+
+        :return: One SignerStats per key, in pool order
+        """
+        with self._lock:
+            return [
+                SignerStats(**vars(self._stats_for(signer)))
+                for signer in self.signers
+            ]
+
+    @property
+    def address(self) -> str:
+        """The address of the signer leased to this context.
+
+        :return: EOA address
+        """
+        return self.current.address
+
+    def send_transaction(self, unsigned_tx: Dict[str, Any]) -> str:
+        """Sign and broadcast through the leased key.
+
+        :param unsigned_tx: Unsigned transaction dict
+        :return: Transaction hash (0x-prefixed hex string)
+        """
+        with self.lease() as signer:
+            tx_hash = signer.send_transaction(unsigned_tx)
+            with self._lock:
+                self._stats_for(signer).submitted += 1
+            return tx_hash
+
+    def sign_message(self, message: bytes) -> bytes:
+        """Sign ``message`` with the leased key.
+
+        :param message: Message bytes to sign
+        :return: 65-byte signature
+        """
+        return self.current.sign_message(message)
+
+    def sign_safe_message(
+        self, safe_address: str, chain_id: int, message: bytes
+    ) -> bytes:
+        """Sign the Safe-wrapped ``message`` with the leased key.
+
+        :param safe_address: Safe (verifyingContract) address
+        :param chain_id: Chain ID for the EIP-712 domain
+        :param message: 32-byte digest to wrap and sign
+        :return: 65-byte signature
+        """
+        return self.current.sign_safe_message(safe_address, chain_id, message)
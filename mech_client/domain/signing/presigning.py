@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Signer that records signed transactions instead of broadcasting them."""
+
+from typing import Any, Dict, List
+
+from mech_client.domain.signing.local import LocalSigner
+from mech_client.infrastructure.blockchain.broadcast import raw_transaction_hash
+from mech_client.infrastructure.blockchain.presigned import PresignedTransaction
+
+
+class PresigningSigner:
+    """:class:`Signer` that signs now and leaves broadcasting for later.
+
+    ``send_transaction`` signs through the wrapped signer and appends the
+    result to :attr:`transactions` as a :class:`PresignedTransaction`; its
+    hash is returned as if it had been sent. Nothing reaches the network,
+    so the caller must not wait for receipts of these hashes.
+
+    Used to build request files ahead of time when signing is slow (e.g. a
+    hardware-backed signer service) and to broadcast them later at a
+    controlled rate.
+    """
+
+    def __init__(self, signer: LocalSigner, chain_id: int) -> None:
+        """
+        Initialize the presigning signer.
+
+        :param signer: Signer able to sign without broadcasting
+        :param chain_id: Chain the transactions are signed for
+        :raises TypeError: If the signer cannot sign without broadcasting
+        """
+        if not callable(getattr(signer, "sign_transaction", None)):
+            raise TypeError(
+                f"{type(signer).__name__} cannot sign without broadcasting; "
+                "pre-signing needs a signer with sign_transaction()"
+            )
+        self.signer = signer
+        self.chain_id = chain_id
+        self.transactions: List[PresignedTransaction] = []
+
+    @property
+    def address(self) -> str:
+        """The EOA address of the wrapped signer.
+
+        :return: EOA address
+        """
+        return self.signer.address
+
+    def send_transaction(self, unsigned_tx: Dict[str, Any]) -> str:
+        """Sign a transaction and record it for deferred broadcast.
+
+        :param unsigned_tx: Unsigned transaction dict (``nonce`` set)
+        :return: Transaction hash (0x-prefixed hex string)
+        :raises ValueError: If the transaction has no nonce
+        """
+        if unsigned_tx.get("nonce") is None:
+            raise ValueError("Pre-signed transactions need a pre-assigned nonce")
+        raw_transaction = self.signer.sign_transaction(unsigned_tx)
+        tx_hash = raw_transaction_hash(raw_transaction)
+        self.transactions.append(
+            PresignedTransaction(
+                chain_id=self.chain_id,
+                sender=self.address,
+                nonce=int(unsigned_tx["nonce"]),
+                tx_hash=tx_hash,
+                raw_transaction="0x" + bytes(raw_transaction).hex(),
+                max_fee_per_gas=unsigned_tx.get("maxFeePerGas"),
+                max_priority_fee_per_gas=unsigned_tx.get("maxPriorityFeePerGas"),
+                gas_price=unsigned_tx.get("gasPrice"),
+            )
+        )
+        return tx_hash
+
+    def annotate(self, tx_hash: str, **metadata: Any) -> None:
+        """
+        Attach metadata to a recorded transaction.
+
+        :param tx_hash: Hash returned by :meth:`send_transaction`
+        :param metadata: Fields to merge into the transaction's metadata
+        :raises KeyError: If no transaction with this hash was recorded
+        """
+        for transaction in self.transactions:
+            if transaction.tx_hash == tx_hash:
+                transaction.metadata.update(metadata)
+                return
+        raise KeyError(f"No pre-signed transaction with hash {tx_hash}")
+
+    def sign_message(self, message: bytes) -> bytes:
+        """Sign ``message`` with the wrapped signer.
+
+        :param message: Message bytes to sign
+        :return: 65-byte signature
+        """
+        return self.signer.sign_message(message)
+
+    def sign_safe_message(
+        self, safe_address: str, chain_id: int, message: bytes
+    ) -> bytes:
+        """Sign the Safe-wrapped ``message`` with the wrapped signer.
+
+        :param safe_address: Safe (verifyingContract) address
+        :param chain_id: Chain ID for the EIP-712 domain
+        :param message: 32-byte digest to wrap and sign
+        :return: 65-byte signature
+        """
+        return self.signer.sign_safe_message(safe_address, chain_id, message)
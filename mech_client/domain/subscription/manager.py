@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -23,7 +23,7 @@ import logging
 from typing import Any, Dict, Optional
 
 from aea_ledger_ethereum import EthereumApi
-from mech_client.domain.execution.base import TransactionExecutor
+from mech_client.domain.execution.base import ContractCall, TransactionExecutor
 from mech_client.domain.subscription.agreement import AgreementBuilder, AgreementData
 from mech_client.domain.subscription.balance_checker import SubscriptionBalanceChecker
 from mech_client.domain.subscription.fulfillment import FulfillmentBuilder
@@ -97,6 +97,9 @@ class SubscriptionManager:  # pylint: disable=too-few-public-methods,too-many-in
         3. Create agreement transaction
         4. Fulfill agreement transaction
 
+        Executors that bundle calls (agent mode) send the approval and the
+        agreement creation as one Safe transaction.
+
         :param plan_did: Plan DID to subscribe to
         :return: Result dictionary with status and transaction details
         """
@@ -116,12 +119,17 @@ class SubscriptionManager:  # pylint: disable=too-few-public-methods,too-many-in
         logger.info(f"Sender credits before purchase: {balance_before}")
 
         # Step 3: Token approval (Base only)
+        bundle_approval = False
         if self.config.requires_token_approval():
             logger.info("Token approval required for Base chain")
-            self._approve_token()
+            if self.executor.supports_batching:
+                # Sent with the agreement creation in step 4.
+                bundle_approval = True
+            else:
+                self._approve_token()
 
         # Step 4: Create agreement
-        agreement_tx_hash = self._create_agreement(agreement)
+        agreement_tx_hash = self._create_agreement(agreement, bundle_approval)
 
         # Step 5: Fulfill agreement
         fulfillment_tx_hash = self._fulfill_agreement(agreement)
@@ -143,26 +151,38 @@ class SubscriptionManager:  # pylint: disable=too-few-public-methods,too-many-in
             "credits_after": balance_after,
         }
 
-    def _approve_token(self) -> None:
-        """Approve USDC token for lock payment contract (Base only)."""
+    def _approval_call(self) -> ContractCall:
+        """
+        Build the USDC approval of the total payment for the lock payment contract.
+
+        :return: Approval contract call
+        :raises ValueError: If no token contract is configured
+        """
         if not self.token_contract:
             raise ValueError("Token contract required for Base chain approval")
 
-        logger.info("Approving USDC token for lock payment contract")
-
-        # Approve total payment amount
-        approval_amount = self.config.get_total_payment_amount()
-
-        # Execute approval transaction
-        tx_hash = self.executor.execute_transaction(
+        return ContractCall(
             contract=self.token_contract.contract,
             method_name="approve",
             method_args={
                 "spender": self.w3.to_checksum_address(
                     self.agreement_builder.lock_payment.address
                 ),
-                "value": approval_amount,
+                "value": self.config.get_total_payment_amount(),
             },
+        )
+
+    def _approve_token(self) -> None:
+        """Approve USDC token for lock payment contract (Base only)."""
+        call = self._approval_call()
+
+        logger.info("Approving USDC token for lock payment contract")
+
+        # Execute approval transaction
+        tx_hash = self.executor.execute_transaction(
+            contract=call.contract,
+            method_name=call.method_name,
+            method_args=call.method_args,
             tx_args={
                 "sender_address": self.sender,
                 "value": 0,
@@ -178,26 +198,63 @@ class SubscriptionManager:  # pylint: disable=too-few-public-methods,too-many-in
 
         logger.info(f"Token approval successful. Tx hash: {tx_hash}")
 
-    def _create_agreement(self, agreement: AgreementData) -> str:
+    def _create_agreement(
+        self, agreement: AgreementData, with_approval: bool = False
+    ) -> str:
         """
         Create the subscription agreement on-chain.
 
         :param agreement: Agreement data
+        :param with_approval: Bundle the USDC approval into the same
+            transaction (requires an executor that supports batching)
         :return: Transaction hash (hex string)
         """
-        logger.info("Creating subscription agreement")
+        call = self._agreement_call(agreement)
+        if with_approval:
+            logger.info(
+                "Approving USDC and creating subscription agreement "
+                "in one Safe transaction"
+            )
+            tx_hash = self.executor.execute_batch([self._approval_call(), call])
+        else:
+            logger.info("Creating subscription agreement")
+            tx_hash = self.executor.execute_transaction(
+                contract=call.contract,
+                method_name=call.method_name,
+                method_args=call.method_args,
+                tx_args={
+                    "sender_address": self.sender,
+                    "value": call.value,
+                    "gas": 600000,
+                },
+            )
+
+        # Wait for receipt
+        receipt = wait_for_receipt(tx_hash, self.ledger_api)
 
+        if receipt["status"] != 1:
+            raise RuntimeError(
+                f"Agreement creation failed. Transaction hash: {tx_hash}"
+            )
+
+        logger.info(f"Agreement created successfully. Tx hash: {tx_hash}")
+
+        return tx_hash
+
+    def _agreement_call(self, agreement: AgreementData) -> ContractCall:
+        """
+        Build the ``createAgreementAndPayEscrow`` call.
+
+        :param agreement: Agreement data
+        :return: Contract call, with the native value to pay
+        """
         # Prepare amounts [fee, price]
         amounts = [
             int(self.config.plan_fee_nvm),
             int(self.config.plan_price_mechs),
         ]
 
-        # Get transaction value (native token for Gnosis, 0 for Base)
-        tx_value = self.config.get_transaction_value()
-
-        # Execute agreement creation transaction
-        tx_hash = self.executor.execute_transaction(
+        return ContractCall(
             contract=self.nft_sales.contract,
             method_name="createAgreementAndPayEscrow",
             method_args={
@@ -213,25 +270,10 @@ class SubscriptionManager:  # pylint: disable=too-few-public-methods,too-many-in
                 "_amounts": amounts,
                 "_receivers": agreement.receivers,
             },
-            tx_args={
-                "sender_address": self.sender,
-                "value": tx_value,
-                "gas": 600000,
-            },
+            # Native token for Gnosis, 0 for Base
+            value=self.config.get_transaction_value(),
         )
 
-        # Wait for receipt
-        receipt = wait_for_receipt(tx_hash, self.ledger_api)
-
-        if receipt["status"] != 1:
-            raise RuntimeError(
-                f"Agreement creation failed. Transaction hash: {tx_hash}"
-            )
-
-        logger.info(f"Agreement created successfully. Tx hash: {tx_hash}")
-
-        return tx_hash
-
     def _fulfill_agreement(self, agreement: AgreementData) -> str:
         """
         Fulfill the subscription agreement.
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,10 +20,16 @@
 """Tool management, validation, and schema handling."""
 
 from mech_client.domain.tools.manager import ToolManager
+from mech_client.domain.tools.metadata_cache import (
+    ToolMetadataCache,
+    get_tool_metadata_cache,
+)
 from mech_client.domain.tools.models import ToolInfo, ToolsForMarketplaceMech
 
 __all__ = [
     "ToolManager",
     "ToolInfo",
+    "ToolMetadataCache",
     "ToolsForMarketplaceMech",
+    "get_tool_metadata_cache",
 ]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -21,15 +21,23 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
 from aea_ledger_ethereum import EthereumApi
+from eth_abi import decode as abi_decode
+from mech_client.domain.tools.metadata_cache import (
+    ToolMetadataCache,
+    get_tool_metadata_cache,
+)
 from mech_client.domain.tools.models import ToolInfo, ToolsForMarketplaceMech
 from mech_client.infrastructure.blockchain.abi_loader import get_abi
 from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.blockchain.multicall import multicall
+from mech_client.infrastructure.config.constants import TOOL_DISCOVERY_WORKERS
 from mech_client.infrastructure.config.loader import get_mech_config
+from mech_client.infrastructure.http import get_http_registry
 from web3.constants import ADDRESS_ZERO
 
 logger = logging.getLogger(__name__)
@@ -43,28 +51,103 @@ class ToolManager:
     """Manager for fetching and caching tool information.
 
     Provides methods for discovering tools, fetching metadata, and
-    retrieving tool schemas from marketplace mechs.
+    retrieving tool schemas from marketplace mechs. Metadata documents come
+    from a :class:`ToolMetadataCache` shared by every manager in the
+    process, so repeated lookups for one mech do no metadata I/O.
     """
 
-    def __init__(self, chain_config: str):
+    def __init__(
+        self, chain_config: str, metadata_cache: Optional[ToolMetadataCache] = None
+    ):
         """
         Initialize tool manager.
 
         :param chain_config: Chain configuration name (gnosis, base, etc.)
+        :param metadata_cache: Metadata cache (default: the process-wide one)
         """
         self.chain_config = chain_config
         self.mech_config = get_mech_config(chain_config)
         self.ledger_api = EthereumApi(**asdict(self.mech_config.ledger_config))
+        get_http_registry().attach_to_provider(self.ledger_api.api.provider)
+        self.metadata_cache = metadata_cache or get_tool_metadata_cache()
 
     def fetch_tools_metadata(self, service_id: int) -> Optional[Dict[str, Any]]:
         """
         Fetch tools metadata for specified service ID.
 
         Queries the complementary metadata hash contract to get the metadata
-        URI, then fetches the metadata from that URI.
+        URI, then fetches the metadata from that URI. Both are skipped while
+        the cached document is fresh (see :class:`ToolMetadataCache`).
 
         :param service_id: The service ID of the mech
         :return: Dictionary containing tools and metadata, or None if error
+        :raises ValueError: If metadata hash address not configured
+        """
+        self._check_metadata_contract()
+        try:
+            return self.metadata_cache.get(
+                self.chain_config,
+                service_id,
+                lambda: self._fetch_metadata_uri(service_id),
+                self._fetch_metadata_document,
+            )
+        except (json.JSONDecodeError, NotImplementedError, IOError) as e:
+            logger.error(f"Error fetching tools for service {service_id}: {e}")
+            return None
+
+    def fetch_tools_metadata_many(
+        self,
+        service_ids: Sequence[int],
+        max_workers: int = TOOL_DISCOVERY_WORKERS,
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Fetch the tools metadata of many services at once.
+
+        The metadata URIs of services without a fresh cache entry are read
+        with Multicall3 (one eth_call per batch instead of one per service),
+        then the documents are fetched concurrently on up to ``max_workers``
+        threads. A service whose metadata cannot be fetched maps to None; it
+        does not fail the others.
+
+        :param service_ids: Service IDs of the mechs
+        :param max_workers: Metadata documents fetched concurrently
+        :return: Metadata document (or None) by service ID, in input order
+        :raises ValueError: If metadata hash address not configured
+        """
+        self._check_metadata_contract()
+        service_ids = list(dict.fromkeys(service_ids))
+        if not service_ids:
+            return {}
+        uris = self._fetch_metadata_uris(
+            [
+                service_id
+                for service_id in service_ids
+                if not self.metadata_cache.is_fresh(self.chain_config, service_id)
+            ]
+        )
+
+        def _fetch(service_id: int) -> Optional[Dict[str, Any]]:
+            try:
+                return self.metadata_cache.get(
+                    self.chain_config,
+                    service_id,
+                    lambda: _required(uris.get(service_id), service_id),
+                    self._fetch_metadata_document,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Error fetching tools for service {service_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(service_ids))),
+            thread_name_prefix="tool-metadata",
+        ) as pool:
+            return dict(zip(service_ids, pool.map(_fetch, service_ids)))
+
+    def _check_metadata_contract(self) -> None:
+        """
+        Check the chain has a complementary metadata contract.
+
         :raises ValueError: If metadata hash address not configured
         """
         if self.mech_config.complementary_metadata_hash_address == ADDRESS_ZERO:
@@ -72,18 +155,80 @@ class ToolManager:
                 f"Metadata hash not yet implemented on {self.chain_config}"
             )
 
-        try:
-            abi = get_abi("ComplementaryServiceMetadata.json")
-            metadata_contract = get_contract(
-                self.mech_config.complementary_metadata_hash_address,
-                abi,
-                self.ledger_api,
+    def _fetch_metadata_uris(
+        self, service_ids: List[int]
+    ) -> Dict[int, Optional[str]]:
+        """
+        Read several services' metadata URIs in aggregated eth_calls.
+
+        :param service_ids: Service IDs of the mechs
+        :return: Metadata URI by service ID (None where the call failed)
+        """
+        if not service_ids:
+            return {}
+        metadata_contract = get_contract(
+            self.mech_config.complementary_metadata_hash_address,
+            get_abi("ComplementaryServiceMetadata.json"),
+            self.ledger_api,
+        )
+        results = multicall(
+            self.ledger_api,
+            [
+                (
+                    metadata_contract.address,
+                    metadata_contract.encode_abi("tokenURI", args=[service_id]),
+                )
+                for service_id in service_ids
+            ],
+        )
+        uris: Dict[int, Optional[str]] = {}
+        for service_id, data in zip(service_ids, results):
+            try:
+                uris[service_id] = abi_decode(["string"], data)[0] if data else None
+            except Exception:  # pylint: disable=broad-except
+                uris[service_id] = None
+        return uris
+
+    def _fetch_metadata_uri(self, service_id: int) -> str:
+        """
+        Read a service's metadata URI from the complementary metadata contract.
+
+        :param service_id: The service ID of the mech
+        :return: Metadata URI (tokenURI)
+        """
+        abi = get_abi("ComplementaryServiceMetadata.json")
+        metadata_contract = get_contract(
+            self.mech_config.complementary_metadata_hash_address,
+            abi,
+            self.ledger_api,
+        )
+        return metadata_contract.functions.tokenURI(service_id).call()
+
+    @staticmethod
+    def _fetch_metadata_document(
+        metadata_uri: str, etag: Optional[str]
+    ) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Fetch a metadata document, conditionally when an ETag is known.
+
+        :param metadata_uri: Metadata URI
+        :param etag: ETag of the cached copy, sent as If-None-Match
+        :return: (document, ETag), or None if the cached copy is current
+        :raises requests.HTTPError: On an error status, so an error body is
+            never cached as the document
+        """
+        if etag is None:
+            response = get_http_registry().get(metadata_uri, timeout=DEFAULT_TIMEOUT)
+        else:
+            response = get_http_registry().get(
+                metadata_uri,
+                timeout=DEFAULT_TIMEOUT,
+                headers={"If-None-Match": etag},
             )
-            metadata_uri = metadata_contract.functions.tokenURI(service_id).call()
-            return requests.get(metadata_uri, timeout=DEFAULT_TIMEOUT).json()
-        except (json.JSONDecodeError, NotImplementedError, IOError) as e:
-            logger.error(f"Error fetching tools for service {service_id}: {e}")
-            return None
+            if response.status_code == 304:
+                return None
+        response.raise_for_status()
+        return response.json(), response.headers.get("ETag")
 
     def get_offchain_url(self, service_id: int) -> str:
         """
@@ -119,7 +264,44 @@ class ToolManager:
         :param service_id: The service ID of the mech
         :return: ToolsForMarketplaceMech with tool list, or None if error
         """
-        metadata = self.fetch_tools_metadata(service_id)
+        return self._tools_from_metadata(
+            service_id, self.fetch_tools_metadata(service_id)
+        )
+
+    def get_tools_for_services(
+        self,
+        service_ids: Sequence[int],
+        max_workers: int = TOOL_DISCOVERY_WORKERS,
+    ) -> Dict[int, ToolsForMarketplaceMech]:
+        """
+        Get the tools of many marketplace mechs at once.
+
+        See :meth:`fetch_tools_metadata_many` for how metadata is fetched.
+
+        :param service_ids: Service IDs of the mechs
+        :param max_workers: Metadata documents fetched concurrently
+        :return: Tools by service ID, for the services that publish any
+        """
+        catalogue: Dict[int, ToolsForMarketplaceMech] = {}
+        for service_id, metadata in self.fetch_tools_metadata_many(
+            service_ids, max_workers
+        ).items():
+            tools = self._tools_from_metadata(service_id, metadata)
+            if tools is not None:
+                catalogue[service_id] = tools
+        return catalogue
+
+    @staticmethod
+    def _tools_from_metadata(
+        service_id: int, metadata: Optional[Dict[str, Any]]
+    ) -> Optional[ToolsForMarketplaceMech]:
+        """
+        Build a service's tool list from its metadata document.
+
+        :param service_id: The service ID of the mech
+        :param metadata: Metadata document (None if it could not be fetched)
+        :return: ToolsForMarketplaceMech with tool list, or None if no tools
+        """
         if not metadata:
             return None
 
@@ -209,3 +391,10 @@ class ToolManager:
 
         tool_name = parts[1]
         return service_id, tool_name
+
+
+def _required(uri: Optional[str], service_id: int) -> str:
+    """Return a bulk-read metadata URI, failing if its call did."""
+    if uri is None:
+        raise IOError(f"Could not read the metadata URI of service {service_id}")
+    return uri
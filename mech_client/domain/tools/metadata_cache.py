@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide cache of mech tool metadata documents.
+
+Resolving a mech's tools costs a ``tokenURI`` eth_call plus an HTTP GET of
+the metadata document, and one request can need them several times (tool
+validation, offchain URL discovery, descriptions, schemas). Documents are
+cached in memory and on disk per (chain, service ID), together with the
+tokenURI they were fetched from:
+
+- younger than ``ttl``: served without any I/O;
+- younger than ``stale_ttl``: served at once while a background thread
+  revalidates them;
+- older, or never fetched: revalidated before being returned.
+
+Revalidation re-reads the tokenURI. An unchanged IPFS URI names immutable
+content, so nothing is downloaded; other URIs are fetched with
+``If-None-Match`` when the server sent an ETag, and a 304 keeps the cached
+document.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+from mech_client.infrastructure.config.constants import (
+    TOOL_METADATA_STALE_TTL,
+    TOOL_METADATA_TTL,
+)
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+# Reads the service's current tokenURI
+ResolveUri = Callable[[], str]
+# Fetches (document, ETag) from a URI, sending the ETag as If-None-Match when
+# given; returns None when the server answers 304 Not Modified
+FetchDocument = Callable[
+    [str, Optional[str]], Optional[Tuple[Dict[str, Any], Optional[str]]]
+]
+
+
+def default_metadata_cache_dir() -> Path:
+    """
+    Return the on-disk cache location (``MECHX_METADATA_CACHE_DIR`` if set).
+
+    :return: Cache directory
+    """
+    configured = EnvironmentConfig.load().mechx_metadata_cache_dir
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "mech_client" / "tool_metadata"
+
+
+def is_content_addressed(uri: str) -> bool:
+    """
+    Return whether ``uri`` names immutable IPFS content.
+
+    :param uri: Metadata URI
+    :return: True for ``ipfs://`` URIs and gateway ``/ipfs/`` paths
+    """
+    return uri.startswith("ipfs://") or "/ipfs/" in urlsplit(uri).path
+
+
+@dataclass
+class CachedMetadata:
+    """A cached metadata document.
+
+    Attributes:
+        uri: tokenURI the document was fetched from
+        document: Parsed metadata document
+        etag: ETag the server returned with the document, if any
+        fetched_at: Unix time it was fetched or last revalidated
+    """
+
+    uri: str
+    document: Dict[str, Any]
+    etag: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+
+
+class ToolMetadataCache:
+    """Thread-safe TTL cache of tool metadata with stale-while-revalidate.
+
+    Entries are keyed by (chain, service ID) and remember the tokenURI they
+    came from, so a mech publishing new metadata is picked up on the next
+    revalidation. With a ``directory`` entries are also kept on disk, one
+    JSON file each, and survive the process.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        ttl: float = TOOL_METADATA_TTL,
+        stale_ttl: float = TOOL_METADATA_STALE_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param directory: On-disk cache directory (None: memory only)
+        :param ttl: Seconds an entry is served without revalidation
+        :param stale_ttl: Seconds an entry may be served while it is being
+            revalidated in the background
+        :param clock: Wall-clock time source
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.ttl = ttl
+        self.stale_ttl = max(ttl, stale_ttl)
+        self._clock = clock
+        self._entries: Dict[Tuple[str, int], CachedMetadata] = {}
+        self._refreshing: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        chain_config: str,
+        service_id: int,
+        resolve_uri: ResolveUri,
+        fetch_document: FetchDocument,
+    ) -> Dict[str, Any]:
+        """
+        Return the metadata document of a service.
+
+        :param chain_config: Chain configuration name
+        :param service_id: Service ID of the mech
+        :param resolve_uri: Reads the service's current tokenURI
+        :param fetch_document: Fetches a document (see :data:`FetchDocument`)
+        :return: Metadata document
+        """
+        key = (chain_config, service_id)
+        entry = self._lookup(key)
+        if entry is not None:
+            age = self._clock() - entry.fetched_at
+            if age < self.ttl:
+                return entry.document
+            if age < self.stale_ttl:
+                self._revalidate_in_background(key, entry, resolve_uri, fetch_document)
+                return entry.document
+        return self._revalidate(key, entry, resolve_uri, fetch_document).document
+
+    def is_fresh(self, chain_config: str, service_id: int) -> bool:
+        """
+        Return whether a service's entry would be served without any I/O.
+
+        :param chain_config: Chain configuration name
+        :param service_id: Service ID of the mech
+        :return: True if an entry younger than ``ttl`` is cached
+        """
+        entry = self._lookup((chain_config, service_id))
+        return entry is not None and self._clock() - entry.fetched_at < self.ttl
+
+    def invalidate(self, chain_config: str, service_id: int) -> None:
+        """
+        Drop a service's entry from memory and disk.
+
+        :param chain_config: Chain configuration name
+        :param service_id: Service ID of the mech
+        """
+        key = (chain_config, service_id)
+        with self._lock:
+            self._entries.pop(key, None)
+        path = self._path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _revalidate(
+        self,
+        key: Tuple[str, int],
+        entry: Optional[CachedMetadata],
+        resolve_uri: ResolveUri,
+        fetch_document: FetchDocument,
+    ) -> CachedMetadata:
+        """Re-read the tokenURI and refresh ``entry`` from it."""
+        uri = resolve_uri()
+        cached = entry if entry is not None and entry.uri == uri else None
+        if cached is not None and is_content_addressed(uri):
+            refreshed = replace(cached, fetched_at=self._clock())
+        else:
+            fetched = fetch_document(uri, cached.etag if cached else None)
+            if fetched is not None:
+                document, etag = fetched
+                refreshed = CachedMetadata(uri, document, etag, self._clock())
+            elif cached is not None:
+                refreshed = replace(cached, fetched_at=self._clock())
+            else:
+                raise IOError(f"{uri} answered Not Modified with nothing cached")
+        self._store(key, refreshed)
+        return refreshed
+
+    def _revalidate_in_background(
+        self,
+        key: Tuple[str, int],
+        entry: CachedMetadata,
+        resolve_uri: ResolveUri,
+        fetch_document: FetchDocument,
+    ) -> None:
+        """Start revalidating ``key`` unless that is already under way."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _run() -> None:
+            try:
+                self._revalidate(key, entry, resolve_uri, fetch_document)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning(
+                    f"Could not revalidate tool metadata for service {key[1]} "
+                    f"on {key[0]}; serving the cached copy: {e}"
+                )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=_run, name=f"tool-metadata-{key[0]}-{key[1]}", daemon=True
+        ).start()
+
+    def _path(self, key: Tuple[str, int]) -> Optional[Path]:
+        """Return the on-disk file of ``key`` (None without a directory)."""
+        if self.directory is None:
+            return None
+        return self.directory / f"{key[0]}-{key[1]}.json"
+
+    def _lookup(self, key: Tuple[str, int]) -> Optional[CachedMetadata]:
+        """Return the entry of ``key`` from memory, else from disk."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.pop("version", None) != CACHE_FORMAT_VERSION:
+                return None
+            entry = CachedMetadata(**data)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable metadata cache file {path}: {e}")
+            return None
+        with self._lock:
+            return self._entries.setdefault(key, entry)
+
+    def _store(self, key: Tuple[str, int], entry: CachedMetadata) -> None:
+        """Keep ``entry`` in memory and, atomically, on disk."""
+        with self._lock:
+            self._entries[key] = entry
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            content = json.dumps({"version": CACHE_FORMAT_VERSION, **asdict(entry)})
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temporary.write_text(content, encoding="utf-8")
+            os.replace(temporary, path)
+        except (OSError, TypeError, ValueError) as e:
+            # The in-memory entry still serves this process
+            logger.debug(f"Could not write metadata cache file {path}: {e}")
+
+
+_cache: Optional[ToolMetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_metadata_cache() -> ToolMetadataCache:
+    """
+    Return the process-wide tool metadata cache.
+
+    Every ToolManager shares it, so repeated lookups for the same mech do
+    no metadata I/O while the entry is fresh.
+
+    :return: Shared ToolMetadataCache backed by :func:`default_metadata_cache_dir`
+    """
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            _cache = ToolMetadataCache(default_metadata_cache_dir())
+        return _cache
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,18 +17,132 @@
 #
 # ------------------------------------------------------------------------------
 
-"""Blockchain infrastructure for Web3 interactions, contracts, and Safe integration."""
+"""Blockchain infrastructure for Web3 interactions, contracts, and Safe integration.
 
-from mech_client.infrastructure.blockchain.abi_loader import get_abi
-from mech_client.infrastructure.blockchain.receipt_waiter import (
-    wait_for_receipt,
-    watch_for_marketplace_request_ids,
-)
-from mech_client.infrastructure.blockchain.safe_client import SafeClient
+Attributes are imported on first access, so using one module (e.g. the ABI
+loader) does not import the Safe client and its dependencies. ``multicall``
+is imported from its module, whose name it shares.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mech_client.infrastructure.blockchain.abi_loader import get_abi
+    from mech_client.infrastructure.blockchain.broadcast import (
+        BroadcastError,
+        BroadcastQueue,
+        BroadcastResult,
+        get_broadcast_queue,
+        send_raw_transactions,
+    )
+    from mech_client.infrastructure.blockchain.fee_oracle import (
+        FeeData,
+        FeeOracle,
+        get_fee_oracle,
+    )
+    from mech_client.infrastructure.blockchain.gas_model import GasModel, get_gas_model
+    from mech_client.infrastructure.blockchain.nonce_manager import (
+        NonceManager,
+        get_nonce_manager,
+    )
+    from mech_client.infrastructure.blockchain.presigned import (
+        PresignedTransaction,
+        read_presigned,
+        write_presigned,
+    )
+    from mech_client.infrastructure.blockchain.receipt_waiter import (
+        ReceiptWaiter,
+        fetch_receipts,
+        get_receipt_waiter,
+        wait_for_receipt,
+        wait_for_receipt_async,
+        watch_for_marketplace_request_ids,
+    )
+    from mech_client.infrastructure.blockchain.safe_client import SafeClient
+    from mech_client.infrastructure.blockchain.safe_nonce_manager import (
+        SafeNonceManager,
+        get_safe_nonce_manager,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "get_abi": "mech_client.infrastructure.blockchain.abi_loader",
+    "BroadcastError": "mech_client.infrastructure.blockchain.broadcast",
+    "BroadcastQueue": "mech_client.infrastructure.blockchain.broadcast",
+    "BroadcastResult": "mech_client.infrastructure.blockchain.broadcast",
+    "get_broadcast_queue": "mech_client.infrastructure.blockchain.broadcast",
+    "send_raw_transactions": "mech_client.infrastructure.blockchain.broadcast",
+    "FeeData": "mech_client.infrastructure.blockchain.fee_oracle",
+    "FeeOracle": "mech_client.infrastructure.blockchain.fee_oracle",
+    "get_fee_oracle": "mech_client.infrastructure.blockchain.fee_oracle",
+    "GasModel": "mech_client.infrastructure.blockchain.gas_model",
+    "get_gas_model": "mech_client.infrastructure.blockchain.gas_model",
+    "NonceManager": "mech_client.infrastructure.blockchain.nonce_manager",
+    "get_nonce_manager": "mech_client.infrastructure.blockchain.nonce_manager",
+    "PresignedTransaction": "mech_client.infrastructure.blockchain.presigned",
+    "read_presigned": "mech_client.infrastructure.blockchain.presigned",
+    "write_presigned": "mech_client.infrastructure.blockchain.presigned",
+    "ReceiptWaiter": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "fetch_receipts": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "get_receipt_waiter": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "wait_for_receipt": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "wait_for_receipt_async": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "watch_for_marketplace_request_ids": "mech_client.infrastructure.blockchain.receipt_waiter",
+    "SafeClient": "mech_client.infrastructure.blockchain.safe_client",
+    "SafeNonceManager": "mech_client.infrastructure.blockchain.safe_nonce_manager",
+    "get_safe_nonce_manager": "mech_client.infrastructure.blockchain.safe_nonce_manager",
+}
 
 __all__ = [
     "get_abi",
+    "BroadcastError",
+    "BroadcastQueue",
+    "BroadcastResult",
+    "get_broadcast_queue",
+    "send_raw_transactions",
+    "FeeData",
+    "FeeOracle",
+    "get_fee_oracle",
+    "GasModel",
+    "get_gas_model",
+    "NonceManager",
+    "get_nonce_manager",
+    "PresignedTransaction",
+    "read_presigned",
+    "write_presigned",
+    "ReceiptWaiter",
+    "fetch_receipts",
+    "get_receipt_waiter",
     "wait_for_receipt",
+    "wait_for_receipt_async",
     "watch_for_marketplace_request_ids",
     "SafeClient",
+    "SafeNonceManager",
+    "get_safe_nonce_manager",
 ]
+
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an attribute on first access (PEP 562).
+
+    :param name: Attribute name
+    :return: The attribute
+    :raises AttributeError: If the package has no such attribute
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package's attributes, including those not imported yet.
+
+    :return: Attribute names
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
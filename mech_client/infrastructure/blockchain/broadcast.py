@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Batched broadcasting of signed raw transactions.
+
+Each ``send_signed_transaction`` is its own HTTP round-trip, so a workload
+that signs a hundred approvals, deposits and requests pays a hundred
+round-trips just to hand them to the node. ``BroadcastQueue`` collects
+signed raw transactions and submits them as JSON-RPC batches of
+``eth_sendRawTransaction``. A transaction's hash is ``keccak(raw)``, so it
+is known the moment it is queued; receipt waiters flush the queue before
+polling, which makes queued hashes safe to wait on straight away.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from aea_ledger_ethereum import EthereumApi
+from eth_utils import keccak
+from hexbytes import HexBytes
+from mech_client.infrastructure.blockchain.nonce_manager import (
+    get_nonce_manager,
+    is_nonce_conflict,
+)
+from mech_client.infrastructure.config.constants import (
+    BROADCAST_BATCH_SIZE,
+    BROADCAST_FAILURES_MAX,
+)
+
+RawTransaction = Union[bytes, str]
+
+
+class BroadcastError(Exception):
+    """Raised when the node rejected a queued raw transaction."""
+
+    def __init__(self, tx_hash: str, message: str) -> None:
+        """
+        Initialize the error.
+
+        :param tx_hash: Hash of the rejected transaction
+        :param message: Error reported by the node
+        """
+        super().__init__(f"Broadcast of {tx_hash} failed: {message}")
+        self.tx_hash = tx_hash
+        self.message = message
+
+
+@dataclass
+class BroadcastResult:
+    """Outcome of one ``eth_sendRawTransaction``.
+
+    Attributes:
+        tx_hash: Transaction hash (0x-prefixed, computed from the raw bytes)
+        error: Node error message, or None if the node accepted it
+    """
+
+    tx_hash: str
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the node accepted the transaction."""
+        return self.error is None
+
+
+def raw_transaction_hash(raw_transaction: RawTransaction) -> str:
+    """
+    Compute the hash of a signed raw transaction.
+
+    :param raw_transaction: Signed transaction bytes (or 0x-hex)
+    :return: 0x-prefixed transaction hash
+    """
+    return "0x" + keccak(HexBytes(raw_transaction)).hex()
+
+
+def _error_message(response: Any) -> Optional[str]:
+    """Extract the error message from a JSON-RPC response, if any."""
+    if not isinstance(response, dict):
+        return f"malformed response: {response!r}"
+    error = response.get("error")
+    if error is None:
+        return None
+    if isinstance(error, dict):
+        return str(error.get("message", error))
+    return str(error)
+
+
+def send_raw_transactions(
+    ledger_api: EthereumApi,
+    raw_transactions: Sequence[RawTransaction],
+    batch_size: int = BROADCAST_BATCH_SIZE,
+) -> List[BroadcastResult]:
+    """
+    Broadcast signed transactions with batched ``eth_sendRawTransaction``.
+
+    Sends ``ceil(len / batch_size)`` HTTP requests. A batch the provider or
+    RPC rejects as a whole is re-sent one transaction at a time, so every
+    transaction gets its own result.
+
+    :param ledger_api: Ethereum API for the target chain
+    :param raw_transactions: Signed transactions, in nonce order per sender
+    :param batch_size: Transactions per JSON-RPC batch
+    :return: One result per transaction, in input order
+    """
+    web3 = ledger_api.api
+    results: List[BroadcastResult] = []
+    for start in range(0, len(raw_transactions), batch_size):
+        chunk = [HexBytes(raw) for raw in raw_transactions[start : start + batch_size]]
+        hashes = [raw_transaction_hash(raw) for raw in chunk]
+        responses: Optional[List[Any]] = None
+        if len(chunk) > 1:
+            try:
+                batch = web3.provider.make_batch_request(
+                    [("eth_sendRawTransaction", [raw.to_0x_hex()]) for raw in chunk]
+                )
+                if isinstance(batch, list) and len(batch) == len(chunk):
+                    responses = batch
+            except Exception:  # pylint: disable=broad-except
+                responses = None
+        if responses is not None:
+            results.extend(
+                BroadcastResult(tx_hash, _error_message(response))
+                for tx_hash, response in zip(hashes, responses)
+            )
+            continue
+        for tx_hash, raw in zip(hashes, chunk):
+            try:
+                web3.eth.send_raw_transaction(raw)
+                results.append(BroadcastResult(tx_hash))
+            except Exception as e:  # pylint: disable=broad-except
+                results.append(BroadcastResult(tx_hash, str(e)))
+    return results
+
+
+@dataclass
+class _Queued:
+    """A signed transaction waiting to be broadcast."""
+
+    raw: HexBytes
+    tx_hash: str
+    sender: Optional[str]
+    nonce: Optional[int]
+
+
+class BroadcastQueue:
+    """Thread-safe queue of signed transactions broadcast in batches.
+
+    ``enqueue`` returns the transaction hash immediately; the transaction
+    goes out on the next ``flush`` (called by receipt waiters before every
+    poll, or automatically once ``batch_size`` transactions are queued).
+    Rejections are remembered per hash until ``pop_failure`` claims them
+    (at most ``max_failures``, oldest dropped first, so rejections nobody
+    waits for do not accumulate); nonces of rejected transactions are handed back to the shared
+    :class:`NonceManager` (or resynced on a nonce conflict).
+    """
+
+    def __init__(
+        self,
+        ledger_api: EthereumApi,
+        batch_size: int = BROADCAST_BATCH_SIZE,
+        max_failures: int = BROADCAST_FAILURES_MAX,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        :param ledger_api: Ethereum API for the target chain
+        :param batch_size: Transactions per JSON-RPC batch (and auto-flush size)
+        :param max_failures: Unclaimed rejections remembered at most
+        """
+        self.ledger_api = ledger_api
+        self.batch_size = batch_size
+        self.max_failures = max_failures
+        self._queued: List[_Queued] = []
+        self._failures: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of transactions queued but not yet broadcast."""
+        with self._lock:
+            return len(self._queued)
+
+    def enqueue(
+        self,
+        raw_transaction: RawTransaction,
+        sender: Optional[str] = None,
+        nonce: Optional[int] = None,
+    ) -> str:
+        """
+        Queue a signed transaction for the next batched broadcast.
+
+        :param raw_transaction: Signed transaction bytes (or 0x-hex)
+        :param sender: Sender address, to return the nonce on rejection
+        :param nonce: Transaction nonce, to return it on rejection
+        :return: Transaction hash
+        """
+        raw = HexBytes(raw_transaction)
+        tx_hash = raw_transaction_hash(raw)
+        with self._lock:
+            self._queued.append(_Queued(raw, tx_hash, sender, nonce))
+            full = len(self._queued) >= self.batch_size
+        if full:
+            self.flush()
+        return tx_hash
+
+    def flush(self) -> List[BroadcastResult]:
+        """
+        Broadcast every queued transaction.
+
+        :return: One result per broadcast transaction, in queue order
+        """
+        with self._flush_lock:
+            with self._lock:
+                queued, self._queued = self._queued, []
+            if not queued:
+                return []
+            results = send_raw_transactions(
+                self.ledger_api, [item.raw for item in queued], self.batch_size
+            )
+            for item, result in zip(queued, results):
+                if result.ok:
+                    continue
+                with self._lock:
+                    self._failures[item.tx_hash] = str(result.error)
+                    while len(self._failures) > self.max_failures:
+                        self._failures.popitem(last=False)
+                self._return_nonce(item, str(result.error))
+            return results
+
+    def _return_nonce(self, item: _Queued, error: str) -> None:
+        """Hand a rejected transaction's nonce back to the nonce manager."""
+        if item.sender is None or item.nonce is None:
+            return
+        manager = get_nonce_manager(self.ledger_api)
+        if is_nonce_conflict(Exception(error)):
+            manager.resync(item.sender)
+        else:
+            manager.release(item.sender, item.nonce)
+
+    def pop_failure(self, tx_hash: str) -> Optional[BroadcastError]:
+        """
+        Return (and forget) the rejection of a queued transaction, if any.
+
+        :param tx_hash: Hash returned by enqueue
+        :return: BroadcastError if the node rejected it, else None
+        """
+        with self._lock:
+            message = self._failures.pop(tx_hash, None)
+        return None if message is None else BroadcastError(tx_hash, message)
+
+    @contextmanager
+    def batch(self) -> Iterator["BroadcastQueue"]:
+        """
+        Flush everything queued inside the block when it exits.
+
+        :yield: This queue
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
+
+
+_queues: Dict[Any, BroadcastQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_broadcast_queue(ledger_api: EthereumApi) -> BroadcastQueue:
+    """
+    Return the process-wide broadcast queue for the ledger's chain.
+
+    :param ledger_api: Ethereum API for the target chain
+    :return: Shared BroadcastQueue
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _queues_lock:
+        queue = _queues.get(key)
+        if queue is None:
+            queue = BroadcastQueue(ledger_api)
+            _queues[key] = queue
+        return queue
+
+
+def flush_broadcasts(ledger_api: EthereumApi) -> None:
+    """
+    Flush the chain's broadcast queue if anything is waiting in it.
+
+    :param ledger_api: Ethereum API for the target chain
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _queues_lock:
+        queue = _queues.get(key)
+    if queue is not None and queue.pending:
+        queue.flush()
+
+
+def pop_broadcast_failure(
+    ledger_api: EthereumApi, tx_hash: str
+) -> Optional[BroadcastError]:
+    """
+    Return the rejection of a transaction queued on the chain, if any.
+
+    :param ledger_api: Ethereum API for the target chain
+    :param tx_hash: Transaction hash
+    :return: BroadcastError if the node rejected it, else None
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _queues_lock:
+        queue = _queues.get(key)
+    return None if queue is None else queue.pop_failure(tx_hash)
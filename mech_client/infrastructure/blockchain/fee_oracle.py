@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Per-block fee data cache shared by every transaction builder on a chain.
+
+Pricing a transaction through ``EthereumApi.try_get_gas_pricing`` costs a
+``get_block`` plus an ``eth_feeHistory`` call, and signers fall back to
+``eth_gasPrice`` on top of that - for every transaction, even when dozens
+are built within one block. ``FeeOracle`` prices from a single
+``eth_feeHistory`` call (next-block base fee and a percentile of recent
+tips) and reuses the result until a newer block is seen or about one block
+time has passed.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aea_ledger_ethereum import (
+    DEFAULT_EIP1559_STRATEGY,
+    EIP1559,
+    EthereumApi,
+    get_base_fee_multiplier,
+)
+from mech_client.infrastructure.blockchain.receipt_waiter import estimate_block_time
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeeData:
+    """Fee snapshot for one block.
+
+    Attributes:
+        block_number: Newest block the snapshot was computed from
+        fees: Transaction fee fields (EIP-1559 or legacy ``gasPrice``)
+        fetched_at: Monotonic time of the fetch
+    """
+
+    block_number: Optional[int]
+    fees: Dict[str, int]
+    fetched_at: float
+
+
+def percentile_tip(
+    rewards: List[int], min_allowed_tip: int, increase_boundary: int
+) -> int:
+    """
+    Pick a priority fee from per-block tip percentiles.
+
+    Takes the median of the rewards at or above the chain's minimum tip. If
+    the upper half starts with a jump larger than ``increase_boundary``
+    percent, the cheap outliers below the jump are discarded first (the
+    same rule ``aea-ledger-ethereum`` applies).
+
+    :param rewards: One tip per block at the requested percentile (wei)
+    :param min_allowed_tip: Lowest tip the chain accepts (wei)
+    :param increase_boundary: Percentage jump treated as an outlier boundary
+    :return: Priority fee in wei
+    """
+    values = sorted(reward for reward in rewards if reward >= min_allowed_tip)
+    if not values:
+        return min_allowed_tip
+    increases = [
+        (high - low) * 100 / low if low else 0
+        for low, high in zip(values[:-1], values[1:])
+    ]
+    if increases:
+        jump_index = increases.index(max(increases))
+        if (
+            increases[jump_index] > increase_boundary
+            and jump_index >= len(values) // 2
+        ):
+            values = values[jump_index:]
+    return values[len(values) // 2]
+
+
+class FeeOracle:
+    """Thread-safe fee cache refreshed at most once per block.
+
+    Uses the ledger's own EIP-1559 strategy settings (tip floor, fee
+    ceiling, fallback estimate), so cached prices match what the ledger
+    would have computed. Chains configured for a non-EIP-1559 strategy are
+    priced through the ledger and cached all the same; nodes without
+    ``eth_feeHistory`` fall back to a cached ``eth_gasPrice``.
+    """
+
+    def __init__(
+        self,
+        ledger_api: EthereumApi,
+        tip_percentile: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the oracle.
+
+        :param ledger_api: Ethereum API for the target chain
+        :param tip_percentile: Percentile of recent tips to pay
+            (default: MECHX_FEE_TIP_PERCENTILE, else the ledger's strategy)
+        :param ttl: Seconds a snapshot stays valid (default: block time)
+        """
+        self.ledger_api = ledger_api
+        strategies = getattr(ledger_api, "_gas_price_strategies", None)
+        self.strategy: Dict[str, Any] = {
+            **DEFAULT_EIP1559_STRATEGY,
+            **(strategies.get(EIP1559, {}) if isinstance(strategies, dict) else {}),
+        }
+        if tip_percentile is None:
+            tip_percentile = EnvironmentConfig.load().mechx_fee_tip_percentile
+        if tip_percentile is not None:
+            self.strategy["fee_history_percentile"] = tip_percentile
+        self.ttl = ttl if ttl is not None else estimate_block_time(ledger_api)
+        self._snapshot: Optional[FeeData] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _uses_eip1559(self) -> bool:
+        """Whether the ledger is configured for the EIP-1559 strategy."""
+        strategy = getattr(self.ledger_api, "_default_gas_price_strategy", EIP1559)
+        return not isinstance(strategy, str) or strategy == EIP1559
+
+    def _is_fresh(self, snapshot: Optional[FeeData]) -> bool:
+        """Check whether a snapshot can still be served."""
+        return (
+            snapshot is not None
+            and time.monotonic() - snapshot.fetched_at < self.ttl
+        )
+
+    def _fetch_eip1559(self) -> FeeData:
+        """Price from one ``eth_feeHistory`` call."""
+        eth = self.ledger_api.api.eth
+        history = eth.fee_history(
+            int(self.strategy["fee_history_blocks"]),
+            "latest",
+            [self.strategy["fee_history_percentile"]],
+        )
+        base_fees = history.get("baseFeePerGas") or []
+        if not base_fees:
+            raise ValueError("eth_feeHistory returned no base fees")
+        # The last entry is the base fee of the next (pending) block.
+        base_fee = int(base_fees[-1])
+        block_number = int(history["oldestBlock"]) + len(base_fees) - 2
+        if self.strategy.get("default_priority_fee") is not None:
+            tip = int(self.strategy["default_priority_fee"])
+        else:
+            rewards = [
+                int(reward[0]) for reward in history.get("reward") or [] if reward
+            ]
+            tip = percentile_tip(
+                rewards,
+                int(self.strategy["min_allowed_tip"]),
+                int(self.strategy["priority_fee_increase_boundary"]),
+            )
+        max_fee = int(
+            base_fee * get_base_fee_multiplier(Web3.from_wei(base_fee, "gwei"))
+        )
+        if tip > max_fee:
+            max_fee += tip
+        max_gas_fast = self.strategy["max_gas_fast"]
+        if (
+            Web3.from_wei(max_fee, "gwei") >= max_gas_fast
+            or Web3.from_wei(tip, "gwei") >= max_gas_fast
+        ):
+            logger.warning(
+                f"Fee estimate above max_gas_fast ({max_gas_fast} gwei); "
+                "using the fallback estimate."
+            )
+            fees = dict(self.strategy["fallback_estimate"])
+        else:
+            fees = {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": tip}
+        return FeeData(block_number, fees, time.monotonic())
+
+    def _fetch(self) -> FeeData:
+        """Fetch a fresh snapshot, falling back to ``eth_gasPrice``."""
+        if self._uses_eip1559:
+            try:
+                return self._fetch_eip1559()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug(f"eth_feeHistory unavailable, using eth_gasPrice: {e}")
+        else:
+            fees = self.ledger_api.try_get_gas_pricing(raise_on_try=True)
+            if fees:
+                return FeeData(None, dict(fees), time.monotonic())
+        gas_price = int(self.ledger_api.api.eth.gas_price)
+        return FeeData(None, {"gasPrice": gas_price}, time.monotonic())
+
+    def snapshot(self) -> FeeData:
+        """
+        Return the current fee snapshot, refreshing it when stale.
+
+        Concurrent callers share a single refresh.
+
+        :return: Fee snapshot
+        """
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot  # type: ignore[return-value]
+        with self._lock:
+            if not self._is_fresh(self._snapshot):
+                self._snapshot = self._fetch()
+            return self._snapshot  # type: ignore[return-value]
+
+    def fees(self) -> Dict[str, int]:
+        """
+        Return transaction fee fields for a new transaction.
+
+        :return: ``maxFeePerGas``/``maxPriorityFeePerGas``, or ``gasPrice``
+        """
+        return dict(self.snapshot().fees)
+
+    def gas_price(self) -> int:
+        """
+        Return a single per-gas price (for legacy transactions).
+
+        :return: ``gasPrice``, or ``maxFeePerGas`` on EIP-1559 chains
+        """
+        fees = self.snapshot().fees
+        return int(fees.get("gasPrice", fees.get("maxFeePerGas", 0)))
+
+    def observe_block(self, block_number: int) -> None:
+        """
+        Drop the snapshot once a newer block is known.
+
+        Callers that already poll the head (receipt waiters, supervisors)
+        pass it here so prices follow new heads without extra RPCs.
+
+        :param block_number: Latest block number seen by the caller
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if (
+                snapshot is not None
+                and snapshot.block_number is not None
+                and block_number > snapshot.block_number
+            ):
+                self._snapshot = None
+
+    def invalidate(self) -> None:
+        """Force the next call to refetch."""
+        with self._lock:
+            self._snapshot = None
+
+
+_oracles: Dict[Any, FeeOracle] = {}
+_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(ledger_api: EthereumApi) -> FeeOracle:
+    """
+    Return the process-wide fee oracle for the ledger's chain.
+
+    :param ledger_api: Ethereum API for the target chain
+    :return: Shared FeeOracle
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _oracles_lock:
+        oracle = _oracles.get(key)
+        if oracle is None:
+            oracle = FeeOracle(ledger_api)
+            _oracles[key] = oracle
+        return oracle
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Learned gas limits for repeated contract calls.
+
+Marketplace traffic is a handful of call shapes (``request``,
+``requestBatch`` of N, ``approve``, ...) whose gas usage barely moves, yet
+each one pays an ``eth_estimateGas`` round-trip. ``GasModel`` records the
+``gasUsed`` of mined transactions per call shape and predicts the limit for
+the next one (largest recent sample plus a safety margin), so the estimate
+can be skipped. Predictions expire after a TTL or a number of uses, which
+forces an occasional real estimate to keep the model honest.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Hashable, Mapping, Optional, Tuple
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.infrastructure.config.constants import (
+    GAS_MODEL_MARGIN,
+    GAS_MODEL_REFRESH_EVERY,
+    GAS_MODEL_TTL,
+    GAS_MODEL_WINDOW,
+)
+
+# Upper bound on submitted-but-unobserved transactions remembered for
+# learning; the oldest are dropped first (their receipts were never awaited).
+_MAX_TRACKED_TRANSACTIONS = 4096
+
+GasKey = Tuple[Hashable, ...]
+
+
+def contract_call_key(
+    contract_address: str,
+    method_name: str,
+    method_args: Mapping[str, Any],
+    value: int = 0,
+) -> GasKey:
+    """
+    Derive the call-shape key a gas sample is filed under.
+
+    Calls share a key when they hit the same method on the same contract
+    with equally long list arguments (batch size), the same payment type,
+    and the same zero/non-zero native value.
+
+    :param contract_address: Target contract address
+    :param method_name: Contract method name
+    :param method_args: Contract method arguments
+    :param value: Native value attached to the call
+    :return: Hashable call-shape key
+    """
+    batch_shape = tuple(
+        sorted(
+            (name, len(arg))
+            for name, arg in method_args.items()
+            if isinstance(arg, (list, tuple))
+        )
+    )
+    payment_type = method_args.get("paymentType")
+    if isinstance(payment_type, (bytes, bytearray)):
+        payment_type = bytes(payment_type).hex()
+    return (
+        contract_address.lower(),
+        method_name,
+        batch_shape,
+        payment_type,
+        bool(value),
+    )
+
+
+@dataclass
+class _GasSamples:
+    """Recent gas observations for one call shape."""
+
+    samples: Deque[int] = field(
+        default_factory=lambda: deque(maxlen=GAS_MODEL_WINDOW)
+    )
+    learned_at: float = 0.0
+    predictions: int = 0
+
+
+class GasModel:
+    """Thread-safe cache of observed gas usage per call shape."""
+
+    def __init__(
+        self,
+        margin: float = GAS_MODEL_MARGIN,
+        ttl: float = GAS_MODEL_TTL,
+        refresh_every: int = GAS_MODEL_REFRESH_EVERY,
+    ) -> None:
+        """
+        Initialize the model.
+
+        :param margin: Multiplier applied to the largest recent sample
+        :param ttl: Seconds after the last observation before a re-estimate
+        :param refresh_every: Predictions served before a re-estimate
+        """
+        self.margin = margin
+        self.ttl = ttl
+        self.refresh_every = refresh_every
+        self._shapes: Dict[GasKey, _GasSamples] = {}
+        self._pending: "OrderedDict[str, GasKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def predict(self, key: GasKey, margin: Optional[float] = None) -> Optional[int]:
+        """
+        Predict the gas limit for a call shape.
+
+        :param key: Call-shape key
+        :param margin: Override the model's safety margin
+        :return: Gas limit, or None when the caller should estimate
+        """
+        with self._lock:
+            entry = self._shapes.get(key)
+            if entry is None or not entry.samples:
+                return None
+            if (
+                time.monotonic() - entry.learned_at > self.ttl
+                or entry.predictions >= self.refresh_every
+            ):
+                return None
+            entry.predictions += 1
+            return int(max(entry.samples) * (margin or self.margin))
+
+    def observe(self, key: GasKey, gas: int) -> None:
+        """
+        Record a gas figure (receipt ``gasUsed`` or a fresh estimate).
+
+        :param key: Call-shape key
+        :param gas: Observed gas
+        """
+        with self._lock:
+            entry = self._shapes.setdefault(key, _GasSamples())
+            entry.samples.append(int(gas))
+            entry.learned_at = time.monotonic()
+            entry.predictions = 0
+
+    def track(self, tx_hash: str, key: GasKey) -> None:
+        """
+        Remember a submitted transaction so its receipt can be learned from.
+
+        :param tx_hash: Submitted transaction hash
+        :param key: Call-shape key of the transaction
+        """
+        with self._lock:
+            self._pending[tx_hash] = key
+            while len(self._pending) > _MAX_TRACKED_TRANSACTIONS:
+                self._pending.popitem(last=False)
+
+    def observe_receipt(self, tx_hash: str, receipt: Mapping[str, Any]) -> None:
+        """
+        Learn from the receipt of a tracked transaction.
+
+        Reverted transactions are ignored; their gas usage says nothing
+        about what a successful call needs.
+
+        :param tx_hash: Hash the transaction was tracked under
+        :param receipt: Mined transaction receipt
+        """
+        with self._lock:
+            key = self._pending.pop(tx_hash, None)
+        if key is None or receipt.get("status") != 1:
+            return
+        gas_used = receipt.get("gasUsed")
+        if isinstance(gas_used, int) and gas_used > 0:
+            self.observe(key, gas_used)
+
+
+_models: Dict[Any, GasModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_gas_model(ledger_api: EthereumApi) -> GasModel:
+    """
+    Return the process-wide gas model for the ledger's chain.
+
+    :param ledger_api: Ethereum API for the target chain
+    :return: Shared GasModel
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = GasModel()
+            _models[key] = model
+        return model
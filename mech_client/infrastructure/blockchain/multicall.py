@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Read-only call aggregation through Multicall3."""
+
+import logging
+from typing import List, Optional, Sequence, Tuple, Union
+
+from aea_ledger_ethereum import EthereumApi
+from hexbytes import HexBytes
+from mech_client.infrastructure.blockchain.abi_loader import get_abi
+from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.config.constants import (
+    MULTICALL3_ADDRESS,
+    MULTICALL_BATCH_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# (target contract address, calldata)
+Call = Tuple[str, Union[bytes, str]]
+
+
+def multicall(
+    ledger_api: EthereumApi,
+    calls: Sequence[Call],
+    batch_size: int = MULTICALL_BATCH_SIZE,
+) -> List[Optional[bytes]]:
+    """
+    Run read-only calls with one ``aggregate3`` eth_call per batch.
+
+    Every call may fail on its own (``allowFailure``): its result is then
+    None and the others are unaffected. A batch the node rejects as a whole
+    (no Multicall3 on the chain, or a response too large) is re-run one
+    ``eth_call`` at a time.
+
+    :param ledger_api: Ethereum API for the target chain
+    :param calls: ``(target, calldata)`` pairs
+    :param batch_size: Calls aggregated per eth_call
+    :return: Return data per call, in input order (None where it failed)
+    """
+    multicall3 = get_contract(
+        MULTICALL3_ADDRESS, get_abi("Multicall3.json"), ledger_api
+    )
+    results: List[Optional[bytes]] = []
+    for start in range(0, len(calls), batch_size):
+        chunk = [
+            (target, HexBytes(data))
+            for target, data in calls[start : start + batch_size]
+        ]
+        try:
+            aggregated = multicall3.functions.aggregate3(
+                [(target, True, data) for target, data in chunk]
+            ).call()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Multicall3 batch failed, calling one by one: {e}")
+            results.extend(_call_each(ledger_api, chunk))
+            continue
+        results.extend(
+            bytes(return_data) if success else None
+            for success, return_data in aggregated
+        )
+    return results
+
+
+def _call_each(
+    ledger_api: EthereumApi, calls: Sequence[Tuple[str, HexBytes]]
+) -> List[Optional[bytes]]:
+    """Run each call as its own eth_call (None where it fails)."""
+    results: List[Optional[bytes]] = []
+    for target, data in calls:
+        try:
+            result = ledger_api.api.eth.call({"to": target, "data": data})
+            results.append(bytes(result))
+        except Exception:  # pylint: disable=broad-except
+            results.append(None)
+    return results
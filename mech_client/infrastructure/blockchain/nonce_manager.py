@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide EOA nonce allocation for pipelined transactions.
+
+Fetching ``get_transaction_count(address)`` per transaction hands the same
+nonce to every transaction sent before the previous one is mined, so a key
+can only have one transaction in flight. ``NonceManager`` seeds each account
+from the node's *pending* count once and then allocates nonces locally, so
+several transactions per key can be broadcast back to back.
+"""
+
+import bisect
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from aea_ledger_ethereum import EthereumApi
+
+# Substrings of node errors meaning the nonce we used is already taken,
+# i.e. our local view is behind the chain and must be resynced.
+NONCE_CONFLICT_ERRORS = (
+    "nonce too low",
+    "already known",
+    "replacement transaction underpriced",
+)
+
+
+def is_nonce_conflict(error: BaseException) -> bool:
+    """
+    Check whether a broadcast error means the nonce was already used.
+
+    :param error: Exception raised while sending a transaction
+    :return: True if the local nonce view is stale
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_CONFLICT_ERRORS)
+
+
+@dataclass
+class _AccountNonces:
+    """Local nonce bookkeeping for one account."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    next_nonce: Optional[int] = None
+    gaps: List[int] = field(default_factory=list)
+    in_flight: Set[int] = field(default_factory=set)
+
+
+class NonceManager:
+    """Thread-safe, pending-aware nonce allocator for EOA accounts.
+
+    Nonces are reserved before a transaction is broadcast and then either
+    confirmed (the node accepted it) or released (sending failed). Released
+    nonces below the high-water mark are kept as gaps and handed out first,
+    so a failed send does not strand every later transaction behind a hole.
+    A nonce conflict reported by the node triggers a resync from the
+    pending count.
+    """
+
+    def __init__(self, ledger_api: EthereumApi) -> None:
+        """
+        Initialize the nonce manager.
+
+        :param ledger_api: Ethereum API used to read pending transaction counts
+        """
+        self.ledger_api = ledger_api
+        self._accounts: Dict[str, _AccountNonces] = {}
+        self._lock = threading.Lock()
+
+    def _account(self, address: str) -> _AccountNonces:
+        """Return the bookkeeping entry for ``address``, creating it if needed."""
+        key = address.lower()
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is None:
+                account = _AccountNonces()
+                self._accounts[key] = account
+            return account
+
+    def _pending_count(self, address: str) -> int:
+        """Read the node's pending transaction count for ``address``."""
+        return int(
+            self.ledger_api.api.eth.get_transaction_count(address, "pending")
+        )
+
+    def _ensure_seeded(self, address: str, account: _AccountNonces) -> int:
+        """Seed the account from the chain on first use (lock must be held)."""
+        if account.next_nonce is None:
+            account.next_nonce = self._pending_count(address)
+        return account.next_nonce
+
+    def peek(self, address: str) -> int:
+        """
+        Return the nonce the next reservation would get, without reserving it.
+
+        :param address: Sender address
+        :return: Next nonce
+        """
+        account = self._account(address)
+        with account.lock:
+            next_nonce = self._ensure_seeded(address, account)
+            return account.gaps[0] if account.gaps else next_nonce
+
+    def reserve(self, address: str) -> int:
+        """
+        Reserve the next nonce for ``address``.
+
+        :param address: Sender address
+        :return: Reserved nonce; must later be confirmed or released
+        """
+        account = self._account(address)
+        with account.lock:
+            next_nonce = self._ensure_seeded(address, account)
+            if account.gaps:
+                nonce = account.gaps.pop(0)
+            else:
+                nonce = next_nonce
+                account.next_nonce = next_nonce + 1
+            account.in_flight.add(nonce)
+            return nonce
+
+    def reserve_batch(self, address: str, count: int) -> int:
+        """
+        Reserve ``count`` consecutive nonces for ``address``.
+
+        Gaps are skipped, since a batch needs a contiguous range.
+
+        :param address: Sender address
+        :param count: Number of nonces to reserve
+        :return: First nonce of the reserved range
+        :raises ValueError: If count is not positive
+        """
+        if count < 1:
+            raise ValueError(f"Nonce batch size must be positive, got {count}")
+        account = self._account(address)
+        with account.lock:
+            base = self._ensure_seeded(address, account)
+            account.next_nonce = base + count
+            account.in_flight.update(range(base, base + count))
+            return base
+
+    def confirm(self, address: str, nonce: int) -> None:
+        """
+        Mark a reserved nonce as used by a broadcast transaction.
+
+        :param address: Sender address
+        :param nonce: Nonce previously returned by reserve
+        """
+        account = self._account(address)
+        with account.lock:
+            account.in_flight.discard(nonce)
+
+    def release(self, address: str, nonce: int) -> None:
+        """
+        Give back a reserved nonce whose transaction was never broadcast.
+
+        :param address: Sender address
+        :param nonce: Nonce previously returned by reserve
+        """
+        account = self._account(address)
+        with account.lock:
+            account.in_flight.discard(nonce)
+            if account.next_nonce is None or nonce >= account.next_nonce:
+                return
+            if nonce not in account.gaps:
+                bisect.insort(account.gaps, nonce)
+            # Collapse gaps touching the high-water mark.
+            while account.gaps and account.gaps[-1] == account.next_nonce - 1:
+                account.gaps.pop()
+                account.next_nonce -= 1
+
+    def resync(self, address: str) -> int:
+        """
+        Realign local state with the node's pending count.
+
+        Nonces the chain has already consumed are dropped from the gap list.
+        With nothing in flight the pending count is authoritative, which
+        also closes gaps left by transactions the node dropped.
+
+        :param address: Sender address
+        :return: Next nonce after the resync
+        """
+        account = self._account(address)
+        with account.lock:
+            chain_nonce = self._pending_count(address)
+            if account.in_flight:
+                account.next_nonce = max(chain_nonce, max(account.in_flight) + 1)
+            else:
+                account.next_nonce = chain_nonce
+            account.gaps = [
+                gap
+                for gap in account.gaps
+                if chain_nonce <= gap < account.next_nonce
+                and gap not in account.in_flight
+            ]
+            return account.next_nonce
+
+    @contextmanager
+    def use(self, address: str) -> Iterator[int]:
+        """
+        Reserve a nonce for the duration of one broadcast.
+
+        The nonce is confirmed when the block exits normally. On error it is
+        released, or the account is resynced if the node reports the nonce
+        as already used.
+
+        :param address: Sender address
+        :yield: Reserved nonce
+        """
+        nonce = self.reserve(address)
+        try:
+            yield nonce
+        except Exception as e:
+            if is_nonce_conflict(e):
+                self.confirm(address, nonce)
+                self.resync(address)
+            else:
+                self.release(address, nonce)
+            raise
+        self.confirm(address, nonce)
+
+
+_managers: Dict[Any, NonceManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(ledger_api: EthereumApi) -> NonceManager:
+    """
+    Return the process-wide nonce manager for the ledger's chain.
+
+    Every executor on the same chain shares one manager, so transactions
+    from one key sent through different services never collide.
+
+    :param ledger_api: Ethereum API for the target chain
+    :return: Shared NonceManager
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = NonceManager(ledger_api)
+            _managers[key] = manager
+        return manager
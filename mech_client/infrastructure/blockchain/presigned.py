@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Pre-signed transaction files for deferred broadcasting.
+
+Signing and broadcasting are decoupled: transactions are signed ahead of
+time with pre-assigned nonces and fee caps, written one JSON object per
+line, and streamed to the network later (possibly from another host). The
+raw transaction is the source of truth; the other fields are a readable
+copy used for ordering, rate limiting and reporting.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from mech_client.infrastructure.blockchain.broadcast import raw_transaction_hash
+
+PRESIGNED_FORMAT_VERSION = 1
+
+
+@dataclass
+class PresignedTransaction:  # pylint: disable=too-many-instance-attributes
+    """One signed transaction waiting to be broadcast.
+
+    Attributes:
+        chain_id: Chain the transaction was signed for
+        sender: EOA address that signed it
+        nonce: Pre-assigned nonce
+        tx_hash: Transaction hash (keccak of the raw bytes)
+        raw_transaction: Signed transaction (0x-prefixed hex)
+        max_fee_per_gas: EIP-1559 fee cap (None for legacy pricing)
+        max_priority_fee_per_gas: EIP-1559 tip cap (None for legacy pricing)
+        gas_price: Legacy gas price (None for EIP-1559 pricing)
+        metadata: What the transaction does (kind, prompts, data hashes, ...)
+    """
+
+    chain_id: int
+    sender: str
+    nonce: int
+    tx_hash: str
+    raw_transaction: str
+    max_fee_per_gas: Optional[int] = None
+    max_priority_fee_per_gas: Optional[int] = None
+    gas_price: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def kind(self) -> str:
+        """The transaction's role (``request``, ``approve``, ...)."""
+        return str(self.metadata.get("kind", "transaction"))
+
+    def to_json(self) -> str:
+        """
+        Serialize to one JSONL line.
+
+        :return: JSON object string (no trailing newline)
+        """
+        return json.dumps(
+            {"version": PRESIGNED_FORMAT_VERSION, **asdict(self)}, sort_keys=True
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "PresignedTransaction":
+        """
+        Parse one JSONL line.
+
+        :param line: JSON object string
+        :return: Parsed transaction
+        :raises ValueError: If the line is malformed, of an unknown format
+            version, or its hash does not match the raw transaction
+        """
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed pre-signed transaction line: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("Pre-signed transaction line is not a JSON object")
+        version = data.pop("version", None)
+        if version != PRESIGNED_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported pre-signed transaction format version {version!r}"
+            )
+        try:
+            transaction = cls(**data)
+        except TypeError as e:
+            raise ValueError(f"Invalid pre-signed transaction fields: {e}") from e
+        if raw_transaction_hash(transaction.raw_transaction) != transaction.tx_hash:
+            raise ValueError(
+                f"Pre-signed transaction {transaction.tx_hash} does not match "
+                "its raw transaction"
+            )
+        return transaction
+
+
+def write_presigned(
+    path: Union[str, Path],
+    transactions: Iterable[PresignedTransaction],
+    append: bool = False,
+) -> int:
+    """
+    Write pre-signed transactions as JSONL.
+
+    :param path: Output file
+    :param transactions: Transactions, in broadcast order
+    :param append: Append to an existing file instead of replacing it
+    :return: Number of transactions written
+    """
+    count = 0
+    with open(path, "a" if append else "w", encoding="utf-8") as f:
+        for transaction in transactions:
+            f.write(transaction.to_json() + "\n")
+            count += 1
+    return count
+
+
+def read_presigned(path: Union[str, Path]) -> List[PresignedTransaction]:
+    """
+    Read pre-signed transactions from a JSONL file.
+
+    Blank lines are skipped.
+
+    :param path: Input file
+    :return: Transactions, in file order
+    :raises ValueError: If a line is invalid (the line number is reported)
+    """
+    transactions = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                transactions.append(PresignedTransaction.from_json(line))
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+    return transactions
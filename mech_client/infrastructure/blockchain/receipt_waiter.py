@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,59 +19,379 @@
 
 """Transaction receipt waiting and event polling utilities."""
 
+import asyncio
+import random
 import time
-from typing import Dict, List, Optional
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from aea_ledger_ethereum import EthereumApi
-from mech_client.infrastructure.config.constants import TRANSACTION_RECEIPT_TIMEOUT
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastError,
+    flush_broadcasts,
+    pop_broadcast_failure,
+)
+from mech_client.infrastructure.blockchain.gas_model import get_gas_model
+from mech_client.infrastructure.config.constants import (
+    CHAIN_ID_TO_BLOCK_TIME,
+    DEFAULT_BLOCK_TIME,
+    RECEIPT_POLL_BACKOFF,
+    RECEIPT_POLL_JITTER,
+    RECEIPT_POLL_MAX_INTERVAL,
+    TRANSACTION_RECEIPT_TIMEOUT,
+)
 from web3.contract import Contract as Web3Contract
 
 
+def estimate_block_time(ledger_api: EthereumApi) -> float:
+    """
+    Return the approximate block time of the ledger's chain.
+
+    :param ledger_api: The Ethereum API used for interacting with the ledger
+    :return: Block time in seconds (DEFAULT_BLOCK_TIME for unknown chains)
+    """
+    chain_id = getattr(ledger_api, "_chain_id", None)
+    try:
+        return CHAIN_ID_TO_BLOCK_TIME.get(int(chain_id), DEFAULT_BLOCK_TIME)
+    except (TypeError, ValueError):
+        return DEFAULT_BLOCK_TIME
+
+
+def _jittered(interval: float) -> float:
+    """Randomise an interval by +/- RECEIPT_POLL_JITTER so pollers spread out."""
+    return interval * random.uniform(  # nosec B311
+        1 - RECEIPT_POLL_JITTER, 1 + RECEIPT_POLL_JITTER
+    )
+
+
+def _next_interval(interval: float, max_interval: float) -> float:
+    """Grow a poll interval by the backoff factor, capped at max_interval."""
+    return min(interval * RECEIPT_POLL_BACKOFF, max_interval)
+
+
+def _timeout_error(
+    ledger_api: EthereumApi,
+    tx_hash: str,
+    timeout: float,
+    retry_count: int,
+    last_exception: Optional[BaseException],
+) -> TimeoutError:
+    """Build the TimeoutError raised when a receipt never arrives."""
+    rpc_endpoint = getattr(
+        ledger_api._api.provider,  # pylint: disable=protected-access
+        "endpoint_uri",
+        "unknown",
+    )
+    return TimeoutError(
+        f"Timeout ({timeout}s) exceeded while waiting for transaction receipt via HTTP RPC. "
+        f"Transaction hash: {tx_hash}. "
+        f"RPC endpoint: {rpc_endpoint}. "
+        f"Retries attempted: {retry_count}. "
+        f"Last error: {repr(last_exception)}"
+    )
+
+
 def wait_for_receipt(
     tx_hash: str,
     ledger_api: EthereumApi,
     timeout: float = TRANSACTION_RECEIPT_TIMEOUT,
+    poll_interval: Optional[float] = None,
 ) -> Dict:
     """
     Wait for transaction receipt via HTTP RPC endpoint with polling.
 
-    Polls the RPC endpoint for transaction receipt with exponential backoff.
-    Raises TimeoutError if timeout is exceeded.
+    Polls the RPC endpoint for transaction receipt, starting at the chain's
+    block time and backing off exponentially (with jitter) up to
+    RECEIPT_POLL_MAX_INTERVAL. Raises TimeoutError if timeout is exceeded.
+
+    This blocks the calling thread; async callers should use
+    ``wait_for_receipt_async`` or a shared ``ReceiptWaiter`` instead.
 
     :param tx_hash: The transaction hash
     :param ledger_api: The Ethereum API used for interacting with the ledger
     :param timeout: Maximum time to wait for receipt in seconds (default: 300)
+    :param poll_interval: First poll interval in seconds (default: block time)
     :return: The receipt of the transaction
     :raises TimeoutError: If timeout is exceeded while waiting for receipt
+    :raises BroadcastError: If the transaction was queued for a batched
+        broadcast and the node rejected it
     """
-    start_time = time.time()
+    # A hash may belong to a transaction still sitting in the broadcast queue.
+    flush_broadcasts(ledger_api)
+    failure = pop_broadcast_failure(ledger_api, tx_hash)
+    if failure is not None:
+        raise failure
+
+    start_time = time.monotonic()
+    interval = poll_interval or estimate_block_time(ledger_api)
     last_exception = None
     retry_count = 0
 
     while True:
         try:
-            return ledger_api._api.eth.get_transaction_receipt(  # pylint: disable=protected-access
+            receipt = ledger_api._api.eth.get_transaction_receipt(  # pylint: disable=protected-access
                 tx_hash
             )
+            get_gas_model(ledger_api).observe_receipt(tx_hash, receipt)
+            return receipt
         except Exception as e:  # pylint: disable=broad-except
             last_exception = e
             retry_count += 1
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                # Get the RPC endpoint for error message
-                rpc_endpoint = getattr(
-                    ledger_api._api.provider,  # pylint: disable=protected-access
-                    "endpoint_uri",
-                    "unknown",
-                )
-                raise TimeoutError(
-                    f"Timeout ({timeout}s) exceeded while waiting for transaction receipt via HTTP RPC. "
-                    f"Transaction hash: {tx_hash}. "
-                    f"RPC endpoint: {rpc_endpoint}. "
-                    f"Retries attempted: {retry_count}. "
-                    f"Last error: {repr(last_exception)}"
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                raise _timeout_error(
+                    ledger_api, tx_hash, timeout, retry_count, last_exception
                 ) from last_exception
-            time.sleep(1)
+            time.sleep(min(_jittered(interval), remaining))
+            interval = _next_interval(interval, RECEIPT_POLL_MAX_INTERVAL)
+
+
+def fetch_receipts(ledger_api: EthereumApi, tx_hashes: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch the receipts of every already-mined transaction in one round trip.
+
+    Sends a single JSON-RPC batch of ``eth_getTransactionReceipt`` calls and
+    only re-fetches (formatted) the receipts that came back non-null, so the
+    per-tick cost of polling many pending hashes is one HTTP request. Falls
+    back to one call per hash when the provider or RPC rejects batches.
+
+    :param ledger_api: The Ethereum API used for interacting with the ledger
+    :param tx_hashes: Transaction hashes to look up
+    :return: Mapping of tx hash to receipt, for mined transactions only
+    """
+    web3 = ledger_api._api  # pylint: disable=protected-access
+    landed: Iterable[str] = tx_hashes
+    if len(tx_hashes) > 1:
+        try:
+            responses = web3.provider.make_batch_request(
+                [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+            )
+            if isinstance(responses, list) and len(responses) == len(tx_hashes):
+                landed = [
+                    tx_hash
+                    for tx_hash, response in zip(tx_hashes, responses)
+                    if isinstance(response, dict) and response.get("result")
+                ]
+        except Exception:  # pylint: disable=broad-except
+            landed = tx_hashes
+
+    receipts: Dict[str, Dict] = {}
+    for tx_hash in landed:
+        try:
+            receipts[tx_hash] = web3.eth.get_transaction_receipt(tx_hash)
+        except Exception:  # pylint: disable=broad-except
+            continue
+    return receipts
+
+
+class ReceiptWaiter:  # pylint: disable=too-many-instance-attributes
+    """Asynchronous receipt waiter that multiplexes many tx hashes.
+
+    Tracked hashes share one polling task: each tick fetches every pending
+    receipt in a single batched RPC call and resolves the matching futures
+    as receipts land. Polling starts at the chain's block time, backs off
+    with jitter while nothing lands, and snaps back to the block time as
+    soon as a receipt arrives (a new block has just been produced).
+
+    Must be used from within a running asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        ledger_api: EthereumApi,
+        timeout: float = TRANSACTION_RECEIPT_TIMEOUT,
+        poll_interval: Optional[float] = None,
+        max_interval: float = RECEIPT_POLL_MAX_INTERVAL,
+    ) -> None:
+        """
+        Initialize the waiter.
+
+        :param ledger_api: The Ethereum API used for interacting with the ledger
+        :param timeout: Per-transaction timeout in seconds (default: 300)
+        :param poll_interval: First poll interval in seconds (default: block time)
+        :param max_interval: Upper bound on the poll interval in seconds
+        """
+        self.ledger_api = ledger_api
+        self.timeout = timeout
+        self.poll_interval = poll_interval or estimate_block_time(ledger_api)
+        self.max_interval = max_interval
+        self._futures: Dict[str, "asyncio.Future[Dict]"] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._timeouts: Dict[str, float] = {}
+        self._polls: Dict[str, int] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def pending(self) -> List[str]:
+        """Transaction hashes still waiting for a receipt."""
+        return [h for h, future in self._futures.items() if not future.done()]
+
+    def track(
+        self, tx_hash: str, timeout: Optional[float] = None
+    ) -> "asyncio.Future[Dict]":
+        """
+        Start tracking a transaction and return a future for its receipt.
+
+        Tracking the same hash twice returns the same future.
+
+        :param tx_hash: The transaction hash
+        :param timeout: Timeout for this hash (default: the waiter's)
+        :return: Future resolved with the receipt, or failed with TimeoutError
+            (or BroadcastError if a queued broadcast was rejected)
+        """
+        future = self._futures.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[tx_hash] = future
+            self._timeouts[tx_hash] = self.timeout if timeout is None else timeout
+            self._deadlines[tx_hash] = time.monotonic() + self._timeouts[tx_hash]
+            self._polls[tx_hash] = 0
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+        return future
+
+    async def wait(self, tx_hash: str, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for a single transaction receipt.
+
+        :param tx_hash: The transaction hash
+        :param timeout: Timeout for this hash (default: the waiter's)
+        :return: The receipt of the transaction
+        :raises TimeoutError: If the receipt does not arrive within the timeout
+        """
+        return await self.track(tx_hash, timeout)
+
+    async def wait_many(self, tx_hashes: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Wait for several transaction receipts concurrently.
+
+        :param tx_hashes: Transaction hashes to wait for
+        :return: Mapping of tx hash to receipt
+        :raises TimeoutError: If any receipt does not arrive within the timeout
+        """
+        hashes = list(dict.fromkeys(tx_hashes))
+        receipts = await asyncio.gather(*(self.track(h) for h in hashes))
+        return dict(zip(hashes, receipts))
+
+    def _flush_and_fetch(
+        self, pending: List[str]
+    ) -> Tuple[Dict[str, Dict], Dict[str, BroadcastError]]:
+        """Flush queued broadcasts, then fetch receipts of the accepted hashes."""
+        flush_broadcasts(self.ledger_api)
+        failures: Dict[str, BroadcastError] = {}
+        for tx_hash in pending:
+            failure = pop_broadcast_failure(self.ledger_api, tx_hash)
+            if failure is not None:
+                failures[tx_hash] = failure
+        accepted = [tx_hash for tx_hash in pending if tx_hash not in failures]
+        receipts = fetch_receipts(self.ledger_api, accepted) if accepted else {}
+        return receipts, failures
+
+    def _forget_done(self) -> None:
+        """Drop resolved hashes so a long-lived waiter stays small."""
+        for tx_hash in [h for h, f in self._futures.items() if f.done()]:
+            del self._futures[tx_hash]
+            self._deadlines.pop(tx_hash, None)
+            self._timeouts.pop(tx_hash, None)
+            self._polls.pop(tx_hash, None)
+
+    async def _poll(self) -> None:
+        """Poll for every pending receipt until none remain."""
+        interval = self.poll_interval
+        while True:
+            pending = self.pending
+            if not pending:
+                return
+            failures: Dict[str, BroadcastError] = {}
+            try:
+                receipts, failures = await asyncio.to_thread(
+                    self._flush_and_fetch, pending
+                )
+                last_exception: Optional[BaseException] = None
+            except Exception as e:  # pylint: disable=broad-except
+                receipts, last_exception = {}, e
+
+            for tx_hash, failure in failures.items():
+                if not self._futures[tx_hash].done():
+                    self._futures[tx_hash].set_exception(failure)
+
+            gas_model = get_gas_model(self.ledger_api)
+            for tx_hash, receipt in receipts.items():
+                gas_model.observe_receipt(tx_hash, receipt)
+                future = self._futures[tx_hash]
+                if not future.done():
+                    future.set_result(receipt)
+
+            now = time.monotonic()
+            for tx_hash in self.pending:
+                self._polls[tx_hash] += 1
+                if now >= self._deadlines[tx_hash]:
+                    self._futures[tx_hash].set_exception(
+                        _timeout_error(
+                            self.ledger_api,
+                            tx_hash,
+                            self._timeouts[tx_hash],
+                            self._polls[tx_hash],
+                            last_exception,
+                        )
+                    )
+
+            self._forget_done()
+            pending = self.pending
+            if not pending:
+                return
+            interval = (
+                self.poll_interval
+                if receipts
+                else _next_interval(interval, self.max_interval)
+            )
+            next_deadline = min(self._deadlines[h] for h in pending) - now
+            await asyncio.sleep(max(0.0, min(_jittered(interval), next_deadline)))
+
+
+# One shared waiter per (event loop, chain); entries die with their loop.
+_shared_waiters: "weakref.WeakKeyDictionary[Any, Dict[Any, ReceiptWaiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_receipt_waiter(ledger_api: EthereumApi) -> ReceiptWaiter:
+    """
+    Return the receipt waiter shared by the running event loop for a chain.
+
+    Every concurrent ``wait_for_receipt_async`` on the chain joins the same
+    polling task, so N outstanding transactions cost one batched RPC call
+    per tick instead of N. The waiter is keyed by chain alone: other
+    ``EthereumApi`` instances for the same chain join the first one's
+    waiter instead of replacing it (and orphaning its pending waits).
+
+    :param ledger_api: The Ethereum API used for interacting with the ledger
+    :return: Shared ReceiptWaiter
+    """
+    waiters = _shared_waiters.setdefault(asyncio.get_running_loop(), {})
+    key = getattr(ledger_api, "_chain_id", None)
+    waiter = waiters.get(key)
+    if waiter is None:
+        waiter = ReceiptWaiter(ledger_api)
+        waiters[key] = waiter
+    return waiter
+
+
+async def wait_for_receipt_async(
+    tx_hash: str,
+    ledger_api: EthereumApi,
+    timeout: float = TRANSACTION_RECEIPT_TIMEOUT,
+) -> Dict:
+    """
+    Wait for a transaction receipt without blocking the event loop.
+
+    :param tx_hash: The transaction hash
+    :param ledger_api: The Ethereum API used for interacting with the ledger
+    :param timeout: Maximum time to wait for receipt in seconds (default: 300)
+    :return: The receipt of the transaction
+    :raises TimeoutError: If timeout is exceeded while waiting for receipt
+    """
+    return await get_receipt_waiter(ledger_api).wait(tx_hash, timeout)
 
 
 def watch_for_marketplace_request_ids(
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,12 +19,24 @@
 
 """Gnosis Safe multisig client for agent mode transactions."""
 
-from typing import Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional, Sequence, Tuple
 
 from hexbytes import HexBytes
 from mech_client.domain.signing import Signer
+from mech_client.infrastructure.blockchain.fee_oracle import FeeOracle
+from mech_client.infrastructure.blockchain.gas_model import GasKey, GasModel
+from mech_client.infrastructure.blockchain.nonce_manager import NonceManager
+from mech_client.infrastructure.blockchain.safe_nonce_manager import (
+    SafeNonceManager,
+)
 from safe_eth.eth import EthereumClient  # pylint:disable=import-error
 from safe_eth.safe import Safe  # pylint:disable=import-error
+from safe_eth.safe.multi_send import (  # pylint:disable=import-error
+    MultiSend,
+    MultiSendOperation,
+    MultiSendTx,
+)
 from web3.constants import ADDRESS_ZERO
 
 # Headroom applied on top of the inner-call gas estimate when sizing the outer
@@ -37,24 +49,61 @@ OUTER_TX_GAS_MULTIPLIER = 1.1
 OUTER_TX_GAS_OVERHEAD_FLOOR = 250_000
 OUTER_TX_GAS_OVERHEAD_SHARE = 0.05
 
+# SafeTx operation codes: a plain call, or a delegatecall (used to run the
+# MultiSend library in the Safe's own context).
+SAFE_OPERATION_CALL = 0
+SAFE_OPERATION_DELEGATE_CALL = 1
+
 
 class SafeClient:
     """Client for interacting with Gnosis Safe multisig wallets.
 
     Provides methods for building, signing, and executing Safe transactions
     in agent mode. Uses safe-eth-py library for Safe interactions.
+
+    With a :class:`GasModel` attached, inner-call gas estimates are reused
+    for repeated call shapes (same target, selector, and calldata length)
+    until the model's TTL or refresh count forces a fresh estimate.
+
+    Several calls can run atomically in one Safe transaction through the
+    call-only MultiSend library (:meth:`send_multisend`).
+
+    With a :class:`SafeNonceManager` and a :class:`NonceManager` attached,
+    the Safe nonce and the owner's outer nonce are allocated locally, so
+    several Safe transactions can be pending at once without a nonce read
+    per transaction.
     """
 
-    def __init__(self, ethereum_client: EthereumClient, safe_address: str):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ethereum_client: EthereumClient,
+        safe_address: str,
+        gas_model: Optional[GasModel] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        safe_nonces: Optional[SafeNonceManager] = None,
+        nonce_manager: Optional[NonceManager] = None,
+    ):
         """
         Initialize Safe client.
 
         :param ethereum_client: Ethereum client instance
         :param safe_address: Address of the Safe multisig wallet
+        :param gas_model: Cache for inner-call gas estimates (optional)
+        :param fee_oracle: Per-block fee cache for the outer transaction
+            (default: ``eth_gasPrice`` per transaction)
+        :param safe_nonces: Local Safe nonce allocator (default: the Safe's
+            ``nonce()`` is read per transaction)
+        :param nonce_manager: Allocator for the owner's outer-transaction
+            nonce (default: the signer fills it from the latest count)
         """
         self.ethereum_client = ethereum_client
         self.safe_address = safe_address
+        self.gas_model = gas_model
+        self.fee_oracle = fee_oracle
+        self.safe_nonces = safe_nonces
+        self.nonce_manager = nonce_manager
         self._safe: Optional[Safe] = None
+        self._multi_send: Optional[MultiSend] = None
 
     @property
     def safe(self) -> Safe:
@@ -68,6 +117,19 @@ class SafeClient:
             )
         return self._safe
 
+    @property
+    def multi_send(self) -> MultiSend:
+        """Get the call-only MultiSend library of this chain (lazy-loaded).
+
+        The canonical deployments are probed once with ``eth_getCode``.
+
+        :return: MultiSend instance
+        :raises ValueError: If no call-only MultiSend is deployed on the chain
+        """
+        if self._multi_send is None:
+            self._multi_send = MultiSend(self.ethereum_client, call_only=True)
+        return self._multi_send
+
     @staticmethod
     def build_pre_validated_signature(owner: str) -> bytes:
         """
@@ -101,6 +163,7 @@ class SafeClient:
         tx_data: str,
         signer: Signer,
         value: int = 0,
+        operation: int = SAFE_OPERATION_CALL,
     ) -> HexBytes:
         """
         Build and execute a Safe multisig transaction via the signer.
@@ -117,61 +180,173 @@ class SafeClient:
         :param tx_data: Transaction data (hex string starting with 0x)
         :param signer: Signer for the Safe owner EOA sending the outer tx
         :param value: ETH/native token value to send (in wei)
+        :param operation: SafeTx operation (call or delegatecall)
         :return: Transaction hash
         """
         # Estimate the inner call's gas to size the outer execTransaction
-        estimated_gas = self.safe.estimate_tx_gas_with_safe(
-            to=to_address,
-            value=value,
-            data=bytes.fromhex(tx_data[2:]),
-            operation=0,
-        )
+        estimated_gas = self._inner_gas(to_address, tx_data, value, operation)
 
-        # safe_tx_gas=0 forwards all available gas to the inner call.
-        # A non-zero safe_tx_gas makes the outer eth_estimateGas revert
-        # for gas-heavy inner calls (EIP-150 63/64 rule).
-        safe_tx = self.safe.build_multisig_tx(
-            to=to_address,
-            value=value,
-            data=bytes.fromhex(tx_data[2:]),
-            operation=0,
-            safe_tx_gas=0,
-            base_gas=0,
-            gas_price=0,
-            gas_token=ADDRESS_ZERO,
-            refund_receiver=ADDRESS_ZERO,
+        safe_nonce_context: ContextManager[Optional[int]] = (
+            self.safe_nonces.use(self.safe_address, self.safe.retrieve_nonce)
+            if self.safe_nonces is not None
+            else nullcontext(None)
         )
+        with safe_nonce_context as safe_nonce:
+            # safe_tx_gas=0 forwards all available gas to the inner call.
+            # A non-zero safe_tx_gas makes the outer eth_estimateGas revert
+            # for gas-heavy inner calls (EIP-150 63/64 rule).
+            safe_tx = self.safe.build_multisig_tx(
+                to=to_address,
+                value=value,
+                data=bytes.fromhex(tx_data[2:]),
+                operation=operation,
+                safe_tx_gas=0,
+                base_gas=0,
+                gas_price=0,
+                gas_token=ADDRESS_ZERO,
+                refund_receiver=ADDRESS_ZERO,
+                safe_nonce=safe_nonce,
+            )
 
-        # Pre-validated signature: valid because the outer tx sender is
-        # the owner encoded in it.
-        safe_tx.signatures = self.build_pre_validated_signature(signer.address)
+            # Pre-validated signature: valid because the outer tx sender is
+            # the owner encoded in it.
+            safe_tx.signatures = self.build_pre_validated_signature(signer.address)
+
+            tx_hash = self._send_outer(safe_tx, estimated_gas, signer)
+            if self.safe_nonces is not None and safe_nonce is not None:
+                self.safe_nonces.track(
+                    self.safe_address,
+                    safe_nonce,
+                    HexBytes(safe_tx.safe_tx_hash).to_0x_hex(),
+                )
+        return tx_hash
+
+    def _send_outer(self, safe_tx: Any, estimated_gas: int, signer: Signer) -> HexBytes:
+        """
+        Build and submit the owner's outer ``execTransaction``.
 
-        # Size the outer gas from the inner estimate; the explicit gas limit
-        # skips the outer eth_estimateGas, which fails for gas-heavy inner
-        # calls for the same 63/64 reason. The nonce is left for the signer
-        # to fill.
+        The gas limit is sized from the inner estimate; the explicit limit
+        skips the outer eth_estimateGas, which fails for gas-heavy inner
+        calls for the EIP-150 63/64 reason. Without a nonce manager the
+        nonce is left for the signer to fill.
+
+        :param safe_tx: Signed SafeTx to execute
+        :param estimated_gas: Inner-call gas estimate
+        :param signer: Signer for the Safe owner EOA
+        :return: Transaction hash
+        """
         overhead = max(
             OUTER_TX_GAS_OVERHEAD_FLOOR,
             int(estimated_gas * OUTER_TX_GAS_OVERHEAD_SHARE),
         )
         tx_gas = int(estimated_gas * OUTER_TX_GAS_MULTIPLIER) + overhead
-        outer_tx = safe_tx.w3_tx.build_transaction(
-            {
-                "from": signer.address,
-                "gas": tx_gas,
-                "gasPrice": self.ethereum_client.w3.eth.gas_price,
-            }
+        fees = (
+            self.fee_oracle.fees()
+            if self.fee_oracle is not None
+            else {"gasPrice": self.ethereum_client.w3.eth.gas_price}
         )
-
-        tx_hash = signer.send_transaction(outer_tx)
+        tx_params: Dict[str, Any] = {"from": signer.address, "gas": tx_gas, **fees}
+        nonce_context: ContextManager[Optional[int]] = (
+            self.nonce_manager.use(signer.address)
+            if self.nonce_manager is not None
+            else nullcontext(None)
+        )
+        with nonce_context as nonce:
+            if nonce is not None:
+                tx_params["nonce"] = nonce
+            outer_tx = safe_tx.w3_tx.build_transaction(tx_params)
+            tx_hash = signer.send_transaction(outer_tx)
         return HexBytes(tx_hash)
 
+    def send_multisend(
+        self,
+        calls: Sequence[Tuple[str, str, int]],
+        signer: Signer,
+    ) -> HexBytes:
+        """
+        Execute several calls atomically in one Safe transaction.
+
+        The calls are encoded for the call-only MultiSend library, which the
+        Safe delegatecalls; each call then runs with the Safe as
+        ``msg.sender`` and any value is paid from the Safe's balance. If one
+        call reverts, the whole transaction reverts.
+
+        :param calls: ``(to_address, tx_data, value)`` per call, in order
+        :param signer: Signer for the Safe owner EOA sending the outer tx
+        :return: Transaction hash
+        :raises ValueError: If ``calls`` is empty
+        """
+        if not calls:
+            raise ValueError("At least one call is required")
+        multi_send = self.multi_send
+        # Encoded locally: MultiSend.build_tx_data would fetch the chain ID.
+        multi_send_data = multi_send.get_contract().encode_abi(
+            "multiSend",
+            args=[
+                b"".join(
+                    MultiSendTx(
+                        MultiSendOperation.CALL,
+                        to_address,
+                        value,
+                        bytes.fromhex(tx_data[2:]),
+                    ).encoded_data
+                    for to_address, tx_data, value in calls
+                )
+            ],
+        )
+        return self.send_transaction(
+            to_address=multi_send.address,
+            tx_data=multi_send_data,
+            signer=signer,
+            operation=SAFE_OPERATION_DELEGATE_CALL,
+        )
+
+    @staticmethod
+    def _call_shape(to_address: str, tx_data: str, value: int) -> GasKey:
+        """Return the gas-model key for an inner Safe call."""
+        return ("safe", to_address.lower(), tx_data[:10], len(tx_data), bool(value))
+
+    def _inner_gas(
+        self,
+        to_address: str,
+        tx_data: str,
+        value: int,
+        operation: int = SAFE_OPERATION_CALL,
+    ) -> int:
+        """
+        Return the inner-call gas, from the model when it has a fresh figure.
+
+        Estimates (not receipts) are cached here: the outer transaction's
+        ``gasUsed`` includes Safe overhead and does not map to the inner call.
+
+        :param to_address: Destination contract/address
+        :param tx_data: Transaction data (hex string starting with 0x)
+        :param value: ETH/native token value to send (in wei)
+        :param operation: SafeTx operation (call or delegatecall)
+        :return: Inner-call gas estimate
+        """
+        if self.gas_model is None:
+            return self.estimate_gas(to_address, tx_data, value, operation)
+        key = self._call_shape(to_address, tx_data, value)
+        # The outer sizing already adds headroom, so no extra margin here.
+        predicted = self.gas_model.predict(key, margin=1.0)
+        if predicted is not None:
+            return predicted
+        estimated_gas = self.estimate_gas(to_address, tx_data, value, operation)
+        self.gas_model.observe(key, estimated_gas)
+        return estimated_gas
+
     def get_nonce(self) -> int:
         """
-        Get the current nonce for the Safe.
+        Get the nonce the next Safe transaction will use.
+
+        With a Safe nonce manager attached this is the local view, which
+        counts transactions still pending; otherwise the on-chain nonce.
 
-        :return: Current Safe nonce
+        :return: Next Safe nonce
         """
+        if self.safe_nonces is not None:
+            return self.safe_nonces.peek(self.safe_address, self.safe.retrieve_nonce)
         return self.safe.retrieve_nonce()
 
     def estimate_gas(
@@ -179,6 +354,7 @@ class SafeClient:
         to_address: str,
         tx_data: str,
         value: int = 0,
+        operation: int = SAFE_OPERATION_CALL,
     ) -> int:
         """
         Estimate gas for a Safe transaction.
@@ -186,11 +362,12 @@ class SafeClient:
         :param to_address: Destination contract/address
         :param tx_data: Transaction data (hex string starting with 0x)
         :param value: ETH/native token value to send (in wei)
+        :param operation: SafeTx operation (call or delegatecall)
         :return: Estimated gas amount
         """
         return self.safe.estimate_tx_gas_with_safe(
             to=to_address,
             value=value,
             data=bytes.fromhex(tx_data[2:]),
-            operation=0,
+            operation=operation,
         )
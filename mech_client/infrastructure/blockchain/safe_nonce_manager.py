@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide Safe nonce allocation for queued agent-mode transactions.
+
+Reading ``nonce()`` from the Safe for every transaction costs a round-trip
+and, while an earlier Safe transaction is still pending, returns a nonce that
+is already spoken for. ``SafeNonceManager`` reads the Safe nonce once and
+then allocates locally, remembering the SafeTx hash sent at each nonce until
+the chain has moved past it.
+
+Execution does not depend on this view being exact: the pre-validated owner
+signature used by :class:`SafeClient` holds at whatever nonce the Safe is at
+when the transaction lands, so a stale view only mislabels SafeTx hashes
+until the next resync.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.infrastructure.config.constants import SAFE_NONCE_RESYNC_INTERVAL
+
+
+@dataclass
+class _SafeNonces:
+    """Local nonce bookkeeping for one Safe."""
+
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    next_nonce: Optional[int] = None
+    synced_at: float = 0.0
+    # nonce -> (SafeTx hash, time sent)
+    pending: Dict[int, Tuple[str, float]] = field(default_factory=dict)
+
+
+class SafeNonceManager:
+    """Thread-safe Safe nonce allocator with pending SafeTx tracking.
+
+    A nonce is held from reservation until its Safe transaction has been
+    handed to the network, so submissions through one Safe are serialised
+    (a few milliseconds each) while any number of them can be pending at
+    once. The on-chain nonce is re-read when the local view is older than
+    ``resync_interval`` seconds and after any failed submission; pending
+    entries the chain has passed are then dropped, as are those the chain
+    has not reached by the time they are older than the interval (their
+    outer transaction was dropped or reverted).
+    """
+
+    def __init__(self, resync_interval: float = SAFE_NONCE_RESYNC_INTERVAL) -> None:
+        """
+        Initialize the Safe nonce manager.
+
+        :param resync_interval: Seconds a local view is trusted before the
+            on-chain nonce is read again
+        """
+        self.resync_interval = resync_interval
+        self._safes: Dict[str, _SafeNonces] = {}
+        self._lock = threading.Lock()
+
+    def _safe(self, safe_address: str) -> _SafeNonces:
+        """Return the entry for ``safe_address``, creating it if needed."""
+        key = safe_address.lower()
+        with self._lock:
+            state = self._safes.get(key)
+            if state is None:
+                state = _SafeNonces()
+                self._safes[key] = state
+            return state
+
+    def _sync(self, state: _SafeNonces, read_nonce: Callable[[], int]) -> int:
+        """Realign ``state`` with the on-chain nonce (lock must be held)."""
+        chain_nonce = int(read_nonce())
+        now = time.monotonic()
+        state.pending = {
+            nonce: entry
+            for nonce, entry in state.pending.items()
+            if nonce >= chain_nonce and now - entry[1] < self.resync_interval
+        }
+        state.next_nonce = max([chain_nonce, *(n + 1 for n in state.pending)])
+        state.synced_at = now
+        return state.next_nonce
+
+    def _current(self, state: _SafeNonces, read_nonce: Callable[[], int]) -> int:
+        """Return the next nonce, resyncing a missing or aged view (lock held)."""
+        if (
+            state.next_nonce is None
+            or time.monotonic() - state.synced_at >= self.resync_interval
+        ):
+            return self._sync(state, read_nonce)
+        return state.next_nonce
+
+    def peek(self, safe_address: str, read_nonce: Callable[[], int]) -> int:
+        """
+        Return the nonce the next Safe transaction would get.
+
+        :param safe_address: Safe address
+        :param read_nonce: Reads the Safe's on-chain nonce
+        :return: Next Safe nonce
+        """
+        state = self._safe(safe_address)
+        with state.lock:
+            return self._current(state, read_nonce)
+
+    def resync(self, safe_address: str, read_nonce: Callable[[], int]) -> int:
+        """
+        Re-read the on-chain nonce and prune settled pending entries.
+
+        :param safe_address: Safe address
+        :param read_nonce: Reads the Safe's on-chain nonce
+        :return: Next Safe nonce after the resync
+        """
+        state = self._safe(safe_address)
+        with state.lock:
+            return self._sync(state, read_nonce)
+
+    def track(self, safe_address: str, nonce: int, safe_tx_hash: str) -> None:
+        """
+        Record the SafeTx hash sent at ``nonce``.
+
+        :param safe_address: Safe address
+        :param nonce: Nonce the transaction was built with
+        :param safe_tx_hash: SafeTx hash (0x-prefixed)
+        """
+        state = self._safe(safe_address)
+        with state.lock:
+            state.pending[nonce] = (safe_tx_hash, time.monotonic())
+
+    def pending(self, safe_address: str) -> Dict[int, str]:
+        """
+        Return the SafeTx hashes believed to be pending, by nonce.
+
+        :param safe_address: Safe address
+        :return: Mapping of nonce to SafeTx hash
+        """
+        state = self._safe(safe_address)
+        with state.lock:
+            return {nonce: entry[0] for nonce, entry in state.pending.items()}
+
+    @contextmanager
+    def use(self, safe_address: str, read_nonce: Callable[[], int]) -> Iterator[int]:
+        """
+        Hold the next Safe nonce for the duration of one submission.
+
+        The nonce is consumed when the block exits normally; on error
+        nothing is consumed and the view is resynced from the chain.
+
+        :param safe_address: Safe address
+        :param read_nonce: Reads the Safe's on-chain nonce
+        :yield: Safe nonce to build the transaction with
+        """
+        state = self._safe(safe_address)
+        with state.lock:
+            nonce = self._current(state, read_nonce)
+            try:
+                yield nonce
+            except Exception:
+                self._sync(state, read_nonce)
+                raise
+            state.next_nonce = max(state.next_nonce or 0, nonce + 1)
+            if nonce not in state.pending:
+                state.pending[nonce] = ("", time.monotonic())
+
+
+_managers: Dict[Any, SafeNonceManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_safe_nonce_manager(ledger_api: EthereumApi) -> SafeNonceManager:
+    """
+    Return the process-wide Safe nonce manager for the ledger's chain.
+
+    Every agent executor on the same chain shares one manager, so requests
+    from different services queued through one Safe get sequential nonces.
+
+    :param ledger_api: Ethereum API for the target chain
+    :return: Shared SafeNonceManager
+    """
+    key = getattr(ledger_api, "_chain_id", None)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = SafeNonceManager()
+            _managers[key] = manager
+        return manager
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -40,7 +40,10 @@ from mech_client.infrastructure.config.contract_addresses import (
     CHAIN_TO_TOKEN_BALANCE_TRACKER_OLAS,
     CHAIN_TO_TOKEN_BALANCE_TRACKER_USDC,
 )
-from mech_client.infrastructure.config.loader import get_mech_config
+from mech_client.infrastructure.config.loader import (
+    clear_config_cache,
+    get_mech_config,
+)
 from mech_client.infrastructure.config.payment_config import PaymentType
 
 __all__ = [
@@ -63,6 +66,7 @@ __all__ = [
     "CHAIN_TO_TOKEN_BALANCE_TRACKER_OLAS",
     "CHAIN_TO_TOKEN_BALANCE_TRACKER_USDC",
     # Loader
+    "clear_config_cache",
     "get_mech_config",
     # Payment
     "PaymentType",
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,8 +19,9 @@
 
 """Chain configuration dataclasses."""
 
+import threading
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional
 
 import requests
 from mech_client.infrastructure.config.constants import CHAIN_ID_TO_NAME
@@ -34,8 +35,14 @@ def get_rpc_chain_id(rpc_url: str, timeout: float = 5.0) -> Optional[int]:
     :param timeout: Request timeout in seconds
     :return: Chain ID as integer, or None if query fails
     """
+    # Import here to avoid circular imports (the HTTP layer reads its settings
+    # from this package)
+    from mech_client.infrastructure.http import (  # pylint: disable=import-outside-toplevel
+        get_http_registry,
+    )
+
     try:
-        response = requests.post(
+        response = get_http_registry().post(
             rpc_url,
             json={"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1},
             timeout=timeout,
@@ -51,6 +58,31 @@ def get_rpc_chain_id(rpc_url: str, timeout: float = 5.0) -> Optional[int]:
     return None
 
 
+_chain_ids: Dict[str, Optional[int]] = {}
+_chain_ids_lock = threading.Lock()
+
+
+def probe_rpc_chain_id(rpc_url: str) -> Optional[int]:
+    """Return an RPC endpoint's chain ID, querying each URL once per process.
+
+    Failed probes are remembered too, so an unreachable endpoint costs one
+    timeout rather than one per configuration load.
+
+    :param rpc_url: RPC endpoint URL
+    :return: Chain ID as integer, or None if the query failed
+    """
+    with _chain_ids_lock:
+        if rpc_url not in _chain_ids:
+            _chain_ids[rpc_url] = get_rpc_chain_id(rpc_url)
+        return _chain_ids[rpc_url]
+
+
+def clear_chain_id_probes() -> None:
+    """Forget the chain IDs probed by :func:`probe_rpc_chain_id`."""
+    with _chain_ids_lock:
+        _chain_ids.clear()
+
+
 @dataclass
 class LedgerConfig:
     """Ledger configuration with environment variable override support.
@@ -100,7 +132,7 @@ class LedgerConfig:
             self.address = env_config.mechx_chain_rpc
 
             # Verify RPC chain ID matches expected chain ID
-            actual_chain_id = get_rpc_chain_id(self.address)
+            actual_chain_id = probe_rpc_chain_id(self.address)
             if actual_chain_id is not None and actual_chain_id != self.chain_id:
                 # Import logger locally to avoid circular import
                 from mech_client.utils.logger import (  # pylint: disable=import-outside-toplevel
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -34,6 +34,77 @@ TIMEOUT = 60.0
 # Transaction receipt timeout (5 minutes)
 TRANSACTION_RECEIPT_TIMEOUT = 300.0
 
+# Receipt polling: start at the chain's block time, grow by the backoff
+# factor while nothing lands, never exceed the cap, randomise by +/- jitter
+RECEIPT_POLL_BACKOFF = 1.5
+RECEIPT_POLL_MAX_INTERVAL = 15.0
+RECEIPT_POLL_JITTER = 0.2
+
+# Stuck transaction replacement: after this many blocks without inclusion the
+# transaction is re-broadcast with fees raised by GAS_BUMP_PERCENT (nodes
+# reject replacements below +10%), at most GAS_BUMP_MAX_ATTEMPTS times
+GAS_BUMP_BLOCKS = 10
+GAS_BUMP_PERCENT = 15
+GAS_BUMP_MAX_ATTEMPTS = 5
+MIN_REPLACEMENT_BUMP_PERCENT = 10
+
+# Learned gas limits: predict max(recent gasUsed) * margin per call shape and
+# fall back to eth_estimateGas after the TTL (seconds) or N predictions
+GAS_MODEL_MARGIN = 1.25
+GAS_MODEL_TTL = 3600.0
+GAS_MODEL_REFRESH_EVERY = 100
+GAS_MODEL_WINDOW = 20
+
+# Signed transactions per batched eth_sendRawTransaction request
+BROADCAST_BATCH_SIZE = 50
+
+# Rejections a broadcast queue remembers for receipt waits that have not
+# claimed them yet; the oldest are dropped first
+BROADCAST_FAILURES_MAX = 1024
+
+# Seconds a locally allocated Safe nonce view is trusted before the Safe's
+# on-chain nonce is read again
+SAFE_NONCE_RESYNC_INTERVAL = 30.0
+
+# requestBatch chunking: one chunk may use REQUEST_BATCH_GAS_SHARE of the block
+# gas limit and REQUEST_BATCH_MAX_CALLDATA bytes of calldata (nodes refuse
+# transactions above 128 KiB); per-item gas is learned from receipts and
+# starts at REQUEST_BATCH_ITEM_GAS
+REQUEST_BATCH_GAS_SHARE = 0.5
+REQUEST_BATCH_ITEM_GAS = 300_000
+REQUEST_BATCH_MAX_CALLDATA = 100_000
+
+# Multicall3 (same address on every supported chain) and the read-only calls
+# aggregated into one eth_call
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_BATCH_SIZE = 200
+
+# Metadata documents fetched concurrently during bulk tool discovery
+TOOL_DISCOVERY_WORKERS = 16
+
+# Local mech index: mechs whose on-chain info and tools were refreshed less
+# than MECH_INDEX_MAX_AGE seconds ago are kept as is by an incremental refresh
+MECH_INDEX_MAX_AGE = 3600.0
+
+# Subgraph snapshot: used as is for SUBGRAPH_SYNC_INTERVAL seconds after a
+# sync, then brought up to date with the entities changed since
+SUBGRAPH_SYNC_INTERVAL = 300.0
+
+# Mech response timeout (seconds) set on marketplace requests; the priority
+# mech must deliver within it before other mechs may step in
+MECH_RESPONSE_TIMEOUT = 300
+
+# Latency-aware mech selection: the last LATENCY_WINDOW requests per mech,
+# no older than LATENCY_MAX_AGE seconds, make up its delivery statistics
+LATENCY_WINDOW = 100
+LATENCY_MAX_AGE = 7 * 86400.0
+
+# Tool metadata cache: documents younger than TOOL_METADATA_TTL seconds are
+# served without I/O; up to TOOL_METADATA_STALE_TTL they are served while a
+# background revalidation runs
+TOOL_METADATA_TTL = 600.0
+TOOL_METADATA_STALE_TTL = 3600.0
+
 # IPFS gateway
 IPFS_GATEWAY_URL = "https://gateway.autonolas.tech/ipfs/"
 IPFS_URL_TEMPLATE = "https://gateway.autonolas.tech/ipfs/f01701220{}"
@@ -51,3 +122,12 @@ CHAIN_ID_TO_NAME = {
     CHAIN_ID_POLYGON: "polygon",
     CHAIN_ID_OPTIMISM: "optimism",
 }
+
+# Approximate block times in seconds, used as the first receipt poll interval
+DEFAULT_BLOCK_TIME = 2.0
+CHAIN_ID_TO_BLOCK_TIME = {
+    CHAIN_ID_GNOSIS: 5.0,
+    CHAIN_ID_BASE: 2.0,
+    CHAIN_ID_POLYGON: 2.0,
+    CHAIN_ID_OPTIMISM: 2.0,
+}
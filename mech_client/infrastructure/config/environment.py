@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -52,6 +52,15 @@ class EnvironmentConfig:  # pylint: disable=too-many-instance-attributes
     - MECHX_LEDGER_POA_CHAIN: Enable POA chain mode
     - MECHX_LEDGER_DEFAULT_GAS_PRICE_STRATEGY: Gas price strategy
     - MECHX_LEDGER_IS_GAS_ESTIMATION_ENABLED: Enable gas estimation
+    - MECHX_HTTP_POOL_SIZE: Keep-alive connections pooled per HTTP host
+    - MECHX_HTTP_TIMEOUT: Default HTTP request timeout in seconds
+    - MECHX_GAS_BUMP_BLOCKS: Blocks a tx may stay pending before its fees are bumped (0 disables)
+    - MECHX_FEE_TIP_PERCENTILE: Percentile of recent priority fees to tip (eth_feeHistory)
+    - MECHX_TOKEN_ALLOWANCE_REQUESTS: Requests a token approval covers (standing allowance)
+    - MECHX_JOURNAL_PATH: Request journal file for --no-wait requests
+    - MECHX_METADATA_CACHE_DIR: Directory of the on-disk tool metadata cache
+    - MECHX_INDEX_PATH: SQLite file of the local mech index
+    - MECHX_SUBGRAPH_SYNC_INTERVAL: Seconds a subgraph snapshot is used before syncing
 
     **OPERATE_* Variables (Internal Agent Mode):**
     - OPERATE_PASSWORD: Password for agent mode keyfile decryption
@@ -76,6 +85,15 @@ class EnvironmentConfig:  # pylint: disable=too-many-instance-attributes
     mechx_ledger_poa_chain: Optional[bool] = None
     mechx_ledger_default_gas_price_strategy: Optional[str] = None
     mechx_ledger_is_gas_estimation_enabled: Optional[bool] = None
+    mechx_http_pool_size: Optional[int] = None
+    mechx_http_timeout: Optional[float] = None
+    mechx_gas_bump_blocks: Optional[int] = None
+    mechx_fee_tip_percentile: Optional[int] = None
+    mechx_token_allowance_requests: Optional[int] = None
+    mechx_journal_path: Optional[str] = None
+    mechx_metadata_cache_dir: Optional[str] = None
+    mechx_index_path: Optional[str] = None
+    mechx_subgraph_sync_interval: Optional[float] = None
 
     # OPERATE_* internal agent mode variables
     operate_password: Optional[str] = None
@@ -129,6 +147,51 @@ class EnvironmentConfig:  # pylint: disable=too-many-instance-attributes
                 )
             )
 
+        # MECHX_HTTP_POOL_SIZE - Pooled keep-alive connections per host
+        http_pool_size_str = os.getenv("MECHX_HTTP_POOL_SIZE")
+        if http_pool_size_str:
+            self.mechx_http_pool_size = int(http_pool_size_str)
+
+        # MECHX_HTTP_TIMEOUT - Default HTTP request timeout
+        http_timeout_str = os.getenv("MECHX_HTTP_TIMEOUT")
+        if http_timeout_str:
+            self.mechx_http_timeout = float(http_timeout_str)
+
+        # MECHX_GAS_BUMP_BLOCKS - Pending blocks before a fee-bumped replacement
+        gas_bump_blocks_str = os.getenv("MECHX_GAS_BUMP_BLOCKS")
+        if gas_bump_blocks_str:
+            self.mechx_gas_bump_blocks = int(gas_bump_blocks_str)
+
+        # MECHX_FEE_TIP_PERCENTILE - Priority fee percentile for the fee oracle
+        fee_tip_percentile_str = os.getenv("MECHX_FEE_TIP_PERCENTILE")
+        if fee_tip_percentile_str:
+            self.mechx_fee_tip_percentile = int(fee_tip_percentile_str)
+
+        # MECHX_TOKEN_ALLOWANCE_REQUESTS - Requests a token approval is sized for
+        allowance_requests_str = os.getenv("MECHX_TOKEN_ALLOWANCE_REQUESTS")
+        if allowance_requests_str:
+            self.mechx_token_allowance_requests = int(allowance_requests_str)
+
+        # MECHX_JOURNAL_PATH - Request journal for detached delivery tracking
+        journal_path = os.getenv("MECHX_JOURNAL_PATH")
+        if journal_path:
+            self.mechx_journal_path = journal_path
+
+        # MECHX_METADATA_CACHE_DIR - On-disk tool metadata cache location
+        metadata_cache_dir = os.getenv("MECHX_METADATA_CACHE_DIR")
+        if metadata_cache_dir:
+            self.mechx_metadata_cache_dir = metadata_cache_dir
+
+        # MECHX_INDEX_PATH - Local mech index location
+        index_path = os.getenv("MECHX_INDEX_PATH")
+        if index_path:
+            self.mechx_index_path = index_path
+
+        # MECHX_SUBGRAPH_SYNC_INTERVAL - Subgraph snapshot refresh schedule
+        sync_interval_str = os.getenv("MECHX_SUBGRAPH_SYNC_INTERVAL")
+        if sync_interval_str:
+            self.mechx_subgraph_sync_interval = float(sync_interval_str)
+
         # OPERATE_PASSWORD - Agent mode password
         password = os.getenv("OPERATE_PASSWORD")
         if password:
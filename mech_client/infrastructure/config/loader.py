@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,14 +17,86 @@
 #
 # ------------------------------------------------------------------------------
 
-"""Configuration loading utilities."""
+"""Configuration loading utilities.
 
+Loaded configurations are memoized per process: ``mechs.json`` is parsed
+once, and each (chain, mode) configuration is built once, so its RPC
+override, operate lookup and chain-ID probe run once too. An entry is
+rebuilt when ``mechs.json`` changes on disk (modification time or size) or
+a ``MECHX_*`` environment variable changes. The stored operate
+configuration is not watched; :func:`clear_config_cache` drops every entry
+after it changes (``mechx setup``).
+"""
+
+import copy
 import json
-from typing import Optional
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
 
-from mech_client.infrastructure.config.chain_config import LedgerConfig, MechConfig
+from mech_client.infrastructure.config.chain_config import (
+    LedgerConfig,
+    MechConfig,
+    clear_chain_id_probes,
+)
 from mech_client.infrastructure.config.constants import MECH_CONFIGS
 
+# (mtime in ns, size) of mechs.json
+FileStamp = Tuple[int, int]
+# MECHX_* environment variables, sorted
+EnvironmentStamp = Tuple[Tuple[str, str], ...]
+
+_parsed: Optional[Tuple[FileStamp, Dict[str, Any]]] = None
+_configs: Dict[Tuple[Optional[str], bool, FileStamp, EnvironmentStamp], MechConfig] = {}
+_lock = threading.Lock()
+
+
+def _file_stamp() -> FileStamp:
+    """Return the modification time and size of mechs.json."""
+    stat = os.stat(MECH_CONFIGS)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _environment_stamp() -> EnvironmentStamp:
+    """Return the MECHX_* environment variables a configuration depends on."""
+    return tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("MECHX_"))
+    )
+
+
+def _load_configs(stamp: FileStamp) -> Dict[str, Any]:
+    """Return the parsed mechs.json, reading it only when ``stamp`` changed."""
+    global _parsed  # pylint: disable=global-statement
+    if _parsed is None or _parsed[0] != stamp:
+        with open(MECH_CONFIGS, "r", encoding="UTF-8") as file:
+            _parsed = (stamp, json.load(file))
+    return _parsed[1]
+
+
+def _build_mech_config(
+    data: Dict[str, Any], chain_config: Optional[str], agent_mode: bool
+) -> MechConfig:
+    """Build a chain's MechConfig from parsed mechs.json."""
+    if chain_config is None:
+        chain_config = next(iter(data))
+
+    entry = data[chain_config].copy()
+    ledger_config_data = entry.pop("ledger_config")
+    # Remove nvm_subscription if present (used by NVMConfig, not MechConfig)
+    entry.pop("nvm_subscription", None)
+
+    # Create LedgerConfig with agent_mode and chain_config context
+    ledger_config = LedgerConfig(
+        **ledger_config_data, agent_mode=agent_mode, chain_config=chain_config
+    )
+
+    return MechConfig(
+        **entry,
+        ledger_config=ledger_config,
+        agent_mode=agent_mode,
+        chain_config=chain_config,
+    )
+
 
 def get_mech_config(
     chain_config: Optional[str] = None, agent_mode: bool = False
@@ -37,31 +109,33 @@ def get_mech_config(
     ``json.JSONDecodeError`` if it is malformed, and ``KeyError`` if the
     requested chain is absent.
 
+    The configuration is memoized (see the module docstring); every call
+    returns its own copy, so callers may modify it.
+
     :param chain_config: Chain name (gnosis, base, polygon, optimism).
                         If None, uses first chain in config.
     :param agent_mode: Whether running in agent mode (uses stored operate config)
     :return: MechConfig instance with loaded configuration
     """
-    with open(MECH_CONFIGS, "r", encoding="UTF-8") as file:
-        data = json.load(file)
-
-        if chain_config is None:
-            chain_config = next(iter(data))
-
-        entry = data[chain_config].copy()
-        ledger_config_data = entry.pop("ledger_config")
-        # Remove nvm_subscription if present (used by NVMConfig, not MechConfig)
-        entry.pop("nvm_subscription", None)
-
-        # Create LedgerConfig with agent_mode and chain_config context
-        ledger_config = LedgerConfig(
-            **ledger_config_data, agent_mode=agent_mode, chain_config=chain_config
-        )
-
-        mech_config = MechConfig(
-            **entry,
-            ledger_config=ledger_config,
-            agent_mode=agent_mode,
-            chain_config=chain_config,
-        )
-        return mech_config
+    stamp = _file_stamp()
+    key = (chain_config, agent_mode, stamp, _environment_stamp())
+    with _lock:
+        mech_config = _configs.get(key)
+        if mech_config is None:
+            mech_config = _build_mech_config(
+                _load_configs(stamp), chain_config, agent_mode
+            )
+            # Entries of an older mechs.json or environment are never hit again
+            for stale in [k for k in _configs if k[2:] != key[2:]]:
+                del _configs[stale]
+            _configs[key] = mech_config
+    return copy.deepcopy(mech_config)
+
+
+def clear_config_cache() -> None:
+    """Forget memoized configurations and RPC chain-ID probes."""
+    global _parsed  # pylint: disable=global-statement
+    with _lock:
+        _parsed = None
+        _configs.clear()
+    clear_chain_id_probes()
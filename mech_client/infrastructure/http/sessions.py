@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide registry of pooled, keep-alive HTTP sessions.
+
+Every outbound HTTP call mech-client makes (offchain mech POST/GET, tool
+metadata fetch, chain-ID probe, JSON-RPC via web3) goes through a
+``requests.Session`` obtained here, keyed by ``scheme://host[:port]``. One
+session per origin means one urllib3 connection pool per origin, so repeated
+calls to the same gateway, mech, or RPC reuse TCP/TLS connections instead of
+paying a handshake per request.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+from requests.adapters import HTTPAdapter
+
+# Number of distinct host pools a single session keeps. Sessions are already
+# per-origin, so this only matters for redirects to other hosts.
+DEFAULT_POOL_CONNECTIONS = 4
+# Keep-alive connections retained per origin. Sized for a busy process
+# pipelining requests to one RPC / mech; raise via MECHX_HTTP_POOL_SIZE.
+DEFAULT_POOL_MAXSIZE = 32
+# Timeout applied when a caller does not pass one explicitly (seconds).
+DEFAULT_HTTP_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """Connection pool settings shared by every registry session.
+
+    Attributes:
+        pool_connections: Number of host pools kept per session
+        pool_maxsize: Maximum keep-alive connections retained per host
+        timeout: Default request timeout in seconds
+        pool_block: Block (instead of opening a throwaway connection) when
+            every pooled connection to a host is busy
+    """
+
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    timeout: float = DEFAULT_HTTP_TIMEOUT
+    pool_block: bool = False
+
+    @classmethod
+    def from_environment(cls) -> "HttpPoolConfig":
+        """
+        Build a pool config honouring MECHX_HTTP_* overrides.
+
+        :return: Pool config with environment overrides applied
+        """
+        env_config = EnvironmentConfig.load()
+        return cls(
+            pool_maxsize=env_config.mechx_http_pool_size or DEFAULT_POOL_MAXSIZE,
+            timeout=env_config.mechx_http_timeout or DEFAULT_HTTP_TIMEOUT,
+        )
+
+
+def origin_of(url: str) -> str:
+    """
+    Return the ``scheme://host[:port]`` origin used as the pool key.
+
+    :param url: Absolute HTTP(S) URL
+    :return: Lower-cased origin string
+    :raises ValueError: If the URL has no scheme or host
+    """
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"Cannot pool a session for a non-absolute URL: {url!r}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class HttpSessionRegistry:
+    """Thread-safe registry of pooled ``requests.Session`` objects per origin.
+
+    Sessions are created lazily on first use and live for the lifetime of the
+    registry (normally the process). ``requests.Session`` is safe to share
+    across threads for sending; the registry lock only guards creation.
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None) -> None:
+        """
+        Initialize the registry.
+
+        :param config: Pool settings (default: environment-derived settings)
+        """
+        self.config = config or HttpPoolConfig.from_environment()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> requests.Session:
+        """Create a session whose adapters use the registry pool settings."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Return the pooled session for ``url``'s origin, creating it if needed.
+
+        :param url: Any absolute URL on the target origin
+        :return: Shared session for that origin
+        """
+        key = origin_of(url)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._new_session()
+                self._sessions[key] = session
+            return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the pooled session for ``url``.
+
+        Applies the registry's default timeout unless the caller passes one.
+        ``requests`` exceptions propagate unchanged.
+
+        :param method: HTTP method (GET, POST, ...)
+        :param url: Absolute request URL
+        :param kwargs: Extra arguments forwarded to ``Session.request``
+        :return: HTTP response
+        """
+        kwargs.setdefault("timeout", self.config.timeout)
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET through the pooled session.
+
+        :param url: Absolute request URL
+        :param kwargs: Extra arguments forwarded to ``Session.request``
+        :return: HTTP response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a POST through the pooled session.
+
+        :param url: Absolute request URL
+        :param kwargs: Extra arguments forwarded to ``Session.request``
+        :return: HTTP response
+        """
+        return self.request("POST", url, **kwargs)
+
+    def attach_to_provider(self, provider: Any) -> None:
+        """
+        Route a web3 HTTP provider through the registry's pooled sessions.
+
+        Handles both a plain ``HTTPProvider`` and aea's ``RotatingHTTPProvider``
+        (which delegates to one child provider per RPC URL). Each provider's
+        session manager is pinned to the registry session for its endpoint
+        origin, so every ``EthereumApi`` built in the process shares one
+        connection pool per RPC host instead of opening its own.
+
+        The rotating provider itself is pinned as well, since batched
+        JSON-RPC calls (``make_batch_request``) bypass its children.
+
+        Providers without a ``requests`` session manager (IPC, websockets)
+        are left untouched.
+
+        :param provider: web3 provider instance
+        """
+        providers = [provider, *(getattr(provider, "_providers", None) or [])]
+        for child in providers:
+            session_manager = getattr(child, "_request_session_manager", None)
+            endpoint_uri = getattr(child, "endpoint_uri", None)
+            if session_manager is None or not endpoint_uri:
+                continue
+            try:
+                session = self.get_session(str(endpoint_uri))
+            except ValueError:
+                continue
+            # web3's HTTPSessionManager returns ``_explicit_session`` for
+            # every thread when set, bypassing its per-thread session cache.
+            # pylint: disable-next=protected-access
+            session_manager._explicit_session = session
+
+    def close(self) -> None:
+        """Close every pooled session and forget them."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_registry: Optional[HttpSessionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_registry() -> HttpSessionRegistry:
+    """
+    Return the process-wide session registry, creating it on first use.
+
+    :return: Shared HttpSessionRegistry
+    """
+    global _registry  # pylint: disable=global-statement
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HttpSessionRegistry()
+    return _registry
+
+
+def configure_http_sessions(config: HttpPoolConfig) -> HttpSessionRegistry:
+    """
+    Replace the process-wide registry with one using ``config``.
+
+    Existing pooled sessions are closed. Call this once at startup, before
+    services are created, to size pools for a high-throughput deployment.
+
+    :param config: Pool settings to apply
+    :return: The new shared registry
+    """
+    global _registry  # pylint: disable=global-statement
+    with _registry_lock:
+        previous = _registry
+        _registry = HttpSessionRegistry(config)
+    if previous is not None:
+        previous.close()
+    return _registry
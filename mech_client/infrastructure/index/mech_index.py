@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""SQLite index of marketplace mechs, their tools, prices and payment types.
+
+Answering "which mech serves tool X for at most Y on payment type Z" from
+the network takes a subgraph query, a metadata fetch per service and two
+eth_calls per mech. The index keeps the answers in one SQLite file so the
+question can be answered offline, in milliseconds, by an indexed query.
+
+Prices are ``uint256`` wei amounts, wider than SQLite integers; they are
+stored as zero-padded decimal text so that comparing the text compares
+the amounts.
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+
+INDEX_FORMAT_VERSION = 1
+INDEX_FILE_NAME = "mech_index.sqlite3"
+
+# Digits of the largest uint256 value
+_PRICE_DIGITS = 78
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mechs (
+    chain TEXT NOT NULL,
+    address TEXT NOT NULL,
+    service_id INTEGER NOT NULL,
+    mech_type TEXT,
+    payment_type TEXT,
+    max_delivery_rate TEXT,
+    total_deliveries INTEGER NOT NULL DEFAULT 0,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (chain, address)
+);
+CREATE INDEX IF NOT EXISTS mechs_by_price
+    ON mechs (chain, payment_type, max_delivery_rate);
+CREATE TABLE IF NOT EXISTS tools (
+    chain TEXT NOT NULL,
+    service_id INTEGER NOT NULL,
+    tool_name TEXT NOT NULL,
+    PRIMARY KEY (chain, service_id, tool_name)
+);
+CREATE INDEX IF NOT EXISTS tools_by_name ON tools (chain, tool_name, service_id);
+CREATE TABLE IF NOT EXISTS refreshes (
+    chain TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+def default_index_path() -> Path:
+    """
+    Return the index location (``MECHX_INDEX_PATH`` if set).
+
+    :return: Path to the SQLite file
+    """
+    configured = EnvironmentConfig.load().mechx_index_path
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "mech_client" / INDEX_FILE_NAME
+
+
+def _encode_price(price: Optional[int]) -> Optional[str]:
+    """Return a wei amount as order-preserving text."""
+    return None if price is None else f"{price:0{_PRICE_DIGITS}d}"
+
+
+@dataclass(frozen=True)
+class IndexedMech:
+    """An indexed marketplace mech.
+
+    Attributes:
+        chain_config: Chain configuration name
+        address: Mech contract address
+        service_id: Service ID of the mech
+        mech_type: Mech type from its factory (e.g. "Fixed Price Native")
+        payment_type: ``PaymentType`` name, or the raw hash if unknown
+            (None if it could not be read)
+        max_delivery_rate: Price per request in wei (None if it could not
+            be read)
+        total_deliveries: Deliveries of the mech's service
+        tools: Tools the mech's service publishes
+        refreshed_at: Unix time its on-chain info and tools were read
+    """
+
+    chain_config: str
+    address: str
+    service_id: int
+    mech_type: Optional[str] = None
+    payment_type: Optional[str] = None
+    max_delivery_rate: Optional[int] = None
+    total_deliveries: int = 0
+    tools: Tuple[str, ...] = ()
+    refreshed_at: float = field(default_factory=time.time)
+
+
+class MechIndex:
+    """SQLite index of mechs, their tools, prices and payment types.
+
+    Each chain's rows are replaced as a whole by :meth:`replace`, in one
+    transaction, so readers never see a half-written refresh.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the index.
+
+        :param path: SQLite file (default: :func:`default_index_path`)
+        """
+        self.path = Path(path) if path is not None else default_index_path()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the database, creating its schema, in one transaction."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                version = connection.execute("PRAGMA user_version").fetchone()[0]
+                if version not in (0, INDEX_FORMAT_VERSION):
+                    raise ValueError(
+                        f"Unsupported mech index format version {version} "
+                        f"in {self.path}"
+                    )
+                connection.executescript(_SCHEMA)
+                connection.execute(f"PRAGMA user_version = {INDEX_FORMAT_VERSION}")
+                yield connection
+        finally:
+            connection.close()
+
+    def replace(
+        self,
+        chain_config: str,
+        mechs: Sequence[IndexedMech],
+        refreshed_at: Optional[float] = None,
+    ) -> None:
+        """
+        Replace a chain's indexed mechs and tools.
+
+        :param chain_config: Chain configuration name
+        :param mechs: Every mech of the chain
+        :param refreshed_at: Unix time of the refresh (default: now)
+        """
+        tools = {
+            (mech.service_id, tool_name) for mech in mechs for tool_name in mech.tools
+        }
+        with self._connect() as connection:
+            connection.execute("DELETE FROM mechs WHERE chain = ?", (chain_config,))
+            connection.execute("DELETE FROM tools WHERE chain = ?", (chain_config,))
+            connection.executemany(
+                "INSERT INTO mechs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        chain_config,
+                        mech.address,
+                        mech.service_id,
+                        mech.mech_type,
+                        mech.payment_type,
+                        _encode_price(mech.max_delivery_rate),
+                        mech.total_deliveries,
+                        mech.refreshed_at,
+                    )
+                    for mech in mechs
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO tools VALUES (?, ?, ?)",
+                [(chain_config, service_id, name) for service_id, name in tools],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO refreshes VALUES (?, ?)",
+                (chain_config, time.time() if refreshed_at is None else refreshed_at),
+            )
+
+    def mechs(self, chain_config: str) -> Dict[str, IndexedMech]:
+        """
+        Return every indexed mech of a chain.
+
+        :param chain_config: Chain configuration name
+        :return: Indexed mechs by address
+        """
+        return {mech.address: mech for mech in self.query(chain_config)}
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        chain_config: str,
+        tool: Optional[str] = None,
+        max_price: Optional[int] = None,
+        payment_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[IndexedMech]:
+        """
+        Find indexed mechs, cheapest first, then most delivered.
+
+        :param chain_config: Chain configuration name
+        :param tool: Only mechs whose service publishes this tool
+        :param max_price: Only mechs charging at most this many wei
+        :param payment_type: Only mechs with this ``PaymentType`` name
+        :param limit: Maximum number of mechs returned (None: all of them)
+        :return: Matching mechs
+        """
+        where = ["m.chain = ?"]
+        parameters: List[object] = [chain_config]
+        if tool is not None:
+            where.append(
+                "EXISTS (SELECT 1 FROM tools t WHERE t.chain = m.chain "
+                "AND t.tool_name = ? AND t.service_id = m.service_id)"
+            )
+            parameters.append(tool)
+        if max_price is not None:
+            where.append("m.max_delivery_rate <= ?")
+            parameters.append(_encode_price(max_price))
+        if payment_type is not None:
+            where.append("m.payment_type = ?")
+            parameters.append(payment_type)
+        sql = (
+            "SELECT m.address, m.service_id, m.mech_type, m.payment_type, "
+            "m.max_delivery_rate, m.total_deliveries, m.refreshed_at "
+            f"FROM mechs m WHERE {' AND '.join(where)} "
+            "ORDER BY m.max_delivery_rate IS NULL, m.max_delivery_rate, "
+            "m.total_deliveries DESC, m.address"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+
+        with self._connect() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+            tools: Dict[int, List[str]] = {}
+            for service_id, tool_name in connection.execute(
+                "SELECT service_id, tool_name FROM tools WHERE chain = ? "
+                "ORDER BY tool_name",
+                (chain_config,),
+            ):
+                tools.setdefault(service_id, []).append(tool_name)
+        return [
+            IndexedMech(
+                chain_config=chain_config,
+                address=address,
+                service_id=service_id,
+                mech_type=mech_type,
+                payment_type=payment_type_name,
+                max_delivery_rate=None if price is None else int(price),
+                total_deliveries=total_deliveries,
+                tools=tuple(tools.get(service_id, ())),
+                refreshed_at=refreshed_at,
+            )
+            for (
+                address,
+                service_id,
+                mech_type,
+                payment_type_name,
+                price,
+                total_deliveries,
+                refreshed_at,
+            ) in rows
+        ]
+
+    def refreshed_at(self, chain_config: str) -> Optional[float]:
+        """
+        Return when a chain was last refreshed.
+
+        :param chain_config: Chain configuration name
+        :return: Unix time, or None if the chain was never indexed
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT refreshed_at FROM refreshes WHERE chain = ?", (chain_config,)
+            ).fetchone()
+        return None if row is None else row[0]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -34,6 +34,9 @@ class IPFSClient:
 
     Provides methods for uploading files, downloading files, and converting
     between IPFS hash formats (v0/v1, hex encoding).
+
+    Transfers go through the aea IPFS tool, whose HTTP client takes no
+    session, so they are not pooled by the HTTP session registry.
     """
 
     def __init__(self) -> None:
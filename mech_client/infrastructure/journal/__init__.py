@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Local journal of submitted marketplace requests."""
+
+from mech_client.infrastructure.journal.request_journal import (
+    JournalRecord,
+    PendingRequest,
+    RequestJournal,
+    RequestOutcome,
+    default_journal_path,
+)
+
+__all__ = [
+    "JournalRecord",
+    "PendingRequest",
+    "RequestJournal",
+    "RequestOutcome",
+    "default_journal_path",
+]
@@ -0,0 +1,718 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Append-only journal of submitted marketplace requests.
+
+``mechx request --no-wait`` returns as soon as the request transactions are
+mined. The request IDs and the block to scan deliveries from are appended
+here, one JSON object per line, so another process can pick them up later
+(``mechx deliveries watch|collect``) and record the deliveries it finds.
+
+Every stage of a request is journaled as it happens: metadata uploaded,
+transaction sent, transaction mined (with its request IDs) or reverted,
+blocks scanned without a delivery, and the delivery itself. Each line is
+flushed to disk before the next stage starts, so a process that dies
+mid-batch leaves enough behind to resume: sent transactions are looked up
+by hash instead of being paid for again, and pending requests are watched
+from the last scanned block. :meth:`RequestJournal.compact` rewrites the
+file down to that resumable state.
+"""
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+from mech_client.utils.constants import OPERATE_FOLDER_NAME
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FORMAT_VERSION = 1
+JOURNAL_FILE_NAME = "request_journal.jsonl"
+
+# Journal events, in the order a request goes through them
+EVENT_UPLOADED = "uploaded"
+EVENT_SENT = "sent"
+EVENT_SUBMITTED = "submitted"
+EVENT_REVERTED = "reverted"
+EVENT_SCANNED = "scanned"
+EVENT_DELIVERED = "delivered"
+
+# Seconds a sent transaction with no recorded receipt survives compaction
+# (after that it was dropped or replaced under another hash)
+UNCONFIRMED_RETENTION = 86400.0
+
+
+def default_journal_path() -> Path:
+    """
+    Return the journal location (``MECHX_JOURNAL_PATH`` if set).
+
+    :return: Path to the journal file
+    """
+    configured = EnvironmentConfig.load().mechx_journal_path
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / OPERATE_FOLDER_NAME / JOURNAL_FILE_NAME
+
+
+def _normalize_request_id(request_id: str) -> str:
+    """Return a request ID as lower-case hex without the 0x prefix."""
+    return request_id.lower().removeprefix("0x")
+
+
+@dataclass
+class JournalRecord:
+    """One journal line.
+
+    Attributes:
+        event: ``uploaded`` (request metadata pushed to IPFS), ``sent`` (a
+            request transaction was handed to the network), ``submitted``
+            (it was mined), ``reverted`` (it was mined and failed),
+            ``scanned`` (requests had no delivery up to a block) or
+            ``delivered`` (deliveries were found)
+        chain_config: Chain configuration name
+        request_ids: Marketplace request IDs (hex, no 0x prefix)
+        tx_hash: Request transaction hash (sent, submitted, reverted records)
+        from_block: Block to scan deliveries from (submitted, scanned records)
+        deliveries: Delivery data by request ID (delivered records)
+        data_hashes: Request metadata hashes (uploaded, sent, submitted records)
+        timestamp: Unix time the record was written
+        mech: Priority mech the requests were sent to (sent and submitted records)
+        delivered_by: Mech that delivered each request, by request ID
+            (delivered records)
+    """
+
+    event: str
+    chain_config: str
+    request_ids: List[str] = field(default_factory=list)
+    tx_hash: Optional[str] = None
+    from_block: Optional[int] = None
+    deliveries: Dict[str, Any] = field(default_factory=dict)
+    data_hashes: List[str] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.time)
+    mech: Optional[str] = None
+    delivered_by: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """
+        Serialize to one JSONL line.
+
+        :return: JSON object string (no trailing newline)
+        """
+        return json.dumps(
+            {"version": JOURNAL_FORMAT_VERSION, **asdict(self)}, sort_keys=True
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "JournalRecord":
+        """
+        Parse one JSONL line.
+
+        :param line: JSON object string
+        :return: Parsed record
+        :raises ValueError: If the line is malformed or of an unknown version
+        """
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed journal line: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("Journal line is not a JSON object")
+        version = data.pop("version", None)
+        if version != JOURNAL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported journal format version {version!r}")
+        try:
+            return cls(**data)
+        except TypeError as e:
+            raise ValueError(f"Invalid journal fields: {e}") from e
+
+
+@dataclass(frozen=True)
+class PendingRequest:
+    """A journaled request with no recorded delivery yet.
+
+    Attributes:
+        chain_config: Chain configuration name
+        request_id: Marketplace request ID (hex, no 0x prefix)
+        tx_hash: Transaction that created the request
+        from_block: Block to scan deliveries from
+        mech: Priority mech the request was sent to, if recorded
+        submitted_at: Unix time the request was recorded as mined
+    """
+
+    chain_config: str
+    request_id: str
+    tx_hash: Optional[str]
+    from_block: Optional[int]
+    # Carried through compaction; not part of the request's identity
+    mech: Optional[str] = field(default=None, compare=False)
+    submitted_at: Optional[float] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class RequestOutcome:
+    """A journaled request sent to a known priority mech, and its delivery.
+
+    Attributes:
+        chain_config: Chain configuration name
+        request_id: Marketplace request ID (hex, no 0x prefix)
+        mech: Priority mech the request was sent to
+        submitted_at: Unix time the request was recorded as mined
+        delivered_at: Unix time its delivery was recorded (None: undelivered)
+        delivered_by: Mech that delivered it, if known
+    """
+
+    chain_config: str
+    request_id: str
+    mech: str
+    submitted_at: float
+    delivered_at: Optional[float] = None
+    delivered_by: Optional[str] = None
+
+
+def _drop_torn_tail(path: Path) -> None:
+    """Cut off a final line left without its newline by a crash mid-write."""
+    with open(path, "rb+") as f:
+        position = f.seek(0, os.SEEK_END)
+        if position == 0:
+            return
+        f.seek(position - 1)
+        if f.read(1) == b"\n":
+            return
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b"\n")
+            if newline != -1:
+                f.truncate(position + newline + 1)
+                return
+        f.truncate(0)
+
+
+class RequestJournal:
+    """Append-only JSONL journal of request stages and their deliveries.
+
+    Each record is written with a single ``write`` in append mode and
+    fsync'd before :meth:`append` returns, so several processes can share
+    one journal file and a crash loses at most the line being written. That
+    torn line is skipped when reading and cut off by the next append.
+
+    Appends hold a shared ``flock`` on a sibling ``.lock`` file and
+    :meth:`compact` an exclusive one, so compaction never drops a record
+    appended while it rewrites the file (where ``fcntl`` is available).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the journal.
+
+        :param path: Journal file (default: :func:`default_journal_path`)
+        """
+        self.path = Path(path) if path is not None else default_journal_path()
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """
+        Hold the journal's lock file for the duration of the block.
+
+        The lock lives next to the journal rather than on it, because
+        compaction replaces the journal file itself.
+
+        :param exclusive: Take the lock exclusively (compaction) instead of
+            shared (appends)
+        :yield: Nothing; the lock is held inside the block
+        """
+        if fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_name(self.path.name + ".lock")
+        with open(lock_path, "a", encoding="utf-8") as lock_file:
+            fcntl.flock(
+                lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def append(self, record: JournalRecord) -> None:
+        """
+        Durably append one record, creating the file and directory if needed.
+
+        :param record: Record to append
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(exclusive=False):
+            if self.path.exists():
+                _drop_torn_tail(self.path)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(record.to_json() + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_upload(self, chain_config: str, data_hashes: Iterable[str]) -> None:
+        """
+        Record request metadata uploaded to IPFS, before anything is sent.
+
+        :param chain_config: Chain configuration name
+        :param data_hashes: Metadata hashes, one per request
+        """
+        self.append(
+            JournalRecord(
+                event=EVENT_UPLOADED,
+                chain_config=chain_config,
+                data_hashes=list(data_hashes),
+            )
+        )
+
+    def record_sent(
+        self,
+        chain_config: str,
+        tx_hash: str,
+        data_hashes: Iterable[str],
+        mech: Optional[str] = None,
+    ) -> None:
+        """
+        Record a request transaction handed to the network, before its receipt.
+
+        :param chain_config: Chain configuration name
+        :param tx_hash: Request transaction hash
+        :param data_hashes: Metadata hashes the transaction requests
+        :param mech: Priority mech of the requests (kept for their receipt
+            recovered after a restart)
+        """
+        self.append(
+            JournalRecord(
+                event=EVENT_SENT,
+                chain_config=chain_config,
+                tx_hash=tx_hash,
+                data_hashes=list(data_hashes),
+                mech=mech,
+            )
+        )
+
+    def record_submission(  # pylint: disable=too-many-arguments
+        self,
+        chain_config: str,
+        tx_hash: str,
+        request_ids: Iterable[str],
+        from_block: Optional[int],
+        data_hashes: Iterable[str] = (),
+        mech: Optional[str] = None,
+        submitted_at: Optional[float] = None,
+    ) -> None:
+        """
+        Record a mined request transaction and the requests it created.
+
+        :param chain_config: Chain configuration name
+        :param tx_hash: Request transaction hash (the one that was included)
+        :param request_ids: Request IDs the transaction created
+        :param from_block: Block the transaction was mined in
+        :param data_hashes: Metadata hashes the transaction requested
+        :param mech: Priority mech the requests were sent to
+        :param submitted_at: Unix time the transaction was sent (default: now)
+        """
+        self.append(
+            JournalRecord(
+                event=EVENT_SUBMITTED,
+                chain_config=chain_config,
+                request_ids=[_normalize_request_id(rid) for rid in request_ids],
+                tx_hash=tx_hash,
+                from_block=from_block,
+                data_hashes=list(data_hashes),
+                timestamp=time.time() if submitted_at is None else submitted_at,
+                mech=mech,
+            )
+        )
+
+    def record_reverted(
+        self, chain_config: str, tx_hash: str, data_hashes: Iterable[str] = ()
+    ) -> None:
+        """
+        Record a request transaction that was mined but reverted.
+
+        :param chain_config: Chain configuration name
+        :param tx_hash: Request transaction hash (the one that was included)
+        :param data_hashes: Metadata hashes the transaction requested
+        """
+        self.append(
+            JournalRecord(
+                event=EVENT_REVERTED,
+                chain_config=chain_config,
+                tx_hash=tx_hash,
+                data_hashes=list(data_hashes),
+            )
+        )
+
+    def record_scanned(
+        self, chain_config: str, request_ids: Iterable[str], from_block: int
+    ) -> None:
+        """
+        Record that requests had no delivery before ``from_block``.
+
+        A later watch of these requests starts from ``from_block`` instead of
+        the block they were submitted in.
+
+        :param chain_config: Chain configuration name
+        :param request_ids: Requests still undelivered
+        :param from_block: First block a later scan must cover
+        """
+        normalized = [_normalize_request_id(rid) for rid in request_ids]
+        if not normalized:
+            return
+        self.append(
+            JournalRecord(
+                event=EVENT_SCANNED,
+                chain_config=chain_config,
+                request_ids=normalized,
+                from_block=from_block,
+            )
+        )
+
+    def record_deliveries(
+        self,
+        chain_config: str,
+        deliveries: Dict[str, Any],
+        delivered_by: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Record delivered requests.
+
+        :param chain_config: Chain configuration name
+        :param deliveries: Delivery data by request ID
+        :param delivered_by: Mech that delivered each request, by request ID
+        """
+        if not deliveries:
+            return
+        normalized = {
+            _normalize_request_id(rid): data for rid, data in deliveries.items()
+        }
+        mechs = {
+            _normalize_request_id(rid): mech
+            for rid, mech in (delivered_by or {}).items()
+            if _normalize_request_id(rid) in normalized
+        }
+        self.append(
+            JournalRecord(
+                event=EVENT_DELIVERED,
+                chain_config=chain_config,
+                request_ids=sorted(normalized),
+                deliveries=normalized,
+                delivered_by=mechs,
+            )
+        )
+
+    def records(self) -> List[JournalRecord]:
+        """
+        Read every record, in file order.
+
+        A missing file is an empty journal; blank lines and a final line torn
+        by a crash (no trailing newline) are skipped.
+
+        :return: Journal records
+        :raises ValueError: If a line is invalid (the line number is reported)
+        """
+        if not self.path.exists():
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.readlines()
+        records = []
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                records.append(JournalRecord.from_json(line))
+            except ValueError as e:
+                if line_number == len(lines) and not line.endswith("\n"):
+                    logger.warning(
+                        f"{self.path}:{line_number}: skipping torn last line ({e})"
+                    )
+                    continue
+                raise ValueError(f"{self.path}:{line_number}: {e}") from e
+        return records
+
+    def deliveries(self, chain_config: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the recorded deliveries by request ID.
+
+        :param chain_config: Only this chain (default: every chain)
+        :return: Delivery data by request ID
+        """
+        return _deliveries(self.records(), chain_config)
+
+    def pending(self, chain_config: Optional[str] = None) -> List[PendingRequest]:
+        """
+        Return submitted requests with no recorded delivery, in order.
+
+        Each starts from its last scanned block, if one was recorded.
+
+        :param chain_config: Only this chain (default: every chain)
+        :return: Pending requests
+        """
+        return _pending(self.records(), chain_config)
+
+    def unconfirmed(self, chain_config: Optional[str] = None) -> List[JournalRecord]:
+        """
+        Return sent request transactions with no recorded receipt, in order.
+
+        These are what a crash between sending and mining leaves behind;
+        looking their receipts up recovers the request IDs without sending
+        (and paying) again.
+
+        :param chain_config: Only this chain (default: every chain)
+        :return: ``sent`` records
+        """
+        return _unconfirmed(self.records(), chain_config)
+
+    def outcomes(self, chain_config: Optional[str] = None) -> List[RequestOutcome]:
+        """
+        Return the requests recorded with their priority mech, in order.
+
+        Delivery times are when the delivery was recorded: right after it
+        for requests that were waited for, later for ones collected by
+        ``mechx deliveries watch|collect``.
+
+        :param chain_config: Only this chain (default: every chain)
+        :return: Request outcomes
+        """
+        return _outcomes(self.records(), chain_config)
+
+    def compact(
+        self,
+        keep_deliveries: bool = False,
+        unconfirmed_retention: float = UNCONFIRMED_RETENTION,
+    ) -> int:
+        """
+        Rewrite the journal down to what a restarted watcher needs.
+
+        Pending requests are kept (one ``submitted`` record per transaction,
+        starting from the last scanned block), as are sent transactions with
+        no receipt that are younger than ``unconfirmed_retention``. Uploads,
+        receipts, scan checkpoints and delivered requests are dropped. The
+        new file replaces the old one atomically while the journal's lock is
+        held exclusively, so appends from other processes wait for it
+        instead of being lost.
+
+        :param keep_deliveries: Keep the recorded deliveries (one record per
+            chain) instead of dropping them
+        :param unconfirmed_retention: Seconds an unconfirmed sent transaction
+            is kept
+        :return: Number of records written
+        """
+        if not self.path.exists():
+            return 0
+        with self._locked(exclusive=True):
+            return self._compact(keep_deliveries, unconfirmed_retention)
+
+    def _compact(self, keep_deliveries: bool, unconfirmed_retention: float) -> int:
+        """Rewrite the journal (see :meth:`compact`); the lock must be held."""
+        if not self.path.exists():
+            return 0
+        records = self.records()
+        now = time.time()
+        kept = [
+            record
+            for record in _unconfirmed(records, None)
+            if now - record.timestamp < unconfirmed_retention
+        ]
+        by_transaction: Dict[Tuple[Any, ...], List[str]] = {}
+        for request in _pending(records, None):
+            key = (
+                request.chain_config,
+                request.tx_hash,
+                request.from_block,
+                request.mech,
+                request.submitted_at,
+            )
+            by_transaction.setdefault(key, []).append(request.request_id)
+        for key, request_ids in by_transaction.items():
+            chain_config, tx_hash, from_block, mech, submitted_at = key
+            kept.append(
+                JournalRecord(
+                    event=EVENT_SUBMITTED,
+                    chain_config=chain_config,
+                    request_ids=request_ids,
+                    tx_hash=tx_hash,
+                    from_block=from_block,
+                    # Keeps the submission time latency statistics rely on
+                    timestamp=submitted_at or now,
+                    mech=mech,
+                )
+            )
+        if keep_deliveries:
+            chains = dict.fromkeys(
+                r.chain_config for r in records if r.event == EVENT_DELIVERED
+            )
+            for chain_config in chains:
+                delivered = _deliveries(records, chain_config)
+                delivered_by: Dict[str, str] = {}
+                for record in records:
+                    if record.event == EVENT_DELIVERED and _matches(
+                        record, chain_config
+                    ):
+                        delivered_by.update(record.delivered_by)
+                kept.append(
+                    JournalRecord(
+                        event=EVENT_DELIVERED,
+                        chain_config=chain_config,
+                        request_ids=sorted(delivered),
+                        deliveries=delivered,
+                        delivered_by=delivered_by,
+                    )
+                )
+
+        temporary = self.path.with_name(self.path.name + ".compact")
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.writelines(record.to_json() + "\n" for record in kept)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+        logger.info(f"Compacted {self.path}: {len(records)} record(s) -> {len(kept)}")
+        return len(kept)
+
+
+def _matches(record: JournalRecord, chain_config: Optional[str]) -> bool:
+    """Return whether ``record`` belongs to ``chain_config`` (None: any)."""
+    return chain_config in (None, record.chain_config)
+
+
+def _deliveries(
+    records: List[JournalRecord], chain_config: Optional[str]
+) -> Dict[str, Any]:
+    """Merge the delivered records of ``chain_config``."""
+    delivered: Dict[str, Any] = {}
+    for record in records:
+        if record.event == EVENT_DELIVERED and _matches(record, chain_config):
+            delivered.update(record.deliveries)
+    return delivered
+
+
+def _pending(
+    records: List[JournalRecord], chain_config: Optional[str]
+) -> List[PendingRequest]:
+    """Resolve the undelivered requests of ``chain_config``."""
+    delivered = {
+        (record.chain_config, rid)
+        for record in records
+        if record.event == EVENT_DELIVERED
+        for rid in record.request_ids
+    }
+    scanned: Dict[Tuple[str, str], int] = {}
+    for record in records:
+        if record.event == EVENT_SCANNED and record.from_block is not None:
+            for rid in record.request_ids:
+                key = (record.chain_config, rid)
+                scanned[key] = max(scanned.get(key, 0), record.from_block)
+    pending: Dict[Tuple[str, str], PendingRequest] = {}
+    for record in records:
+        if record.event != EVENT_SUBMITTED or not _matches(record, chain_config):
+            continue
+        for rid in record.request_ids:
+            key = (record.chain_config, rid)
+            if key in delivered or key in pending:
+                continue
+            from_block = record.from_block
+            if key in scanned:
+                from_block = max(from_block or 0, scanned[key])
+            pending[key] = PendingRequest(
+                chain_config=record.chain_config,
+                request_id=rid,
+                tx_hash=record.tx_hash,
+                from_block=from_block,
+                mech=record.mech,
+                submitted_at=record.timestamp,
+            )
+    return list(pending.values())
+
+
+def _outcomes(
+    records: List[JournalRecord], chain_config: Optional[str]
+) -> List[RequestOutcome]:
+    """Pair the requests of ``chain_config`` sent to a known mech with deliveries."""
+    delivered: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+    for record in records:
+        if record.event != EVENT_DELIVERED:
+            continue
+        for rid in record.request_ids:
+            delivered.setdefault(
+                (record.chain_config, rid),
+                (record.timestamp, record.delivered_by.get(rid)),
+            )
+    outcomes: Dict[Tuple[str, str], RequestOutcome] = {}
+    for record in records:
+        if (
+            record.event != EVENT_SUBMITTED
+            or not record.mech
+            or not _matches(record, chain_config)
+        ):
+            continue
+        for rid in record.request_ids:
+            key = (record.chain_config, rid)
+            if key in outcomes:
+                continue
+            delivered_at, delivered_by = delivered.get(key, (None, None))
+            outcomes[key] = RequestOutcome(
+                chain_config=record.chain_config,
+                request_id=rid,
+                mech=record.mech,
+                submitted_at=record.timestamp,
+                delivered_at=delivered_at,
+                delivered_by=delivered_by,
+            )
+    return list(outcomes.values())
+
+
+def _unconfirmed(
+    records: List[JournalRecord], chain_config: Optional[str]
+) -> List[JournalRecord]:
+    """Return the sent records of ``chain_config`` with no receipt recorded."""
+    # A fee-bumped transaction is mined under another hash; its receipt
+    # record then matches the sent one by the metadata hashes it carries.
+    settled = set()
+    for record in records:
+        if record.event in (EVENT_SUBMITTED, EVENT_REVERTED):
+            settled.add((record.chain_config, record.tx_hash))
+            if record.data_hashes:
+                settled.add((record.chain_config, tuple(record.data_hashes)))
+    unconfirmed: Dict[Tuple[str, Optional[str]], JournalRecord] = {}
+    for record in records:
+        if record.event != EVENT_SENT or not _matches(record, chain_config):
+            continue
+        key = (record.chain_config, record.tx_hash)
+        if (
+            key in settled
+            or (record.chain_config, tuple(record.data_hashes)) in settled
+            or key in unconfirmed
+        ):
+            continue
+        unconfirmed[key] = record
+    return list(unconfirmed.values())
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,9 +20,18 @@
 """Subgraph infrastructure for querying marketplace data."""
 
 from mech_client.infrastructure.subgraph.client import SubgraphClient
-from mech_client.infrastructure.subgraph.queries import query_mm_mechs_info
+from mech_client.infrastructure.subgraph.queries import (
+    iter_mm_mechs_info,
+    query_mech_requests,
+    query_mm_mechs_info,
+)
+from mech_client.infrastructure.subgraph.sync import MechSnapshot, SubgraphSync
 
 __all__ = [
+    "MechSnapshot",
     "SubgraphClient",
+    "SubgraphSync",
+    "iter_mm_mechs_info",
+    "query_mech_requests",
     "query_mm_mechs_info",
 ]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,19 +19,46 @@
 
 """GraphQL subgraph client."""
 
-from typing import Any, Dict
+import asyncio
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from gql import Client, gql
+from gql.client import AsyncClientSession
+from gql.graphql_request import GraphQLRequest
 from gql.transport.aiohttp import AIOHTTPTransport
 
 DEFAULT_TIMEOUT = 600.0
 
+# Largest page a Graph Node serves per query
+PAGE_SIZE = 1000
 
-class SubgraphClient:
+# Fields selected for each mech: what listings display (only the first
+# service metadata entry) plus the ID that pagination is keyed on
+MECH_FIELDS = (
+    "id address mechFactory totalDeliveriesTransactions "
+    "service { id totalDeliveries metadata(first: 1) { metadata } }"
+)
+
+# Fields selected for each request: when it was mined and its delivery
+# (None until delivered), with the mech that delivered it and when
+REQUEST_FIELDS = "requestId blockTimestamp priorityMech delivery { mech blockTimestamp }"
+
+
+class SubgraphClient:  # pylint: disable=too-many-instance-attributes
     """Client for querying mech marketplace subgraph via GraphQL.
 
     Provides methods for executing GraphQL queries against the marketplace
     subgraph to retrieve mech metadata, delivery counts, and other on-chain data.
+
+    The ``*_async`` methods share one session, kept open on the running
+    event loop until :meth:`close_async` (or the end of an ``async with``
+    block), and can run several queries concurrently. Synchronous queries
+    share one the same way inside a :meth:`session` block, which
+    :meth:`iter_mechs` and :meth:`execute_many` open for themselves;
+    outside one, :meth:`execute` opens a connection and an event loop per
+    query.
     """
 
     def __init__(self, subgraph_url: str, timeout: float = DEFAULT_TIMEOUT):
@@ -44,6 +71,11 @@ class SubgraphClient:
         self.subgraph_url = subgraph_url
         self.timeout = timeout
         self._client: Client = None  # type: ignore
+        self._async_client: Optional[Client] = None
+        self._session: Optional[AsyncClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
     def client(self) -> Client:
@@ -52,16 +84,51 @@ class SubgraphClient:
         :return: GQL client instance
         """
         if self._client is None:
-            transport = AIOHTTPTransport(url=self.subgraph_url)
-            self._client = Client(
-                transport=transport,
-                execute_timeout=self.timeout,
-            )
+            self._client = self._new_client()
         return self._client
 
-    def execute(self, query: str) -> Dict[str, Any]:
+    def _new_client(self) -> Client:
+        """Create a GQL client over a fresh aiohttp transport."""
+        transport = AIOHTTPTransport(url=self.subgraph_url)
+        return Client(
+            transport=transport,
+            execute_timeout=self.timeout,
+        )
+
+    async def __aenter__(self) -> "SubgraphClient":
+        """Open the shared session."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the shared session."""
+        await self.close_async()
+
+    async def _get_session(self) -> AsyncClientSession:
+        """Return the session of the running loop, connecting it once."""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # Sessions belong to the loop they were opened on
+            self._async_client = None
+            self._session = None
+            self._session_loop = loop
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:  # type: ignore[union-attr]
+            if self._session is None:
+                self._async_client = self._new_client()
+                self._session = await self._async_client.connect_async()
+        return self._session
+
+    async def close_async(self) -> None:
+        """Close the shared session, if one is open."""
+        client, self._async_client, self._session = self._async_client, None, None
+        self._session_loop = None
+        if client is not None:
+            await client.close_async()
+
+    async def execute_async(self, query: str) -> Dict[str, Any]:
         """
-        Execute a GraphQL query.
+        Execute a GraphQL query on the shared session.
 
         Any underlying error from the gql client (transport / parse /
         server) propagates to the caller unchanged.
@@ -69,35 +136,219 @@ class SubgraphClient:
         :param query: GraphQL query string
         :return: Query response data
         """
+        session = await self._get_session()
+        return await session.execute(gql(query))
+
+    async def execute_many_async(
+        self, queries: Sequence[str], batch: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several GraphQL queries on the shared session.
+
+        By default the queries run concurrently, one HTTP request each over
+        the session's pooled connections. With ``batch`` they are sent as
+        one GraphQL batch (a JSON array body), which needs an endpoint that
+        accepts batched requests.
+
+        :param queries: GraphQL query strings
+        :param batch: Send the queries in one batched request
+        :return: Query response data, in query order
+        """
+        session = await self._get_session()
+        if batch:
+            return await session.execute_batch(
+                [GraphQLRequest(gql(query)) for query in queries]
+            )
+        return list(
+            await asyncio.gather(*(session.execute(gql(query)) for query in queries))
+        )
+
+    @contextmanager
+    def session(self) -> Iterator["SubgraphClient"]:
+        """
+        Run the synchronous queries of the block over one shared session.
+
+        :meth:`execute`, :meth:`execute_many` and the queries built on them
+        reuse one event loop and one connection until the block ends, which
+        then closes both. A nested block joins the outer one. Not for use
+        from a running event loop (use the ``*_async`` methods there).
+
+        :yield: This client
+        """
+        if self._sync_loop is not None:
+            yield self
+            return
+        loop = asyncio.new_event_loop()
+        self._sync_loop = loop
+        try:
+            yield self
+        finally:
+            self._sync_loop = None
+            try:
+                loop.run_until_complete(self.close_async())
+            finally:
+                loop.close()
+
+    def execute_many(
+        self, queries: Sequence[str], batch: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several GraphQL queries from synchronous code.
+
+        The queries run concurrently on the shared :meth:`session` (opened
+        for the call unless one is already open), instead of paying for an
+        event loop and a connection per query as :meth:`execute` does.
+
+        :param queries: GraphQL query strings
+        :param batch: Send the queries in one batched request
+        :return: Query response data, in query order
+        """
+        with self.session():
+            return self._sync_loop.run_until_complete(  # type: ignore[union-attr]
+                self.execute_many_async(queries, batch=batch)
+            )
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query.
+
+        Runs on the shared session inside a :meth:`session` block, and on a
+        connection of its own otherwise. Any underlying error from the gql
+        client (transport / parse / server) propagates to the caller
+        unchanged.
+
+        :param query: GraphQL query string
+        :return: Query response data
+        """
+        if self._sync_loop is not None:
+            return self._sync_loop.run_until_complete(self.execute_async(query))
         return self.client.execute(gql(request_string=query))
 
     def query_mechs(
         self,
         order_by: str = "totalDeliveriesTransactions",
         order_direction: str = "desc",
+        first: Optional[int] = None,
+        where: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Query mechs ordered by specified field.
 
         :param order_by: Field to order by (default: totalDeliveriesTransactions)
         :param order_direction: Sort direction "asc" or "desc" (default: desc)
+        :param first: Maximum number of mechs returned (None: the server's
+            default page)
+        :param where: Filter, e.g. ``{"totalDeliveriesTransactions_gt": "0"}``
         :return: Query response with mech data
         """
+        arguments = [f"orderBy: {order_by}", f"orderDirection: {order_direction}"]
+        if first is not None:
+            arguments.append(f"first: {int(first)}")
+        if where:
+            arguments.append(f"where: {_graphql_value(where)}")
         query = f"""
         query MechsOrderedByServiceDeliveries {{
-          meches(orderBy: {order_by}, orderDirection: {order_direction}) {{
-            id
-            address
-            mechFactory
-            totalDeliveriesTransactions
-            service {{
-              id
-              totalDeliveries
-              metadata {{
-                metadata
-              }}
-            }}
+          meches({", ".join(arguments)}) {{
+            {MECH_FIELDS}
           }}
         }}
         """
         return self.execute(query)
+
+    def query_requests(
+        self,
+        mechs: Sequence[str],
+        since: Optional[int] = None,
+        first: int = PAGE_SIZE,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Query the latest requests to several priority mechs, one query per mech.
+
+        Each request comes with its delivery, by whichever mech delivered it,
+        or ``None`` if it has none yet. The queries run concurrently over one
+        shared session (see :meth:`execute_many`).
+
+        :param mechs: Priority mech addresses
+        :param since: Only requests mined after this Unix time
+        :param first: Most recent requests returned per mech
+        :return: Requests by priority mech address, most recent first
+        """
+        queries = []
+        for mech in mechs:
+            where: Dict[str, Any] = {"priorityMech": mech.lower()}
+            if since is not None:
+                # BigInt filters take strings
+                where["blockTimestamp_gt"] = str(int(since))
+            arguments = [
+                f"first: {int(first)}",
+                "orderBy: blockTimestamp",
+                "orderDirection: desc",
+                f"where: {_graphql_value(where)}",
+            ]
+            queries.append(
+                f"""
+            query MechRequests {{
+              requests({", ".join(arguments)}) {{
+                {REQUEST_FIELDS}
+              }}
+            }}
+            """
+            )
+        responses = self.execute_many(queries) if queries else []
+        return {
+            mech: response.get("requests") or []
+            for mech, response in zip(mechs, responses)
+        }
+
+    def query_block_number(self) -> int:
+        """
+        Query the latest block the subgraph has indexed.
+
+        :return: Block number
+        """
+        response = self.execute("query IndexedBlock { _meta { block { number } } }")
+        return int(response["_meta"]["block"]["number"])
+
+    def iter_mechs(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        page_size: int = PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every mech matching ``where``, one page per query.
+
+        Pages are keyed by ID (``id_gt`` the last ID seen) rather than by
+        offset, so each query is cheap for the indexer however far the
+        iteration goes, and no single query has to return the whole
+        marketplace. Every page is fetched over one :meth:`session`.
+
+        :param where: Filter, e.g. ``{"totalDeliveriesTransactions_gt": "0"}``
+        :param page_size: Mechs fetched per query (at most 1000)
+        :yield: Mech data, in ascending ID order
+        """
+        with self.session():
+            last_id = ""
+            while True:
+                page = self.query_mechs(
+                    order_by="id",
+                    order_direction="asc",
+                    first=page_size,
+                    where={**(where or {}), "id_gt": last_id},
+                )["meches"]
+                yield from page
+                if len(page) < page_size:
+                    return
+                last_id = page[-1]["id"]
+
+
+def _graphql_value(value: Any) -> str:
+    """Render a filter value as a GraphQL input literal."""
+    if isinstance(value, dict):
+        fields = (f"{key}: {_graphql_value(item)}" for key, item in value.items())
+        return f"{{{', '.join(fields)}}}"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_graphql_value(item) for item in value)}]"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    # Int filters take numbers; BigInt, BigDecimal, Bytes and ID take strings
+    return json.dumps(value if isinstance(value, int) else str(value))
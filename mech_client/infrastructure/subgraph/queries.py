@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,10 +19,11 @@
 
 """Subgraph query functions and mappings."""
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 from mech_client.infrastructure.config.loader import get_mech_config
-from mech_client.infrastructure.subgraph.client import SubgraphClient
+from mech_client.infrastructure.subgraph.client import PAGE_SIZE, SubgraphClient
+from mech_client.infrastructure.subgraph.sync import SubgraphSync
 
 # Mapping of mech factory addresses to mech types per chain
 CHAIN_TO_MECH_FACTORY_TO_MECH_TYPE = {
@@ -53,37 +54,151 @@ CHAIN_TO_MECH_FACTORY_TO_MECH_TYPE = {
 
 RESULTS_LIMIT = 20
 
+# Subgraph filter of mechs that delivered at least once
+DELIVERED_MECHS = {"totalDeliveriesTransactions_gt": "0"}
 
-def query_mm_mechs_info(chain_config: str) -> Optional[List]:
+
+def iter_mm_mechs_info(chain_config: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over every marketplace mech with deliveries, page by page.
+
+    The delivery filter runs in the subgraph and pages are fetched as the
+    iteration proceeds, so even a full listing never waits on one query
+    returning the whole marketplace.
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism)
+    :yield: Mech data dicts with their ``mech_type``, in ascending ID order
+    :raises Exception: If subgraph URL not set for chain
+    """
+    client = _subgraph_client(chain_config)
+    mech_type = _mech_type_resolver(chain_config)
+    for item in client.iter_mechs(where=DELIVERED_MECHS):
+        item["mech_type"] = mech_type(item)
+        yield item
+
+
+def query_mm_mechs_info(
+    chain_config: str,
+    limit: Optional[int] = RESULTS_LIMIT,
+    snapshot: bool = False,
+    refresh: bool = False,
+) -> Optional[List]:
     """
     Query marketplace mechs and related info from subgraph.
 
     Queries the subgraph for mech information, filtering by mechs with
     total deliveries > 0 and enriching with mech type from factory address.
+    The filter and the limit are applied by the subgraph; without a limit
+    (or one above a page) every mech is fetched with :func:`iter_mm_mechs_info`.
+
+    With ``snapshot`` the mechs are read from the chain's local
+    :class:`SubgraphSync` snapshot instead, which only queries the subgraph
+    for the mechs changed since its last sync, once its refresh interval
+    has passed.
 
     :param chain_config: Chain configuration name (gnosis, base, polygon, optimism)
-    :return: List of mech data dicts, or None if no mechs found
+    :param limit: Maximum number of mechs returned (None: all of them)
+    :param snapshot: Read from the local snapshot
+    :param refresh: Sync the snapshot even within its refresh interval
+    :return: List of mech data dicts, most delivered first, or None if no
+        mechs found
     :raises Exception: If subgraph URL not set for chain
     """
+    if snapshot:
+        mech_type = _mech_type_resolver(chain_config)
+        synced = SubgraphSync(chain_config, _subgraph_url(chain_config)).snapshot(
+            force=refresh
+        )
+        mechs = sorted(
+            (
+                {**item, "mech_type": mech_type(item)}
+                for item in synced.mechs.values()
+                if int(item["totalDeliveriesTransactions"]) > 0
+            ),
+            key=lambda item: int(item["totalDeliveriesTransactions"]),
+            reverse=True,
+        )
+        return mechs[:limit]
+
+    if limit is None or limit > PAGE_SIZE:
+        mechs = sorted(
+            iter_mm_mechs_info(chain_config),
+            key=lambda item: int(item["totalDeliveriesTransactions"]),
+            reverse=True,
+        )
+        return mechs[:limit]
+
+    client = _subgraph_client(chain_config)
+    mech_type = _mech_type_resolver(chain_config)
+    response = client.query_mechs(first=limit, where=DELIVERED_MECHS)
+
+    filtered_mechs_data = []
+    for item in response["meches"]:  # pylint: disable=unsubscriptable-object
+        # The subgraph already filters; this guards endpoints that do not
+        if int(item["totalDeliveriesTransactions"]) > 0:
+            item["mech_type"] = mech_type(item)
+            filtered_mechs_data.append(item)
+
+    return filtered_mechs_data[:limit]
+
+
+def query_mech_requests(
+    chain_config: str, mechs: Sequence[str], since: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Query the recent requests to several priority mechs and their deliveries.
+
+    :param chain_config: Chain configuration name (gnosis, base, polygon, optimism)
+    :param mechs: Priority mech addresses
+    :param since: Only requests mined after this Unix time
+    :return: Requests as dicts with ``request_id``, ``priority_mech``,
+        ``requested_at``, ``delivered_by`` and ``delivered_at`` (both
+        ``None`` while the request is undelivered)
+    :raises Exception: If subgraph URL not set for chain
+    """
+    client = _subgraph_client(chain_config)
+    by_mech = client.query_requests(
+        mechs, since=int(since) if since is not None else None
+    )
+    requests = []
+    for mech, items in by_mech.items():
+        for item in items:
+            delivery = item.get("delivery") or {}
+            delivered = bool(delivery.get("mech") and delivery.get("blockTimestamp"))
+            requests.append(
+                {
+                    "request_id": item["requestId"].lower().removeprefix("0x"),
+                    "priority_mech": mech.lower(),
+                    "requested_at": float(item["blockTimestamp"]),
+                    "delivered_by": delivery["mech"].lower() if delivered else None,
+                    "delivered_at": (
+                        float(delivery["blockTimestamp"]) if delivered else None
+                    ),
+                }
+            )
+    return requests
+
+
+def _subgraph_url(chain_config: str) -> str:
+    """Return the chain's subgraph URL."""
     mech_config = get_mech_config(chain_config)
     if not mech_config.subgraph_url:
         raise Exception(f"Subgraph URL not set for chain config: {chain_config}")
+    return mech_config.subgraph_url
 
-    client = SubgraphClient(mech_config.subgraph_url)
-    response = client.query_mechs()
 
+def _subgraph_client(chain_config: str) -> SubgraphClient:
+    """Return a client for the chain's subgraph."""
+    return SubgraphClient(_subgraph_url(chain_config))
+
+
+def _mech_type_resolver(chain_config: str) -> Callable[[Dict[str, Any]], str]:
+    """Return a function mapping a mech item to its type by factory address."""
     # Map factory addresses to mech types (case-insensitive)
     mech_factory_to_mech_type = {
         k.lower(): v
         for k, v in CHAIN_TO_MECH_FACTORY_TO_MECH_TYPE[chain_config].items()
     }
-
-    # Filter mechs with deliveries > 0 and add mech type
-    filtered_mechs_data = []
-    for item in response["meches"]:  # pylint: disable=unsubscriptable-object
-        if int(item["totalDeliveriesTransactions"]) > 0:
-            factory = item["mechFactory"].lower()
-            item["mech_type"] = mech_factory_to_mech_type.get(factory, "Unknown")
-            filtered_mechs_data.append(item)
-
-    return filtered_mechs_data[:RESULTS_LIMIT]
+    return lambda item: mech_factory_to_mech_type.get(
+        item["mechFactory"].lower(), "Unknown"
+    )
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Incremental sync of marketplace mechs into a local snapshot.
+
+Listings, the mech index and tool discovery all start from every mech in
+the marketplace subgraph. Instead of re-querying all of them each time,
+a snapshot of the mechs (with their service and delivery counters) is
+kept on disk per chain. A sync asks the subgraph for the block it has
+indexed and fetches only the mechs changed since the previous sync
+(``_change_block: {number_gte: ...}``); within the refresh interval the
+snapshot is used without any query at all.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from mech_client.infrastructure.config.constants import SUBGRAPH_SYNC_INTERVAL
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+from mech_client.infrastructure.subgraph.client import SubgraphClient
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def default_snapshot_dir() -> Path:
+    """
+    Return the directory subgraph snapshots are kept in.
+
+    :return: Snapshot directory
+    """
+    return Path.home() / ".cache" / "mech_client" / "subgraph"
+
+
+@dataclass
+class MechSnapshot:
+    """Local copy of a chain's marketplace mechs.
+
+    Attributes:
+        subgraph_url: Subgraph the snapshot was taken from
+        block: Subgraph block the snapshot is complete up to (None: never
+            synced)
+        synced_at: Unix time of the last sync
+        mechs: Mech data by mech ID, as returned by the subgraph
+    """
+
+    subgraph_url: str
+    block: Optional[int] = None
+    synced_at: float = 0.0
+    mechs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class SubgraphSync:
+    """Keeps a chain's :class:`MechSnapshot` up to date.
+
+    The first sync (or one against a different subgraph URL) fetches every
+    mech. Later ones fetch the mechs the subgraph changed at or after the
+    block of the previous sync and merge them in, so a sync costs one page
+    per thousand changed mechs rather than per thousand mechs.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        chain_config: str,
+        subgraph_url: str,
+        directory: Optional[Union[str, Path]] = None,
+        interval: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the sync.
+
+        :param chain_config: Chain configuration name
+        :param subgraph_url: GraphQL endpoint URL for the subgraph
+        :param directory: Snapshot directory (default: :func:`default_snapshot_dir`)
+        :param interval: Seconds a snapshot is used before syncing again
+            (default: ``MECHX_SUBGRAPH_SYNC_INTERVAL`` or 300)
+        :param clock: Wall-clock time source
+        """
+        if interval is None:
+            interval = EnvironmentConfig.load().mechx_subgraph_sync_interval
+        self.chain_config = chain_config
+        self.subgraph_url = subgraph_url
+        self.directory = (
+            Path(directory) if directory is not None else default_snapshot_dir()
+        )
+        self.interval = SUBGRAPH_SYNC_INTERVAL if interval is None else interval
+        self.client = SubgraphClient(subgraph_url)
+        self._clock = clock
+
+    @property
+    def path(self) -> Path:
+        """Snapshot file of the chain.
+
+        :return: Path to the JSON snapshot
+        """
+        return self.directory / f"{self.chain_config}.json"
+
+    def snapshot(self, force: bool = False) -> MechSnapshot:
+        """
+        Return the chain's snapshot, syncing it first if it is due.
+
+        A failed sync is logged and the previous snapshot returned, unless
+        there is none to fall back on.
+
+        :param force: Sync even within the refresh interval
+        :return: Snapshot of the chain's mechs
+        """
+        snapshot = self.load()
+        synced = snapshot.block is not None
+        if synced and not force and self._clock() - snapshot.synced_at < self.interval:
+            return snapshot
+        try:
+            return self.sync(snapshot)
+        except Exception as e:  # pylint: disable=broad-except
+            if not synced:
+                raise
+            logger.warning(
+                f"Could not sync the {self.chain_config} subgraph snapshot; "
+                f"using the one from block {snapshot.block}: {e}"
+            )
+            return snapshot
+
+    def sync(self, snapshot: Optional[MechSnapshot] = None) -> MechSnapshot:
+        """
+        Fetch the mechs changed since ``snapshot`` and store the result.
+
+        :param snapshot: Snapshot to bring up to date (default: the stored one)
+        :return: Updated snapshot
+        """
+        snapshot = snapshot if snapshot is not None else self.load()
+        # The head and every page share one connection.
+        with self.client.session():
+            # Read the head first: changes indexed while paging are fetched
+            # again by the next sync instead of being missed.
+            head = self.client.query_block_number()
+            if snapshot.block is None:
+                mechs: Dict[str, Dict[str, Any]] = {}
+                changed = self.client.iter_mechs()
+            else:
+                mechs = dict(snapshot.mechs)
+                changed = self.client.iter_mechs(
+                    where={"_change_block": {"number_gte": snapshot.block}}
+                )
+            count = 0
+            for item in changed:
+                mechs[item["id"]] = item
+                count += 1
+        logger.debug(
+            f"Synced {count} changed mech(s) of {self.chain_config} up to block {head}"
+        )
+        synced = MechSnapshot(self.subgraph_url, head, self._clock(), mechs)
+        self._store(synced)
+        return synced
+
+    def load(self) -> MechSnapshot:
+        """
+        Read the stored snapshot.
+
+        :return: Stored snapshot, or an empty one if there is none usable
+        """
+        empty = MechSnapshot(self.subgraph_url)
+        if not self.path.exists():
+            return empty
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.pop("version", None) != SNAPSHOT_FORMAT_VERSION:
+                return empty
+            snapshot = MechSnapshot(**data)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable subgraph snapshot {self.path}: {e}")
+            return empty
+        # A snapshot of another subgraph says nothing about this one
+        return snapshot if snapshot.subgraph_url == self.subgraph_url else empty
+
+    def _store(self, snapshot: MechSnapshot) -> None:
+        """Write ``snapshot`` atomically (failures only cost the next sync)."""
+        try:
+            content = json.dumps(
+                {"version": SNAPSHOT_FORMAT_VERSION, **asdict(snapshot)}
+            )
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(content, encoding="utf-8")
+            os.replace(temporary, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write subgraph snapshot {self.path}: {e}")
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,12 +17,62 @@
 #
 # ------------------------------------------------------------------------------
 
-"""Service layer for business logic orchestration."""
+"""Service layer for business logic orchestration.
 
-from mech_client.services.marketplace_service import MarketplaceService
-from mech_client.services.tool_service import ToolService
+Services are imported on first access, so using one does not import the
+others (and their chain, Safe and operate dependencies).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mech_client.services.broadcast_service import BroadcastService
+    from mech_client.services.delivery_service import DeliveryService
+    from mech_client.services.index_service import IndexService
+    from mech_client.services.marketplace_service import MarketplaceService
+    from mech_client.services.selection_service import MechSelectionService
+    from mech_client.services.tool_service import ToolService
+
+_LAZY_ATTRIBUTES = {
+    "BroadcastService": "mech_client.services.broadcast_service",
+    "DeliveryService": "mech_client.services.delivery_service",
+    "IndexService": "mech_client.services.index_service",
+    "MarketplaceService": "mech_client.services.marketplace_service",
+    "MechSelectionService": "mech_client.services.selection_service",
+    "ToolService": "mech_client.services.tool_service",
+}
 
 __all__ = [
+    "BroadcastService",
+    "DeliveryService",
+    "IndexService",
     "MarketplaceService",
+    "MechSelectionService",
     "ToolService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a service on first access (PEP 562).
+
+    :param name: Attribute name
+    :return: The attribute
+    :raises AttributeError: If the package has no such attribute
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package's attributes, including those not imported yet.
+
+    :return: Attribute names
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -24,8 +24,9 @@ from typing import Optional
 
 from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 from mech_client.domain.execution import ExecutorFactory, TransactionExecutor
-from mech_client.domain.signing import LocalSigner, Signer
+from mech_client.domain.signing import LocalSigner, Signer, SignerPool
 from mech_client.infrastructure.config import MechConfig, get_mech_config
+from mech_client.infrastructure.http import get_http_registry
 from safe_eth.eth import EthereumClient
 
 
@@ -44,9 +45,18 @@ class BaseTransactionService:  # pylint: disable=too-few-public-methods,too-many
     ``crypto=`` to sign locally as before.
 
     Subclasses should call super().__init__() first, then add their own
-    specific initialization.
+    specific initialization. Subclasses that await every receipt through
+    the executor's :class:`TransactionSupervisor` (and forget it afterwards)
+    set ``supervise_transactions`` to get fee-bumped replacement.
+    Subclasses that hold a :meth:`SignerPool.lease` around every operation
+    set ``leases_signer_pool`` to accept a pool; elsewhere each call could
+    pick another key, signing with one key a nonce and sender read for
+    another.
     """
 
+    supervise_transactions: bool = False
+    leases_signer_pool: bool = False
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         chain_config: str,
@@ -65,10 +75,16 @@ class BaseTransactionService:  # pylint: disable=too-few-public-methods,too-many
         :param safe_address: Safe address (required for agent mode)
         :param ethereum_client: Ethereum client (required for agent mode)
         :param signer: Signer for externalized signing (alternative to crypto)
-        :raises ValueError: If neither crypto nor signer is provided
+        :raises ValueError: If neither crypto nor signer is provided, or a
+            SignerPool is given to a service that does not lease its keys
         """
         if crypto is None and signer is None:
             raise ValueError("Either a crypto object or a signer is required")
+        if isinstance(signer, SignerPool) and not self.leases_signer_pool:
+            raise ValueError(
+                f"{type(self).__name__} does not support a SignerPool; pass "
+                "one of the pool's signers instead."
+            )
 
         self.chain_config = chain_config
         self.agent_mode = agent_mode
@@ -80,6 +96,7 @@ class BaseTransactionService:  # pylint: disable=too-few-public-methods,too-many
             chain_config, agent_mode=agent_mode
         )
         self.ledger_api = EthereumApi(**asdict(self.mech_config.ledger_config))
+        get_http_registry().attach_to_provider(self.ledger_api.api.provider)
 
         # Resolve the signer (injected, or local default around crypto)
         if signer is None:
@@ -93,4 +110,5 @@ class BaseTransactionService:  # pylint: disable=too-few-public-methods,too-many
             safe_address=safe_address,
             ethereum_client=ethereum_client,
             signer=self.signer,
+            supervise=self.supervise_transactions,
         )
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Broadcast service for streaming pre-signed transactions to the network."""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.domain.delivery import OnchainDeliveryWatcher
+from mech_client.infrastructure.blockchain.abi_loader import get_abi
+from mech_client.infrastructure.blockchain.broadcast import send_raw_transactions
+from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.blockchain.presigned import PresignedTransaction
+from mech_client.infrastructure.blockchain.receipt_waiter import (
+    get_receipt_waiter,
+    watch_for_marketplace_request_ids,
+)
+from mech_client.infrastructure.config import MechConfig, get_mech_config
+from mech_client.infrastructure.config.constants import BROADCAST_BATCH_SIZE
+from mech_client.infrastructure.http import get_http_registry
+from web3.contract import Contract as Web3Contract
+
+logger = logging.getLogger(__name__)
+
+# Node error for a transaction it already holds, i.e. an earlier broadcast
+# of the same file got through; the transaction counts as sent.
+_ALREADY_KNOWN = "already known"
+
+
+@dataclass
+class BroadcastOutcome:
+    """What happened to one pre-signed transaction.
+
+    Attributes:
+        transaction: The pre-signed transaction
+        status: ``mined``, ``reverted``, ``rejected``, ``skipped`` or ``timeout``
+        error: Node or timeout error, if any
+        request_ids: Marketplace request IDs the transaction created
+        block_number: Block the transaction was mined in
+    """
+
+    transaction: PresignedTransaction
+    status: str
+    error: Optional[str] = None
+    request_ids: List[str] = field(default_factory=list)
+    block_number: Optional[int] = None
+
+
+class BroadcastService:
+    """Service for broadcasting pre-signed marketplace transactions.
+
+    Streams transactions produced by
+    :meth:`MarketplaceService.presign_requests` to the network in batched
+    ``eth_sendRawTransaction`` calls at a bounded rate, waits for their
+    receipts, and watches the resulting requests for delivery. No key is
+    needed: the transactions are already signed.
+    """
+
+    def __init__(self, chain_config: str):
+        """
+        Initialize broadcast service.
+
+        :param chain_config: Chain configuration name (gnosis, base, etc.)
+        """
+        self.chain_config = chain_config
+        self.mech_config: MechConfig = get_mech_config(chain_config)
+        self.ledger_api = EthereumApi(**asdict(self.mech_config.ledger_config))
+        get_http_registry().attach_to_provider(self.ledger_api.api.provider)
+
+    def _get_marketplace_contract(self) -> Web3Contract:
+        """
+        Get marketplace contract instance.
+
+        :return: Marketplace contract
+        :raises ValueError: If marketplace not available on this chain
+        """
+        if not self.mech_config.mech_marketplace_contract:
+            raise ValueError(
+                f"Marketplace contract not available on {self.chain_config}"
+            )
+        return get_contract(
+            self.mech_config.mech_marketplace_contract,
+            get_abi("MechMarketplace.json"),
+            self.ledger_api,
+        )
+
+    async def broadcast(  # pylint: disable=too-many-arguments
+        self,
+        transactions: Sequence[PresignedTransaction],
+        rate: Optional[float] = None,
+        batch_size: int = BROADCAST_BATCH_SIZE,
+        timeout: Optional[float] = None,
+        watch_deliveries: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Broadcast pre-signed transactions and follow them to delivery.
+
+        Transactions go out in file order. Once a sender has a transaction
+        rejected, its later transactions are skipped: their nonces could
+        never be mined.
+
+        :param transactions: Pre-signed transactions, in nonce order per sender
+        :param rate: Maximum transactions per second (None: no limit)
+        :param batch_size: Transactions per JSON-RPC batch
+        :param timeout: Timeout for delivery watching
+        :param watch_deliveries: Wait for mech deliveries of the requests
+        :return: Dictionary with per-transaction outcomes, request IDs and
+            delivery results
+        :raises ValueError: If a transaction was signed for another chain
+            or the rate is not positive
+        """
+        chain_id = self.mech_config.ledger_config.chain_id
+        for transaction in transactions:
+            if transaction.chain_id != chain_id:
+                raise ValueError(
+                    f"Transaction {transaction.tx_hash} was signed for chain "
+                    f"{transaction.chain_id}, not {self.chain_config} ({chain_id})"
+                )
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Broadcast rate must be positive, got {rate}")
+
+        outcomes = await self._send(transactions, rate, batch_size)
+        await self._collect_receipts(outcomes)
+
+        request_ids = [rid for outcome in outcomes for rid in outcome.request_ids]
+        delivery_results: Dict[str, Any] = {}
+        if watch_deliveries and request_ids:
+            logger.info(f"Waiting for delivery of {len(request_ids)} request(s)...")
+            watcher = OnchainDeliveryWatcher(
+                self._get_marketplace_contract(), self.ledger_api, timeout
+            )
+            from_block = min(
+                outcome.block_number
+                for outcome in outcomes
+                if outcome.request_ids and outcome.block_number is not None
+            )
+            delivery_results = await watcher.watch(request_ids, from_block=from_block)
+
+        return {
+            "outcomes": outcomes,
+            "request_ids": request_ids,
+            "delivery_results": delivery_results,
+        }
+
+    async def _send(
+        self,
+        transactions: Sequence[PresignedTransaction],
+        rate: Optional[float],
+        batch_size: int,
+    ) -> List[BroadcastOutcome]:
+        """
+        Broadcast transactions in rate-limited batches.
+
+        A JSON-RPC batch carries at most one transaction per sender; a
+        sender's next transaction only goes out once the previous one was
+        accepted, so nothing follows a rejected nonce.
+
+        :param transactions: Pre-signed transactions
+        :param rate: Maximum transactions per second (None: no limit)
+        :param batch_size: Transactions per JSON-RPC batch
+        :return: One outcome per transaction (``sent`` for accepted ones),
+            in file order
+        """
+        chunk_size = batch_size
+        if rate is not None:
+            chunk_size = max(1, min(batch_size, math.ceil(rate)))
+        outcomes: List[BroadcastOutcome] = []
+        blocked: Set[str] = set()
+        for start in range(0, len(transactions), chunk_size):
+            started = time.monotonic()
+            chunk = list(transactions[start : start + chunk_size])
+            chunk_outcomes: Dict[int, BroadcastOutcome] = {}
+            waiting = list(enumerate(chunk))
+            while waiting:
+                # Each sender's earliest transaction still to send
+                batch: List[Tuple[int, PresignedTransaction]] = []
+                later: List[Tuple[int, PresignedTransaction]] = []
+                senders: Set[str] = set()
+                for index, transaction in waiting:
+                    sender = transaction.sender.lower()
+                    if sender in blocked:
+                        chunk_outcomes[index] = BroadcastOutcome(
+                            transaction,
+                            "skipped",
+                            "an earlier transaction from this sender was rejected",
+                        )
+                    elif sender in senders:
+                        later.append((index, transaction))
+                    else:
+                        senders.add(sender)
+                        batch.append((index, transaction))
+                if batch:
+                    results = await asyncio.to_thread(
+                        send_raw_transactions,
+                        self.ledger_api,
+                        [transaction.raw_transaction for _, transaction in batch],
+                        batch_size,
+                    )
+                    for (index, transaction), result in zip(batch, results):
+                        chunk_outcomes[index] = self._outcome(
+                            transaction, result.ok, result.error
+                        )
+                        if chunk_outcomes[index].status == "rejected":
+                            blocked.add(transaction.sender.lower())
+                waiting = later
+            outcomes.extend(chunk_outcomes[index] for index in range(len(chunk)))
+            logger.info(
+                f"Broadcast {start + len(chunk)}/{len(transactions)} transaction(s)"
+            )
+            if rate is not None and start + chunk_size < len(transactions):
+                remaining = chunk_size / rate - (time.monotonic() - started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+        return outcomes
+
+    @staticmethod
+    def _outcome(
+        transaction: PresignedTransaction, ok: bool, error: Optional[str]
+    ) -> BroadcastOutcome:
+        """
+        Classify the node's answer to one broadcast transaction.
+
+        :param transaction: Transaction that was broadcast
+        :param ok: Whether the node accepted it
+        :param error: Node error message, if any
+        :return: ``sent`` outcome (also for already known transactions), or
+            ``rejected``
+        """
+        if ok or _ALREADY_KNOWN in (error or "").lower():
+            return BroadcastOutcome(transaction, "sent")
+        logger.warning(
+            f"Broadcast of {transaction.tx_hash} (nonce "
+            f"{transaction.nonce}) rejected: {error}"
+        )
+        return BroadcastOutcome(transaction, "rejected", error)
+
+    async def _collect_receipts(self, outcomes: List[BroadcastOutcome]) -> None:
+        """
+        Wait for the receipts of sent transactions and extract request IDs.
+
+        :param outcomes: Outcomes from :meth:`_send`, updated in place
+        """
+        sent = [outcome for outcome in outcomes if outcome.status == "sent"]
+        if not sent:
+            return
+        waiter = get_receipt_waiter(self.ledger_api)
+        receipts = await asyncio.gather(
+            *(waiter.wait(outcome.transaction.tx_hash) for outcome in sent),
+            return_exceptions=True,
+        )
+        marketplace_contract: Optional[Web3Contract] = None
+        for outcome, receipt in zip(sent, receipts):
+            if isinstance(receipt, BaseException):
+                outcome.status = "timeout"
+                outcome.error = str(receipt)
+                continue
+            outcome.block_number = receipt.get("blockNumber")
+            if receipt.get("status") != 1:
+                outcome.status = "reverted"
+                continue
+            outcome.status = "mined"
+            if outcome.transaction.kind == "request":
+                marketplace_contract = (
+                    marketplace_contract or self._get_marketplace_contract()
+                )
+                outcome.request_ids = watch_for_marketplace_request_ids(
+                    marketplace_contract,
+                    self.ledger_api,
+                    outcome.transaction.tx_hash,
+                    tx_receipt=receipt,
+                )
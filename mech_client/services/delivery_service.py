@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Delivery service for collecting journaled requests in a separate process."""
+
+import logging
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from aea_ledger_ethereum import EthereumApi
+from mech_client.domain.delivery import OnchainDeliveryWatcher
+from mech_client.infrastructure.blockchain.abi_loader import get_abi
+from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.blockchain.receipt_waiter import (
+    watch_for_marketplace_request_ids,
+)
+from mech_client.infrastructure.config import MechConfig, get_mech_config
+from mech_client.infrastructure.http import get_http_registry
+from mech_client.infrastructure.journal import PendingRequest, RequestJournal
+from web3.contract import Contract as Web3Contract
+from web3.exceptions import TransactionNotFound
+
+logger = logging.getLogger(__name__)
+
+# Seconds a collect pass polls before reporting what has been delivered so far
+COLLECT_TIMEOUT = 1.0
+
+
+def _request_id_set(request_ids: Sequence[str]) -> Set[str]:
+    """Normalize request IDs to the journal's form (hex, no 0x prefix)."""
+    return {rid.lower().removeprefix("0x") for rid in request_ids}
+
+
+class DeliveryService:
+    """Service for watching requests recorded in a :class:`RequestJournal`.
+
+    Resolves request transactions that were sent but whose receipts were
+    never journaled (the sender crashed before they were mined), reads the
+    pending request IDs of one chain, watches the marketplace for their
+    deliveries from the earliest block not yet scanned, and records what it
+    finds, including how far it scanned, so a later run only watches what is
+    still outstanding. No key is needed.
+    """
+
+    def __init__(
+        self, chain_config: str, journal: Optional[RequestJournal] = None
+    ):
+        """
+        Initialize delivery service.
+
+        :param chain_config: Chain configuration name (gnosis, base, etc.)
+        :param journal: Journal to read and update (default location if None)
+        """
+        self.chain_config = chain_config
+        self.journal = journal or RequestJournal()
+        self.mech_config: MechConfig = get_mech_config(chain_config)
+        self.ledger_api = EthereumApi(**asdict(self.mech_config.ledger_config))
+        get_http_registry().attach_to_provider(self.ledger_api.api.provider)
+
+    def _get_marketplace_contract(self) -> Web3Contract:
+        """
+        Get marketplace contract instance.
+
+        :return: Marketplace contract
+        :raises ValueError: If marketplace not available on this chain
+        """
+        if not self.mech_config.mech_marketplace_contract:
+            raise ValueError(
+                f"Marketplace contract not available on {self.chain_config}"
+            )
+        return get_contract(
+            self.mech_config.mech_marketplace_contract,
+            get_abi("MechMarketplace.json"),
+            self.ledger_api,
+        )
+
+    def pending(
+        self, request_ids: Optional[Sequence[str]] = None
+    ) -> List[PendingRequest]:
+        """
+        Return this chain's journaled requests that have no delivery yet.
+
+        :param request_ids: Only these request IDs (default: all pending)
+        :return: Pending requests
+        """
+        pending = self.journal.pending(self.chain_config)
+        if request_ids:
+            wanted = _request_id_set(request_ids)
+            pending = [p for p in pending if p.request_id in wanted]
+        return pending
+
+    def resume_sent(self) -> List[str]:
+        """
+        Look up the receipts of journaled transactions that were never confirmed.
+
+        Mined transactions are journaled with their request IDs, reverted
+        ones as reverted; transactions still unknown to the node are left
+        for a later run. Nothing is sent again.
+
+        :return: Request IDs recovered from newly confirmed transactions
+        """
+        recovered: List[str] = []
+        unconfirmed = self.journal.unconfirmed(self.chain_config)
+        if not unconfirmed:
+            return recovered
+        contract = self._get_marketplace_contract()
+        # Fee-bumped versions of one transaction share its metadata hashes;
+        # once one of them is resolved the others are never mined.
+        resolved: Set[Tuple[str, ...]] = set()
+        for record in unconfirmed:
+            if record.data_hashes and tuple(record.data_hashes) in resolved:
+                continue
+            tx_hash = str(record.tx_hash)
+            try:
+                receipt = self.ledger_api.api.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                logger.info(f"Request transaction {tx_hash} is not mined yet")
+                continue
+            if receipt.get("status") != 1:
+                logger.warning(f"Request transaction {tx_hash} reverted")
+                self.journal.record_reverted(
+                    self.chain_config, tx_hash, record.data_hashes
+                )
+                resolved.add(tuple(record.data_hashes))
+                continue
+            request_ids = watch_for_marketplace_request_ids(
+                contract, self.ledger_api, tx_hash, tx_receipt=receipt
+            )
+            self.journal.record_submission(
+                self.chain_config,
+                tx_hash,
+                request_ids,
+                receipt.get("blockNumber"),
+                data_hashes=record.data_hashes,
+                mech=record.mech,
+                # Latency is measured from when the request was sent
+                submitted_at=record.timestamp,
+            )
+            resolved.add(tuple(record.data_hashes))
+            recovered.extend(request_ids)
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} request(s) from sent transactions")
+        return recovered
+
+    async def watch(
+        self,
+        request_ids: Optional[Sequence[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for the pending requests to be delivered and journal the results.
+
+        Unconfirmed sent transactions are resolved first (see
+        :meth:`resume_sent`). Requests still undelivered afterwards are
+        checkpointed at the block the watch started from: they had no
+        delivery then, so the next run need not scan anything earlier.
+
+        :param request_ids: Only these request IDs (default: all pending)
+        :param timeout: Seconds to wait (default: the watcher's default)
+        :return: Deliveries found in this run, by request ID
+        """
+        self.resume_sent()
+        pending = self.pending(request_ids)
+        if not pending:
+            return {}
+        blocks = [p.from_block for p in pending if p.from_block is not None]
+        logger.info(f"Watching {len(pending)} journaled request(s) for delivery...")
+        watcher = OnchainDeliveryWatcher(
+            self._get_marketplace_contract(), self.ledger_api, timeout
+        )
+        scan_start = self.ledger_api.api.eth.block_number
+        results = await watcher.watch(
+            [p.request_id for p in pending],
+            from_block=min(blocks) if blocks else None,
+        )
+        self.journal.record_deliveries(
+            self.chain_config, results, delivered_by=watcher.delivered_by
+        )
+        delivered = _request_id_set(list(results))
+        self.journal.record_scanned(
+            self.chain_config,
+            [p.request_id for p in pending if p.request_id not in delivered],
+            scan_start,
+        )
+        return results
+
+    async def collect(
+        self, request_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Pick up deliveries that have already happened, without waiting.
+
+        :param request_ids: Only these request IDs (default: every journaled one)
+        :return: All journaled deliveries of this chain, by request ID
+        """
+        await self.watch(request_ids, timeout=COLLECT_TIMEOUT)
+        delivered = self.journal.deliveries(self.chain_config)
+        if request_ids:
+            wanted = _request_id_set(request_ids)
+            delivered = {k: v for k, v in delivered.items() if k in wanted}
+        return delivered
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -148,43 +148,51 @@ class DepositService(
         # Get balance tracker address
         balance_tracker_address = payment_strategy.get_balance_tracker_address()
 
-        # Approve tokens
-        logger.info(f"Approving {token_type.upper()} tokens...")
-        # Returns None if approval not needed, tx hash otherwise
-        # pylint: disable=assignment-from-none
-        approve_tx = payment_strategy.approve_if_needed(
-            payer_address=sender,
-            spender_address=balance_tracker_address,
-            amount=amount,
-            executor=self.executor,
-        )
-        if approve_tx:
-            wait_for_receipt(approve_tx, self.ledger_api)
-            logger.info("Token approval successful")
-
-        # Deposit tokens
-        abi = get_abi("BalanceTrackerFixedPriceToken.json")
-        balance_tracker = get_contract(balance_tracker_address, abi, self.ledger_api)
-
-        tx_args = {
-            "sender_address": sender,
-            "value": 0,
-            "gas": self.mech_config.gas_limit,
-        }
-
-        method_args = {
-            "amount": amount,
-        }
-
-        tx_hash = self.executor.execute_transaction(
-            contract=balance_tracker,
-            method_name="deposit",
-            method_args=method_args,
-            tx_args=tx_args,
-        )
+        # Hold the amount until the deposit is mined, so concurrent requests
+        # from this key keep it out of the allowance they count on.
+        with payment_strategy.reserve_allowance(
+            sender, balance_tracker_address, amount
+        ) as reserved:
+            # Approve tokens
+            logger.info(f"Approving {token_type.upper()} tokens...")
+            # Returns None if approval not needed, tx hash otherwise
+            # pylint: disable=assignment-from-none
+            approve_tx = payment_strategy.approve_if_needed(
+                payer_address=sender,
+                spender_address=balance_tracker_address,
+                amount=amount,
+                executor=self.executor,
+                reserved=reserved,
+            )
+            if approve_tx:
+                wait_for_receipt(approve_tx, self.ledger_api)
+                logger.info("Token approval successful")
+
+            # Deposit tokens
+            abi = get_abi("BalanceTrackerFixedPriceToken.json")
+            balance_tracker = get_contract(
+                balance_tracker_address, abi, self.ledger_api
+            )
 
-        # Wait for receipt
-        wait_for_receipt(tx_hash, self.ledger_api)
+            tx_args = {
+                "sender_address": sender,
+                "value": 0,
+                "gas": self.mech_config.gas_limit,
+            }
+
+            method_args = {
+                "amount": amount,
+            }
+
+            tx_hash = self.executor.execute_transaction(
+                contract=balance_tracker,
+                method_name="deposit",
+                method_args=method_args,
+                tx_args=tx_args,
+            )
+
+            # Wait for receipt
+            wait_for_receipt(tx_hash, self.ledger_api)
 
         logger.info(f"{token_type.upper()} deposit successful: {amount}")
         # Format with the expected {transaction_digest} placeholder
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Index service for building and querying the local mech index."""
+
+import logging
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from eth_abi import decode as abi_decode
+from mech_client.domain.tools import ToolManager
+from mech_client.infrastructure.blockchain.abi_loader import get_abi
+from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.blockchain.multicall import multicall
+from mech_client.infrastructure.config.constants import MECH_INDEX_MAX_AGE
+from mech_client.infrastructure.config.payment_config import PaymentType
+from mech_client.infrastructure.index import IndexedMech, MechIndex
+from mech_client.infrastructure.subgraph.queries import query_mm_mechs_info
+
+logger = logging.getLogger(__name__)
+
+# (payment type name, max delivery rate) as read on chain
+MechInfo = Tuple[Optional[str], Optional[int]]
+
+
+class IndexService:
+    """Service for the local index of marketplace mechs.
+
+    :meth:`refresh` lists the marketplace mechs from the subgraph, reads the
+    payment type and price of new or outdated mechs with Multicall3 and
+    fetches their services' tools. :meth:`query` answers from the index
+    alone, without any network access.
+    """
+
+    def __init__(self, chain_config: str, index: Optional[MechIndex] = None):
+        """
+        Initialize index service.
+
+        :param chain_config: Chain configuration name (gnosis, base, etc.)
+        :param index: Mech index (default: the one at ``MECHX_INDEX_PATH``)
+        """
+        self.chain_config = chain_config
+        self.index = index or MechIndex()
+
+    def refresh(
+        self, full: bool = False, max_age: float = MECH_INDEX_MAX_AGE
+    ) -> Tuple[int, int]:
+        """
+        Bring the chain's index up to date with the marketplace.
+
+        Delivery counts are updated for every mech and mechs no longer
+        listed are dropped. On-chain info and tools are only re-read for
+        mechs that are new or were refreshed more than ``max_age`` seconds
+        ago, unless ``full`` is set.
+
+        :param full: Re-read every mech
+        :param max_age: Seconds an indexed mech's info is kept
+        :return: (mechs indexed, mechs re-read)
+        """
+        listed = (
+            query_mm_mechs_info(self.chain_config, limit=None, snapshot=True) or []
+        )
+        known = self.index.mechs(self.chain_config)
+        now = time.time()
+        outdated = [
+            item
+            for item in listed
+            if full
+            or item["address"] not in known
+            or now - known[item["address"]].refreshed_at >= max_age
+        ]
+
+        tool_manager = ToolManager(self.chain_config)
+        mech_info = self._read_mech_info(
+            tool_manager, [item["address"] for item in outdated]
+        )
+        catalogue = tool_manager.get_tools_for_services(
+            [int(item["service"]["id"]) for item in outdated]
+        )
+
+        mechs: List[IndexedMech] = []
+        for item in listed:
+            address = item["address"]
+            service_id = int(item["service"]["id"])
+            previous = known.get(address)
+            # A new mech counts as never refreshed until its info is read.
+            indexed = previous or IndexedMech(
+                self.chain_config, address, service_id, refreshed_at=0.0
+            )
+            indexed = replace(
+                indexed,
+                service_id=service_id,
+                mech_type=item.get("mech_type"),
+                total_deliveries=int(item["service"].get("totalDeliveries") or 0),
+            )
+            if address in mech_info:
+                payment_type, max_delivery_rate = mech_info[address]
+                tools = catalogue.get(service_id)
+                indexed = replace(
+                    indexed,
+                    payment_type=payment_type or indexed.payment_type,
+                    max_delivery_rate=(
+                        indexed.max_delivery_rate
+                        if max_delivery_rate is None
+                        else max_delivery_rate
+                    ),
+                    tools=(
+                        tuple(tool.tool_name for tool in tools.tools)
+                        if tools is not None
+                        else indexed.tools
+                    ),
+                    # Failed reads are retried on the next refresh instead of
+                    # leaving the mech without a price for max_age seconds.
+                    refreshed_at=(
+                        now
+                        if payment_type is not None and max_delivery_rate is not None
+                        else indexed.refreshed_at
+                    ),
+                )
+            mechs.append(indexed)
+
+        self.index.replace(self.chain_config, mechs, refreshed_at=now)
+        return len(mechs), len(outdated)
+
+    def query(
+        self,
+        tool: Optional[str] = None,
+        max_price: Optional[int] = None,
+        payment_type: Optional[PaymentType] = None,
+        limit: Optional[int] = None,
+    ) -> List[IndexedMech]:
+        """
+        Find indexed mechs, cheapest first, then most delivered.
+
+        :param tool: Only mechs whose service publishes this tool
+        :param max_price: Only mechs charging at most this many wei
+        :param payment_type: Only mechs accepting this payment type
+        :param limit: Maximum number of mechs returned (None: all of them)
+        :return: Matching mechs
+        :raises ValueError: If the chain was never indexed
+        """
+        if self.index.refreshed_at(self.chain_config) is None:
+            raise ValueError(
+                f"The mech index of {self.chain_config} is empty. Run "
+                f"'mechx index refresh --chain-config {self.chain_config}' first."
+            )
+        return self.index.query(
+            self.chain_config,
+            tool=tool,
+            max_price=max_price,
+            payment_type=payment_type.name if payment_type is not None else None,
+            limit=limit,
+        )
+
+    @staticmethod
+    def _read_mech_info(
+        tool_manager: ToolManager, addresses: Sequence[str]
+    ) -> Dict[str, MechInfo]:
+        """
+        Read the payment type and price of several mechs with Multicall3.
+
+        :param tool_manager: Tool manager of the chain (for its ledger API)
+        :param addresses: Mech addresses
+        :return: Payment type name and price by address (None where unread)
+        """
+        if not addresses:
+            return {}
+        mech_contract = get_contract(
+            addresses[0], get_abi("IMech.json"), tool_manager.ledger_api
+        )
+        payment_type_call = mech_contract.encode_abi("paymentType")
+        price_call = mech_contract.encode_abi("maxDeliveryRate")
+        results = multicall(
+            tool_manager.ledger_api,
+            [
+                (address, data)
+                for address in addresses
+                for data in (payment_type_call, price_call)
+            ],
+        )
+        return {
+            address: (
+                _decode_payment_type(results[2 * i]),
+                _decode_uint(results[2 * i + 1]),
+            )
+            for i, address in enumerate(addresses)
+        }
+
+
+def _decode_payment_type(data: Optional[bytes]) -> Optional[str]:
+    """Return the ``PaymentType`` name (or raw hash) of ``paymentType()``."""
+    if not data:
+        return None
+    try:
+        value = abi_decode(["bytes32"], data)[0].hex()
+    except Exception:  # pylint: disable=broad-except
+        return None
+    try:
+        return PaymentType.from_value(value).name
+    except ValueError:
+        return value
+
+
+def _decode_uint(data: Optional[bytes]) -> Optional[int]:
+    """Return the ``uint256`` returned by a call (None if it failed)."""
+    if not data:
+        return None
+    try:
+        return abi_decode(["uint256"], data)[0]
+    except Exception:  # pylint: disable=broad-except
+        return None
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,26 +19,61 @@
 
 """Marketplace service for orchestrating mech requests."""
 
+import asyncio
 import logging
+import time
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, FrozenSet, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import requests
 from aea_ledger_ethereum import EthereumCrypto
 from eth_account import Account
-from mech_client.domain.delivery import OffchainDeliveryWatcher, OnchainDeliveryWatcher
+from mech_client.domain.delivery import (
+    DEFAULT_TIMEOUT,
+    WAIT_SLEEP,
+    OffchainDeliveryWatcher,
+    OnchainDeliveryWatcher,
+)
+from mech_client.domain.execution import (
+    ClientExecutor,
+    ContractCall,
+    RequestBatchPlanner,
+    TransactionExecutor,
+    TransactionSupervisor,
+)
+from mech_client.domain.execution.batch_planner import request_item_key
 from mech_client.domain.payment import PaymentStrategyFactory
-from mech_client.domain.signing import Signer
+from mech_client.domain.signing import PresigningSigner, Signer, SignerPool
 from mech_client.domain.tools import ToolManager
 from mech_client.infrastructure.blockchain.abi_loader import get_abi
 from mech_client.infrastructure.blockchain.contracts import get_contract
+from mech_client.infrastructure.blockchain.nonce_manager import get_nonce_manager
+from mech_client.infrastructure.blockchain.presigned import PresignedTransaction
 from mech_client.infrastructure.blockchain.receipt_waiter import (
-    wait_for_receipt,
+    wait_for_receipt_async,
     watch_for_marketplace_request_ids,
 )
 from mech_client.infrastructure.config import PaymentType
+from mech_client.infrastructure.config.constants import MECH_RESPONSE_TIMEOUT
+from mech_client.infrastructure.config.environment import EnvironmentConfig
+from mech_client.infrastructure.http import get_http_registry
 from mech_client.infrastructure.ipfs import IPFSClient, push_metadata_to_ipfs
+from mech_client.infrastructure.journal import RequestJournal
 from mech_client.services.base_service import BaseTransactionService
+from mech_client.services.selection_service import (
+    AUTO_PRIORITY_MECH,
+    MechSelectionService,
+)
 from mech_client.utils.validators import ensure_checksummed_address
 from safe_eth.eth import EthereumClient
 from web3.contract import Contract as Web3Contract
@@ -94,6 +129,28 @@ def _safe_int(value: Any, default: int = 0) -> int:
         return default
 
 
+def _standing_allowance(max_delivery_rate: int, num_requests: int) -> int:
+    """Size a token approval for the standing allowance, if one is configured.
+
+    With ``MECHX_TOKEN_ALLOWANCE_REQUESTS=N`` an approval covers ``N``
+    requests at the mech's current rate, so the next ``N - 1`` requests find
+    the allowance sufficient and skip their approve transaction. Without it
+    (the default) the approval covers exactly this request.
+
+    :param max_delivery_rate: Price per request (token's smallest unit)
+    :param num_requests: Requests paid for now
+    :return: Amount to approve
+    """
+    standing = EnvironmentConfig.load().mechx_token_allowance_requests or 0
+    return max_delivery_rate * max(num_requests, standing)
+
+
+def _fully_delivered(result: Dict[str, Any]) -> bool:
+    """Return whether every request of a result has a delivery."""
+    deliveries = result.get("delivery_results") or {}
+    return all(deliveries.get(request_id) for request_id in result["request_ids"])
+
+
 @dataclass(frozen=True)
 class PaymentChallenge:
     """Typed view of the structured 402 challenge the mech returns.
@@ -126,6 +183,11 @@ class MarketplaceService(
     and delivery watching to provide high-level marketplace operations.
     """
 
+    # Every on-chain send is awaited through ``_await_receipt``.
+    supervise_transactions = True
+    # Every public operation runs inside ``_lease_sender``.
+    leases_signer_pool = True
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         chain_config: str,
@@ -134,6 +196,8 @@ class MarketplaceService(
         safe_address: Optional[str] = None,
         ethereum_client: Optional[EthereumClient] = None,
         signer: Optional[Signer] = None,
+        journal: Optional[RequestJournal] = None,
+        use_journal: bool = True,
     ):
         """
         Initialize marketplace service.
@@ -143,8 +207,20 @@ class MarketplaceService(
         :param crypto: Ethereum crypto object for local signing (alternative to signer)
         :param safe_address: Safe address (required for agent mode)
         :param ethereum_client: Ethereum client (required for agent mode)
-        :param signer: Signer for externalized signing (alternative to crypto)
+        :param signer: Signer for externalized signing (alternative to crypto);
+            a :class:`SignerPool` shards requests across several keys
+        :param journal: Journal every on-chain request stage is recorded in,
+            so a restarted process can resume watching (default: the one at
+            :func:`default_journal_path`)
+        :param use_journal: Journal on-chain requests; with False only
+            requests sent with ``wait=False`` (which need it) are journaled
+        :raises ValueError: If a SignerPool is combined with agent mode
         """
+        if agent_mode and isinstance(signer, SignerPool):
+            raise ValueError(
+                "SignerPool is only supported in client mode; a Safe is "
+                "operated by a single owner key."
+            )
         super().__init__(
             chain_config=chain_config,
             agent_mode=agent_mode,
@@ -160,7 +236,21 @@ class MarketplaceService(
         # Create IPFS client
         self.ipfs_client = IPFSClient()
 
-    async def send_request(  # pylint: disable=too-many-arguments,too-many-locals
+        self.journal = (journal or RequestJournal()) if use_journal else None
+
+    @contextmanager
+    def _lease_sender(self) -> Iterator[str]:
+        """Bind one pool key to the current request (no-op for a single signer).
+
+        :yield: Address the request is sent from
+        """
+        if isinstance(self.signer, SignerPool):
+            with self.signer.lease() as leased:
+                yield leased.address
+        else:
+            yield self.executor.get_sender_address()
+
+    async def send_request(  # pylint: disable=too-many-arguments
         self,
         prompts: Tuple[str, ...],
         tools: Tuple[str, ...],
@@ -170,29 +260,361 @@ class MarketplaceService(
         auto_deposit: bool = False,
         extra_attributes: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        wait: bool = True,
+        max_price: Optional[int] = None,
+        hedge_after: Optional[float] = None,
+        hedge_mech: Optional[str] = None,
+        hedge_offchain: bool = False,
     ) -> Dict[str, Any]:
         """
         Send marketplace request(s) to mech(s).
 
+        With a :class:`SignerPool`, the whole request (approval, request
+        transaction, offchain signature) is sent from the least-loaded key.
+
+        With ``hedge_after``, an on-chain request not delivered within that
+        many seconds of being mined is sent again to a second mech (see
+        :meth:`_send_hedged`); the first complete delivery is returned.
+
         :param prompts: Tuple of prompt strings
         :param tools: Tuple of tool identifiers
-        :param priority_mech: Priority mech address (optional)
+        :param priority_mech: Priority mech address (optional); ``"auto"``
+            picks the indexed mech with the lowest expected delivery latency
+            (see :class:`MechSelectionService`)
         :param use_prepaid: Use prepaid balance instead of per-request payment
         :param use_offchain: Use offchain mech (URL discovered from metadata)
         :param auto_deposit: On an offchain HTTP 402, top up the prepaid balance
             with the shortfall and retry once (only applies to the offchain path)
         :param extra_attributes: Extra attributes for metadata
         :param timeout: Timeout for delivery watching
-        :return: Dictionary with request results
+        :param wait: Wait for delivery; with False, return once the request
+            transactions are mined and record the request IDs in the journal
+            for ``mechx deliveries watch|collect`` (on-chain requests only)
+        :param max_price: With ``priority_mech="auto"``, only consider mechs
+            charging at most this many wei per request (also applies to an
+            automatically selected hedge mech)
+        :param hedge_after: Seconds to wait for the delivery before hedging
+            (None: never hedge)
+        :param hedge_mech: Mech to hedge with; None or ``"auto"`` picks the
+            next-best indexed mech by expected latency
+        :param hedge_offchain: Send the hedge through the hedge mech's
+            offchain endpoint instead of on-chain
+        :return: Dictionary with request results; hedged requests add a
+            ``hedge`` entry describing the second request and which one won
         """
         # Validate inputs
         if len(prompts) != len(tools):
             raise ValueError(
                 f"Number of prompts ({len(prompts)}) must match number of tools ({len(tools)})"
             )
+        if hedge_after is not None:
+            if hedge_after <= 0:
+                raise ValueError("hedge_after must be a positive number of seconds")
+            if use_offchain or not wait:
+                raise ValueError(
+                    "Hedging watches an on-chain request for delivery; it "
+                    "cannot be combined with offchain or non-waiting requests."
+                )
+
+        with self._lease_sender():
+            if hedge_after is not None:
+                return await self._send_hedged(
+                    prompts=prompts,
+                    tools=tools,
+                    priority_mech=priority_mech,
+                    hedge_after=hedge_after,
+                    hedge_mech=hedge_mech,
+                    hedge_offchain=hedge_offchain,
+                    max_price=max_price,
+                    timeout=timeout,
+                    use_prepaid=use_prepaid,
+                    auto_deposit=auto_deposit,
+                    extra_attributes=extra_attributes,
+                )
+            return await self._send_request(
+                prompts=prompts,
+                tools=tools,
+                priority_mech=priority_mech,
+                use_prepaid=use_prepaid,
+                use_offchain=use_offchain,
+                auto_deposit=auto_deposit,
+                extra_attributes=extra_attributes,
+                timeout=timeout,
+                wait=wait,
+                max_price=max_price,
+            )
+
+    async def send_requests(
+        self,
+        batch: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several independent requests concurrently.
+
+        Each ``(prompts, tools)`` pair becomes its own marketplace request;
+        with a :class:`SignerPool` they are spread over the pool's keys.
+
+        :param batch: Sequence of ``(prompts, tools)`` pairs
+        :param kwargs: Options forwarded to :meth:`send_request`
+        :return: One result per request, in input order, each with the
+            ``sender`` address it was sent from
+        """
+
+        async def _send_one(
+            prompts: Tuple[str, ...], tools: Tuple[str, ...]
+        ) -> Dict[str, Any]:
+            with self._lease_sender() as sender:
+                result = await self.send_request(
+                    prompts=prompts, tools=tools, **kwargs
+                )
+            return {**result, "sender": sender}
+
+        return list(
+            await asyncio.gather(
+                *(_send_one(prompts, tools) for prompts, tools in batch)
+            )
+        )
+
+    def presign_requests(  # pylint: disable=too-many-locals
+        self,
+        batch: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+        priority_mech: Optional[str] = None,
+        use_prepaid: bool = False,
+        extra_attributes: Optional[Dict[str, Any]] = None,
+        max_price: Optional[int] = None,
+    ) -> List[PresignedTransaction]:
+        """
+        Build and sign on-chain requests now, for broadcasting later.
+
+        Metadata for every request is uploaded first, then one transaction
+        per ``(prompts, tools)`` pair is signed with consecutive nonces from
+        the shared nonce manager and the current fee caps. Token-paid
+        requests are preceded by a single approval covering all of them.
+        Nothing is broadcast; write the result with ``write_presigned`` and
+        send it with :class:`BroadcastService`.
+
+        The nonces stay reserved in this process, so transactions sent
+        afterwards from the same key queue behind the pre-signed ones.
+
+        :param batch: Sequence of ``(prompts, tools)`` pairs
+        :param priority_mech: Priority mech address (optional), or ``"auto"``
+            (see :meth:`send_request`)
+        :param use_prepaid: Use prepaid balance instead of per-request payment
+        :param extra_attributes: Extra attributes for metadata
+        :param max_price: With ``priority_mech="auto"``, only consider mechs
+            charging at most this many wei per request
+        :return: Signed transactions, in nonce order
+        :raises ValueError: In agent mode, or if the batch is invalid
+        """
+        if self.agent_mode:
+            raise ValueError(
+                "Pre-signing is only supported in client mode; Safe "
+                "transactions need the Safe nonce at execution time."
+            )
+        if not batch:
+            raise ValueError("Nothing to pre-sign")
+        for prompts, tools in batch:
+            if len(prompts) != len(tools):
+                raise ValueError(
+                    f"Number of prompts ({len(prompts)}) must match number "
+                    f"of tools ({len(tools)})"
+                )
+        priority_mech = self._resolve_priority_mech(
+            priority_mech, [tool for _, tools in batch for tool in tools], max_price
+        )
+
+        with self._lease_sender():
+            signer = (
+                self.signer.current
+                if isinstance(self.signer, SignerPool)
+                else self.signer
+            )
+            presigner = PresigningSigner(
+                signer,  # type: ignore[arg-type]
+                self.mech_config.ledger_config.chain_id,
+            )
+            # Later transactions are simulated without their predecessors
+            # (e.g. a request without its pending approval), so a failed
+            # estimate falls back to the configured gas limit.
+            executor = ClientExecutor(self.ledger_api, presigner, gas_fallback=True)
+            try:
+                self._presign(
+                    executor,
+                    presigner,
+                    batch,
+                    priority_mech,
+                    use_prepaid,
+                    extra_attributes or {},
+                )
+            except Exception:
+                # Nothing will be broadcast; realign the local nonce view.
+                if presigner.transactions:
+                    get_nonce_manager(self.ledger_api).resync(presigner.address)
+                raise
+        return presigner.transactions
+
+    def _presign(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self,
+        executor: TransactionExecutor,
+        presigner: PresigningSigner,
+        batch: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+        priority_mech: Optional[str],
+        use_prepaid: bool,
+        extra_attributes: Dict[str, Any],
+    ) -> None:
+        """
+        Sign the approval (if needed) and request transactions of a batch.
+
+        :param executor: Executor sending through the presigning signer
+        :param presigner: Signer recording the signed transactions
+        :param batch: Sequence of ``(prompts, tools)`` pairs
+        :param priority_mech: Priority mech address (optional)
+        :param use_prepaid: Use prepaid balance instead of per-request payment
+        :param extra_attributes: Extra attributes for metadata
+        """
+        marketplace_contract = self._get_marketplace_contract()
+        payment_type, service_id, max_delivery_rate = self._fetch_mech_info(
+            priority_mech
+        )
+        self._validate_tools(
+            tuple(dict.fromkeys(tool for _, tools in batch for tool in tools)),
+            service_id,
+        )
+        priority_mech_address = priority_mech or self.mech_config.priority_mech_address
+        if not priority_mech_address:
+            raise ValueError("No priority mech address specified")
+
+        # Upload everything before signing, so a failed upload signs nothing.
+        logger.info("Uploading metadata to IPFS...")
+        uploads = [
+            [
+                push_metadata_to_ipfs(prompt, tool, extra_attributes)[0]
+                for prompt, tool in zip(prompts, tools)
+            ]
+            for prompts, tools in batch
+        ]
+
+        if not use_prepaid and payment_type in (
+            PaymentType.OLAS_TOKEN,
+            PaymentType.USDC_TOKEN,
+        ):
+            payment_strategy = PaymentStrategyFactory.create(
+                payment_type=payment_type,
+                ledger_api=self.ledger_api,
+                chain_id=self.mech_config.ledger_config.chain_id,
+            )
+            balance_tracker = payment_strategy.get_balance_tracker_address()
+            price = max_delivery_rate * sum(len(prompts) for prompts, _ in batch)
+            if not payment_strategy.check_balance(presigner.address, price):
+                raise ValueError(
+                    f"Insufficient balance for token payment. Required: "
+                    f"{price} wei. Please check your token balance for "
+                    f"address: {presigner.address}"
+                )
+            approve_amount = _standing_allowance(
+                max_delivery_rate, sum(len(prompts) for prompts, _ in batch)
+            )
+            approval_tx_hash = payment_strategy.approve_if_needed(
+                payer_address=presigner.address,
+                spender_address=balance_tracker,
+                amount=price,
+                executor=executor,
+                approve_amount=approve_amount,
+            )
+            if approval_tx_hash is not None:
+                presigner.annotate(
+                    approval_tx_hash,
+                    kind="approve",
+                    spender=balance_tracker,
+                    amount=approve_amount,
+                )
+
+        logger.info(f"Signing {len(batch)} marketplace request(s)...")
+        for (prompts, tools), data_hashes in zip(batch, uploads):
+            tx_hash = self._send_marketplace_request(
+                marketplace_contract=marketplace_contract,
+                data_hashes=data_hashes,
+                max_delivery_rate=max_delivery_rate,
+                payment_type=payment_type,
+                priority_mech=priority_mech_address,
+                response_timeout=MECH_RESPONSE_TIMEOUT,
+                use_prepaid=use_prepaid,
+                executor=executor,
+            )
+            presigner.annotate(
+                tx_hash,
+                kind="request",
+                prompts=list(prompts),
+                tools=list(tools),
+                data_hashes=data_hashes,
+                priority_mech=priority_mech_address,
+            )
+
+    async def _await_receipt(self, tx_hash: str) -> Tuple[str, Dict]:
+        """
+        Wait for a transaction, or its fee-bumped replacement, to be mined.
+
+        Transactions broadcast through the executor's supervisor are
+        replaced with higher fees while they sit pending; the hash that
+        actually landed is returned alongside its receipt.
+
+        :param tx_hash: Hash returned when the transaction was sent
+        :return: Tuple of (included transaction hash, receipt)
+        :raises TimeoutError: If no version is mined within the timeout
+        """
+        supervisor = getattr(self.executor, "supervisor", None)
+        if isinstance(supervisor, TransactionSupervisor) and supervisor.is_tracking(
+            tx_hash
+        ):
+            try:
+                receipt = await supervisor.wait_async(tx_hash)
+            finally:
+                record = supervisor.forget(tx_hash)
+            return record.included_hash or tx_hash, receipt
+        return tx_hash, await wait_for_receipt_async(tx_hash, self.ledger_api)
+
+    async def _send_request(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        prompts: Tuple[str, ...],
+        tools: Tuple[str, ...],
+        priority_mech: Optional[str] = None,
+        use_prepaid: bool = False,
+        use_offchain: bool = False,
+        auto_deposit: bool = False,
+        extra_attributes: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        wait: bool = True,
+        max_price: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send marketplace request(s) from the current sender.
+
+        :param prompts: Tuple of prompt strings
+        :param tools: Tuple of tool identifiers
+        :param priority_mech: Priority mech address (optional)
+        :param use_prepaid: Use prepaid balance instead of per-request payment
+        :param use_offchain: Use offchain mech (URL discovered from metadata)
+        :param auto_deposit: On an offchain HTTP 402, top up the prepaid balance
+            with the shortfall and retry once (only applies to the offchain path)
+        :param extra_attributes: Extra attributes for metadata
+        :param timeout: Timeout for delivery watching
+        :param wait: Wait for delivery (False: journal the requests instead)
+        :param max_price: Price cap of an automatically selected mech
+        :return: Dictionary with request results
+        """
+        if use_offchain and not wait:
+            raise ValueError(
+                "Offchain requests are delivered by the mech's HTTP endpoint "
+                "and cannot be collected from the journal; wait for them."
+            )
 
         # Get marketplace contract
         marketplace_contract = self._get_marketplace_contract()
+        # Selection queries the subgraph synchronously: keep it off the loop.
+        priority_mech = await asyncio.to_thread(
+            self._resolve_priority_mech, priority_mech, tools, max_price
+        )
 
         # Fetch mech info (payment type, service ID, max delivery rate)
         payment_type, service_id, max_delivery_rate = self._fetch_mech_info(
@@ -207,8 +629,7 @@ class MarketplaceService(
         if not priority_mech_address:
             raise ValueError("No priority mech address specified")
 
-        # Response timeout (5 minutes, matching historic default)
-        response_timeout = 300
+        response_timeout = MECH_RESPONSE_TIMEOUT
 
         # Branch between on-chain and off-chain flows
         if use_offchain:
@@ -245,104 +666,508 @@ class MarketplaceService(
             data_hash, _ = push_metadata_to_ipfs(prompt, tool, extra_attributes or {})
             data_hashes.append(data_hash)
         logger.info(f"Uploaded {len(data_hashes)} metadata hash(es) to IPFS")
+        journal = self.journal if wait else self.journal or RequestJournal()
+        if journal is not None:
+            journal.record_upload(self.chain_config, data_hashes)
+
+        # Allowance reserved for this request is released once it is mined.
+        with ExitStack() as allowance_hold:
+            # Set when the approval is bundled with the request (agent mode).
+            approval_call: Optional[ContractCall] = None
+
+            # Handle payment (approval if needed)
+            # `is_token()` also matches TOKEN_NVM_USDC, which the factory routes
+            # to NVMPaymentStrategy (no ERC20 approve) — gate on the exact types
+            # that resolve to TokenPaymentStrategy, mirroring factory.py:59.
+            if not use_prepaid and payment_type in (
+                PaymentType.OLAS_TOKEN,
+                PaymentType.USDC_TOKEN,
+            ):
+                balance_tracker = payment_strategy.get_balance_tracker_address()
+                # The marketplace pulls up to `max_delivery_rate * numRequests`
+                # from the requester via `BalanceTracker.checkAndRecordDeliveryRates`.
+                # Use the per-mech `max_delivery_rate` (read from the mech
+                # contract) instead of the static chain-wide `mech_config.price`
+                # from mechs.json — the latter is a default that does not match
+                # per-mech pricing and under-funds the approve whenever a mech's
+                # rate exceeds it, making the marketplace's transferFrom revert
+                # with "ERC20: transfer amount exceeds allowance".
+                price = max_delivery_rate * len(prompts)
+
+                # Check balance
+                logger.info(f"Checking {payment_type.name} token balance...")
+                sender = self.executor.get_sender_address()
+                if not payment_strategy.check_balance(sender, price):
+                    raise ValueError(
+                        f"Insufficient balance for token payment. Required: "
+                        f"{price} wei. Please check your token balance for "
+                        f"address: {sender}"
+                    )
 
-        # Handle payment (approval if needed)
-        # `is_token()` also matches TOKEN_NVM_USDC, which the factory routes
-        # to NVMPaymentStrategy (no ERC20 approve) — gate on the exact types
-        # that resolve to TokenPaymentStrategy, mirroring factory.py:59.
-        if not use_prepaid and payment_type in (
-            PaymentType.OLAS_TOKEN,
-            PaymentType.USDC_TOKEN,
-        ):
-            balance_tracker = payment_strategy.get_balance_tracker_address()
-            # The marketplace pulls up to `max_delivery_rate * numRequests`
-            # from the requester via `BalanceTracker.checkAndRecordDeliveryRates`.
-            # Use the per-mech `max_delivery_rate` (read from the mech
-            # contract) instead of the static chain-wide `mech_config.price`
-            # from mechs.json — the latter is a default that does not match
-            # per-mech pricing and under-funds the approve whenever a mech's
-            # rate exceeds it, making the marketplace's transferFrom revert
-            # with "ERC20: transfer amount exceeds allowance".
-            price = max_delivery_rate * len(prompts)
-
-            # Check balance
-            logger.info(f"Checking {payment_type.name} token balance...")
-            sender = self.executor.get_sender_address()
-            if not payment_strategy.check_balance(sender, price):
-                raise ValueError(
-                    f"Insufficient balance for token payment. Required: {price} wei. "
-                    f"Please check your token balance for address: {sender}"
+                # Approve unless the current allowance already covers the request
+                # (e.g. a standing approval from MECHX_TOKEN_ALLOWANCE_REQUESTS).
+                # The price stays reserved until the request is mined, so other
+                # in-flight requests from this key neither count it as spare nor
+                # overwrite it with a smaller approve.
+                reserved = allowance_hold.enter_context(
+                    payment_strategy.reserve_allowance(sender, balance_tracker, price)
+                )
+                approve_amount = _standing_allowance(max_delivery_rate, len(prompts))
+                logger.info(
+                    f"Ensuring {price} wei allowance ({max_delivery_rate} per request "
+                    f"x {len(prompts)}) for spender {balance_tracker}..."
                 )
+                approval_tx_hash: Optional[str] = None
+                if self.executor.supports_batching:
+                    # Sent below in one Safe transaction with the request.
+                    approval_call = payment_strategy.approval_call(
+                        payer_address=sender,
+                        spender_address=balance_tracker,
+                        amount=price,
+                        approve_amount=approve_amount,
+                        reserved=reserved,
+                    )
+                else:
+                    approval_tx_hash = payment_strategy.approve_if_needed(
+                        payer_address=sender,
+                        spender_address=balance_tracker,
+                        amount=price,
+                        executor=self.executor,
+                        approve_amount=approve_amount,
+                        reserved=reserved,
+                    )
+                if approval_call is None and approval_tx_hash is None:
+                    logger.info("Token allowance sufficient, skipping approval")
+                elif approval_tx_hash is not None:
+                    # Wait for the approval to be mined before submitting the request.
+                    # Otherwise the request transaction is built on the pre-approval
+                    # ("latest") nonce while the approval is still pending, so both grab
+                    # the same nonce -> "replacement transaction underpriced", and the
+                    # allowance may not yet be on-chain when the request pulls payment.
+                    approval_tx_hash, approval_receipt = await self._await_receipt(
+                        approval_tx_hash
+                    )
+                    if approval_receipt.get("status") != 1:
+                        raise ValueError(
+                            f"Token approval transaction reverted. Hash: "
+                            f"{approval_tx_hash}. The request was not sent. This "
+                            f"often means the approval ran out of gas; check the "
+                            f"transaction on the block explorer."
+                        )
+                    logger.info("Token approval complete")
+
+            # Large batches go out as several requestBatch transactions sized to
+            # fit a block (the metadata above is uploaded once for all of them).
+            planner = RequestBatchPlanner(self.ledger_api)
+            item_key = request_item_key(
+                marketplace_contract.address, payment_type.value
+            )
+            chunks = planner.plan(data_hashes, item_key)
+            if len(chunks) > 1:
+                logger.info(
+                    f"Splitting {len(data_hashes)} requests into {len(chunks)} "
+                    f"requestBatch transactions of up to {len(chunks[0])} requests"
+                )
+            mined = await self._submit_request_chunks(
+                chunks,
+                approval_call,
+                journal,
+                {
+                    "marketplace_contract": marketplace_contract,
+                    "max_delivery_rate": max_delivery_rate,
+                    "payment_type": payment_type,
+                    "priority_mech": priority_mech_address,
+                    "response_timeout": response_timeout,
+                    "use_prepaid": use_prepaid,
+                },
+            )
 
-            # Approve. TokenPaymentStrategy.approve_if_needed always returns
-            # the hash of a sent transaction or raises; the base signature is
-            # Optional[str] only because NativePaymentStrategy is a no-op.
-            logger.info(
-                f"Approving {price} wei ({max_delivery_rate} per request "
-                f"x {len(prompts)}) for spender {balance_tracker}..."
-            )
-            approval_tx_hash = cast(
-                str,
-                payment_strategy.approve_if_needed(
-                    payer_address=sender,
-                    spender_address=balance_tracker,
-                    amount=price,
-                    executor=self.executor,
-                ),
-            )
-            # Wait for the approval to be mined before submitting the request.
-            # Otherwise the request transaction is built on the pre-approval
-            # ("latest") nonce while the approval is still pending, so both grab
-            # the same nonce -> "replacement transaction underpriced", and the
-            # allowance may not yet be on-chain when the request pulls payment.
-            approval_receipt = wait_for_receipt(approval_tx_hash, self.ledger_api)
-            if approval_receipt.get("status") != 1:
-                raise ValueError(
-                    f"Token approval transaction reverted. Hash: {approval_tx_hash}. "
-                    f"The request was not sent. This often means the approval ran "
-                    f"out of gas; check the transaction on the block explorer."
+        # Check every chunk and merge the request IDs in submission order
+        request_ids: List[str] = []
+        reverted: List[Tuple[str, str]] = []
+        for (tx_hash, receipt), chunk in zip(mined, chunks):
+            tx_url = self.mech_config.transaction_url.format(transaction_digest=tx_hash)
+            if receipt.get("status") != 1:
+                if journal is not None:
+                    journal.record_reverted(self.chain_config, tx_hash, chunk)
+                reverted.append((tx_hash, tx_url))
+                continue
+            planner.observe(item_key, receipt, len(chunk))
+            chunk_request_ids = watch_for_marketplace_request_ids(
+                marketplace_contract, self.ledger_api, tx_hash, tx_receipt=receipt
+            )
+            request_ids.extend(chunk_request_ids)
+            if journal is not None:
+                journal.record_submission(
+                    self.chain_config,
+                    tx_hash,
+                    chunk_request_ids,
+                    receipt.get("blockNumber"),
+                    data_hashes=chunk,
+                    mech=priority_mech_address,
+                )
+            logger.info(f"Transaction confirmed: {tx_url}")
+        if reverted:
+            message = (
+                f"Transaction reverted. Hash: {reverted[0][0]}. "
+                f"This may indicate insufficient gas or a contract error. "
+                f"Check the transaction on the block explorer: "
+                f"{', '.join(tx_url for _, tx_url in reverted)}"
+            )
+            if request_ids:
+                message += (
+                    f". Requests from the other transactions were created: "
+                    f"{request_ids}"
                 )
-            logger.info("Token approval complete")
+            raise ValueError(message)
 
-        logger.info("Submitting marketplace request transaction...")
-        tx_hash = self._send_marketplace_request(
-            marketplace_contract=marketplace_contract,
-            data_hashes=data_hashes,
-            max_delivery_rate=max_delivery_rate,
-            payment_type=payment_type,
-            priority_mech=priority_mech_address,
-            response_timeout=response_timeout,
-            use_prepaid=use_prepaid,
+        tx_hash, receipt = mined[0]
+        result: Dict[str, Any] = {
+            "tx_hash": tx_hash,
+            "tx_hashes": [mined_hash for mined_hash, _ in mined],
+            "request_ids": request_ids,
+            "delivery_results": {},
+            "receipt": receipt,
+        }
+        if journal is not None and not wait:
+            logger.info(f"Recorded {len(request_ids)} request(s) in {journal.path}")
+            return {**result, "journal": str(journal.path)}
+
+        # Watch for on-chain delivery (scan from the first tx block to catch
+        # all Deliver events)
+        logger.info("Waiting for mech delivery...")
+        watcher = OnchainDeliveryWatcher(marketplace_contract, self.ledger_api, timeout)
+        blocks = [
+            receipt["blockNumber"]
+            for _, receipt in mined
+            if receipt.get("blockNumber") is not None
+        ]
+        result["delivery_results"] = await watcher.watch(
+            request_ids, from_block=min(blocks) if blocks else None
         )
-        tx_url = self.mech_config.transaction_url.format(transaction_digest=tx_hash)
-        logger.info(f"Transaction submitted: {tx_url}")
+        if journal is not None:
+            journal.record_deliveries(
+                self.chain_config,
+                result["delivery_results"],
+                delivered_by=watcher.delivered_by,
+            )
+        return result
+
+    async def _send_hedged(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        prompts: Tuple[str, ...],
+        tools: Tuple[str, ...],
+        priority_mech: Optional[str],
+        hedge_after: float,
+        hedge_mech: Optional[str],
+        hedge_offchain: bool,
+        max_price: Optional[int],
+        timeout: Optional[float],
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send on-chain request(s) and hedge them with a second mech if late.
+
+        The primary request is submitted and watched for ``hedge_after``
+        seconds. If it is not fully delivered by then, the same prompts are
+        sent to the hedge mech (on-chain, or to its offchain endpoint) and
+        both are watched until the first complete delivery, within
+        ``timeout`` overall. Other mechs may still step in for the primary
+        once its response timeout has passed.
 
-        # Wait for receipt and check success
-        receipt = wait_for_receipt(tx_hash, self.ledger_api)
-        if receipt.get("status") != 1:
+        Both requests are paid for. The losing one is not watched any
+        further: on-chain requests stay pending in the journal, where
+        ``mechx deliveries watch|collect`` picks up their deliveries.
+
+        :param prompts: Tuple of prompt strings
+        :param tools: Tuple of tool identifiers
+        :param priority_mech: Primary mech address, ``"auto"`` or None
+        :param hedge_after: Seconds to wait for the primary delivery
+        :param hedge_mech: Hedge mech address, ``"auto"`` or None
+        :param hedge_offchain: Send the hedge offchain
+        :param max_price: Price cap of automatically selected mechs
+        :param timeout: Seconds to wait for a delivery overall
+        :param options: ``use_prepaid``, ``auto_deposit`` and
+            ``extra_attributes`` for both requests
+        :return: Result of the winning request, with a ``hedge`` entry (with
+            an ``error`` instead of a ``mech`` if no hedge mech could be
+            selected; the primary request is then watched alone)
+        :raises ValueError: If a price cap is given without automatic
+            selection, or the hedge mech is the primary mech
+        """
+        auto_primary = (priority_mech or "").lower() == AUTO_PRIORITY_MECH
+        auto_hedge = (hedge_mech or AUTO_PRIORITY_MECH).lower() == AUTO_PRIORITY_MECH
+        if max_price is not None and not (auto_primary or auto_hedge):
             raise ValueError(
-                f"Transaction reverted. Hash: {tx_hash}. "
-                f"This may indicate insufficient gas or a contract error. "
-                f"Check the transaction on the block explorer: "
-                f"{tx_url}"
+                "A maximum price only applies to automatic mech selection "
+                f"(priority_mech or hedge_mech={AUTO_PRIORITY_MECH!r})"
+            )
+        primary_mech = (
+            await asyncio.to_thread(
+                self._resolve_priority_mech,
+                priority_mech,
+                tools,
+                max_price if auto_primary else None,
             )
-        request_ids = watch_for_marketplace_request_ids(
-            marketplace_contract, self.ledger_api, tx_hash, tx_receipt=receipt
+            or self.mech_config.priority_mech_address
         )
-        logger.info(f"Transaction confirmed: {tx_url}")
+        # The hedge mech is picked before the primary request is paid for:
+        # a failed selection then only costs the hedge, not the request.
+        hedge_error: Optional[str] = None
+        hedge_address: Optional[str] = None
+        if auto_hedge:
+            try:
+                hedge_address = await asyncio.to_thread(
+                    self._hedge_target, hedge_mech, primary_mech, tools, max_price
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                hedge_error = str(e)
+                logger.warning(f"No hedge mech could be selected: {e}")
+        else:
+            hedge_address = self._hedge_target(hedge_mech, primary_mech, tools, None)
+        if hedge_after >= MECH_RESPONSE_TIMEOUT:
+            logger.warning(
+                f"Hedging after {hedge_after}s: other mechs may already step "
+                f"in after the {MECH_RESPONSE_TIMEOUT}s response timeout"
+            )
 
-        # Watch for on-chain delivery (scan from tx block to catch all Deliver events)
-        logger.info("Waiting for mech delivery...")
-        watcher = OnchainDeliveryWatcher(marketplace_contract, self.ledger_api, timeout)
-        tx_block = receipt.get("blockNumber")
-        results = await watcher.watch(request_ids, from_block=tx_block)
+        journal = self.journal or RequestJournal()
+        total = timeout or DEFAULT_TIMEOUT
+        started = time.monotonic()
+        primary = await self._send_request(
+            prompts, tools, priority_mech=primary_mech, wait=False, **options
+        )
+        watched = await self._watch_submitted(primary, hedge_after, journal)
+        hedge_info: Dict[str, Any] = {
+            "mech": None,
+            "offchain": hedge_offchain,
+            "winner": "primary",
+            "primary_request_ids": primary["request_ids"],
+            "hedge_request_ids": [],
+        }
+        if _fully_delivered(watched):
+            return {**watched, "hedge": hedge_info}
 
-        return {
-            "tx_hash": tx_hash,
-            "request_ids": request_ids,
-            "delivery_results": results,
-            "receipt": receipt,
+        remaining = max(total - (time.monotonic() - started), WAIT_SLEEP)
+        if hedge_address is None:
+            logger.info(
+                f"No delivery from {primary_mech} within {hedge_after}s; "
+                f"not hedged, still waiting"
+            )
+            watched = await self._watch_submitted(primary, remaining, journal)
+            hedge_info["winner"] = "primary" if _fully_delivered(watched) else None
+            return {**watched, "hedge": {**hedge_info, "error": hedge_error}}
+        hedge_info["mech"] = hedge_address
+        logger.info(
+            f"No delivery from {primary_mech} within {hedge_after}s; "
+            f"hedging with {hedge_address}"
+            f"{' (offchain)' if hedge_offchain else ''}"
+        )
+
+        async def _hedge() -> Dict[str, Any]:
+            if hedge_offchain:
+                result = await self._send_request(
+                    prompts,
+                    tools,
+                    priority_mech=hedge_address,
+                    use_offchain=True,
+                    timeout=remaining,
+                    **options,
+                )
+                hedge_info["hedge_request_ids"] = result["request_ids"]
+                return result
+            submitted = await self._send_request(
+                prompts, tools, priority_mech=hedge_address, wait=False, **options
+            )
+            hedge_info["hedge_request_ids"] = submitted["request_ids"]
+            left = max(total - (time.monotonic() - started), WAIT_SLEEP)
+            return await self._watch_submitted(submitted, left, journal)
+
+        contenders = {
+            asyncio.ensure_future(
+                self._watch_submitted(primary, remaining, journal)
+            ): "primary",
+            asyncio.ensure_future(_hedge()): "hedge",
         }
+        results: Dict[str, Dict[str, Any]] = {"primary": watched}
+        errors: Dict[str, BaseException] = {}
+        winner: Optional[str] = None
+        pending = set(contenders)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    role = contenders[task]
+                    if task.exception() is not None:
+                        errors[role] = task.exception()  # type: ignore[assignment]
+                        logger.warning(
+                            f"Hedged {role} request failed: {errors[role]}"
+                        )
+                        continue
+                    results[role] = task.result()
+                    if winner is None and _fully_delivered(results[role]):
+                        winner = role
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner is None and "primary" in errors and "hedge" not in results:
+            raise errors["primary"]
+        hedge_info["winner"] = winner
+        return {**results[winner or "primary"], "hedge": hedge_info}
+
+    def _hedge_target(
+        self,
+        hedge_mech: Optional[str],
+        primary_mech: Optional[str],
+        tools: Sequence[str],
+        max_price: Optional[int],
+    ) -> str:
+        """
+        Return the mech a late request is hedged with.
+
+        :param hedge_mech: Hedge mech address, ``"auto"`` or None
+        :param primary_mech: Mech the request was first sent to
+        :param tools: Tools of the request
+        :param max_price: Price cap of an automatically selected mech
+        :return: Hedge mech address
+        :raises ValueError: If the hedge mech is the primary mech
+        """
+        if hedge_mech and hedge_mech.lower() != AUTO_PRIORITY_MECH:
+            if primary_mech and hedge_mech.lower() == primary_mech.lower():
+                raise ValueError("The hedge mech must differ from the primary mech")
+            return hedge_mech
+        return MechSelectionService(self.chain_config, journal=self.journal).select(
+            tools, max_price=max_price, exclude=[primary_mech] if primary_mech else []
+        )
+
+    async def _watch_submitted(
+        self,
+        submitted: Dict[str, Any],
+        timeout: float,
+        journal: RequestJournal,
+    ) -> Dict[str, Any]:
+        """
+        Watch journaled on-chain requests for delivery.
+
+        :param submitted: Result of a request sent with ``wait=False``
+        :param timeout: Seconds to wait
+        :param journal: Journal the deliveries are recorded in
+        :return: ``submitted`` with the deliveries found
+        """
+        watcher = OnchainDeliveryWatcher(
+            self._get_marketplace_contract(), self.ledger_api, timeout
+        )
+        receipt = submitted.get("receipt") or {}
+        deliveries = await watcher.watch(
+            submitted["request_ids"], from_block=receipt.get("blockNumber")
+        )
+        journal.record_deliveries(
+            self.chain_config, deliveries, delivered_by=watcher.delivered_by
+        )
+        return {**submitted, "delivery_results": deliveries}
+
+    async def _submit_request_chunks(
+        self,
+        chunks: List[List[str]],
+        approval_call: Optional[ContractCall],
+        journal: Optional[RequestJournal],
+        request_args: Dict[str, Any],
+    ) -> List[Tuple[str, Dict]]:
+        """
+        Send one marketplace request transaction per chunk and await them.
+
+        Chunks are sent back to back, taking sequential nonces from the
+        executor, and their receipts are awaited together. A bundled
+        approval travels with the first chunk, which is then mined before
+        the rest are sent: their gas estimates need the allowance on-chain.
+
+        :param chunks: Data hashes per transaction, in order
+        :param approval_call: Approval to bundle with the first chunk, if any
+        :param journal: Journal each sent transaction is recorded in, if any
+        :param request_args: Arguments for the marketplace request call
+        :return: ``(included transaction hash, receipt)`` per chunk sent
+        """
+        receipt_waits: List["asyncio.Future[Tuple[str, Dict]]"] = []
+        try:
+            for index, chunk in enumerate(chunks):
+                label = f" ({index + 1}/{len(chunks)})" if len(chunks) > 1 else ""
+                if index == 0 and approval_call is not None:
+                    logger.info(
+                        "Submitting token approval and marketplace request "
+                        f"in one Safe transaction{label}..."
+                    )
+                    tx_hash = self.executor.execute_batch(
+                        [
+                            approval_call,
+                            self._marketplace_request_call(
+                                data_hashes=chunk, **request_args
+                            ),
+                        ]
+                    )
+                else:
+                    logger.info(f"Submitting marketplace request transaction{label}...")
+                    tx_hash = self._send_marketplace_request(
+                        data_hashes=chunk, **request_args
+                    )
+                tx_url = self.mech_config.transaction_url.format(
+                    transaction_digest=tx_hash
+                )
+                logger.info(f"Transaction submitted: {tx_url}")
+                if journal is not None:
+                    self._journal_sent(
+                        journal, tx_hash, chunk, request_args["priority_mech"]
+                    )
+                receipt_waits.append(
+                    asyncio.ensure_future(self._await_receipt(tx_hash))
+                )
+                if index == 0 and approval_call is not None and len(chunks) > 1:
+                    _, receipt = await receipt_waits[0]
+                    if receipt.get("status") != 1:
+                        break
+        except Exception:
+            if receipt_waits:
+                logger.warning(
+                    f"{len(receipt_waits)} of {len(chunks)} request transactions "
+                    "were sent before the failure; their requests may still "
+                    "be created"
+                )
+            for receipt_wait in receipt_waits:
+                receipt_wait.cancel()
+            raise
+        return list(await asyncio.gather(*receipt_waits))
+
+    def _journal_sent(
+        self,
+        journal: RequestJournal,
+        tx_hash: str,
+        data_hashes: List[str],
+        mech: Optional[str] = None,
+    ) -> None:
+        """
+        Journal a sent request transaction and every fee-bumped replacement.
+
+        Replacements are journaled as they are broadcast, so a process that
+        dies after a bump can still find whichever version was mined.
+
+        :param journal: Journal to record in
+        :param tx_hash: Hash returned when the transaction was sent
+        :param data_hashes: Metadata hashes the transaction requests
+        :param mech: Priority mech of the requests
+        """
+        journal.record_sent(self.chain_config, tx_hash, data_hashes, mech=mech)
+        supervisor = getattr(self.executor, "supervisor", None)
+        if isinstance(supervisor, TransactionSupervisor) and supervisor.is_tracking(
+            tx_hash
+        ):
+            supervisor.get(tx_hash).on_replaced.append(
+                lambda new_hash: journal.record_sent(
+                    self.chain_config, new_hash, data_hashes, mech=mech
+                )
+            )
 
     async def _send_offchain_request(  # pylint: disable=too-many-arguments,too-many-locals,unused-argument
         self,
@@ -670,8 +1495,8 @@ class MarketplaceService(
 
     @staticmethod
     def _do_offchain_post(url: str, payload: Dict[str, Any]) -> requests.Response:
-        """POST the offchain payload. Centralises the headers + timeout."""
-        return requests.post(
+        """POST the offchain payload through the pooled session for the mech."""
+        return get_http_registry().post(
             url=url,
             data=payload,
             headers={"Content-Type": "application/json"},
@@ -860,6 +1685,35 @@ class MarketplaceService(
             self.ledger_api,
         )
 
+    def _resolve_priority_mech(
+        self,
+        priority_mech: Optional[str],
+        tools: Sequence[str],
+        max_price: Optional[int],
+    ) -> Optional[str]:
+        """
+        Replace ``"auto"`` with the mech selected for the tools.
+
+        Selection (and indexing the chain on first use) runs the synchronous
+        subgraph API, so async callers must not call this on the event loop.
+
+        :param priority_mech: Priority mech address, ``"auto"`` or None
+        :param tools: Tools of the request(s)
+        :param max_price: Price cap of the selected mech, in wei
+        :return: Priority mech address (None: use the configured default)
+        :raises ValueError: If a price cap is given without ``"auto"``
+        """
+        if priority_mech is None or priority_mech.lower() != AUTO_PRIORITY_MECH:
+            if max_price is not None:
+                raise ValueError(
+                    "A maximum price only applies to automatic mech "
+                    f"selection (priority_mech={AUTO_PRIORITY_MECH!r})"
+                )
+            return priority_mech
+        return MechSelectionService(
+            self.chain_config, journal=self.journal
+        ).select(tools, max_price=max_price)
+
     def _fetch_mech_info(
         self, priority_mech: Optional[str]
     ) -> Tuple[PaymentType, int, int]:
@@ -887,7 +1741,7 @@ class MarketplaceService(
 
         return payment_type, service_id, max_delivery_rate
 
-    def _send_marketplace_request(  # pylint: disable=too-many-arguments,too-many-locals
+    def _send_marketplace_request(  # pylint: disable=too-many-arguments
         self,
         marketplace_contract: Web3Contract,
         data_hashes: List[str],
@@ -896,6 +1750,7 @@ class MarketplaceService(
         priority_mech: str,
         response_timeout: int,
         use_prepaid: bool,
+        executor: Optional[TransactionExecutor] = None,
     ) -> str:
         """
         Send marketplace request transaction.
@@ -907,12 +1762,63 @@ class MarketplaceService(
         :param priority_mech: Priority mech address
         :param response_timeout: Response timeout in seconds
         :param use_prepaid: Whether to use prepaid balance
+        :param executor: Executor to send through (default: the service's)
         :return: Transaction hash
         """
+        executor = executor or self.executor
+        call = self._marketplace_request_call(
+            marketplace_contract=marketplace_contract,
+            data_hashes=data_hashes,
+            max_delivery_rate=max_delivery_rate,
+            payment_type=payment_type,
+            priority_mech=priority_mech,
+            response_timeout=response_timeout,
+            use_prepaid=use_prepaid,
+        )
+
+        # gas_limit is the initial value; when is_gas_estimation_enabled is true
+        # (default), EthereumApi.build_transaction() overwrites it with
+        # eth_estimateGas(). gas_limit serves as fallback when estimation is
+        # disabled or fails. Agent mode ignores this entirely (Safe uses gas=0).
+        tx_args = {
+            "sender_address": executor.get_sender_address(),
+            "value": call.value,
+            "gas": self.mech_config.gas_limit,
+        }
+
+        # Execute transaction
+        return executor.execute_transaction(
+            contract=call.contract,
+            method_name=call.method_name,
+            method_args=call.method_args,
+            tx_args=tx_args,
+        )
+
+    @staticmethod
+    def _marketplace_request_call(  # pylint: disable=too-many-arguments,too-many-locals
+        marketplace_contract: Web3Contract,
+        data_hashes: List[str],
+        max_delivery_rate: int,
+        payment_type: PaymentType,
+        priority_mech: str,
+        response_timeout: int,
+        use_prepaid: bool,
+    ) -> ContractCall:
+        """
+        Build the marketplace ``request``/``requestBatch`` call.
+
+        :param marketplace_contract: Marketplace contract instance
+        :param data_hashes: List of IPFS data hashes
+        :param max_delivery_rate: Maximum delivery rate
+        :param payment_type: Payment type
+        :param priority_mech: Priority mech address
+        :param response_timeout: Response timeout in seconds
+        :param use_prepaid: Whether to use prepaid balance
+        :return: Contract call, with the native value to pay
+        """
         # Build transaction arguments
         method_name = "requestBatch" if len(data_hashes) > 1 else "request"
 
-        sender = self.executor.get_sender_address()
         value = (
             0
             if payment_type.is_token() or use_prepaid
@@ -958,20 +1864,4 @@ class MarketplaceService(
                 "paymentData": payment_data,
             }
 
-        # gas_limit is the initial value; when is_gas_estimation_enabled is true
-        # (default), EthereumApi.build_transaction() overwrites it with
-        # eth_estimateGas(). gas_limit serves as fallback when estimation is
-        # disabled or fails. Agent mode ignores this entirely (Safe uses gas=0).
-        tx_args = {
-            "sender_address": sender,
-            "value": value,
-            "gas": self.mech_config.gas_limit,
-        }
-
-        # Execute transaction
-        return self.executor.execute_transaction(
-            contract=marketplace_contract,
-            method_name=method_name,
-            method_args=method_args,
-            tx_args=tx_args,
-        )
+        return ContractCall(marketplace_contract, method_name, method_args, value)
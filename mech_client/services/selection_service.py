@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Selection service for picking the mech with the lowest expected latency."""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from mech_client.domain.selection import (
+    DeliverySample,
+    MechLatency,
+    rank_mechs,
+    summarize,
+)
+from mech_client.infrastructure.config.constants import (
+    LATENCY_MAX_AGE,
+    MECH_RESPONSE_TIMEOUT,
+)
+from mech_client.infrastructure.config.payment_config import PaymentType
+from mech_client.infrastructure.journal import RequestJournal
+from mech_client.infrastructure.subgraph.queries import query_mech_requests
+from mech_client.services.index_service import IndexService
+from mech_client.utils.validators import ensure_checksummed_address
+
+logger = logging.getLogger(__name__)
+
+# ``priority_mech`` value asking for the mech to be selected automatically
+AUTO_PRIORITY_MECH = "auto"
+
+
+class MechSelectionService:
+    """Service ranking marketplace mechs by their historical delivery latency.
+
+    Samples come from the local request journal (requests this client sent)
+    and from the subgraph's requests (every requester's, with exact block
+    times; they take precedence for requests found in both). Either way a
+    request with no delivery counts as timed out once its response timeout
+    has passed. Candidates are the mechs of the local index
+    that publish the requested tools within the price cap.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        chain_config: str,
+        journal: Optional[RequestJournal] = None,
+        index_service: Optional[IndexService] = None,
+        use_subgraph: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize selection service.
+
+        :param chain_config: Chain configuration name (gnosis, base, etc.)
+        :param journal: Request journal (default: the one at ``MECHX_JOURNAL_PATH``)
+        :param index_service: Index service (default: the local mech index)
+        :param use_subgraph: Also sample the subgraph's deliveries
+        :param clock: Wall-clock time source
+        """
+        self.chain_config = chain_config
+        self.journal = journal or RequestJournal()
+        self.index_service = index_service or IndexService(chain_config)
+        self.use_subgraph = use_subgraph
+        self._clock = clock
+
+    def samples(
+        self,
+        mechs: Optional[Sequence[str]] = None,
+        max_age: float = LATENCY_MAX_AGE,
+    ) -> List[DeliverySample]:
+        """
+        Collect the delivery samples of the chain's priority mechs.
+
+        A request with no delivery counts as timed out once its response
+        timeout has passed; until then it is left out.
+
+        :param mechs: Only these priority mechs (default: every journaled
+            one; the subgraph is only queried for given mechs)
+        :param max_age: Seconds of history sampled
+        :return: Delivery samples
+        """
+        now = self._clock()
+        since = now - max_age
+        wanted = {mech.lower() for mech in mechs} if mechs is not None else None
+
+        by_request: Dict[str, DeliverySample] = {}
+        for outcome in self.journal.outcomes(self.chain_config):
+            mech = outcome.mech.lower()
+            if outcome.submitted_at < since or (wanted and mech not in wanted):
+                continue
+            if outcome.delivered_at is not None:
+                latency: Optional[float] = outcome.delivered_at - outcome.submitted_at
+            elif now - outcome.submitted_at > MECH_RESPONSE_TIMEOUT:
+                latency = None
+            else:
+                continue
+            by_request[outcome.request_id] = DeliverySample(
+                mech=mech,
+                requested_at=outcome.submitted_at,
+                latency=latency,
+                stepped_in=bool(
+                    outcome.delivered_by and outcome.delivered_by.lower() != mech
+                ),
+            )
+
+        if self.use_subgraph and wanted:
+            for request in self._subgraph_requests(sorted(wanted), since):
+                mech = request["priority_mech"]
+                if mech not in wanted:
+                    continue
+                if request["delivered_at"] is not None:
+                    latency = request["delivered_at"] - request["requested_at"]
+                elif request["request_id"] in by_request:
+                    # The journal may have seen a delivery not indexed yet
+                    continue
+                elif now - request["requested_at"] > MECH_RESPONSE_TIMEOUT:
+                    latency = None
+                else:
+                    continue
+                by_request[request["request_id"]] = DeliverySample(
+                    mech=mech,
+                    requested_at=request["requested_at"],
+                    latency=latency,
+                    stepped_in=bool(
+                        request["delivered_by"] and request["delivered_by"] != mech
+                    ),
+                )
+        return list(by_request.values())
+
+    def stats(self, mechs: Optional[Sequence[str]] = None) -> Dict[str, MechLatency]:
+        """
+        Compute rolling latency statistics per priority mech.
+
+        :param mechs: Only these mechs (see :meth:`samples`)
+        :return: Statistics by mech address (lower-case)
+        """
+        return summarize(self.samples(mechs))
+
+    def candidates(
+        self,
+        tools: Sequence[str],
+        max_price: Optional[int] = None,
+        payment_type: Optional[PaymentType] = None,
+    ) -> List[str]:
+        """
+        List the indexed mechs offering every tool, cheapest first.
+
+        The chain is indexed first if it never was.
+
+        :param tools: Tools the mech must publish
+        :param max_price: Only mechs charging at most this many wei
+        :param payment_type: Only mechs accepting this payment type
+        :return: Mech addresses
+        """
+        index = self.index_service.index
+        if index.refreshed_at(self.chain_config) is None:
+            logger.info(f"Indexing the mechs of {self.chain_config}...")
+            self.index_service.refresh()
+
+        matches: Optional[List[str]] = None
+        for tool in dict.fromkeys(tools):
+            found = [
+                mech.address
+                for mech in self.index_service.query(
+                    tool=tool, max_price=max_price, payment_type=payment_type
+                )
+            ]
+            if matches is None:
+                matches = found
+            else:
+                offering = set(found)
+                matches = [address for address in matches if address in offering]
+        return matches or []
+
+    def select(
+        self,
+        tools: Sequence[str],
+        max_price: Optional[int] = None,
+        payment_type: Optional[PaymentType] = None,
+        exclude: Sequence[str] = (),
+    ) -> str:
+        """
+        Pick the mech with the lowest expected delivery latency.
+
+        :param tools: Tools the mech must publish
+        :param max_price: Only mechs charging at most this many wei
+        :param payment_type: Only mechs accepting this payment type
+        :param exclude: Mechs not to pick (e.g. the one a request is hedged
+            against)
+        :return: Checksummed mech address
+        :raises ValueError: If no indexed mech offers the tools within the cap
+        """
+        excluded = {mech.lower() for mech in exclude}
+        candidates = [
+            mech
+            for mech in self.candidates(tools, max_price, payment_type)
+            if mech.lower() not in excluded
+        ]
+        if not candidates:
+            cap = f" at most {max_price} wei" if max_price is not None else ""
+            other = " other" if excluded else ""
+            raise ValueError(
+                f"No{other} indexed mech on {self.chain_config} offers "
+                f"{', '.join(dict.fromkeys(tools))}{cap}. Refresh the index with "
+                f"'mechx index refresh --chain-config {self.chain_config}'."
+            )
+        stats = self.stats(candidates)
+        chosen = rank_mechs(candidates, stats)[0]
+        chosen_stats = stats.get(chosen.lower())
+        if chosen_stats is None:
+            logger.info(f"Selected mech {chosen} (no delivery history)")
+        else:
+            logger.info(
+                f"Selected mech {chosen}: p50 {chosen_stats.p50}s, "
+                f"p95 {chosen_stats.p95}s over {chosen_stats.requests} request(s), "
+                f"{chosen_stats.timeout_rate:.0%} timed out"
+            )
+        return ensure_checksummed_address(chosen)
+
+    def _subgraph_requests(self, mechs: Sequence[str], since: float) -> List[Dict]:
+        """Query the subgraph requests to ``mechs`` (none if it is unavailable)."""
+        try:
+            return query_mech_requests(self.chain_config, mechs, since=since)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(
+                f"Could not read requests from the subgraph; using the "
+                f"journal only: {e}"
+            )
+            return []
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -24,7 +24,7 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
-from mech_client.infrastructure.config import get_mech_config
+from mech_client.infrastructure.config import clear_config_cache, get_mech_config
 from mech_client.infrastructure.config.environment import EnvironmentConfig
 from mech_client.infrastructure.operate import OperateManager
 from operate.quickstart.run_service import run_service
@@ -88,6 +88,8 @@ class SetupService:
                 skip_dependency_check=False,
             )
             logger.info(f"Service configured for {self.chain_config}")
+            # Agent-mode configurations read the RPC stored by the setup
+            clear_config_cache()
         except Exception as e:
             logger.error(f"Service setup failed: {e}")
             raise
@@ -31,6 +31,7 @@ from mech_client.domain.subscription import (
     SubscriptionManager,
 )
 from mech_client.infrastructure.config.loader import get_mech_config
+from mech_client.infrastructure.http import get_http_registry
 from mech_client.infrastructure.nvm.config import NVMConfig
 from mech_client.infrastructure.nvm.contracts import (
     AgreementManagerContract,
@@ -84,6 +85,7 @@ class SubscriptionService:  # pylint: disable=too-many-instance-attributes,too-f
         # Load mech configuration and create ledger API (pass agent_mode to load RPC from operate config in agent mode)
         mech_config = get_mech_config(chain_config, agent_mode=agent_mode)
         self.ledger_api = EthereumApi(**asdict(mech_config.ledger_config))
+        get_http_registry().attach_to_provider(self.ledger_api.api.provider)
 
         # Load NVM configuration
         self.config = NVMConfig.from_chain(chain_config)
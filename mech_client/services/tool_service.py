@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -19,9 +19,11 @@
 
 """Tool service for managing mech tools."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 from mech_client.domain.tools import ToolManager, ToolsForMarketplaceMech
+from mech_client.infrastructure.config.constants import TOOL_DISCOVERY_WORKERS
+from mech_client.infrastructure.subgraph.queries import query_mm_mechs_info
 
 
 class ToolService:
@@ -77,6 +79,40 @@ class ToolService:
             raise ValueError(f"No tools found for service {service_id}")
         return tools_info
 
+    def get_tools_for_services(
+        self,
+        service_ids: Sequence[int],
+        max_workers: int = TOOL_DISCOVERY_WORKERS,
+    ) -> Dict[int, ToolsForMarketplaceMech]:
+        """
+        Get the tools of many mechs at once.
+
+        Metadata URIs are read with Multicall3 and the documents fetched
+        concurrently, so the cost grows with the slowest mech rather than
+        with the number of mechs.
+
+        :param service_ids: Service IDs of the mechs
+        :param max_workers: Metadata documents fetched concurrently
+        :return: Tools by service ID, for the services that publish any
+        """
+        return self.tool_manager.get_tools_for_services(service_ids, max_workers)
+
+    def get_marketplace_tools(
+        self, max_workers: int = TOOL_DISCOVERY_WORKERS
+    ) -> Dict[int, ToolsForMarketplaceMech]:
+        """
+        Get the merged tool catalogue of every mech on the marketplace.
+
+        :param max_workers: Metadata documents fetched concurrently
+        :return: Tools by service ID, for the services that publish any
+        :raises ValueError: If the subgraph lists no mechs
+        """
+        mechs = query_mm_mechs_info(self.chain_config, limit=None, snapshot=True)
+        if not mechs:
+            raise ValueError(f"No marketplace mechs found on {self.chain_config}")
+        service_ids = dict.fromkeys(int(mech["service"]["id"]) for mech in mechs)
+        return self.get_tools_for_services(list(service_ids), max_workers)
+
     def format_input_schema(self, schema: Dict[str, Any]) -> List[Tuple[str, str]]:
         """
         Format input schema for display.
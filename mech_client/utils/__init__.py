@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,9 +17,23 @@
 #
 # ------------------------------------------------------------------------------
 
-"""Shared utilities for mech client."""
+"""Shared utilities for mech client.
 
-from mech_client.utils import constants, errors, logger, validators
+Submodules are imported on first access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mech_client.utils import constants, errors, logger, validators
+
+_LAZY_ATTRIBUTES = {
+    "constants": "mech_client.utils.constants",
+    "errors": "mech_client.utils.errors",
+    "logger": "mech_client.utils.logger",
+    "validators": "mech_client.utils.validators",
+}
 
 __all__ = [
     "constants",
@@ -27,3 +41,28 @@ __all__ = [
     "logger",
     "validators",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a submodule on first access (PEP 562).
+
+    :param name: Attribute name
+    :return: The attribute
+    :raises AttributeError: If the package has no such attribute
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(module)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package's attributes, including those not imported yet.
+
+    :return: Attribute names
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
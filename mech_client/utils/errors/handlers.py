@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -20,6 +20,8 @@
 """Error handler decorators for CLI commands."""
 
 import functools
+import importlib
+from types import ModuleType
 from typing import Callable, Optional
 
 import requests
@@ -39,7 +41,18 @@ from mech_client.utils.errors.exceptions import (
     ValidationError,
 )
 from mech_client.utils.errors.messages import ErrorMessages
-from web3.exceptions import ContractLogicError, Web3ValidationError
+
+
+def _web3_exceptions() -> ModuleType:
+    """Return ``web3.exceptions``, imported only once an error is classified.
+
+    Importing web3 takes a large share of the CLI's startup time, and every
+    command is wrapped by these handlers. ``except`` clauses are evaluated
+    only when an exception reaches them.
+
+    :return: The web3.exceptions module
+    """
+    return importlib.import_module("web3.exceptions")
 
 
 # pylint: disable=too-many-statements
@@ -114,9 +127,9 @@ def handle_cli_errors(func: Callable) -> Callable:
             raise ClickException(
                 ErrorMessages.rpc_timeout(optional_rpc_url, str(e))
             ) from e
-        except ContractLogicError as e:
+        except _web3_exceptions().ContractLogicError as e:
             raise ClickException(ErrorMessages.contract_logic_error(str(e))) from e
-        except Web3ValidationError as e:
+        except _web3_exceptions().Web3ValidationError as e:
             raise ClickException(ErrorMessages.validation_error(str(e))) from e
         except (ValueError, FileNotFoundError) as e:
             raise ClickException(str(e)) from e
@@ -183,9 +196,9 @@ def handle_contract_errors(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):  # type: ignore
         try:
             return func(*args, **kwargs)
-        except ContractLogicError as e:
+        except _web3_exceptions().ContractLogicError as e:
             raise ContractError(f"Contract logic error: {e}") from e
-        except Web3ValidationError as e:
+        except _web3_exceptions().Web3ValidationError as e:
             raise ContractError(f"Contract validation error: {e}") from e
 
     return wrapper
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2025 Valory AG
+#   Copyright 2025-2026 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -25,11 +25,12 @@ They can be used by services, domain logic, or any other component.
 
 from typing import List, Optional
 
-from eth_utils import is_address
+from eth_utils import is_address, to_checksum_address
 from mech_client.infrastructure.config import PaymentType
 from mech_client.utils.errors import ValidationError
-from web3 import Web3
-from web3.constants import ADDRESS_ZERO
+
+# Same as web3.constants.ADDRESS_ZERO, without importing web3 (slow) here
+ADDRESS_ZERO = "0x0000000000000000000000000000000000000000"
 
 
 def ensure_checksummed_address(address: str) -> str:
@@ -44,7 +45,7 @@ def ensure_checksummed_address(address: str) -> str:
     :param address: Ethereum address (checksummed or not)
     :return: Checksummed address
     """
-    return Web3.to_checksum_address(address)
+    return to_checksum_address(address)
 
 
 def validate_ethereum_address(address: str, allow_zero: bool = False) -> str:
@@ -71,7 +72,7 @@ def validate_ethereum_address(address: str, allow_zero: bool = False) -> str:
         )
 
     # Convert to checksummed address
-    checksummed_address = Web3.to_checksum_address(address)
+    checksummed_address = to_checksum_address(address)
 
     # Check zero address after checksumming
     if not allow_zero and checksummed_address == ADDRESS_ZERO:
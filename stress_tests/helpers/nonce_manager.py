@@ -19,24 +19,6 @@
 
 import gevent
 
-class NonceAllocator:
-    """
-    Thread/greenlet-safe nonce allocator per account.
-    Uses 'pending' count so unmined txs are included.
-    """
-    def __init__(self, w3, address: str):
-        self._w3 = w3
-        self._addr = address
-        self._lock = gevent.lock.Semaphore()
-        self._next = self._w3.eth.get_transaction_count(address, "pending")
-
-    def allocate_batch(self, n: int) -> int:
-        """Reserve n sequential nonces, returning the base nonce."""
-        with self._lock:
-            base = self._next
-            self._next += n
-            return base
-
 class MapNonceAllocator:
     def __init__(self, marketplace_contract, address: str):
         self._c = marketplace_contract
@@ -43,7 +43,11 @@ from mech_client.marketplace_interact import (
     CHAIN_TO_DEFAULT_MECH_MARKETPLACE_REQUEST_CONFIG
 )
 from stress_tests.helpers.marketplace_helpers import send_marketplace_request_nonblocking, delivery_consumer_loop_status_only
-from stress_tests.helpers.nonce_manager import MapNonceAllocator, NonceAllocator
+from mech_client.infrastructure.blockchain.nonce_manager import (
+    get_nonce_manager,
+    is_nonce_conflict,
+)
+from stress_tests.helpers.nonce_manager import MapNonceAllocator
 from stress_tests.helpers.query_generation import make_prompts
 
 # -------------------- TEST PARAMS --------------------
@@ -136,8 +140,8 @@ class MechUser(User):
             **{k: v for k, v in cfg_values.items()}
         )
 
-        # nonce allocator per sender
-        self.nonce_alloc = NonceAllocator(self.ledger_api.api, self.crypto.address)
+        # process-wide pending-aware nonce manager (shared across users)
+        self.nonce_alloc = get_nonce_manager(self.ledger_api)
 
         # start one consumer for the whole test
         if not consumer_started:
@@ -182,6 +186,39 @@ class MechUser(User):
                 env.runner.quit()  # graceful stop -> UI gets final snapshot
             gevent.sleep(2.0)  # give UI time to pull latest stats
 
+    def _settle_failed_nonces(self, nonces, error):
+        """
+        Return the nonces of a transaction that was never broadcast; if the
+        node says they are already used, resync with its pending count.
+        """
+        address = self.crypto.address
+        for nonce in nonces:
+            if is_nonce_conflict(error):
+                self.nonce_alloc.confirm(address, nonce)
+            else:
+                self.nonce_alloc.release(address, nonce)
+        if is_nonce_conflict(error):
+            self.nonce_alloc.resync(address)
+
+    def _settle_sent_nonces(self, tx_hash, nonces):
+        """
+        Confirm the nonces of a broadcast transaction once it is mined. If no
+        receipt arrives in time the tx may have been dropped, so resync with
+        the node instead of reusing the nonces blindly.
+        """
+        address = self.crypto.address
+        try:
+            self.ledger_api.api.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=float(self.req_cfg.response_timeout)
+            )
+        except Exception:
+            for nonce in nonces:
+                self.nonce_alloc.confirm(address, nonce)
+            self.nonce_alloc.resync(address)
+            return
+        for nonce in nonces:
+            self.nonce_alloc.confirm(address, nonce)
+
     @task
     def submit(self):
         """
@@ -199,21 +236,31 @@ class MechUser(User):
         # For single-request txs, batch_size = 1
         batch_size = 1
 
-        base_eth_nonce = self.nonce_alloc.allocate_batch(batch_size)
+        base_eth_nonce = self.nonce_alloc.reserve_batch(
+            self.crypto.address, batch_size
+        )
         base_map_nonce = self.mapnonce_alloc.allocate_batch(batch_size)
+        nonces = range(base_eth_nonce, base_eth_nonce + batch_size)
+
+        try:
+            tx_hash, request_ids, from_block = _send_nonblocking_with_explicit_nonce(
+                crypto=self.crypto,
+                ledger_api=self.ledger_api,
+                marketplace_contract=self.marketplace,
+                gas_limit=self.mech_config.gas_limit,
+                prompts=prompts,
+                tools=tools,
+                method_args_data=self.req_cfg,
+                extra_attributes=None,
+                base_nonce=base_eth_nonce,
+                contract_nonce=base_map_nonce,
+            )
+        except Exception as e:
+            self._settle_failed_nonces(nonces, e)
+            raise
 
-        tx_hash, request_ids, from_block = _send_nonblocking_with_explicit_nonce(
-            crypto=self.crypto,
-            ledger_api=self.ledger_api,
-            marketplace_contract=self.marketplace,
-            gas_limit=self.mech_config.gas_limit,
-            prompts=prompts,
-            tools=tools,
-            method_args_data=self.req_cfg,
-            extra_attributes=None,
-            base_nonce=base_eth_nonce,
-            contract_nonce=base_map_nonce,
-        )
+        # hand the nonces back to the manager once the tx is mined (or dropped)
+        gevent.spawn(self._settle_sent_nonces, tx_hash, nonces)
 
         t0 = time.monotonic()
         for rid in request_ids:
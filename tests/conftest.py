@@ -19,15 +19,31 @@
 
 """Pytest configuration and shared fixtures."""
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterator
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from web3.constants import ADDRESS_ZERO
 
+from mech_client.infrastructure.config import clear_config_cache
 from mech_client.infrastructure.config.chain_config import LedgerConfig
 
 
+@pytest.fixture(autouse=True)
+def fresh_config_cache() -> Iterator[None]:
+    """Start every test without memoized configurations or chain-ID probes."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_journal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Journal the requests of every test to a temporary file."""
+    monkeypatch.setenv("MECHX_JOURNAL_PATH", str(tmp_path / "request_journal.jsonl"))
+
+
 @pytest.fixture
 def mock_ledger_api() -> MagicMock:
     """
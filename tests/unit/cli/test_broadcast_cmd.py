@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for broadcast command."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from click.testing import CliRunner
+
+from mech_client.cli.commands.broadcast_cmd import broadcast
+from mech_client.infrastructure.blockchain.broadcast import raw_transaction_hash
+from mech_client.infrastructure.blockchain.presigned import (
+    PresignedTransaction,
+    write_presigned,
+)
+from mech_client.services.broadcast_service import BroadcastOutcome
+
+
+def _presigned() -> PresignedTransaction:
+    """Build a pre-signed request transaction."""
+    return PresignedTransaction(
+        chain_id=100,
+        sender="0x" + "a" * 40,
+        nonce=3,
+        tx_hash=raw_transaction_hash("0x02f8aa"),
+        raw_transaction="0x02f8aa",
+        metadata={"kind": "request"},
+    )
+
+
+class TestBroadcastCommand:
+    """Tests for broadcast command."""
+
+    @patch("mech_client.cli.commands.broadcast_cmd.BroadcastService")
+    def test_broadcast_success(self, mock_service_cls: MagicMock) -> None:
+        """Test a file is read, broadcast with the options, and reported."""
+        transaction = _presigned()
+        mock_service = MagicMock()
+        mock_service.broadcast = AsyncMock(
+            return_value={
+                "outcomes": [BroadcastOutcome(transaction, "mined", request_ids=["r1"])],
+                "request_ids": ["r1"],
+                "delivery_results": {"r1": {"task_result": "bafyresult"}},
+            }
+        )
+        mock_service_cls.return_value = mock_service
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_presigned("requests.jsonl", [transaction])
+            result = runner.invoke(
+                broadcast,
+                [
+                    "requests.jsonl",
+                    "--chain-config",
+                    "gnosis",
+                    "--rate",
+                    "5",
+                    "--no-watch",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_service_cls.assert_called_once_with("gnosis")
+        args, kwargs = mock_service.broadcast.call_args
+        assert args == ([transaction],)
+        assert kwargs["rate"] == 5
+        assert kwargs["watch_deliveries"] is False
+        assert f"✓ request nonce 3 {transaction.tx_hash}: mined" in result.output
+        assert "Request IDs: ['r1']" in result.output
+        assert "bafyresult" in result.output
+
+    def test_broadcast_rejects_non_positive_rate(self) -> None:
+        """Test --rate must be positive."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_presigned("requests.jsonl", [_presigned()])
+            result = runner.invoke(
+                broadcast,
+                ["requests.jsonl", "--chain-config", "gnosis", "--rate", "0"],
+            )
+
+        assert result.exit_code != 0
+        assert "--rate must be positive" in result.output
+
+    def test_broadcast_empty_file(self) -> None:
+        """Test an empty file is reported instead of broadcasting nothing."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            open("requests.jsonl", "w", encoding="utf-8").close()
+            result = runner.invoke(
+                broadcast, ["requests.jsonl", "--chain-config", "gnosis"]
+            )
+
+        assert result.exit_code != 0
+        assert "No transactions found" in result.output
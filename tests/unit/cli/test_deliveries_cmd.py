@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for deliveries command."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from click.testing import CliRunner
+
+from mech_client.cli.commands.deliveries_cmd import deliveries
+from mech_client.infrastructure.journal import PendingRequest, RequestJournal
+
+
+class TestDeliveriesCommand:
+    """Tests for deliveries watch/collect."""
+
+    @patch("mech_client.cli.commands.deliveries_cmd.DeliveryService")
+    def test_watch_reports_deliveries(self, mock_service_cls: MagicMock) -> None:
+        """Test watch passes the options through and prints the results."""
+        mock_service = MagicMock()
+        mock_service.pending.side_effect = [
+            [PendingRequest("gnosis", "aa", "0xt1", 10)],
+            [],
+        ]
+        mock_service.watch = AsyncMock(
+            return_value={"aa": {"task_result": "bafyresult"}}
+        )
+        mock_service_cls.return_value = mock_service
+
+        result = CliRunner().invoke(
+            deliveries,
+            [
+                "watch",
+                "--chain-config",
+                "gnosis",
+                "--request-id",
+                "0xaa",
+                "--journal",
+                "journal.jsonl",
+                "--timeout",
+                "30",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        chain, journal = mock_service_cls.call_args.args
+        assert chain == "gnosis"
+        assert str(journal.path) == "journal.jsonl"
+        mock_service.watch.assert_awaited_once_with(("0xaa",), timeout=30.0)
+        assert "bafyresult" in result.output
+        assert "0 request(s) still awaiting delivery" in result.output
+
+    @patch("mech_client.cli.commands.deliveries_cmd.DeliveryService")
+    def test_watch_with_nothing_pending(self, mock_service_cls: MagicMock) -> None:
+        """Test watch exits early when the journal has nothing outstanding."""
+        mock_service = MagicMock()
+        mock_service.pending.return_value = []
+        mock_service_cls.return_value = mock_service
+
+        result = CliRunner().invoke(deliveries, ["watch", "--chain-config", "gnosis"])
+
+        assert result.exit_code == 0, result.output
+        assert "No pending requests" in result.output
+        mock_service.watch.assert_not_called()
+
+    @patch("mech_client.cli.commands.deliveries_cmd.DeliveryService")
+    def test_collect(self, mock_service_cls: MagicMock) -> None:
+        """Test collect prints journaled deliveries and the outstanding count."""
+        mock_service = MagicMock()
+        mock_service.collect = AsyncMock(return_value={})
+        mock_service.pending.return_value = [
+            PendingRequest("gnosis", "aa", "0xt1", 10)
+        ]
+        mock_service_cls.return_value = mock_service
+
+        result = CliRunner().invoke(
+            deliveries, ["collect", "--chain-config", "gnosis"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "No deliveries yet." in result.output
+        assert "1 request(s) still awaiting delivery" in result.output
+
+    def test_compact(self) -> None:
+        """Test compact rewrites the journal and reports the record counts."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            journal = RequestJournal("journal.jsonl")
+            journal.record_submission("gnosis", "0xt1", ["aa", "bb"], from_block=10)
+            journal.record_deliveries("gnosis", {"aa": "ipfs://aa"})
+
+            result = runner.invoke(
+                deliveries, ["compact", "--journal", "journal.jsonl"]
+            )
+
+            assert result.exit_code == 0, result.output
+            assert "2 record(s) -> 1" in result.output
+            assert [p.request_id for p in journal.pending()] == ["bb"]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Import-time budgets of the CLI and its commands.
+
+Each case imports the CLI in a fresh interpreter with ``python -X importtime``
+(as ``mechx <command>`` does before running) and checks which heavy
+libraries were imported and how long importing took. Time budgets are a few
+times the typical figure, so they only catch regressions such as a module
+importing the whole stack again.
+"""
+
+import subprocess  # nosec
+import sys
+from typing import Dict, FrozenSet, Tuple
+
+import pytest
+
+# Heavy third-party packages a command may not need
+HEAVY = frozenset(
+    {"aea_ledger_ethereum", "gql", "operate", "safe_eth", "tabulate", "web3"}
+)
+
+# Command ("" for the group itself, as for --help): (packages it may import,
+# import-time budget in seconds)
+BUDGETS: Dict[str, Tuple[FrozenSet[str], float]] = {
+    "": (frozenset(), 0.5),
+    "ipfs": (frozenset(), 1.5),
+    "mech": (frozenset({"gql", "tabulate"}), 3.0),
+    "tool": (frozenset({"aea_ledger_ethereum", "gql", "tabulate", "web3"}), 5.0),
+    "index": (frozenset({"aea_ledger_ethereum", "gql", "tabulate", "web3"}), 5.0),
+    "deliveries": (frozenset({"aea_ledger_ethereum", "web3"}), 5.0),
+    "broadcast": (frozenset({"aea_ledger_ethereum", "web3"}), 5.0),
+    "setup": (frozenset({"aea_ledger_ethereum", "operate", "web3"}), 8.0),
+    "request": (HEAVY - {"tabulate"}, 10.0),
+    "deposit": (HEAVY - {"gql", "tabulate"}, 10.0),
+    "subscription": (HEAVY - {"gql", "tabulate"}, 10.0),
+}
+
+
+def _import(command: str) -> Tuple[FrozenSet[str], float]:
+    """
+    Import the CLI (and a command) in a fresh interpreter.
+
+    :param command: Command to load ("" for none)
+    :return: Imported modules and the total import time in seconds
+    """
+    code = "from mech_client.cli.main import cli"
+    if command:
+        code += f"; cli.get_command(None, {command!r})"
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        # Nested imports are indented and already counted by their importer
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return frozenset(modules), total / 1e6
+
+
+@pytest.mark.parametrize("command", sorted(BUDGETS))
+def test_command_import_budget(command: str) -> None:
+    """Test a command imports only the heavy packages it needs, within budget."""
+    allowed, budget = BUDGETS[command]
+    modules, seconds = _import(command)
+
+    assert HEAVY & modules <= allowed
+    assert seconds < budget
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for index command."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from mech_client.cli.commands.index_cmd import index
+from mech_client.infrastructure.config.payment_config import PaymentType
+from mech_client.infrastructure.index import IndexedMech
+
+
+class TestIndexCommand:
+    """Tests for the index command group."""
+
+    @patch("mech_client.cli.commands.index_cmd.IndexService")
+    def test_refresh(self, mock_index_service: MagicMock) -> None:
+        """Test refreshing reports how many mechs were indexed."""
+        mock_index_service.return_value.refresh.return_value = (12, 3)
+
+        result = CliRunner().invoke(
+            index, ["refresh", "--chain-config", "gnosis", "--full"]
+        )
+
+        assert result.exit_code == 0
+        assert "Indexed 12 mech(s) on gnosis (3 read from the network)" in (
+            result.output
+        )
+        mock_index_service.return_value.refresh.assert_called_once_with(full=True)
+
+    @patch("mech_client.cli.commands.index_cmd.IndexService")
+    def test_query(self, mock_index_service: MagicMock) -> None:
+        """Test the filters are passed on and matches are tabulated."""
+        mock_index_service.return_value.query.return_value = [
+            IndexedMech(
+                "gnosis",
+                "0xaaa",
+                1722,
+                payment_type="NATIVE",
+                max_delivery_rate=10**16,
+                total_deliveries=42,
+                tools=("gpt", "prediction-online"),
+            )
+        ]
+
+        result = CliRunner().invoke(
+            index,
+            [
+                "query",
+                "--chain-config",
+                "gnosis",
+                "--tool",
+                "gpt",
+                "--max-price",
+                "10000000000000000",
+                "--payment-type",
+                "native",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "0xaaa" in result.output
+        assert "1722" in result.output
+        mock_index_service.return_value.query.assert_called_once_with(
+            tool="gpt",
+            max_price=10**16,
+            payment_type=PaymentType.NATIVE,
+            limit=None,
+        )
+
+    @patch("mech_client.cli.commands.index_cmd.IndexService")
+    def test_query_no_matches(self, mock_index_service: MagicMock) -> None:
+        """Test an empty result is reported."""
+        mock_index_service.return_value.query.return_value = []
+
+        result = CliRunner().invoke(index, ["query", "--chain-config", "gnosis"])
+
+        assert result.exit_code == 0
+        assert "No matching mechs found" in result.output
@@ -22,9 +22,11 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from mech_client.cli.main import OPERATE_FOLDER_NAME, cli
+from mech_client.cli.main import COMMANDS, OPERATE_FOLDER_NAME, cli
 
 
 class TestCliMain:
@@ -78,3 +80,28 @@ class TestCliMain:
             "Operate path does not exist" in combined
             or result.exit_code != 0
         )
+
+
+class TestLazyCommands:
+    """Tests for the lazily imported subcommands."""
+
+    def test_help_lists_every_command(self) -> None:
+        """Test --help lists the registered commands with their help."""
+        result = CliRunner().invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        for name in COMMANDS:
+            assert f"  {name} " in result.output
+        assert "Send an AI task request to a mech on-chain." in result.output
+
+    @pytest.mark.parametrize("name", sorted(COMMANDS))
+    def test_registry_matches_command(self, name: str) -> None:
+        """Test each registered command loads and its listed help is current."""
+        command = cli.get_command(click.Context(cli), name)
+
+        assert command is not None and command.name == name
+        assert (command.help or "").splitlines()[0] == COMMANDS[name].help
+
+    def test_unknown_command(self) -> None:
+        """Test an unregistered command is reported as missing."""
+        assert cli.get_command(click.Context(cli), "nope") is None
@@ -208,6 +208,20 @@ class TestMechListCommand:
         assert result.exit_code == 0
         assert "No mechs found" in result.output
 
+    @patch("mech_client.cli.commands.mech_cmd.query_mm_mechs_info")
+    def test_list_command_reads_snapshot(self, mock_query: MagicMock) -> None:
+        """Test mech list reads the subgraph snapshot, synced on --refresh."""
+        mock_query.return_value = []
+
+        runner = CliRunner()
+        runner.invoke(mech, ["list", "--chain-config", "gnosis"])
+        runner.invoke(mech, ["list", "--chain-config", "gnosis", "--refresh"])
+
+        assert [call.kwargs for call in mock_query.call_args_list] == [
+            {"chain_config": "gnosis", "snapshot": True, "refresh": False},
+            {"chain_config": "gnosis", "snapshot": True, "refresh": True},
+        ]
+
     @patch("mech_client.cli.commands.mech_cmd.query_mm_mechs_info")
     def test_list_command_for_base_chain(self, mock_query: MagicMock) -> None:
         """Test mech list works for base chain."""
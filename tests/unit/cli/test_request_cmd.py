@@ -19,12 +19,19 @@
 
 """Tests for request command."""
 
+from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from mech_client.infrastructure.config import IPFS_URL_TEMPLATE
 from click.testing import CliRunner
 
 from mech_client.cli.commands.request_cmd import request
+from mech_client.infrastructure.blockchain.broadcast import raw_transaction_hash
+from mech_client.infrastructure.blockchain.presigned import (
+    PresignedTransaction,
+    read_presigned,
+)
 
 
 class TestRequestCommand:
@@ -627,6 +634,199 @@ class TestRequestCommand:
             assert result.exit_code == 1
             assert "Invalid" in result.output or "address" in result.output.lower()
 
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_with_auto_priority_mech(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --priority-mech auto is passed on with the price cap, journaled."""
+        mock_setup_wallet.return_value = MagicMock()
+        mock_service = MagicMock()
+        mock_service.send_request = AsyncMock(
+            return_value={"tx_hash": "0xauto", "request_ids": [1]}
+        )
+        mock_marketplace_service.return_value = mock_service
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                [
+                    "--prompts",
+                    "Test prompt",
+                    "--tools",
+                    "tool1",
+                    "--priority-mech",
+                    "auto",
+                    "--max-price",
+                    "1000",
+                    "--chain-config",
+                    "gnosis",
+                    "--key",
+                    "key.txt",
+                ],
+            )
+
+            assert result.exit_code == 0, result.output
+            call_kwargs = mock_service.send_request.call_args[1]
+            assert call_kwargs["priority_mech"] == "auto"
+            assert call_kwargs["max_price"] == 1000
+            assert mock_marketplace_service.call_args.kwargs["use_journal"] is True
+
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_no_journal(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --no-journal turns off journaling of the request."""
+        mock_setup_wallet.return_value = MagicMock()
+        mock_service = MagicMock()
+        mock_service.send_request = AsyncMock(
+            return_value={"tx_hash": "0x1", "request_ids": [1]}
+        )
+        mock_marketplace_service.return_value = mock_service
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                [
+                    "--prompts",
+                    "Test prompt",
+                    "--tools",
+                    "tool1",
+                    "--no-journal",
+                    "--chain-config",
+                    "gnosis",
+                    "--key",
+                    "key.txt",
+                ],
+            )
+
+            assert result.exit_code == 0, result.output
+            assert mock_marketplace_service.call_args.kwargs["use_journal"] is False
+
+    def test_request_max_price_requires_auto(self) -> None:
+        """Test --max-price is refused without --priority-mech auto."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                [
+                    "--prompts",
+                    "Test prompt",
+                    "--tools",
+                    "tool1",
+                    "--max-price",
+                    "1000",
+                    "--chain-config",
+                    "gnosis",
+                    "--key",
+                    "key.txt",
+                ],
+            )
+
+            assert result.exit_code == 1
+            assert "--max-price only applies to --priority-mech auto" in result.output
+
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_with_hedge(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --hedge-after is passed on and the hedge outcome is shown."""
+        mock_setup_wallet.return_value = MagicMock()
+        mock_service = MagicMock()
+        mock_service.send_request = AsyncMock(
+            return_value={
+                "tx_hash": "0xhedge",
+                "request_ids": ["b"],
+                "delivery_results": {"b": "result"},
+                "hedge": {
+                    "mech": "0x" + "2" * 40,
+                    "offchain": False,
+                    "winner": "hedge",
+                    "primary_request_ids": ["a"],
+                    "hedge_request_ids": ["b"],
+                },
+            }
+        )
+        mock_marketplace_service.return_value = mock_service
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                [
+                    "--prompts",
+                    "Test prompt",
+                    "--tools",
+                    "tool1",
+                    "--hedge-after",
+                    "90",
+                    "--max-price",
+                    "1000",
+                    "--chain-config",
+                    "gnosis",
+                    "--key",
+                    "key.txt",
+                ],
+            )
+
+            assert result.exit_code == 0, result.output
+            call_kwargs = mock_service.send_request.call_args[1]
+            assert call_kwargs["hedge_after"] == 90
+            assert call_kwargs["hedge_mech"] is None
+            assert call_kwargs["max_price"] == 1000
+            assert "hedge mech delivered first" in result.output
+
+    @pytest.mark.parametrize(
+        "options, message",
+        [
+            (["--hedge-mech", "auto"], "need --hedge-after"),
+            (["--hedge-after", "30", "--no-wait"], "cannot be combined"),
+            (["--hedge-after", "30", "--use-offchain", "true"], "cannot be combined"),
+            (
+                ["--hedge-after", "30", "--hedge-mech", "0x" + "2" * 40]
+                + ["--max-price", "1"],
+                "--max-price only applies",
+            ),
+        ],
+    )
+    def test_request_invalid_hedge(self, options: List[str], message: str) -> None:
+        """Test hedging options that cannot apply are refused."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                ["--prompts", "Test prompt", "--tools", "tool1", *options]
+                + ["--chain-config", "gnosis", "--key", "key.txt"],
+            )
+
+            assert result.exit_code == 1
+            assert message in result.output
+
     def test_request_invalid_chain_config(self) -> None:
         """Test request fails with invalid chain config."""
         runner = CliRunner()
@@ -985,3 +1185,151 @@ class TestRequestEdgeCases:
 
             # Should handle long prompts
             assert result.exit_code == 0
+
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_presign_to_writes_file(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --presign-to signs one request per prompt and sends nothing."""
+        mock_wallet_ctx = MagicMock()
+        mock_wallet_ctx.agent_mode = False
+        mock_setup_wallet.return_value = mock_wallet_ctx
+        transactions = [
+            PresignedTransaction(
+                chain_id=100,
+                sender="0x" + "a" * 40,
+                nonce=nonce,
+                tx_hash=raw_transaction_hash(raw),
+                raw_transaction=raw,
+                metadata={"kind": "request"},
+            )
+            for nonce, raw in ((7, "0x02f8aa"), (8, "0x02f8bb"))
+        ]
+        mock_service = MagicMock()
+        mock_service.presign_requests.return_value = transactions
+        mock_marketplace_service.return_value = mock_service
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("key.txt", "w") as f:
+                f.write("dummy_key")
+
+            result = runner.invoke(
+                request,
+                [
+                    "--prompts",
+                    "p1",
+                    "--prompts",
+                    "p2",
+                    "--tools",
+                    "t1",
+                    "--tools",
+                    "t2",
+                    "--chain-config",
+                    "gnosis",
+                    "--key",
+                    "key.txt",
+                    "--presign-to",
+                    "requests.jsonl",
+                ],
+            )
+
+            assert result.exit_code == 0, result.output
+            assert read_presigned("requests.jsonl") == transactions
+
+        assert "Wrote 2 signed transaction(s)" in result.output
+        assert "nonces 7-8" in result.output
+        mock_service.send_request.assert_not_called()
+        kwargs = mock_service.presign_requests.call_args.kwargs
+        assert kwargs["batch"] == [(("p1",), ("t1",)), (("p2",), ("t2",))]
+
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_presign_to_rejects_agent_mode(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --presign-to requires client mode."""
+        mock_wallet_ctx = MagicMock()
+        mock_wallet_ctx.agent_mode = True
+        mock_setup_wallet.return_value = mock_wallet_ctx
+
+        result = CliRunner().invoke(
+            request,
+            [
+                "--prompts",
+                "p1",
+                "--tools",
+                "t1",
+                "--chain-config",
+                "gnosis",
+                "--presign-to",
+                "requests.jsonl",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "only supported in client mode" in result.output
+        mock_marketplace_service.assert_not_called()
+
+    @patch("mech_client.cli.commands.request_cmd.MarketplaceService")
+    @patch("mech_client.cli.commands.request_cmd.setup_wallet_command")
+    def test_request_no_wait_reports_journal(
+        self,
+        mock_setup_wallet: MagicMock,
+        mock_marketplace_service: MagicMock,
+    ) -> None:
+        """Test --no-wait skips delivery and points at the journal."""
+        mock_setup_wallet.return_value = MagicMock()
+        mock_service = MagicMock()
+        mock_service.send_request = AsyncMock(
+            return_value={
+                "tx_hash": "0xabc",
+                "request_ids": ["aa"],
+                "delivery_results": {},
+                "journal": "/tmp/journal.jsonl",
+            }
+        )
+        mock_marketplace_service.return_value = mock_service
+
+        result = CliRunner().invoke(
+            request,
+            [
+                "--prompts",
+                "p1",
+                "--tools",
+                "t1",
+                "--chain-config",
+                "gnosis",
+                "--no-wait",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert mock_service.send_request.call_args.kwargs["wait"] is False
+        assert "Recorded in /tmp/journal.jsonl" in result.output
+        assert "mechx deliveries watch --chain-config gnosis" in result.output
+
+    def test_request_no_wait_rejects_offchain(self) -> None:
+        """Test --no-wait cannot be combined with --use-offchain."""
+        result = CliRunner().invoke(
+            request,
+            [
+                "--prompts",
+                "p1",
+                "--tools",
+                "t1",
+                "--chain-config",
+                "gnosis",
+                "--use-offchain",
+                "true",
+                "--no-wait",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "--no-wait" in result.output
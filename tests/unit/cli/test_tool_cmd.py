@@ -64,6 +64,45 @@ class TestToolListCommand:
         mock_tool_service.assert_called_once_with("gnosis")
         mock_instance.get_tools_info.assert_called_once_with(2182)
 
+    @patch("mech_client.cli.commands.tool_cmd.ToolService")
+    def test_list_all_command(self, mock_tool_service: MagicMock) -> None:
+        """Test listing the tools of every marketplace mech."""
+        mock_instance = mock_tool_service.return_value
+        mock_instance.get_marketplace_tools.return_value = {
+            1: MagicMock(
+                tools=[MagicMock(tool_name="gpt", unique_identifier="1-gpt")]
+            ),
+            2182: MagicMock(
+                tools=[
+                    MagicMock(
+                        tool_name="superforcaster",
+                        unique_identifier="2182-superforcaster",
+                    )
+                ]
+            ),
+        }
+
+        runner = CliRunner()
+        result = runner.invoke(tool, ["list", "--all", "--chain-config", "gnosis"])
+
+        assert result.exit_code == 0
+        assert "AI Agent Id" in result.output
+        assert "1-gpt" in result.output
+        assert "2182-superforcaster" in result.output
+        mock_instance.get_tools_info.assert_not_called()
+
+    @patch("mech_client.cli.commands.tool_cmd.ToolService")
+    def test_list_needs_agent_id_or_all(self, mock_tool_service: MagicMock) -> None:
+        """Test exactly one of an agent ID and --all is accepted."""
+        runner = CliRunner()
+        neither = runner.invoke(tool, ["list", "--chain-config", "gnosis"])
+        both = runner.invoke(tool, ["list", "1", "--all", "--chain-config", "gnosis"])
+
+        for result in (neither, both):
+            assert result.exit_code != 0
+            assert "Pass either an <agent-id> or --all" in result.output
+        mock_tool_service.assert_not_called()
+
     @patch("mech_client.cli.commands.tool_cmd.ToolService")
     def test_list_command_empty_tools(self, mock_tool_service: MagicMock) -> None:
         """Test tool list with no tools available."""
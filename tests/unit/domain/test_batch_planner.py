@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for requestBatch chunk planning."""
+
+from unittest.mock import MagicMock
+
+from mech_client.domain.execution.batch_planner import (
+    RequestBatchPlanner,
+    item_calldata_size,
+    request_item_key,
+)
+from mech_client.infrastructure.blockchain.gas_model import GasModel
+from mech_client.infrastructure.config.constants import REQUEST_BATCH_ITEM_GAS
+
+KEY = request_item_key("0x" + "2" * 40, "ba699a34be8fe0e7725e93dcbce1701b0211a8ca")
+HASH = "0x" + "ab" * 34
+
+
+def _planner(gas_limit: object = 10 * REQUEST_BATCH_ITEM_GAS) -> RequestBatchPlanner:
+    """Planner over a chain whose latest block has ``gas_limit``."""
+    ledger_api = MagicMock()
+    ledger_api.api.eth.get_block.return_value = {"gasLimit": gas_limit}
+    return RequestBatchPlanner(ledger_api, gas_model=GasModel(margin=1.0))
+
+
+class TestRequestBatchPlanner:
+    """Tests for RequestBatchPlanner."""
+
+    def test_item_calldata_size(self) -> None:
+        """Test a 34-byte hash takes offset, length and two data words."""
+        assert item_calldata_size(HASH) == 128
+
+    def test_small_batch_is_one_chunk_without_rpc(self) -> None:
+        """Test a single request is returned as is without reading the chain."""
+        planner = _planner()
+        assert planner.plan([HASH], KEY) == [[HASH]]
+        planner.ledger_api.api.eth.get_block.assert_not_called()
+
+    def test_chunks_fit_gas_share_and_are_balanced(self) -> None:
+        """Test 11 requests at 5 per chunk become 4 + 4 + 3 in order."""
+        hashes = [f"0x{i:068x}" for i in range(11)]
+        chunks = _planner().plan(hashes, KEY)
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+        assert [h for chunk in chunks for h in chunk] == hashes
+
+    def test_learned_item_gas_grows_chunks(self) -> None:
+        """Test a cheaper observed per-item gas allows larger chunks."""
+        planner = _planner()
+        planner.observe(KEY, {"status": 1, "gasUsed": 500_000}, items=5)
+
+        assert planner.item_gas(KEY) == 100_000
+        assert planner.capacity(KEY, 128) == 15
+
+    def test_reverted_receipts_are_not_learned(self) -> None:
+        """Test a reverted chunk leaves the per-item gas untouched."""
+        planner = _planner()
+        planner.observe(KEY, {"status": 0, "gasUsed": 50_000}, items=5)
+
+        assert planner.item_gas(KEY) == REQUEST_BATCH_ITEM_GAS
+
+    def test_calldata_cap_without_gas_limit(self) -> None:
+        """Test an unreadable gas limit falls back to the calldata cap."""
+        planner = _planner(gas_limit=None)
+        planner.max_calldata = 1000
+
+        assert planner.capacity(KEY, 128) == 7
+
+    def test_capacity_is_at_least_one(self) -> None:
+        """Test a block too small for one item still yields single chunks."""
+        planner = _planner(gas_limit=1000)
+
+        assert planner.plan([HASH, HASH], KEY) == [[HASH], [HASH]]
@@ -24,9 +24,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mech_client.domain.execution.agent_executor import AgentExecutor
+from mech_client.domain.execution.base import ContractCall
 from mech_client.domain.execution.client_executor import ClientExecutor
 from mech_client.domain.execution.factory import ExecutorFactory
 from mech_client.domain.signing import LocalSigner
+from mech_client.infrastructure.blockchain.gas_model import (
+    GasModel,
+    contract_call_key,
+)
+from mech_client.infrastructure.blockchain.nonce_manager import NonceManager
 
 from tests.unit.helpers import DEFAULT_TX_HASH, create_mock_signer
 
@@ -138,8 +144,12 @@ class TestClientExecutorTransfer:
         """Test successful native transfer in client mode."""
         mock_signer = create_mock_signer()
         mock_ledger_api.get_transfer_transaction.return_value = {"raw": "tx"}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
 
-        executor = ClientExecutor(mock_ledger_api, mock_signer)
+        fee_oracle = MagicMock()
+        fee_oracle.fees.return_value = {"gasPrice": 9}
+
+        executor = ClientExecutor(mock_ledger_api, mock_signer, fee_oracle=fee_oracle)
         to_address = "0x" + "2" * 40
         amount = 10**18
         gas = 50000
@@ -153,8 +163,11 @@ class TestClientExecutorTransfer:
             amount=amount,
             tx_fee=gas,
             tx_nonce="0x",
+            max_fee_per_gas=None,
+            max_priority_fee_per_gas=None,
+            gas_price=9,
         )
-        mock_signer.send_transaction.assert_called_once_with({"raw": "tx"})
+        mock_signer.send_transaction.assert_called_once_with({"raw": "tx", "nonce": 4})
 
 
 class TestAgentExecutorTransfer:
@@ -267,6 +280,90 @@ class TestAgentExecutorTransaction:
         args, _ = mock_function.build_transaction.call_args
         assert args[0]["from"] == "0x" + "1" * 40
 
+    @patch("mech_client.domain.execution.agent_executor.SafeClient")
+    def test_execute_batch_sends_one_multisend(
+        self,
+        mock_safe_client_cls: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_ethereum_client: MagicMock,
+    ) -> None:
+        """Test calls are encoded in order and sent as one MultiSend."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api._chain_id = 100  # pylint: disable=protected-access
+
+        mock_safe_client = MagicMock()
+        mock_safe_client.get_nonce.return_value = 7
+        mock_tx_hash = MagicMock()
+        mock_tx_hash.to_0x_hex.return_value = "0xtxhash"
+        mock_safe_client.send_multisend.return_value = mock_tx_hash
+        mock_safe_client_cls.return_value = mock_safe_client
+
+        executor = AgentExecutor(
+            mock_ledger_api, mock_signer, "0x" + "b" * 40, mock_ethereum_client
+        )
+        assert executor.supports_batching
+
+        def _contract(address: str, data: str) -> MagicMock:
+            function = MagicMock()
+            function.build_transaction.return_value = {"data": data}
+            contract = MagicMock()
+            contract.address = address
+            contract.functions.__getitem__.return_value.return_value = function
+            return contract
+
+        token = _contract("0x" + "c" * 40, "0xaaaa")
+        marketplace = _contract("0x" + "d" * 40, "0xbbbb")
+
+        tx_hash = executor.execute_batch(
+            [
+                ContractCall(token, "approve", {"_to": "x", "_value": 1}),
+                ContractCall(marketplace, "request", {}, value=5),
+            ]
+        )
+
+        assert tx_hash == "0xtxhash"
+        mock_safe_client.send_multisend.assert_called_once_with(
+            [("0x" + "c" * 40, "0xaaaa", 0), ("0x" + "d" * 40, "0xbbbb", 5)],
+            signer=mock_signer,
+        )
+        mock_safe_client.send_transaction.assert_not_called()
+        # One Safe nonce read for the whole batch.
+        mock_safe_client.get_nonce.assert_called_once()
+
+    @patch("mech_client.domain.execution.agent_executor.SafeClient")
+    def test_execute_batch_failure_is_wrapped(
+        self,
+        mock_safe_client_cls: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_ethereum_client: MagicMock,
+    ) -> None:
+        """Test MultiSend failures surface like single Safe transaction ones."""
+        mock_ledger_api._chain_id = 100  # pylint: disable=protected-access
+        mock_safe_client = MagicMock()
+        mock_safe_client.send_multisend.side_effect = ValueError("no MultiSend")
+        mock_safe_client_cls.return_value = mock_safe_client
+        executor = AgentExecutor(
+            mock_ledger_api,
+            create_mock_signer(),
+            "0x" + "b" * 40,
+            mock_ethereum_client,
+        )
+
+        with pytest.raises(
+            Exception, match="Failed to execute Safe MultiSend transaction"
+        ):
+            executor.execute_batch([ContractCall(MagicMock(), "approve")])
+
+    def test_client_executor_cannot_batch(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test EOA executors refuse to bundle calls."""
+        executor = ClientExecutor(mock_ledger_api, create_mock_signer())
+
+        assert not executor.supports_batching
+        with pytest.raises(NotImplementedError):
+            executor.execute_batch([ContractCall(MagicMock(), "approve")])
+
 
 class TestClientExecutorTransaction:
     """Tests for ClientExecutor.execute_transaction."""
@@ -277,8 +374,11 @@ class TestClientExecutorTransaction:
         """Test successful contract transaction in client mode."""
         mock_signer = create_mock_signer()
         mock_ledger_api.build_transaction.return_value = {"raw": "tx"}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
+        fee_oracle = MagicMock()
+        fee_oracle.fees.return_value = {"maxFeePerGas": 8, "maxPriorityFeePerGas": 2}
 
-        executor = ClientExecutor(mock_ledger_api, mock_signer)
+        executor = ClientExecutor(mock_ledger_api, mock_signer, fee_oracle=fee_oracle)
 
         mock_contract = MagicMock()
         sender = "0x" + "1" * 40
@@ -297,10 +397,136 @@ class TestClientExecutorTransaction:
             contract_instance=mock_contract,
             method_name="request",
             method_args=method_args,
-            tx_args=tx_args,
+            tx_args={**tx_args, "maxFeePerGas": 8, "maxPriorityFeePerGas": 2},
             raise_on_try=True,
         )
-        mock_signer.send_transaction.assert_called_once_with({"raw": "tx"})
+        mock_signer.send_transaction.assert_called_once_with({"raw": "tx", "nonce": 4})
+
+    def test_execute_transaction_keeps_caller_fees(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test explicit fees are passed through without asking the oracle."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api.build_transaction.return_value = {"raw": "tx"}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
+        fee_oracle = MagicMock()
+        executor = ClientExecutor(mock_ledger_api, mock_signer, fee_oracle=fee_oracle)
+        tx_args = {"sender_address": "0x" + "1" * 40, "gasPrice": 3}
+
+        executor.execute_transaction(MagicMock(), "request", {}, tx_args)
+
+        fee_oracle.fees.assert_not_called()
+        assert mock_ledger_api.build_transaction.call_args.kwargs["tx_args"] == tx_args
+
+    def test_execute_transaction_uses_learned_gas(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test a learned call shape skips the ledger's estimating build."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api._is_gas_estimation_enabled = True
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
+        mock_ledger_api.api.to_checksum_address.side_effect = lambda a: a
+        fee_oracle = MagicMock()
+        fee_oracle.fees.return_value = {"gasPrice": 7}
+        gas_model = GasModel(margin=1.0)
+        mock_contract = MagicMock()
+        mock_contract.address = "0x" + "c" * 40
+        built = mock_contract.functions.request.return_value.build_transaction
+        built.return_value = {"built": True}
+        method_args = {"param": "value"}
+        gas_model.observe(
+            contract_call_key(mock_contract.address, "request", method_args),
+            90_000,
+        )
+
+        executor = ClientExecutor(
+            mock_ledger_api, mock_signer, gas_model=gas_model, fee_oracle=fee_oracle
+        )
+        sender = "0x" + "1" * 40
+        result = executor.execute_transaction(
+            contract=mock_contract,
+            method_name="request",
+            method_args=method_args,
+            tx_args={"sender_address": sender},
+        )
+
+        assert result == DEFAULT_TX_HASH
+        mock_ledger_api.build_transaction.assert_not_called()
+        built.assert_called_once_with(
+            {"from": sender, "value": 0, "gas": 90_000, "gasPrice": 7}
+        )
+        mock_signer.send_transaction.assert_called_once_with(
+            {"built": True, "nonce": 4}
+        )
+
+    def test_execute_transaction_learns_from_receipt(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test the sent hash is tracked so its receipt trains the model."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api.build_transaction.return_value = {"raw": "tx"}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
+        gas_model = GasModel(margin=1.0)
+        mock_contract = MagicMock()
+        mock_contract.address = "0x" + "c" * 40
+
+        executor = ClientExecutor(mock_ledger_api, mock_signer, gas_model=gas_model)
+        tx_hash = executor.execute_transaction(
+            contract=mock_contract,
+            method_name="request",
+            method_args={"param": "value"},
+            tx_args={"sender_address": "0x" + "1" * 40},
+        )
+        gas_model.observe_receipt(tx_hash, {"status": 1, "gasUsed": 60_000})
+
+        key = contract_call_key(mock_contract.address, "request", {"param": "value"})
+        assert gas_model.predict(key) == 60_000
+
+
+    @pytest.mark.parametrize("gas_fallback", [False, True])
+    def test_failed_estimate_with_gas_fallback(
+        self, mock_ledger_api: MagicMock, gas_fallback: bool
+    ) -> None:
+        """Test a failed estimate raises unless gas_fallback is enabled."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api._is_gas_estimation_enabled = True
+        mock_ledger_api.build_transaction.side_effect = ValueError("reverted")
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 4
+        mock_ledger_api.api.to_checksum_address.side_effect = lambda a: a
+        fee_oracle = MagicMock()
+        fee_oracle.fees.return_value = {"gasPrice": 7}
+        mock_contract = MagicMock()
+        mock_contract.address = "0x" + "c" * 40
+        built = mock_contract.functions.request.return_value.build_transaction
+        built.return_value = {"built": True}
+        executor = ClientExecutor(
+            mock_ledger_api,
+            mock_signer,
+            gas_model=GasModel(),
+            fee_oracle=fee_oracle,
+            gas_fallback=gas_fallback,
+        )
+        sender = "0x" + "1" * 40
+
+        def _execute() -> str:
+            return executor.execute_transaction(
+                contract=mock_contract,
+                method_name="request",
+                method_args={},
+                tx_args={"sender_address": sender, "gas": 500_000},
+            )
+
+        if not gas_fallback:
+            with pytest.raises(ValueError, match="reverted"):
+                _execute()
+            return
+        _execute()
+        built.assert_called_once_with(
+            {"from": sender, "value": 0, "gas": 500_000, "gasPrice": 7}
+        )
+        mock_signer.send_transaction.assert_called_once_with(
+            {"built": True, "nonce": 4}
+        )
 
 
 class TestClientExecutorGetters:
@@ -316,10 +542,10 @@ class TestClientExecutorGetters:
 
         assert executor.get_sender_address() == mock_signer.address
 
-    def test_get_nonce_returns_transaction_count(
+    def test_get_nonce_returns_pending_transaction_count(
         self, mock_ledger_api: MagicMock
     ) -> None:
-        """Test get_nonce returns the on-chain transaction count."""
+        """Test get_nonce returns the pending on-chain transaction count."""
         mock_signer = create_mock_signer(address="0x" + "3" * 40)
         mock_ledger_api.api.eth.get_transaction_count.return_value = 5
 
@@ -327,8 +553,29 @@ class TestClientExecutorGetters:
 
         assert executor.get_nonce() == 5
         mock_ledger_api.api.eth.get_transaction_count.assert_called_once_with(
-            mock_signer.address
+            mock_signer.address, "pending"
+        )
+
+    def test_pipelined_transactions_get_consecutive_nonces(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test back-to-back sends do not wait for receipts or reuse nonces."""
+        mock_signer = create_mock_signer()
+        mock_ledger_api.build_transaction.return_value = {"raw": "tx"}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 9
+
+        executor = ClientExecutor(
+            mock_ledger_api, mock_signer, NonceManager(mock_ledger_api)
         )
+        for _ in range(3):
+            executor.execute_transaction(MagicMock(), "request", {}, {})
+
+        nonces = [
+            call.args[0]["nonce"]
+            for call in mock_signer.send_transaction.call_args_list
+        ]
+        assert nonces == [9, 10, 11]
+        mock_ledger_api.api.eth.get_transaction_count.assert_called_once()
 
 
 class TestAgentExecutorTransactionFailure:
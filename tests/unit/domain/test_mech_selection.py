@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for latency-aware mech selection."""
+
+import pytest
+
+from mech_client.domain.selection import (
+    DeliverySample,
+    MechLatency,
+    rank_mechs,
+    summarize,
+)
+
+
+def _samples(mech: str, *latencies: object) -> list:
+    """Create one sample per latency, one second apart."""
+    return [
+        DeliverySample(mech, float(i), latency)  # type: ignore[arg-type]
+        for i, latency in enumerate(latencies)
+    ]
+
+
+class TestSummarize:
+    """Tests for summarize."""
+
+    def test_percentiles_and_rates(self) -> None:
+        """Test p50/p95, timeout and step-in rates of one mech."""
+        samples = _samples("0xA", *range(10, 101, 10), None, None)
+        samples.append(DeliverySample("0xa", 20.0, 30.0, stepped_in=True))
+
+        stats = summarize(samples)["0xa"]
+
+        assert stats.requests == 13
+        assert stats.delivered == 11
+        assert stats.p50 == 50.0
+        assert stats.p95 == pytest.approx(95.0)
+        assert stats.timeout_rate == pytest.approx(2 / 13)
+        assert stats.step_in_rate == pytest.approx(1 / 11)
+
+    def test_window_keeps_latest_samples(self) -> None:
+        """Test only the most recent samples of a mech count."""
+        stats = summarize(_samples("0xa", None, None, 5, 7), window=2)["0xa"]
+
+        assert stats.requests == 2
+        assert stats.timeout_rate == 0.0
+        assert stats.p50 == 6.0
+
+    def test_only_timeouts(self) -> None:
+        """Test a mech that never delivered has no latency percentiles."""
+        stats = summarize(_samples("0xa", None))["0xa"]
+
+        assert stats.p50 is None
+        assert stats.timeout_rate == 1.0
+        assert stats.expected_latency(response_timeout=300) == 600
+
+
+class TestRankMechs:
+    """Tests for rank_mechs."""
+
+    def test_faster_mech_first(self) -> None:
+        """Test the mech with the lowest expected latency ranks first."""
+        stats = summarize(_samples("0xa", *[60] * 20) + _samples("0xb", *[20] * 20))
+
+        assert rank_mechs(["0xA", "0xB"], stats) == ["0xB", "0xA"]
+
+    def test_timeouts_are_penalised(self) -> None:
+        """Test a fast mech that often times out loses to a reliable one."""
+        stats = summarize(
+            _samples("0xa", *[10, None] * 10) + _samples("0xb", *[60] * 20)
+        )
+
+        assert rank_mechs(["0xa", "0xb"], stats) == ["0xb", "0xa"]
+
+    def test_unknown_mech_ranks_at_the_median(self) -> None:
+        """Test a mech without history is tried before slow mechs only."""
+        stats = summarize(_samples("0xa", *[10] * 50) + _samples("0xb", *[100] * 50))
+
+        assert rank_mechs(["0xb", "0xc", "0xa"], stats) == ["0xa", "0xc", "0xb"]
+
+    def test_unknown_mechs_keep_their_order(self) -> None:
+        """Test candidates without statistics keep the fallback order."""
+        assert rank_mechs(["0xc", "0xa", "0xb"], {}) == ["0xc", "0xa", "0xb"]
+
+    def test_expected_latency_blends_timeouts(self) -> None:
+        """Test the expected latency charges timeouts twice the response timeout."""
+        stats = MechLatency("0xa", 4, 3, 10.0, 20.0, 12.0, 0.25, 0.0)
+
+        assert stats.expected_latency(response_timeout=100) == pytest.approx(
+            0.75 * 12 + 0.25 * 200
+        )
@@ -61,16 +61,16 @@ class TestOffchainDeliveryWatcherWatch:
     """Tests for watch method."""
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_single_request_immediate_delivery(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test watching single request with immediate delivery."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": "response_data", "result": "success"}
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -87,14 +87,14 @@ class TestOffchainDeliveryWatcherWatch:
         assert results["0x1a"]["data"] == "response_data"
 
         # Verify request was made with integer string
-        mock_requests.get.assert_called_once()
-        call_kwargs = mock_requests.get.call_args[1]
+        mock_registry.return_value.get.assert_called_once()
+        call_kwargs = mock_registry.return_value.get.call_args[1]
         assert call_kwargs["data"]["request_id"] == "26"  # hex 0x1a = 26
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_multiple_requests_all_delivered(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test watching multiple requests with all delivered."""
         # Setup mock responses - different data for each request
@@ -108,7 +108,7 @@ class TestOffchainDeliveryWatcherWatch:
             mock_response.raise_for_status.return_value = None
             return mock_response
 
-        mock_requests.get.side_effect = mock_get_response
+        mock_registry.return_value.get.side_effect = mock_get_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -130,9 +130,9 @@ class TestOffchainDeliveryWatcherWatch:
 
     @pytest.mark.anyio
     @patch("mech_client.domain.delivery.offchain_watcher.asyncio.sleep")
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_delayed_delivery(
-        self, mock_requests: MagicMock, mock_sleep: AsyncMock
+        self, mock_registry: MagicMock, mock_sleep: AsyncMock
     ) -> None:
         """Test watching with delayed delivery (multiple polls)."""
         # Setup mock to return None first, then data
@@ -152,7 +152,7 @@ class TestOffchainDeliveryWatcherWatch:
             mock_response.raise_for_status.return_value = None
             return mock_response
 
-        mock_requests.get.side_effect = mock_get_response
+        mock_registry.return_value.get.side_effect = mock_get_response
         mock_sleep.return_value = None
 
         # Create watcher
@@ -174,9 +174,9 @@ class TestOffchainDeliveryWatcherWatch:
     @pytest.mark.anyio
     @patch("mech_client.domain.delivery.offchain_watcher.time.time")
     @patch("mech_client.domain.delivery.offchain_watcher.asyncio.sleep")
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_timeout_no_responses(
-        self, mock_requests: MagicMock, mock_sleep: AsyncMock, mock_time: MagicMock
+        self, mock_registry: MagicMock, mock_sleep: AsyncMock, mock_time: MagicMock
     ) -> None:
         """Test watching with timeout and no responses."""
         # Setup mock time to simulate timeout
@@ -186,7 +186,7 @@ class TestOffchainDeliveryWatcherWatch:
         mock_response = MagicMock()
         mock_response.json.return_value = None
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
         mock_sleep.return_value = None
 
         # Create watcher
@@ -204,9 +204,9 @@ class TestOffchainDeliveryWatcherWatch:
     @pytest.mark.anyio
     @patch("mech_client.domain.delivery.offchain_watcher.time.time")
     @patch("mech_client.domain.delivery.offchain_watcher.asyncio.sleep")
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_timeout_partial_responses(
-        self, mock_requests: MagicMock, mock_sleep: AsyncMock, mock_time: MagicMock
+        self, mock_registry: MagicMock, mock_sleep: AsyncMock, mock_time: MagicMock
     ) -> None:
         """Test watching with timeout and partial responses."""
         # Setup mock time to simulate timeout after first response
@@ -224,7 +224,7 @@ class TestOffchainDeliveryWatcherWatch:
             mock_response.raise_for_status.return_value = None
             return mock_response
 
-        mock_requests.get.side_effect = mock_get_response
+        mock_registry.return_value.get.side_effect = mock_get_response
         mock_sleep.return_value = None
 
         # Create watcher
@@ -242,9 +242,9 @@ class TestOffchainDeliveryWatcherWatch:
         assert "0x14" not in results
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_http_error_retries(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test watching with HTTP errors continues to retry."""
         # Setup mock to fail first, then succeed
@@ -264,7 +264,7 @@ class TestOffchainDeliveryWatcherWatch:
                 mock_response.raise_for_status.return_value = None
                 return mock_response
 
-        mock_requests.get.side_effect = mock_get_response
+        mock_registry.return_value.get.side_effect = mock_get_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -280,9 +280,9 @@ class TestOffchainDeliveryWatcherWatch:
         assert results["0x1"]["data"] == "success_after_retry"
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_watch_empty_response_treated_as_none(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test watching with empty response is treated as no data."""
         # Setup mock to return empty dict
@@ -302,7 +302,7 @@ class TestOffchainDeliveryWatcherWatch:
             mock_response.raise_for_status.return_value = None
             return mock_response
 
-        mock_requests.get.side_effect = mock_get_response
+        mock_registry.return_value.get.side_effect = mock_get_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -318,23 +318,23 @@ class TestOffchainDeliveryWatcherWatch:
         assert results["0x1"]["data"] == "real_response"
 
         # Verify multiple calls were made
-        assert mock_requests.get.call_count >= 2
+        assert mock_registry.return_value.get.call_count >= 2
 
 
 class TestOffchainDeliveryWatcherFetchData:
     """Tests for _fetch_offchain_data method."""
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_fetch_offchain_data_success(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test successful data fetch."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": "test_data", "status": "delivered"}
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -350,16 +350,16 @@ class TestOffchainDeliveryWatcherFetchData:
         assert data["status"] == "delivered"
 
     @pytest.mark.anyio
-    @patch("mech_client.domain.delivery.offchain_watcher.requests")
+    @patch("mech_client.domain.delivery.offchain_watcher.get_http_registry")
     async def test_fetch_offchain_data_empty_response(
-        self, mock_requests: MagicMock
+        self, mock_registry: MagicMock
     ) -> None:
         """Test fetch with empty response returns None."""
         # Setup mock response with empty dict
         mock_response = MagicMock()
         mock_response.json.return_value = {}
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
 
         # Create watcher
         watcher = OffchainDeliveryWatcher(
@@ -150,6 +150,7 @@ class TestTokenPaymentStrategy:
     ) -> None:
         """Test approval with executor (agent mode and client mode)."""
         mock_get_contract.return_value = mock_web3_contract
+        mock_web3_contract.functions.allowance.return_value.call.return_value = 0
         mock_executor = MagicMock()
         mock_executor.execute_transaction.return_value = "0xtxhash"
 
@@ -177,6 +178,110 @@ class TestTokenPaymentStrategy:
         # is caught here, not in production.
         assert call_args["tx_args"]["gas"] == _APPROVE_FALLBACK_GAS
 
+    @patch("mech_client.domain.payment.token.get_contract")
+    @patch("mech_client.domain.payment.token.get_abi")
+    def test_approve_if_needed_skips_when_allowance_sufficient(
+        self,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        strategy: TokenPaymentStrategy,
+        mock_web3_contract: MagicMock,
+    ) -> None:
+        """Test no approval is sent when the allowance already covers amount."""
+        mock_get_contract.return_value = mock_web3_contract
+        mock_web3_contract.functions.allowance.return_value.call.return_value = (
+            10**18
+        )
+        mock_executor = MagicMock()
+
+        result = strategy.approve_if_needed(
+            payer_address="0x1234567890123456789012345678901234567890",
+            spender_address="0x" + "a" * 40,
+            amount=10**18,
+            executor=mock_executor,
+        )
+
+        assert result is None
+        mock_executor.execute_transaction.assert_not_called()
+        # Both addresses are checksummed before the call.
+        mock_web3_contract.functions.allowance.assert_called_once_with(
+            "0x1234567890123456789012345678901234567890",
+            "0xaAaAaAaaAaAaAaaAaAAAAAAAAaaaAaAaAaaAaaAa",
+        )
+
+    @patch("mech_client.domain.payment.token.get_contract")
+    @patch("mech_client.domain.payment.token.get_abi")
+    def test_approve_if_needed_standing_allowance(
+        self,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        strategy: TokenPaymentStrategy,
+        mock_web3_contract: MagicMock,
+    ) -> None:
+        """Test a short allowance is topped up to approve_amount, not amount."""
+        mock_get_contract.return_value = mock_web3_contract
+        mock_web3_contract.functions.allowance.return_value.call.return_value = (
+            10**17
+        )
+        mock_executor = MagicMock()
+        mock_executor.execute_transaction.return_value = "0xtxhash"
+
+        result = strategy.approve_if_needed(
+            payer_address="0x1234567890123456789012345678901234567890",
+            spender_address="0x" + "a" * 40,
+            amount=10**18,
+            executor=mock_executor,
+            approve_amount=5 * 10**18,
+        )
+
+        assert result == "0xtxhash"
+        call_args = mock_executor.execute_transaction.call_args[1]
+        assert call_args["method_args"]["_value"] == 5 * 10**18
+
+    @patch("mech_client.domain.payment.token.get_contract")
+    @patch("mech_client.domain.payment.token.get_abi")
+    def test_concurrent_requests_see_each_others_reservation(
+        self,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        strategy: TokenPaymentStrategy,
+        mock_web3_contract: MagicMock,
+    ) -> None:
+        """Test a standing allowance covering one request is not spent twice."""
+        mock_get_contract.return_value = mock_web3_contract
+        mock_web3_contract.functions.allowance.return_value.call.return_value = 10
+        mock_executor = MagicMock()
+        mock_executor.execute_transaction.return_value = "0xtxhash"
+        payer = "0x1234567890123456789012345678901234567890"
+        spender = "0x" + "a" * 40
+
+        with strategy.reserve_allowance(payer, spender, 10) as first:
+            assert first == 0
+            assert strategy.approve_if_needed(
+                payer, spender, 10, mock_executor, reserved=first
+            ) is None
+            with strategy.reserve_allowance(payer, spender, 10) as second:
+                assert second == 10
+                assert strategy.approve_if_needed(
+                    payer, spender, 10, mock_executor, reserved=second
+                ) == "0xtxhash"
+
+        # The approval keeps the first request's share on top of its own.
+        call_args = mock_executor.execute_transaction.call_args[1]
+        assert call_args["method_args"]["_value"] == 20
+        with strategy.reserve_allowance(payer, spender, 10) as released:
+            assert released == 0
+
+    def test_reservations_are_per_payer(
+        self,
+        strategy: TokenPaymentStrategy,
+    ) -> None:
+        """Test that reservations of one key do not affect another."""
+        spender = "0x" + "a" * 40
+        with strategy.reserve_allowance("0x" + "1" * 40, spender, 10):
+            with strategy.reserve_allowance("0x" + "2" * 40, spender, 5) as other:
+                assert other == 0
+
     def test_approve_if_needed_no_executor_raises_error(
         self,
         strategy: TokenPaymentStrategy,
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the sharding SignerPool."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from mech_client.domain.signing import Signer, SignerPool
+
+from tests.unit.helpers import create_mock_signer
+
+ADDRESS_A = "0x" + "a" * 40
+ADDRESS_B = "0x" + "b" * 40
+
+
+@pytest.fixture
+def pool() -> SignerPool:
+    """Two-key pool."""
+    return SignerPool(
+        [
+            create_mock_signer(address=ADDRESS_A, tx_hash="0xaa"),
+            create_mock_signer(address=ADDRESS_B, tx_hash="0xbb"),
+        ]
+    )
+
+
+class TestSignerPool:
+    """Tests for SignerPool."""
+
+    def test_satisfies_signer_protocol(self, pool: SignerPool) -> None:
+        """Test that a pool can be passed anywhere a Signer is expected."""
+        assert isinstance(pool, Signer)
+
+    def test_rejects_empty_and_duplicate_pools(self) -> None:
+        """Test constructor validation."""
+        with pytest.raises(ValueError, match="at least one"):
+            SignerPool([])
+        with pytest.raises(ValueError, match="unique"):
+            SignerPool(
+                [
+                    create_mock_signer(address=ADDRESS_A),
+                    create_mock_signer(address=ADDRESS_A.upper().replace("0X", "0x")),
+                ]
+            )
+
+    def test_lease_picks_least_loaded_key(self, pool: SignerPool) -> None:
+        """Test that concurrent leases land on different keys."""
+        with pool.lease() as first:
+            with pool.lease() as nested:
+                assert nested is first
+            assert pool.address == first.address
+            assert [s.pending for s in pool.stats()].count(1) == 1
+
+        assert all(s.pending == 0 for s in pool.stats())
+
+    def test_calls_within_lease_use_one_key(self, pool: SignerPool) -> None:
+        """Test that every call inside a lease goes to the leased signer."""
+        with pool.lease() as leased:
+            tx_hash = pool.send_transaction({"to": ADDRESS_B})
+            pool.sign_message(b"\x00" * 32)
+
+        leased.send_transaction.assert_called_once_with({"to": ADDRESS_B})
+        leased.sign_message.assert_called_once_with(b"\x00" * 32)
+        assert tx_hash == leased.send_transaction.return_value
+        submitted = {s.address: s.submitted for s in pool.stats()}
+        assert submitted[leased.address] == 1
+
+    def test_refresh_balances_prefers_funded_keys(self, pool: SignerPool) -> None:
+        """Test that balances break ties and underfunded keys are skipped."""
+        ledger_api = MagicMock()
+        ledger_api.get_balance.side_effect = lambda address: (
+            5 if address == ADDRESS_A else 50
+        )
+        pool.min_balance = 10
+
+        assert pool.refresh_balances(ledger_api) == {ADDRESS_A: 5, ADDRESS_B: 50}
+        with pool.lease() as leased:
+            assert leased.address == ADDRESS_B
+
+        pool.min_balance = 100
+        with pytest.raises(ValueError, match="minimum balance"):
+            with pool.lease():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_distinct_keys(
+        self, pool: SignerPool
+    ) -> None:
+        """Test that leases are isolated per asyncio task."""
+
+        async def _lease_address() -> str:
+            with pool.lease():
+                await asyncio.sleep(0.01)
+                return pool.address
+
+        addresses = await asyncio.gather(_lease_address(), _lease_address())
+
+        assert sorted(addresses) == [ADDRESS_A, ADDRESS_B]
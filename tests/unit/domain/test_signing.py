@@ -21,13 +21,22 @@
 
 from pathlib import Path
 from typing import Any, Dict
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from aea_ledger_ethereum import EthereumCrypto
 from eth_account import Account
 
-from mech_client.domain.signing import LocalSigner, Signer
+from mech_client.domain.signing import (
+    BatchingSigner,
+    LocalSigner,
+    PresigningSigner,
+    Signer,
+)
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastQueue,
+    raw_transaction_hash,
+)
 
 
 class TestSignerProtocol:
@@ -109,16 +118,22 @@ class TestLocalSignerSendTransaction:
         mock_ledger_api.api.eth.get_transaction_count.assert_not_called()
         mock_ledger_api.api.eth.estimate_gas.assert_not_called()
 
-    def test_fills_missing_fields_from_node(self) -> None:
-        """Test nonce, gas price, and gas are filled when absent."""
+    @patch("mech_client.domain.signing.local.get_fee_oracle")
+    def test_fills_missing_fields_from_node(
+        self, mock_get_fee_oracle: MagicMock
+    ) -> None:
+        """Test nonce, fees, and gas are filled when absent."""
         mock_crypto = MagicMock()
         mock_crypto.address = "0x" + "a" * 40
         mock_crypto.sign_transaction.return_value = {"signed": True}
         mock_ledger_api = MagicMock()
         mock_ledger_api.api.eth.get_transaction_count.return_value = 5
-        mock_ledger_api.api.eth.gas_price = 2 * 10**9
         mock_ledger_api.api.eth.estimate_gas.return_value = 50000
         mock_ledger_api.send_signed_transaction.return_value = "0xtxhash"
+        mock_get_fee_oracle.return_value.fees.return_value = {
+            "maxFeePerGas": 3 * 10**9,
+            "maxPriorityFeePerGas": 10**9,
+        }
 
         signer = LocalSigner(mock_crypto, mock_ledger_api)
 
@@ -128,8 +143,10 @@ class TestLocalSignerSendTransaction:
         signed_tx = mock_crypto.sign_transaction.call_args[0][0]
         assert signed_tx["from"] == "0x" + "a" * 40
         assert signed_tx["nonce"] == 5
-        assert signed_tx["gasPrice"] == 2 * 10**9
+        assert signed_tx["maxFeePerGas"] == 3 * 10**9
+        assert signed_tx["maxPriorityFeePerGas"] == 10**9
         assert signed_tx["gas"] == 50000
+        mock_get_fee_oracle.assert_called_once_with(mock_ledger_api)
         mock_ledger_api.api.eth.get_transaction_count.assert_called_once_with(
             "0x" + "a" * 40
         )
@@ -183,6 +200,107 @@ class TestLocalSignerSendTransaction:
         assert unsigned_tx == {"to": "0x" + "b" * 40, "gas": 21000, "gasPrice": 1}
 
 
+class TestLocalSignerSignTransaction:
+    """Tests for LocalSigner.sign_transaction (sign without broadcasting)."""
+
+    def test_returns_raw_bytes_without_sending(self) -> None:
+        """Test a signed raw transaction is returned and nothing is sent."""
+        mock_crypto = MagicMock()
+        mock_crypto.address = "0x" + "a" * 40
+        mock_crypto.sign_transaction.return_value = {"raw_transaction": "0x02f8aa"}
+        mock_ledger_api = MagicMock()
+
+        signer = LocalSigner(mock_crypto, mock_ledger_api)
+        raw = signer.sign_transaction(
+            {"nonce": 1, "gas": 21000, "gasPrice": 1, "to": "0x" + "b" * 40}
+        )
+
+        assert raw == bytes.fromhex("02f8aa")
+        mock_ledger_api.send_signed_transaction.assert_not_called()
+
+
+class TestBatchingSigner:
+    """Tests for BatchingSigner."""
+
+    def test_requires_sign_transaction(self) -> None:
+        """Test signers that can only sign-and-send are rejected."""
+        with pytest.raises(TypeError, match="cannot sign without broadcasting"):
+            BatchingSigner(MagicMock(spec=["address", "send_transaction"]), MagicMock())
+
+    def test_send_transaction_queues_and_returns_hash(self) -> None:
+        """Test a send signs, queues, and returns the hash of the raw tx."""
+        inner = MagicMock()
+        inner.address = "0x" + "a" * 40
+        inner.sign_transaction.return_value = bytes.fromhex("02f8aa")
+        ledger_api = MagicMock()
+        queue = BroadcastQueue(ledger_api)
+        signer = BatchingSigner(inner, ledger_api, queue=queue)
+
+        tx_hash = signer.send_transaction({"nonce": 7})
+
+        assert tx_hash == raw_transaction_hash(bytes.fromhex("02f8aa"))
+        assert queue.pending == 1
+        ledger_api.api.eth.send_raw_transaction.assert_not_called()
+
+        signer.flush()
+
+        assert queue.pending == 0
+        ledger_api.api.eth.send_raw_transaction.assert_called_once()
+
+
+class TestPresigningSigner:
+    """Tests for PresigningSigner."""
+
+    def test_requires_sign_transaction(self) -> None:
+        """Test signers that can only sign-and-send are rejected."""
+        with pytest.raises(TypeError, match="cannot sign without broadcasting"):
+            PresigningSigner(MagicMock(spec=["address", "send_transaction"]), 100)
+
+    def test_send_transaction_records_without_broadcast(self) -> None:
+        """Test a send signs and records the transaction with its fee caps."""
+        inner = MagicMock()
+        inner.address = "0x" + "a" * 40
+        inner.sign_transaction.return_value = bytes.fromhex("02f8aa")
+        signer = PresigningSigner(inner, 100)
+
+        tx_hash = signer.send_transaction(
+            {"nonce": 7, "maxFeePerGas": 30, "maxPriorityFeePerGas": 2}
+        )
+
+        assert tx_hash == raw_transaction_hash(bytes.fromhex("02f8aa"))
+        inner.send_transaction.assert_not_called()
+        (recorded,) = signer.transactions
+        assert recorded.tx_hash == tx_hash
+        assert recorded.raw_transaction == "0x02f8aa"
+        assert recorded.chain_id == 100
+        assert recorded.sender == "0x" + "a" * 40
+        assert recorded.nonce == 7
+        assert recorded.max_fee_per_gas == 30
+        assert recorded.max_priority_fee_per_gas == 2
+        assert recorded.gas_price is None
+
+    def test_send_transaction_requires_nonce(self) -> None:
+        """Test a transaction without a pre-assigned nonce is refused."""
+        signer = PresigningSigner(MagicMock(), 100)
+
+        with pytest.raises(ValueError, match="pre-assigned nonce"):
+            signer.send_transaction({"gas": 21000})
+
+    def test_annotate(self) -> None:
+        """Test metadata is attached by hash, and unknown hashes raise."""
+        inner = MagicMock()
+        inner.sign_transaction.return_value = bytes.fromhex("02f8aa")
+        signer = PresigningSigner(inner, 100)
+        tx_hash = signer.send_transaction({"nonce": 0})
+
+        signer.annotate(tx_hash, kind="approve", amount=5)
+
+        assert signer.transactions[0].kind == "approve"
+        assert signer.transactions[0].metadata["amount"] == 5
+        with pytest.raises(KeyError):
+            signer.annotate("0x" + "0" * 64, kind="request")
+
+
 class TestLocalSignerSignMessage:
     """Tests for LocalSigner.sign_message."""
 
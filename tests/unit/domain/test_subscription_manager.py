@@ -60,6 +60,7 @@ class TestSubscriptionManager:
         """Create mock transaction executor."""
         executor = MagicMock()
         executor.execute_transaction.return_value = "0xabcd1234"
+        executor.supports_batching = False
         return executor
 
     @pytest.fixture
@@ -278,6 +279,60 @@ class TestSubscriptionManager:
         # Verify result
         assert result["status"] == "success"
 
+    def test_purchase_subscription_base_bundles_approval(
+        self,
+        mock_w3: MagicMock,
+        mock_config: MagicMock,
+        mock_executor: MagicMock,
+        mock_agreement_builder: MagicMock,
+        mock_fulfillment_builder: MagicMock,
+        mock_balance_checker: MagicMock,
+        mock_contracts: dict,
+    ) -> None:
+        """Test a batching executor approves and creates the agreement at once."""
+        mock_config.requires_token_approval.return_value = True
+        mock_config.get_transaction_value.return_value = 0
+        mock_executor.supports_batching = True
+        mock_executor.execute_batch.return_value = "0xbatch"
+        mock_token_contract = MagicMock()
+
+        manager = SubscriptionManager(
+            w3=mock_w3,
+            ledger_api=MagicMock(),
+            config=mock_config,
+            sender="0x1234567890123456789012345678901234567890",
+            executor=mock_executor,
+            agreement_builder=mock_agreement_builder,
+            fulfillment_builder=mock_fulfillment_builder,
+            balance_checker=mock_balance_checker,
+            nft_sales=mock_contracts["nft_sales"],
+            subscription_provider=mock_contracts["subscription_provider"],
+            subscription_nft=mock_contracts["subscription_nft"],
+            token_contract=mock_token_contract,
+        )
+
+        with patch(
+            "mech_client.domain.subscription.manager.wait_for_receipt",
+            return_value={"status": 1},
+        ) as mock_wait_for_receipt:
+            result = manager.purchase_subscription("did:nvm:test456")
+
+        # approve + createAgreementAndPayEscrow in one transaction, then fulfill
+        (calls,), _ = mock_executor.execute_batch.call_args
+        assert [call.method_name for call in calls] == [
+            "approve",
+            "createAgreementAndPayEscrow",
+        ]
+        assert calls[0].contract is mock_token_contract.contract
+        assert calls[1].method_args["_accessConsumer"] == manager.sender
+        assert calls[1].value == 0
+        assert mock_executor.execute_transaction.call_count == 1
+        assert (
+            mock_executor.execute_transaction.call_args[1]["method_name"] == "fulfill"
+        )
+        assert mock_wait_for_receipt.call_count == 2
+        assert result["agreement_tx_hash"] == "0xbatch"
+
     def test_purchase_subscription_balance_check_failure(
         self,
         manager: SubscriptionManager,
@@ -394,6 +449,7 @@ class TestSubscriptionManagerFailedReceipts:
         """Create mock transaction executor."""
         executor = MagicMock()
         executor.execute_transaction.return_value = "0xabcd1234"
+        executor.supports_batching = False
         return executor
 
     @pytest.fixture
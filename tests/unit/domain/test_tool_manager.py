@@ -19,16 +19,31 @@
 
 """Tests for tool manager."""
 
+from pathlib import Path
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from eth_abi import encode as abi_encode
 
 from mech_client.domain.tools.manager import ToolManager
+from mech_client.domain.tools.metadata_cache import ToolMetadataCache
 from mech_client.domain.tools.models import ToolInfo, ToolsForMarketplaceMech
 from mech_client.infrastructure.config.chain_config import LedgerConfig
 
 
+@pytest.fixture(autouse=True)
+def metadata_cache() -> Iterator[ToolMetadataCache]:
+    """Give every manager a fresh in-memory metadata cache."""
+    cache = ToolMetadataCache()
+    with patch(
+        "mech_client.domain.tools.manager.get_tool_metadata_cache",
+        return_value=cache,
+    ):
+        yield cache
+
+
 def create_mock_mech_config() -> MagicMock:
     """
     Create a mock MechConfig with proper LedgerConfig dataclass.
@@ -109,7 +124,7 @@ class TestParseToolId:
 class TestFetchToolsMetadata:
     """Tests for fetch_tools_metadata method."""
 
-    @patch("mech_client.domain.tools.manager.requests")
+    @patch("mech_client.domain.tools.manager.get_http_registry")
     @patch("mech_client.domain.tools.manager.get_contract")
     @patch("mech_client.domain.tools.manager.get_abi")
     @patch("mech_client.domain.tools.manager.EthereumApi")
@@ -120,7 +135,7 @@ class TestFetchToolsMetadata:
         mock_ledger_api: MagicMock,
         mock_get_abi: MagicMock,
         mock_get_contract: MagicMock,
-        mock_requests: MagicMock,
+        mock_registry: MagicMock,
     ) -> None:
         """Test successful metadata fetching."""
         # Setup mocks
@@ -142,7 +157,7 @@ class TestFetchToolsMetadata:
                 "stability-ai": {"description": "Image generation"},
             },
         }
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
 
         # Create manager and fetch
         manager = ToolManager(chain_config="gnosis")
@@ -154,7 +169,7 @@ class TestFetchToolsMetadata:
         assert "toolMetadata" in metadata
         assert len(metadata["tools"]) == 2
         mock_contract.functions.tokenURI.assert_called_once_with(1)
-        mock_requests.get.assert_called_once_with(
+        mock_registry.return_value.get.assert_called_once_with(
             "https://metadata.example.com/tool.json", timeout=10
         )
 
@@ -178,7 +193,7 @@ class TestFetchToolsMetadata:
         with pytest.raises(ValueError, match="not yet implemented"):
             manager.fetch_tools_metadata(service_id=1)
 
-    @patch("mech_client.domain.tools.manager.requests")
+    @patch("mech_client.domain.tools.manager.get_http_registry")
     @patch("mech_client.domain.tools.manager.get_contract")
     @patch("mech_client.domain.tools.manager.get_abi")
     @patch("mech_client.domain.tools.manager.EthereumApi")
@@ -189,7 +204,7 @@ class TestFetchToolsMetadata:
         mock_ledger_api: MagicMock,
         mock_get_abi: MagicMock,
         mock_get_contract: MagicMock,
-        mock_requests: MagicMock,
+        mock_registry: MagicMock,
     ) -> None:
         """Test fetch with HTTP error returns None."""
         # Setup mocks
@@ -202,7 +217,7 @@ class TestFetchToolsMetadata:
         mock_get_contract.return_value = mock_contract
 
         # Mock HTTP error
-        mock_requests.get.side_effect = IOError("Network error")
+        mock_registry.return_value.get.side_effect = IOError("Network error")
 
         # Create manager and fetch
         manager = ToolManager(chain_config="gnosis")
@@ -211,7 +226,37 @@ class TestFetchToolsMetadata:
         # Should return None on error
         assert metadata is None
 
-    @patch("mech_client.domain.tools.manager.requests")
+    @patch("mech_client.domain.tools.manager.get_http_registry")
+    @patch("mech_client.domain.tools.manager.get_contract")
+    @patch("mech_client.domain.tools.manager.get_abi")
+    @patch("mech_client.domain.tools.manager.EthereumApi")
+    @patch("mech_client.domain.tools.manager.get_mech_config")
+    def test_fetch_tools_metadata_error_status_is_not_cached(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        mock_registry: MagicMock,
+        metadata_cache: ToolMetadataCache,
+    ) -> None:
+        """Test a JSON error body is not cached as the metadata document."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_contract = MagicMock()
+        mock_contract.functions.tokenURI.return_value.call.return_value = (
+            "https://metadata.example.com/tool.json"
+        )
+        mock_get_contract.return_value = mock_contract
+        error = requests.Response()
+        error.status_code = 503
+        error._content = b'{"error": "gateway timeout"}'  # pylint: disable=protected-access
+        mock_registry.return_value.get.return_value = error
+
+        manager = ToolManager(chain_config="gnosis")
+        assert manager.fetch_tools_metadata(service_id=1) is None
+        assert not metadata_cache.is_fresh("gnosis", 1)
+
+    @patch("mech_client.domain.tools.manager.get_http_registry")
     @patch("mech_client.domain.tools.manager.get_contract")
     @patch("mech_client.domain.tools.manager.get_abi")
     @patch("mech_client.domain.tools.manager.EthereumApi")
@@ -222,7 +267,7 @@ class TestFetchToolsMetadata:
         mock_ledger_api: MagicMock,
         mock_get_abi: MagicMock,
         mock_get_contract: MagicMock,
-        mock_requests: MagicMock,
+        mock_registry: MagicMock,
     ) -> None:
         """Test fetch with invalid JSON returns None."""
         # Setup mocks
@@ -239,7 +284,7 @@ class TestFetchToolsMetadata:
         mock_response.json.side_effect = requests.exceptions.JSONDecodeError(
             "Invalid JSON", "", 0
         )
-        mock_requests.get.return_value = mock_response
+        mock_registry.return_value.get.return_value = mock_response
 
         # Create manager and fetch
         manager = ToolManager(chain_config="gnosis")
@@ -248,6 +293,54 @@ class TestFetchToolsMetadata:
         # Should return None on JSON error
         assert metadata is None
 
+    @patch("mech_client.domain.tools.manager.get_http_registry")
+    @patch("mech_client.domain.tools.manager.get_contract")
+    @patch("mech_client.domain.tools.manager.get_abi")
+    @patch("mech_client.domain.tools.manager.EthereumApi")
+    @patch("mech_client.domain.tools.manager.get_mech_config")
+    def test_repeated_lookups_use_cache(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        mock_registry: MagicMock,
+        metadata_cache: ToolMetadataCache,
+    ) -> None:
+        """Test repeated lookups for one service do a single tokenURI and GET."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_contract = MagicMock()
+        mock_contract.functions.tokenURI.return_value.call.return_value = (
+            "https://metadata.example.com/tool.json"
+        )
+        mock_get_contract.return_value = mock_contract
+        mock_response = MagicMock()
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_response.json.return_value = {
+            "tools": ["gpt"],
+            "toolMetadata": {"gpt": {"description": "GPT"}},
+            "url": "https://mech.example.com",
+        }
+        mock_registry.return_value.get.return_value = mock_response
+
+        manager = ToolManager(chain_config="gnosis")
+        assert manager.metadata_cache is metadata_cache
+        manager.get_tools(1)
+        assert manager.get_tool_description("1-gpt") == "GPT"
+        assert manager.get_offchain_url(1) == "https://mech.example.com"
+
+        mock_contract.functions.tokenURI.assert_called_once_with(1)
+        mock_registry.return_value.get.assert_called_once()
+
+        # Once expired, the document is revalidated with its ETag.
+        metadata_cache.ttl = metadata_cache.stale_ttl = 0
+        mock_response.status_code = 304
+        assert manager.fetch_tools_metadata(1) == mock_response.json.return_value
+        mock_registry.return_value.get.assert_called_with(
+            "https://metadata.example.com/tool.json",
+            timeout=10,
+            headers={"If-None-Match": '"v1"'},
+        )
 
 class TestGetTools:
     """Tests for get_tools method."""
@@ -353,6 +446,113 @@ class TestGetTools:
         assert result is None
 
 
+class TestGetToolsForServices:
+    """Tests for get_tools_for_services method."""
+
+    @patch("mech_client.domain.tools.manager.get_http_registry")
+    @patch("mech_client.domain.tools.manager.multicall")
+    @patch("mech_client.domain.tools.manager.get_contract")
+    @patch("mech_client.domain.tools.manager.get_abi")
+    @patch("mech_client.domain.tools.manager.EthereumApi")
+    @patch("mech_client.domain.tools.manager.get_mech_config")
+    def test_bulk_discovery(  # pylint: disable=too-many-arguments
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        mock_multicall: MagicMock,
+        mock_registry: MagicMock,
+    ) -> None:
+        """Test URIs are multicalled once and failures only drop their service."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_contract = MagicMock()
+        mock_contract.encode_abi.side_effect = lambda _fn, args: f"0x{args[0]:02x}"
+        mock_get_contract.return_value = mock_contract
+        mock_multicall.return_value = [
+            abi_encode(["string"], ["https://metadata.example.com/1.json"]),
+            None,
+            abi_encode(["string"], ["https://metadata.example.com/3.json"]),
+            abi_encode(["string"], ["https://metadata.example.com/4.json"]),
+        ]
+        documents = {
+            "https://metadata.example.com/1.json": {"tools": ["gpt", "claude"]},
+            "https://metadata.example.com/3.json": {"tools": []},
+        }
+
+        def _get(uri: str, **_kwargs: object) -> MagicMock:
+            if uri not in documents:
+                raise requests.exceptions.ConnectionError("gateway down")
+            response = MagicMock(headers={})
+            response.json.return_value = documents[uri]
+            return response
+
+        mock_registry.return_value.get.side_effect = _get
+
+        manager = ToolManager(chain_config="gnosis")
+        catalogue = manager.get_tools_for_services([1, 2, 3, 4, 1], max_workers=4)
+
+        assert list(catalogue) == [1]
+        assert [tool.unique_identifier for tool in catalogue[1].tools] == [
+            "1-gpt",
+            "1-claude",
+        ]
+        mock_multicall.assert_called_once()
+        assert [call[1] for call in mock_multicall.call_args.args[1]] == [
+            "0x01",
+            "0x02",
+            "0x03",
+            "0x04",
+        ]
+        mock_contract.functions.tokenURI.assert_not_called()
+
+    @patch("mech_client.domain.tools.manager.get_http_registry")
+    @patch("mech_client.domain.tools.manager.multicall")
+    @patch("mech_client.domain.tools.manager.get_contract")
+    @patch("mech_client.domain.tools.manager.get_abi")
+    @patch("mech_client.domain.tools.manager.EthereumApi")
+    @patch("mech_client.domain.tools.manager.get_mech_config")
+    def test_fresh_entries_are_not_multicalled(  # pylint: disable=too-many-arguments
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api: MagicMock,
+        mock_get_abi: MagicMock,
+        mock_get_contract: MagicMock,
+        mock_multicall: MagicMock,
+        mock_registry: MagicMock,
+    ) -> None:
+        """Test services with a fresh cache entry need no on-chain read."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_multicall.return_value = [
+            abi_encode(["string"], ["https://metadata.example.com/1.json"])
+        ]
+        mock_registry.return_value.get.return_value.json.return_value = {
+            "tools": ["gpt"]
+        }
+
+        manager = ToolManager(chain_config="gnosis")
+        manager.get_tools_for_services([1])
+        assert list(manager.get_tools_for_services([1])) == [1]
+
+        mock_multicall.assert_called_once()
+        mock_registry.return_value.get.assert_called_once()
+
+    @patch("mech_client.domain.tools.manager.EthereumApi")
+    @patch("mech_client.domain.tools.manager.get_mech_config")
+    def test_zero_address(
+        self, mock_config: MagicMock, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test bulk discovery needs the metadata contract."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_config.return_value.complementary_metadata_hash_address = (
+            "0x" + "0" * 40
+        )
+
+        manager = ToolManager(chain_config="gnosis")
+        with pytest.raises(ValueError, match="Metadata hash not yet implemented"):
+            manager.get_tools_for_services([1])
+
+
 class TestGetToolDescription:
     """Tests for get_tool_description method."""
 
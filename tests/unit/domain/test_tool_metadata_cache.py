@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the tool metadata cache."""
+
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.domain.tools.metadata_cache import (
+    ToolMetadataCache,
+    is_content_addressed,
+)
+
+HTTP_URI = "https://metadata.example.com/tool.json"
+IPFS_URI = "https://gateway.autonolas.tech/ipfs/f01701220abc"
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary time."""
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class InlineThread:
+    """Thread stand-in that runs its target when started."""
+
+    def __init__(self, target: Callable[[], Any], **_kwargs: Any) -> None:
+        """Keep the target."""
+        self.target = target
+
+    def start(self) -> None:
+        """Run the target synchronously."""
+        self.target()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+def _cache(clock: FakeClock, directory: Any = None) -> ToolMetadataCache:
+    """Create a cache with a 10 s TTL and a 100 s stale window."""
+    return ToolMetadataCache(directory, ttl=10, stale_ttl=100, clock=clock)
+
+
+class TestToolMetadataCache:
+    """Tests for ToolMetadataCache."""
+
+    def test_fresh_entry_does_no_io(self, clock: FakeClock) -> None:
+        """Test a document inside the TTL is served without resolving or fetching."""
+        cache = _cache(clock)
+        resolve = MagicMock(return_value=HTTP_URI)
+        fetch = MagicMock(return_value=({"tools": ["a"]}, None))
+
+        assert cache.get("gnosis", 1, resolve, fetch) == {"tools": ["a"]}
+        clock.now += 5
+        assert cache.get("gnosis", 1, resolve, fetch) == {"tools": ["a"]}
+
+        resolve.assert_called_once_with()
+        fetch.assert_called_once_with(HTTP_URI, None)
+
+    def test_entries_are_per_chain_and_service(self, clock: FakeClock) -> None:
+        """Test different services and chains do not share entries."""
+        cache = _cache(clock)
+        fetch = MagicMock(side_effect=lambda uri, _etag: ({"uri": uri}, None))
+
+        cache.get("gnosis", 1, lambda: "https://a.example/1", fetch)
+        cache.get("gnosis", 2, lambda: "https://a.example/2", fetch)
+        cache.get("base", 1, lambda: "https://a.example/3", fetch)
+
+        assert fetch.call_count == 3
+
+    def test_unchanged_ipfs_uri_is_not_refetched(self, clock: FakeClock) -> None:
+        """Test an expired entry whose tokenURI still names the same CID is kept."""
+        cache = _cache(clock)
+        resolve = MagicMock(return_value=IPFS_URI)
+        fetch = MagicMock(return_value=({"tools": ["a"]}, None))
+        cache.get("gnosis", 1, resolve, fetch)
+
+        clock.now += 500
+        assert cache.get("gnosis", 1, resolve, fetch) == {"tools": ["a"]}
+        assert resolve.call_count == 2
+        fetch.assert_called_once()
+
+        # Revalidated: fresh again
+        clock.now += 5
+        cache.get("gnosis", 1, resolve, fetch)
+        assert resolve.call_count == 2
+
+    def test_etag_revalidation(self, clock: FakeClock) -> None:
+        """Test a 304 keeps the document and a new tokenURI fetches afresh."""
+        cache = _cache(clock)
+        resolve = MagicMock(return_value=HTTP_URI)
+        fetch = MagicMock(side_effect=[({"v": 1}, '"e1"'), None, ({"v": 2}, None)])
+        cache.get("gnosis", 1, resolve, fetch)
+
+        clock.now += 500
+        assert cache.get("gnosis", 1, resolve, fetch) == {"v": 1}
+        assert fetch.call_args.args == (HTTP_URI, '"e1"')
+
+        clock.now += 500
+        resolve.return_value = "https://metadata.example.com/v2.json"
+        assert cache.get("gnosis", 1, resolve, fetch) == {"v": 2}
+        assert fetch.call_args.args == ("https://metadata.example.com/v2.json", None)
+
+    def test_stale_entry_served_while_revalidating(self, clock: FakeClock) -> None:
+        """Test a stale document is returned at once and refreshed behind it."""
+        cache = _cache(clock)
+        fetch = MagicMock(side_effect=[({"v": 1}, None), ({"v": 2}, None)])
+        cache.get("gnosis", 1, lambda: HTTP_URI, fetch)
+
+        clock.now += 50
+        with patch(
+            "mech_client.domain.tools.metadata_cache.threading.Thread", InlineThread
+        ):
+            assert cache.get("gnosis", 1, lambda: HTTP_URI, fetch) == {"v": 1}
+        assert cache.get("gnosis", 1, lambda: HTTP_URI, fetch) == {"v": 2}
+
+    def test_failed_background_revalidation_keeps_entry(
+        self, clock: FakeClock
+    ) -> None:
+        """Test an error while revalidating in the background is not raised."""
+        cache = _cache(clock)
+        cache.get("gnosis", 1, lambda: HTTP_URI, lambda _u, _e: ({"v": 1}, None))
+
+        clock.now += 50
+        failing = MagicMock(side_effect=IOError("gateway down"))
+        with patch(
+            "mech_client.domain.tools.metadata_cache.threading.Thread", InlineThread
+        ):
+            assert cache.get("gnosis", 1, failing, failing) == {"v": 1}
+
+    def test_expired_entry_errors_propagate(self, clock: FakeClock) -> None:
+        """Test an entry past the stale window is not served if refreshing fails."""
+        cache = _cache(clock)
+        cache.get("gnosis", 1, lambda: HTTP_URI, lambda _u, _e: ({"v": 1}, None))
+
+        clock.now += 500
+        with pytest.raises(IOError, match="gateway down"):
+            cache.get(
+                "gnosis", 1, MagicMock(side_effect=IOError("gateway down")), MagicMock()
+            )
+
+    def test_disk_entries_survive_the_process(
+        self, clock: FakeClock, tmp_path: Path
+    ) -> None:
+        """Test a second cache on the same directory serves without I/O."""
+        _cache(clock, tmp_path).get(
+            "gnosis", 7, lambda: HTTP_URI, lambda _u, _e: ({"v": 1}, '"e1"')
+        )
+        resolve = MagicMock()
+
+        assert _cache(clock, tmp_path).get("gnosis", 7, resolve, MagicMock()) == {
+            "v": 1
+        }
+        resolve.assert_not_called()
+        assert [p.name for p in tmp_path.iterdir()] == ["gnosis-7.json"]
+
+    def test_corrupt_disk_entry_is_ignored(
+        self, clock: FakeClock, tmp_path: Path
+    ) -> None:
+        """Test an unreadable cache file is treated as a miss."""
+        (tmp_path / "gnosis-7.json").write_text("{not json", encoding="utf-8")
+        fetch = MagicMock(return_value=({"v": 1}, None))
+
+        assert _cache(clock, tmp_path).get("gnosis", 7, lambda: HTTP_URI, fetch) == {
+            "v": 1
+        }
+        fetch.assert_called_once()
+
+    def test_invalidate(self, clock: FakeClock, tmp_path: Path) -> None:
+        """Test invalidating drops the entry from memory and disk."""
+        cache = _cache(clock, tmp_path)
+        fetch = MagicMock(return_value=({"v": 1}, None))
+        cache.get("gnosis", 7, lambda: HTTP_URI, fetch)
+
+        cache.invalidate("gnosis", 7)
+        assert not list(tmp_path.iterdir())
+        cache.get("gnosis", 7, lambda: HTTP_URI, fetch)
+        assert fetch.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "uri, expected",
+    [
+        (IPFS_URI, True),
+        ("ipfs://bafybeigdyr", True),
+        (HTTP_URI, False),
+        ("https://example.com/api/ipfs", False),
+    ],
+)
+def test_is_content_addressed(uri: str, expected: bool) -> None:
+    """Test IPFS URIs are recognised as immutable."""
+    assert is_content_addressed(uri) is expected
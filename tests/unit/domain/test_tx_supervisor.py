@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the fee-bumping transaction supervisor."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.domain.execution.client_executor import ClientExecutor
+from mech_client.domain.execution.factory import ExecutorFactory
+from mech_client.domain.execution.supervisor import (
+    TransactionSupervisor,
+    bump_fees,
+    create_supervisor,
+)
+from mech_client.infrastructure.blockchain.nonce_manager import NonceManager
+
+from tests.unit.helpers import create_mock_signer
+
+FETCH_RECEIPTS = "mech_client.domain.execution.supervisor.fetch_receipts"
+EIP1559_TX = {
+    "nonce": 7,
+    "to": "0x" + "2" * 40,
+    "maxFeePerGas": 100,
+    "maxPriorityFeePerGas": 10,
+}
+
+
+class TestBumpFees:
+    """Tests for bump_fees."""
+
+    def test_eip1559_fields_bumped(self) -> None:
+        """Test that both EIP-1559 fee fields grow by the bump."""
+        bumped = bump_fees(EIP1559_TX, percent=15)
+
+        assert bumped["maxFeePerGas"] == 115
+        assert bumped["maxPriorityFeePerGas"] == 12  # ceil(11.5)
+        assert EIP1559_TX["maxFeePerGas"] == 100  # input untouched
+
+    def test_bump_respects_replacement_floor(self) -> None:
+        """Test that bumps below 10% are raised to the node minimum."""
+        bumped = bump_fees({"gasPrice": 1000}, percent=5)
+        assert bumped["gasPrice"] == 1100
+
+    def test_tiny_fees_still_increase(self) -> None:
+        """Test that rounding never leaves a fee unchanged."""
+        assert bump_fees({"gasPrice": 1})["gasPrice"] == 2
+
+
+class TestTransactionSupervisor:
+    """Tests for TransactionSupervisor."""
+
+    def test_submit_requires_nonce(self, mock_ledger_api: MagicMock) -> None:
+        """Test that replacements need a pinned nonce."""
+        supervisor = TransactionSupervisor(mock_ledger_api, create_mock_signer())
+        with pytest.raises(ValueError, match="explicit nonce"):
+            supervisor.submit({"to": "0x" + "2" * 40})
+
+    @patch("mech_client.domain.execution.supervisor.get_fee_oracle")
+    def test_submit_pins_missing_fees(
+        self, mock_get_fee_oracle: MagicMock, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that fees are filled from the fee oracle before broadcasting."""
+        signer = create_mock_signer()
+        mock_get_fee_oracle.return_value.fees.return_value = {
+            "maxFeePerGas": 50,
+            "maxPriorityFeePerGas": 5,
+        }
+        supervisor = TransactionSupervisor(mock_ledger_api, signer)
+
+        supervisor.submit({"nonce": 1})
+
+        sent = signer.send_transaction.call_args.args[0]
+        assert sent["maxFeePerGas"] == 50
+
+    def test_stuck_transaction_is_replaced(self, mock_ledger_api: MagicMock) -> None:
+        """Test a bumped re-broadcast after the configured pending blocks."""
+        signer = create_mock_signer()
+        signer.send_transaction.side_effect = ["0xorig", "0xbump"]
+        supervisor = TransactionSupervisor(
+            mock_ledger_api, signer, bump_after_blocks=3
+        )
+        tx_hash = supervisor.submit(EIP1559_TX)
+        replaced = MagicMock()
+        supervisor.get(tx_hash).on_replaced.append(replaced)
+
+        with patch(FETCH_RECEIPTS, return_value={}) as mock_fetch:
+            mock_ledger_api.api.eth.block_number = 100
+            assert supervisor.poll(tx_hash) is None  # records broadcast block
+            mock_ledger_api.api.eth.block_number = 102
+            assert supervisor.poll(tx_hash) is None  # not yet stuck
+            mock_ledger_api.api.eth.block_number = 103
+            assert supervisor.poll(tx_hash) is None  # replaced
+
+            mock_fetch.return_value = {"0xbump": {"status": 1}}
+            receipt = supervisor.poll(tx_hash)
+
+        assert receipt == {"status": 1}
+        record = supervisor.get(tx_hash)
+        assert record.hashes == ["0xorig", "0xbump"]
+        assert record.included_hash == "0xbump"
+        replacement = signer.send_transaction.call_args.args[0]
+        assert replacement["nonce"] == 7
+        assert replacement["maxFeePerGas"] == 115
+        assert mock_fetch.call_args.args[1] == ["0xorig", "0xbump"]
+        replaced.assert_called_once_with("0xbump")
+
+    def test_fee_cap_stops_bumping(self, mock_ledger_api: MagicMock) -> None:
+        """Test that no replacement exceeds max_fee_per_gas_cap."""
+        signer = create_mock_signer()
+        supervisor = TransactionSupervisor(
+            mock_ledger_api, signer, bump_after_blocks=1, max_fee_per_gas_cap=110
+        )
+        tx_hash = supervisor.submit(EIP1559_TX)
+
+        with patch(FETCH_RECEIPTS, return_value={}):
+            mock_ledger_api.api.eth.block_number = 1
+            supervisor.poll(tx_hash)
+            mock_ledger_api.api.eth.block_number = 5
+            supervisor.poll(tx_hash)
+
+        assert signer.send_transaction.call_count == 1
+        assert supervisor.get(tx_hash).bumps == supervisor.max_bumps
+
+    @pytest.mark.asyncio
+    async def test_wait_async_times_out(self, mock_ledger_api: MagicMock) -> None:
+        """Test the timeout error lists every broadcast hash."""
+        mock_ledger_api._chain_id = 100
+        supervisor = TransactionSupervisor(
+            mock_ledger_api, create_mock_signer(), bump_after_blocks=0
+        )
+        tx_hash = supervisor.submit(EIP1559_TX)
+
+        with patch(FETCH_RECEIPTS, return_value={}):
+            with pytest.raises(TimeoutError, match="0 fee bump"):
+                await supervisor.wait_async(tx_hash, timeout=0.01)
+
+
+class TestSupervisorWiring:
+    """Tests for supervisor construction and executor integration."""
+
+    @patch.dict("os.environ", {"MECHX_GAS_BUMP_BLOCKS": "0"}, clear=True)
+    def test_env_zero_disables(self, mock_ledger_api: MagicMock) -> None:
+        """Test MECHX_GAS_BUMP_BLOCKS=0 turns supervision off."""
+        assert create_supervisor(mock_ledger_api, create_mock_signer()) is None
+
+    @patch.dict("os.environ", {"MECHX_GAS_BUMP_BLOCKS": "4"}, clear=True)
+    def test_env_sets_block_window(self, mock_ledger_api: MagicMock) -> None:
+        """Test MECHX_GAS_BUMP_BLOCKS configures the pending window."""
+        supervisor = create_supervisor(mock_ledger_api, create_mock_signer())
+        assert supervisor is not None
+        assert supervisor.bump_after_blocks == 4
+
+    def test_client_executor_submits_through_supervisor(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that client-mode sends are tracked with their managed nonce."""
+        signer = create_mock_signer()
+        mock_ledger_api.build_transaction.return_value = {"maxFeePerGas": 1}
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 3
+        supervisor = TransactionSupervisor(mock_ledger_api, signer)
+        executor = ClientExecutor(
+            mock_ledger_api, signer, NonceManager(mock_ledger_api), supervisor
+        )
+
+        tx_hash = executor.execute_transaction(MagicMock(), "request", {}, {})
+
+        assert supervisor.is_tracking(tx_hash)
+        assert supervisor.get(tx_hash).tx["nonce"] == 3
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_factory_supervises_only_on_request(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that only callers awaiting through the supervisor get one."""
+        signer = create_mock_signer()
+
+        plain = ExecutorFactory.create(False, mock_ledger_api, signer=signer)
+        supervised = ExecutorFactory.create(
+            False, mock_ledger_api, signer=signer, supervise=True
+        )
+
+        assert isinstance(plain, ClientExecutor)
+        assert plain.supervisor is None
+        assert isinstance(supervised, ClientExecutor)
+        assert isinstance(supervised.supervisor, TransactionSupervisor)
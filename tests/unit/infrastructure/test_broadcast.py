@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for batched raw transaction broadcasting."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastError,
+    BroadcastQueue,
+    get_broadcast_queue,
+    raw_transaction_hash,
+    send_raw_transactions,
+)
+
+
+RAW_A = bytes.fromhex("02f8aa")
+RAW_B = bytes.fromhex("02f8bb")
+RAW_C = bytes.fromhex("02f8cc")
+
+
+class TestSendRawTransactions:
+    """Tests for send_raw_transactions."""
+
+    def test_one_batch_request_per_chunk(self) -> None:
+        """Test transactions go out as chunked JSON-RPC batches."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_batch_request.return_value = [
+            {"result": "0x1"},
+            {"error": {"message": "nonce too low"}},
+        ]
+
+        results = send_raw_transactions(ledger_api, [RAW_A, RAW_B, RAW_C], 2)
+
+        # The trailing single-transaction chunk is sent without batching.
+        assert ledger_api.api.provider.make_batch_request.call_count == 1
+        batch = ledger_api.api.provider.make_batch_request.call_args.args[0]
+        assert batch == [
+            ("eth_sendRawTransaction", ["0x02f8aa"]),
+            ("eth_sendRawTransaction", ["0x02f8bb"]),
+        ]
+        ledger_api.api.eth.send_raw_transaction.assert_called_once_with(RAW_C)
+        assert [r.tx_hash for r in results] == [
+            raw_transaction_hash(raw) for raw in (RAW_A, RAW_B, RAW_C)
+        ]
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error == "nonce too low"
+
+    def test_falls_back_when_batching_rejected(self) -> None:
+        """Test a provider without batch support sends one by one."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_batch_request.side_effect = ValueError("no")
+        ledger_api.api.eth.send_raw_transaction.side_effect = [
+            None,
+            ValueError("insufficient funds"),
+        ]
+
+        results = send_raw_transactions(ledger_api, [RAW_A, RAW_B])
+
+        assert ledger_api.api.eth.send_raw_transaction.call_count == 2
+        assert results[0].ok
+        assert "insufficient funds" in str(results[1].error)
+
+
+class TestBroadcastQueue:
+    """Tests for BroadcastQueue."""
+
+    def test_enqueue_returns_hash_without_broadcasting(self) -> None:
+        """Test the hash is known before anything is sent."""
+        ledger_api = MagicMock()
+        queue = BroadcastQueue(ledger_api, batch_size=10)
+
+        tx_hash = queue.enqueue(RAW_A)
+
+        assert tx_hash == raw_transaction_hash(RAW_A)
+        assert queue.pending == 1
+        ledger_api.api.provider.make_batch_request.assert_not_called()
+        ledger_api.api.eth.send_raw_transaction.assert_not_called()
+
+    def test_auto_flush_when_full(self) -> None:
+        """Test reaching batch_size broadcasts the queue."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_batch_request.return_value = [
+            {"result": "0x1"},
+            {"result": "0x2"},
+        ]
+        queue = BroadcastQueue(ledger_api, batch_size=2)
+
+        queue.enqueue(RAW_A)
+        queue.enqueue(RAW_B)
+
+        assert queue.pending == 0
+        ledger_api.api.provider.make_batch_request.assert_called_once()
+
+    @patch("mech_client.infrastructure.blockchain.broadcast.get_nonce_manager")
+    def test_rejection_recorded_and_nonce_returned(
+        self, mock_get_nonce_manager: MagicMock
+    ) -> None:
+        """Test a rejected transaction is reported and its nonce released."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_batch_request.return_value = [
+            {"result": "0x1"},
+            {"error": {"message": "insufficient funds"}},
+        ]
+        queue = BroadcastQueue(ledger_api)
+        ok_hash = queue.enqueue(RAW_A, sender="0xabc", nonce=4)
+        bad_hash = queue.enqueue(RAW_B, sender="0xabc", nonce=5)
+
+        queue.flush()
+
+        assert queue.pop_failure(ok_hash) is None
+        failure = queue.pop_failure(bad_hash)
+        assert isinstance(failure, BroadcastError)
+        assert failure.message == "insufficient funds"
+        assert queue.pop_failure(bad_hash) is None
+        mock_get_nonce_manager.return_value.release.assert_called_once_with(
+            "0xabc", 5
+        )
+
+    @patch("mech_client.infrastructure.blockchain.broadcast.get_nonce_manager")
+    def test_unclaimed_rejections_are_bounded(
+        self, _mock_get_nonce_manager: MagicMock
+    ) -> None:
+        """Test the oldest unclaimed rejection is dropped past max_failures."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_batch_request.return_value = [
+            {"error": {"message": "underpriced"}} for _ in range(3)
+        ]
+        queue = BroadcastQueue(ledger_api, max_failures=2)
+        hashes = [queue.enqueue(raw) for raw in (RAW_A, RAW_B, RAW_C)]
+
+        queue.flush()
+
+        assert queue.pop_failure(hashes[0]) is None
+        assert queue.pop_failure(hashes[1]) is not None
+        assert queue.pop_failure(hashes[2]) is not None
+
+    def test_batch_context_flushes_on_exit(self) -> None:
+        """Test the batch() block broadcasts everything queued inside it."""
+        ledger_api = MagicMock()
+        queue = BroadcastQueue(ledger_api)
+
+        with queue.batch():
+            queue.enqueue(RAW_A)
+
+        assert queue.pending == 0
+        ledger_api.api.eth.send_raw_transaction.assert_called_once_with(RAW_A)
+
+
+def test_get_broadcast_queue_shared_per_chain() -> None:
+    """Test that ledgers on one chain share a queue."""
+    assert get_broadcast_queue(MagicMock(_chain_id=100)) is get_broadcast_queue(
+        MagicMock(_chain_id=100)
+    )
+
+
+@pytest.mark.parametrize("raw", [RAW_A, "0x02f8aa"])
+def test_raw_transaction_hash_accepts_hex(raw: object) -> None:
+    """Test bytes and 0x-hex raw transactions hash the same."""
+    assert raw_transaction_hash(raw) == raw_transaction_hash(RAW_A)  # type: ignore
@@ -27,13 +27,14 @@ import requests
 from mech_client.infrastructure.config.chain_config import (
     LedgerConfig,
     get_rpc_chain_id,
+    probe_rpc_chain_id,
 )
 
 
 class TestGetRpcChainId:
     """Tests for get_rpc_chain_id function."""
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_success(self, mock_post: MagicMock) -> None:
         """Test successful RPC chain ID query."""
         # Mock successful response with chain ID 100 (Gnosis)
@@ -49,7 +50,7 @@ class TestGetRpcChainId:
         call_kwargs = mock_post.call_args[1]
         assert call_kwargs["json"]["method"] == "eth_chainId"
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_base_chain(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query for Base chain."""
         # Mock response with chain ID 8453 (Base)
@@ -62,7 +63,7 @@ class TestGetRpcChainId:
 
         assert result == 8453
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_polygon_chain(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query for Polygon chain."""
         # Mock response with chain ID 137 (Polygon)
@@ -75,7 +76,7 @@ class TestGetRpcChainId:
 
         assert result == 137
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_connection_error(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with connection error."""
         mock_post.side_effect = requests.ConnectionError("Connection failed")
@@ -84,7 +85,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_timeout(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with timeout."""
         mock_post.side_effect = requests.Timeout("Request timeout")
@@ -93,7 +94,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_http_error(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with HTTP error."""
         mock_response = MagicMock()
@@ -104,7 +105,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_invalid_json(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with invalid JSON response."""
         mock_response = MagicMock()
@@ -116,7 +117,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_missing_result(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with missing result field."""
         mock_response = MagicMock()
@@ -128,7 +129,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_invalid_hex(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with invalid hex value."""
         mock_response = MagicMock()
@@ -140,7 +141,7 @@ class TestGetRpcChainId:
 
         assert result is None
 
-    @patch("mech_client.infrastructure.config.chain_config.requests.post")
+    @patch("mech_client.infrastructure.http.sessions.HttpSessionRegistry.post")
     def test_get_rpc_chain_id_custom_timeout(self, mock_post: MagicMock) -> None:
         """Test RPC chain ID query with custom timeout."""
         mock_response = MagicMock()
@@ -155,6 +156,22 @@ class TestGetRpcChainId:
         assert call_kwargs["timeout"] == 10.0
 
 
+class TestProbeRpcChainId:
+    """Tests for probe_rpc_chain_id function."""
+
+    @patch("mech_client.infrastructure.config.chain_config.get_rpc_chain_id")
+    def test_probes_each_url_once(self, mock_probe: MagicMock) -> None:
+        """Test each URL is queried once, including failed queries."""
+        mock_probe.side_effect = lambda url: None if "down" in url else 100
+
+        assert probe_rpc_chain_id("https://rpc.example") == 100
+        assert probe_rpc_chain_id("https://rpc.example") == 100
+        assert probe_rpc_chain_id("https://down.example") is None
+        assert probe_rpc_chain_id("https://down.example") is None
+
+        assert mock_probe.call_count == 2
+
+
 class TestLedgerConfigRpcValidation:
     """Tests for LedgerConfig RPC chain ID validation."""
 
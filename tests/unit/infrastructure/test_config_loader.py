@@ -19,11 +19,20 @@
 
 """Tests for configuration loader."""
 
+import json
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from mech_client.infrastructure.config import LedgerConfig, MechConfig, get_mech_config
+from mech_client.infrastructure.config import (
+    MECH_CONFIGS,
+    LedgerConfig,
+    MechConfig,
+    clear_config_cache,
+    get_mech_config,
+)
 
 
 class TestGetMechConfig:
@@ -475,3 +484,58 @@ class TestMechConfigPriorityOrder:
         # Should not load from operate when chain_config is None
         mock_load_rpc.assert_not_called()
         assert config.rpc_url == "https://default.rpc.com"
+
+
+class TestConfigCache:
+    """Tests for memoized configuration loading."""
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_parsed_once_and_copied(self) -> None:
+        """Test mechs.json is parsed once and every caller gets its own copy."""
+        with patch(
+            "mech_client.infrastructure.config.loader.json.load", wraps=json.load
+        ) as load:
+            first = get_mech_config("gnosis")
+            second = get_mech_config("gnosis")
+            get_mech_config("base")
+
+        load.assert_called_once()
+        assert first == second
+        first.gas_limit = 1
+        assert get_mech_config("gnosis").gas_limit == second.gas_limit
+
+    def test_environment_change_invalidates(self) -> None:
+        """Test a changed MECHX_* variable rebuilds the configuration."""
+        with patch.dict("os.environ", {"MECHX_GAS_LIMIT": "123"}):
+            assert get_mech_config("gnosis").gas_limit == 123
+        with patch.dict("os.environ", {"MECHX_GAS_LIMIT": "456"}):
+            assert get_mech_config("gnosis").gas_limit == 456
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_file_change_invalidates(self, tmp_path: Path) -> None:
+        """Test rewriting mechs.json is picked up without clearing the cache."""
+        with open(MECH_CONFIGS, encoding="utf-8") as file:
+            data = json.load(file)
+        path = tmp_path / "mechs.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        with patch("mech_client.infrastructure.config.loader.MECH_CONFIGS", path):
+            price = get_mech_config("gnosis").price
+            data["gnosis"]["price"] = price + 1
+            path.write_text(json.dumps(data), encoding="utf-8")
+            os.utime(path, ns=(0, 0))
+
+            assert get_mech_config("gnosis").price == price + 1
+
+    @patch.dict("os.environ", {"MECHX_CHAIN_RPC": "https://env.rpc.com"}, clear=True)
+    @patch("mech_client.infrastructure.config.chain_config.get_rpc_chain_id")
+    def test_chain_id_probed_once_per_url(self, mock_probe: MagicMock) -> None:
+        """Test loading several chains through one RPC probes it once."""
+        mock_probe.return_value = 100
+
+        get_mech_config("gnosis")
+        get_mech_config("base")
+        clear_config_cache()
+        get_mech_config("gnosis")
+
+        assert mock_probe.call_count == 2
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the per-block fee oracle."""
+
+from unittest.mock import MagicMock, patch
+
+from mech_client.infrastructure.blockchain.fee_oracle import (
+    FeeOracle,
+    get_fee_oracle,
+    percentile_tip,
+)
+
+
+GWEI = 10**9
+
+
+def _ledger(base_fee: int = GWEI, tips: tuple = (2 * GWEI,) * 5) -> MagicMock:
+    """Build a ledger whose node answers eth_feeHistory."""
+    # pylint: disable=protected-access
+    ledger_api = MagicMock()
+    ledger_api._gas_price_strategies = {}
+    ledger_api._default_gas_price_strategy = "eip1559"
+    ledger_api.api.eth.fee_history.return_value = {
+        "oldestBlock": 100,
+        "baseFeePerGas": [base_fee] * (len(tips) + 1),
+        "reward": [[tip] for tip in tips],
+    }
+    return ledger_api
+
+
+class TestPercentileTip:
+    """Tests for percentile_tip."""
+
+    def test_median_of_allowed_rewards(self) -> None:
+        """Test the median is taken over rewards at or above the floor."""
+        assert percentile_tip([1, 5, 3, 4, 0], 1, 200) == 4
+
+    def test_floor_when_no_reward_qualifies(self) -> None:
+        """Test the chain minimum is tipped in an idle network."""
+        assert percentile_tip([0, 0], 7, 200) == 7
+
+    def test_discards_cheap_outliers(self) -> None:
+        """Test a large jump in the upper half drops the cheap tail."""
+        assert percentile_tip([1, 1, 1, 100, 100], 1, 200) == 100
+
+
+class TestFeeOracle:
+    """Tests for FeeOracle."""
+
+    def test_prices_from_single_fee_history_call(self) -> None:
+        """Test base fee and tip come from one eth_feeHistory response."""
+        ledger_api = _ledger()
+        oracle = FeeOracle(ledger_api, tip_percentile=25, ttl=60.0)
+
+        fees = oracle.fees()
+
+        assert fees["maxPriorityFeePerGas"] == 2 * GWEI
+        assert fees["maxFeePerGas"] >= GWEI
+        ledger_api.api.eth.fee_history.assert_called_once_with(10, "latest", [25])
+        assert oracle.snapshot().block_number == 104
+
+    def test_cached_within_block(self) -> None:
+        """Test repeated pricing within the TTL hits the node once."""
+        ledger_api = _ledger()
+        oracle = FeeOracle(ledger_api, ttl=60.0)
+
+        oracle.fees()
+        oracle.fees()
+        oracle.gas_price()
+
+        assert ledger_api.api.eth.fee_history.call_count == 1
+
+    def test_refreshes_on_new_block_and_ttl(self) -> None:
+        """Test a newer head or an expired TTL triggers a refetch."""
+        ledger_api = _ledger()
+        oracle = FeeOracle(ledger_api, ttl=5.0)
+
+        oracle.fees()
+        oracle.observe_block(104)
+        oracle.fees()
+        assert ledger_api.api.eth.fee_history.call_count == 1
+
+        oracle.observe_block(105)
+        oracle.fees()
+        assert ledger_api.api.eth.fee_history.call_count == 2
+
+        with patch(
+            "mech_client.infrastructure.blockchain.fee_oracle.time.monotonic",
+            return_value=10**9,
+        ):
+            oracle.fees()
+        assert ledger_api.api.eth.fee_history.call_count == 3
+
+    def test_falls_back_to_gas_price(self) -> None:
+        """Test nodes without eth_feeHistory are priced with eth_gasPrice."""
+        ledger_api = _ledger()
+        ledger_api.api.eth.fee_history.side_effect = ValueError("not supported")
+        ledger_api.api.eth.gas_price = 3 * GWEI
+        oracle = FeeOracle(ledger_api, ttl=60.0)
+
+        assert oracle.fees() == {"gasPrice": 3 * GWEI}
+        assert oracle.gas_price() == 3 * GWEI
+
+    def test_uses_fallback_estimate_above_ceiling(self) -> None:
+        """Test anomalous fees are replaced with the strategy fallback."""
+        ledger_api = _ledger(base_fee=5000 * GWEI)
+        oracle = FeeOracle(ledger_api, ttl=60.0)
+
+        assert oracle.fees() == oracle.strategy["fallback_estimate"]
+
+    def test_respects_chain_strategy_overrides(self) -> None:
+        """Test the ledger's tip floor applies to cached prices."""
+        ledger_api = _ledger(tips=(0, 0, 0))
+        ledger_api._gas_price_strategies = {  # pylint: disable=protected-access
+            "eip1559": {"min_allowed_tip": GWEI}
+        }
+        oracle = FeeOracle(ledger_api, ttl=60.0)
+
+        assert oracle.fees()["maxPriorityFeePerGas"] == GWEI
+
+    def test_non_eip1559_strategy_uses_ledger_pricing(self) -> None:
+        """Test other configured strategies are priced by the ledger, cached."""
+        # pylint: disable=protected-access
+        ledger_api = _ledger()
+        ledger_api._default_gas_price_strategy = "gas_station"
+        ledger_api.try_get_gas_pricing.return_value = {"gasPrice": 40 * GWEI}
+        oracle = FeeOracle(ledger_api, ttl=60.0)
+
+        assert oracle.fees() == {"gasPrice": 40 * GWEI}
+        oracle.fees()
+        ledger_api.try_get_gas_pricing.assert_called_once()
+        ledger_api.api.eth.fee_history.assert_not_called()
+
+    @patch.dict("os.environ", {"MECHX_FEE_TIP_PERCENTILE": "60"}, clear=True)
+    def test_env_tip_percentile(self) -> None:
+        """Test MECHX_FEE_TIP_PERCENTILE selects the tip percentile."""
+        oracle = FeeOracle(_ledger())
+
+        assert oracle.strategy["fee_history_percentile"] == 60
+
+
+class TestGetFeeOracle:
+    """Tests for get_fee_oracle."""
+
+    def test_shared_per_chain(self) -> None:
+        """Test that ledgers on one chain share an oracle."""
+        ledger_a = MagicMock(_chain_id=100)
+        ledger_b = MagicMock(_chain_id=100)
+        ledger_c = MagicMock(_chain_id=10)
+
+        assert get_fee_oracle(ledger_a) is get_fee_oracle(ledger_b)
+        assert get_fee_oracle(ledger_a) is not get_fee_oracle(ledger_c)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the learned gas model."""
+
+from unittest.mock import MagicMock, patch
+
+from mech_client.infrastructure.blockchain.gas_model import (
+    GasModel,
+    contract_call_key,
+    get_gas_model,
+)
+
+
+MARKETPLACE = "0x" + "Ab" * 20
+
+
+class TestContractCallKey:
+    """Tests for contract_call_key."""
+
+    def test_batch_size_distinguishes_shapes(self) -> None:
+        """Test that list-argument lengths are part of the key."""
+        one = contract_call_key(MARKETPLACE, "requestBatch", {"datas": [b"a"]})
+        two = contract_call_key(MARKETPLACE, "requestBatch", {"datas": [b"a", b"b"]})
+        again = contract_call_key(
+            MARKETPLACE.lower(), "requestBatch", {"datas": [b"c", b"d"]}
+        )
+
+        assert one != two
+        assert two == again
+
+    def test_payment_type_and_value_distinguish_shapes(self) -> None:
+        """Test that payment type and zero/non-zero value split shapes."""
+        native = contract_call_key(
+            MARKETPLACE, "request", {"paymentType": b"\x01"}, value=10
+        )
+        token = contract_call_key(MARKETPLACE, "request", {"paymentType": b"\x02"})
+        free = contract_call_key(MARKETPLACE, "request", {"paymentType": b"\x01"})
+
+        assert len({native, token, free}) == 3
+
+
+class TestGasModel:
+    """Tests for GasModel."""
+
+    def test_no_prediction_without_samples(self) -> None:
+        """Test that an unseen shape asks the caller to estimate."""
+        assert GasModel().predict(("x",)) is None
+
+    def test_predicts_max_sample_with_margin(self) -> None:
+        """Test the prediction is the largest recent sample times the margin."""
+        model = GasModel(margin=1.5)
+        model.observe(("x",), 100_000)
+        model.observe(("x",), 120_000)
+
+        assert model.predict(("x",)) == 180_000
+        assert model.predict(("x",), margin=1.0) == 120_000
+
+    def test_prediction_expires_after_ttl(self) -> None:
+        """Test that a stale shape falls back to estimation."""
+        model = GasModel(ttl=10.0)
+        with patch(
+            "mech_client.infrastructure.blockchain.gas_model.time.monotonic",
+            side_effect=[100.0, 105.0, 111.0],
+        ):
+            model.observe(("x",), 100_000)
+            assert model.predict(("x",)) is not None
+            assert model.predict(("x",)) is None
+
+    def test_refresh_after_n_predictions(self) -> None:
+        """Test that a fresh sample is forced after refresh_every uses."""
+        model = GasModel(refresh_every=2)
+        model.observe(("x",), 100_000)
+
+        assert model.predict(("x",)) is not None
+        assert model.predict(("x",)) is not None
+        assert model.predict(("x",)) is None
+
+        model.observe(("x",), 90_000)
+        assert model.predict(("x",)) is not None
+
+    def test_observe_receipt_learns_tracked_success(self) -> None:
+        """Test that a successful tracked receipt feeds its shape."""
+        model = GasModel(margin=1.0)
+        model.track("0xaa", ("x",))
+
+        model.observe_receipt("0xaa", {"status": 1, "gasUsed": 77_000})
+
+        assert model.predict(("x",)) == 77_000
+
+    def test_observe_receipt_ignores_reverts_and_untracked(self) -> None:
+        """Test that reverted and unknown transactions are not learned."""
+        model = GasModel()
+        model.track("0xaa", ("x",))
+
+        model.observe_receipt("0xaa", {"status": 0, "gasUsed": 77_000})
+        model.observe_receipt("0xbb", {"status": 1, "gasUsed": 77_000})
+
+        assert model.predict(("x",)) is None
+
+
+class TestGetGasModel:
+    """Tests for get_gas_model."""
+
+    def test_shared_per_chain(self) -> None:
+        """Test that ledgers on one chain share a model."""
+        ledger_a = MagicMock(_chain_id=100)
+        ledger_b = MagicMock(_chain_id=100)
+        ledger_c = MagicMock(_chain_id=8453)
+
+        assert get_gas_model(ledger_a) is get_gas_model(ledger_b)
+        assert get_gas_model(ledger_a) is not get_gas_model(ledger_c)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the pooled HTTP session registry."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.http import sessions
+from mech_client.infrastructure.http.sessions import (
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_POOL_MAXSIZE,
+    HttpPoolConfig,
+    HttpSessionRegistry,
+    configure_http_sessions,
+    get_http_registry,
+    origin_of,
+)
+
+
+class TestOriginOf:
+    """Tests for origin_of."""
+
+    def test_strips_path_and_query(self) -> None:
+        """Test that only scheme and host[:port] form the key."""
+        assert (
+            origin_of("HTTPS://Gateway.Example.com:8443/ipfs/abc?x=1")
+            == "https://gateway.example.com:8443"
+        )
+
+    def test_rejects_relative_url(self) -> None:
+        """Test that a URL without scheme/host is rejected."""
+        with pytest.raises(ValueError, match="non-absolute"):
+            origin_of("/fetch_offchain_info")
+
+
+class TestHttpPoolConfig:
+    """Tests for HttpPoolConfig."""
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_defaults_without_env(self) -> None:
+        """Test defaults when no MECHX_HTTP_* variables are set."""
+        config = HttpPoolConfig.from_environment()
+
+        assert config.pool_maxsize == DEFAULT_POOL_MAXSIZE
+        assert config.timeout == DEFAULT_HTTP_TIMEOUT
+
+    @patch.dict(
+        "os.environ",
+        {"MECHX_HTTP_POOL_SIZE": "64", "MECHX_HTTP_TIMEOUT": "12.5"},
+        clear=True,
+    )
+    def test_env_overrides(self) -> None:
+        """Test MECHX_HTTP_POOL_SIZE and MECHX_HTTP_TIMEOUT overrides."""
+        config = HttpPoolConfig.from_environment()
+
+        assert config.pool_maxsize == 64
+        assert config.timeout == 12.5
+
+
+class TestHttpSessionRegistry:
+    """Tests for HttpSessionRegistry."""
+
+    def test_same_origin_shares_session(self) -> None:
+        """Test that URLs on one origin share one session."""
+        registry = HttpSessionRegistry(HttpPoolConfig())
+
+        first = registry.get_session("https://mech.example.com/send_signed_requests")
+        second = registry.get_session("https://mech.example.com/fetch_offchain_info")
+        other = registry.get_session("https://rpc.example.com/")
+
+        assert first is second
+        assert first is not other
+
+    def test_adapter_uses_pool_config(self) -> None:
+        """Test that mounted adapters carry the configured pool size."""
+        registry = HttpSessionRegistry(HttpPoolConfig(pool_maxsize=7))
+
+        session = registry.get_session("https://mech.example.com")
+        adapter = session.get_adapter("https://mech.example.com")
+
+        assert adapter._pool_maxsize == 7  # pylint: disable=protected-access
+
+    def test_request_applies_default_timeout(self) -> None:
+        """Test that the registry timeout is used when none is passed."""
+        registry = HttpSessionRegistry(HttpPoolConfig(timeout=4.0))
+        session = registry.get_session("https://mech.example.com")
+
+        with patch.object(session, "request") as mock_request:
+            registry.post("https://mech.example.com/x", data={"a": 1})
+
+        mock_request.assert_called_once_with(
+            "POST", "https://mech.example.com/x", data={"a": 1}, timeout=4.0
+        )
+
+    def test_request_keeps_explicit_timeout(self) -> None:
+        """Test that an explicit timeout wins over the registry default."""
+        registry = HttpSessionRegistry(HttpPoolConfig(timeout=4.0))
+        session = registry.get_session("https://mech.example.com")
+
+        with patch.object(session, "request") as mock_request:
+            registry.get("https://mech.example.com/x", timeout=10)
+
+        assert mock_request.call_args.kwargs["timeout"] == 10
+
+    def test_attach_to_rotating_provider(self) -> None:
+        """Test that every child provider is pinned to the pooled session."""
+        registry = HttpSessionRegistry(HttpPoolConfig())
+        child_a = MagicMock()
+        child_a.endpoint_uri = "https://rpc-a.example.com/v1"
+        child_b = MagicMock()
+        child_b.endpoint_uri = "https://rpc-b.example.com"
+        provider = MagicMock()
+        provider._providers = [child_a, child_b]  # pylint: disable=protected-access
+
+        registry.attach_to_provider(provider)
+
+        # pylint: disable=protected-access
+        assert child_a._request_session_manager._explicit_session is (
+            registry.get_session("https://rpc-a.example.com")
+        )
+        assert child_b._request_session_manager._explicit_session is (
+            registry.get_session("https://rpc-b.example.com")
+        )
+
+    def test_attach_skips_provider_without_session_manager(self) -> None:
+        """Test that non-HTTP providers are left untouched."""
+        registry = HttpSessionRegistry(HttpPoolConfig())
+        provider = MagicMock(spec=["endpoint_uri"])
+        provider.endpoint_uri = "https://rpc.example.com"
+
+        registry.attach_to_provider(provider)
+
+        assert not registry._sessions  # pylint: disable=protected-access
+
+    def test_close_forgets_sessions(self) -> None:
+        """Test that close() closes and drops every pooled session."""
+        registry = HttpSessionRegistry(HttpPoolConfig())
+        session = registry.get_session("https://mech.example.com")
+
+        with patch.object(session, "close") as mock_close:
+            registry.close()
+
+        mock_close.assert_called_once()
+        assert registry.get_session("https://mech.example.com") is not session
+
+
+class TestProcessRegistry:
+    """Tests for the process-wide registry accessors."""
+
+    def test_get_http_registry_is_singleton(self) -> None:
+        """Test that repeated calls return the same registry."""
+        assert get_http_registry() is get_http_registry()
+
+    def test_configure_replaces_and_closes_previous(self) -> None:
+        """Test that configure_http_sessions swaps in a new registry."""
+        previous = get_http_registry()
+        try:
+            with patch.object(previous, "close") as mock_close:
+                registry = configure_http_sessions(HttpPoolConfig(pool_maxsize=3))
+
+            mock_close.assert_called_once()
+            assert get_http_registry() is registry
+            assert registry.config.pool_maxsize == 3
+        finally:
+            sessions._registry = None  # pylint: disable=protected-access
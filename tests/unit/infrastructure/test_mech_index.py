@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the local mech index."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from mech_client.infrastructure.index import IndexedMech, MechIndex
+
+NATIVE_CHEAP = IndexedMech(
+    "gnosis",
+    "0xaaa",
+    1,
+    mech_type="Fixed Price Native",
+    payment_type="NATIVE",
+    max_delivery_rate=10**16,
+    total_deliveries=5,
+    tools=("gpt", "prediction-online"),
+    refreshed_at=100.0,
+)
+NATIVE_POPULAR = IndexedMech(
+    "gnosis",
+    "0xbbb",
+    2,
+    payment_type="NATIVE",
+    max_delivery_rate=10**16,
+    total_deliveries=50,
+    tools=("prediction-online",),
+    refreshed_at=100.0,
+)
+# Wider than a 64-bit integer
+OLAS_EXPENSIVE = IndexedMech(
+    "gnosis",
+    "0xccc",
+    3,
+    payment_type="OLAS_TOKEN",
+    max_delivery_rate=10**20,
+    total_deliveries=1,
+    tools=("gpt",),
+    refreshed_at=100.0,
+)
+UNREAD = IndexedMech("gnosis", "0xddd", 4, refreshed_at=100.0)
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> MechIndex:
+    """Create an index of the four mechs above."""
+    mech_index = MechIndex(tmp_path / "index.sqlite3")
+    mech_index.replace(
+        "gnosis", [OLAS_EXPENSIVE, UNREAD, NATIVE_POPULAR, NATIVE_CHEAP], 123.0
+    )
+    return mech_index
+
+
+class TestMechIndex:
+    """Tests for MechIndex."""
+
+    def test_query_orders_cheapest_then_most_delivered(
+        self, index: MechIndex
+    ) -> None:
+        """Test results come cheapest first, then most delivered, unread last."""
+        assert index.query("gnosis") == [
+            NATIVE_POPULAR,
+            NATIVE_CHEAP,
+            OLAS_EXPENSIVE,
+            UNREAD,
+        ]
+
+    def test_query_filters(self, index: MechIndex) -> None:
+        """Test the tool, price, payment type and limit filters."""
+        assert index.query("gnosis", tool="gpt") == [NATIVE_CHEAP, OLAS_EXPENSIVE]
+        assert index.query("gnosis", max_price=10**19) == [
+            NATIVE_POPULAR,
+            NATIVE_CHEAP,
+        ]
+        assert index.query("gnosis", max_price=10**20, payment_type="OLAS_TOKEN") == [
+            OLAS_EXPENSIVE
+        ]
+        assert index.query("gnosis", tool="gpt", max_price=10**15) == []
+        assert index.query("gnosis", limit=1) == [NATIVE_POPULAR]
+
+    def test_replace_is_per_chain(self, index: MechIndex) -> None:
+        """Test refreshing a chain replaces its rows and leaves others alone."""
+        index.replace("base", [IndexedMech("base", "0xeee", 9, tools=("gpt",))])
+        index.replace("gnosis", [NATIVE_CHEAP], 456.0)
+
+        assert index.query("gnosis") == [NATIVE_CHEAP]
+        assert index.query("gnosis", tool="gpt") == [NATIVE_CHEAP]
+        assert list(index.mechs("base")) == ["0xeee"]
+        assert index.refreshed_at("gnosis") == 456.0
+
+    def test_never_indexed_chain(self, tmp_path: Path) -> None:
+        """Test an unknown chain has no rows and no refresh time."""
+        index = MechIndex(tmp_path / "index.sqlite3")
+
+        assert index.query("polygon") == []
+        assert index.refreshed_at("polygon") is None
+
+    def test_unknown_format_version(self, tmp_path: Path) -> None:
+        """Test an index written by an incompatible version is refused."""
+        path = tmp_path / "index.sqlite3"
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA user_version = 99")
+        connection.close()
+
+        with pytest.raises(ValueError, match="format version 99"):
+            MechIndex(path).query("gnosis")
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for Multicall3 call aggregation."""
+
+from unittest.mock import MagicMock, patch
+
+from mech_client.infrastructure.blockchain.multicall import multicall
+
+TARGET = "0x" + "1" * 40
+
+
+@patch("mech_client.infrastructure.blockchain.multicall.get_contract")
+def test_multicall_batches_calls(mock_get_contract: MagicMock) -> None:
+    """Test calls are aggregated per batch and failed calls map to None."""
+    aggregate3 = mock_get_contract.return_value.functions.aggregate3
+    aggregate3.return_value.call.side_effect = [
+        [(True, b"\x01"), (False, b"")],
+        [(True, b"\x03")],
+    ]
+    ledger_api = MagicMock()
+
+    results = multicall(
+        ledger_api, [(TARGET, b"\xaa"), (TARGET, "0xbb"), (TARGET, b"\xcc")], 2
+    )
+
+    assert results == [b"\x01", None, b"\x03"]
+    assert aggregate3.call_count == 2
+    assert aggregate3.call_args_list[0].args[0] == [
+        (TARGET, True, b"\xaa"),
+        (TARGET, True, b"\xbb"),
+    ]
+    ledger_api.api.eth.call.assert_not_called()
+
+
+@patch("mech_client.infrastructure.blockchain.multicall.get_contract")
+def test_multicall_falls_back_to_single_calls(mock_get_contract: MagicMock) -> None:
+    """Test a rejected batch is re-run one eth_call at a time."""
+    aggregate3 = mock_get_contract.return_value.functions.aggregate3
+    aggregate3.return_value.call.side_effect = ValueError("no code at address")
+    ledger_api = MagicMock()
+    ledger_api.api.eth.call.side_effect = [b"\x01", ValueError("reverted")]
+
+    results = multicall(ledger_api, [(TARGET, b"\xaa"), (TARGET, b"\xbb")])
+
+    assert results == [b"\x01", None]
+    assert ledger_api.api.eth.call.call_count == 2
+    assert ledger_api.api.eth.call.call_args_list[0].args[0] == {
+        "to": TARGET,
+        "data": b"\xaa",
+    }
+
+
+@patch("mech_client.infrastructure.blockchain.multicall.get_contract")
+def test_multicall_no_calls(mock_get_contract: MagicMock) -> None:
+    """Test an empty call list makes no request."""
+    assert multicall(MagicMock(), []) == []
+    mock_get_contract.return_value.functions.aggregate3.assert_not_called()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the process-wide nonce manager."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mech_client.infrastructure.blockchain.nonce_manager import (
+    NonceManager,
+    get_nonce_manager,
+    is_nonce_conflict,
+)
+
+SENDER = "0x" + "1" * 40
+
+
+@pytest.fixture
+def manager(mock_ledger_api: MagicMock) -> NonceManager:
+    """Nonce manager seeded at pending count 10."""
+    mock_ledger_api.api.eth.get_transaction_count.return_value = 10
+    return NonceManager(mock_ledger_api)
+
+
+class TestNonceManager:
+    """Tests for NonceManager."""
+
+    def test_seeds_from_pending_count_once(
+        self, manager: NonceManager, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that nonces are allocated locally after one pending read."""
+        assert [manager.reserve(SENDER) for _ in range(3)] == [10, 11, 12]
+        mock_ledger_api.api.eth.get_transaction_count.assert_called_once_with(
+            SENDER, "pending"
+        )
+
+    def test_addresses_are_case_insensitive(self, manager: NonceManager) -> None:
+        """Test that checksummed and lower-case addresses share state."""
+        manager.reserve(SENDER.upper().replace("0X", "0x"))
+        assert manager.reserve(SENDER.lower()) == 11
+
+    def test_release_of_last_nonce_rolls_back(self, manager: NonceManager) -> None:
+        """Test that releasing the newest nonce reuses it next."""
+        nonce = manager.reserve(SENDER)
+        manager.release(SENDER, nonce)
+        assert manager.reserve(SENDER) == 10
+
+    def test_release_in_middle_fills_gap_first(self, manager: NonceManager) -> None:
+        """Test that a released nonce below the high-water mark is reused."""
+        first, second, third = (manager.reserve(SENDER) for _ in range(3))
+        manager.confirm(SENDER, first)
+        manager.confirm(SENDER, third)
+        manager.release(SENDER, second)
+
+        assert manager.peek(SENDER) == 11
+        assert manager.reserve(SENDER) == 11
+        assert manager.reserve(SENDER) == 13
+
+    def test_reserve_batch_is_contiguous(self, manager: NonceManager) -> None:
+        """Test that batches reserve a consecutive range."""
+        assert manager.reserve_batch(SENDER, 5) == 10
+        assert manager.reserve(SENDER) == 15
+        with pytest.raises(ValueError, match="positive"):
+            manager.reserve_batch(SENDER, 0)
+
+    def test_use_resyncs_on_nonce_too_low(
+        self, manager: NonceManager, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that a nonce conflict realigns with the chain."""
+        manager.reserve(SENDER)
+        manager.confirm(SENDER, 10)
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 14
+
+        with pytest.raises(ValueError):
+            with manager.use(SENDER):
+                raise ValueError("nonce too low: next nonce 14, tx nonce 11")
+
+        assert manager.reserve(SENDER) == 14
+
+    def test_use_releases_on_other_errors(self, manager: NonceManager) -> None:
+        """Test that a failed broadcast gives its nonce back."""
+        with pytest.raises(RuntimeError):
+            with manager.use(SENDER) as nonce:
+                assert nonce == 10
+                raise RuntimeError("connection reset")
+
+        with manager.use(SENDER) as nonce:
+            assert nonce == 10
+        assert manager.reserve(SENDER) == 11
+
+    def test_resync_closes_dropped_transaction_gap(
+        self, manager: NonceManager, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that with nothing in flight the pending count wins."""
+        for _ in range(3):
+            manager.confirm(SENDER, manager.reserve(SENDER))
+        # The node dropped the last two transactions.
+        mock_ledger_api.api.eth.get_transaction_count.return_value = 11
+
+        assert manager.resync(SENDER) == 11
+
+
+def test_is_nonce_conflict() -> None:
+    """Test classification of node errors."""
+    assert is_nonce_conflict(ValueError("Nonce too low"))
+    assert is_nonce_conflict(ValueError({"message": "already known"}))
+    assert not is_nonce_conflict(ValueError("insufficient funds"))
+
+
+def test_get_nonce_manager_shared_per_chain() -> None:
+    """Test that one manager is shared per chain ID."""
+    gnosis_a, gnosis_b, base = MagicMock(), MagicMock(), MagicMock()
+    gnosis_a._chain_id = gnosis_b._chain_id = 100
+    base._chain_id = 8453
+
+    assert get_nonce_manager(gnosis_a) is get_nonce_manager(gnosis_b)
+    assert get_nonce_manager(gnosis_a) is not get_nonce_manager(base)
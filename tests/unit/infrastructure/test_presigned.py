@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for pre-signed transaction files."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mech_client.infrastructure.blockchain.broadcast import raw_transaction_hash
+from mech_client.infrastructure.blockchain.presigned import (
+    PresignedTransaction,
+    read_presigned,
+    write_presigned,
+)
+
+
+def _presigned(raw: str = "0x02f8aa", nonce: int = 0) -> PresignedTransaction:
+    """Build a consistent pre-signed transaction."""
+    return PresignedTransaction(
+        chain_id=100,
+        sender="0x" + "a" * 40,
+        nonce=nonce,
+        tx_hash=raw_transaction_hash(raw),
+        raw_transaction=raw,
+        max_fee_per_gas=30,
+        max_priority_fee_per_gas=2,
+        metadata={"kind": "request", "data_hashes": ["0x01"]},
+    )
+
+
+class TestPresignedFiles:
+    """Tests for write_presigned / read_presigned."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test transactions survive a write/read cycle in order."""
+        path = tmp_path / "requests.jsonl"
+        transactions = [_presigned("0x02f8aa", 0), _presigned("0x02f8bb", 1)]
+
+        assert write_presigned(path, transactions) == 2
+        loaded = read_presigned(path)
+
+        assert loaded == transactions
+        assert loaded[0].kind == "request"
+
+    def test_append_and_blank_lines(self, tmp_path: Path) -> None:
+        """Test appending keeps earlier lines and blank lines are skipped."""
+        path = tmp_path / "requests.jsonl"
+        write_presigned(path, [_presigned("0x02f8aa", 0)])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n")
+        write_presigned(path, [_presigned("0x02f8bb", 1)], append=True)
+
+        assert [tx.nonce for tx in read_presigned(path)] == [0, 1]
+
+    def test_hash_mismatch_is_rejected(self, tmp_path: Path) -> None:
+        """Test a line whose hash does not match its raw bytes is refused."""
+        path = tmp_path / "requests.jsonl"
+        record = json.loads(_presigned().to_json())
+        record["raw_transaction"] = "0x02f8bb"
+        path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="requests.jsonl:1: .*does not match"):
+            read_presigned(path)
+
+    def test_unknown_version_is_rejected(self) -> None:
+        """Test lines of another format version are refused."""
+        record = json.loads(_presigned().to_json())
+        record["version"] = 99
+
+        with pytest.raises(ValueError, match="format version 99"):
+            PresignedTransaction.from_json(json.dumps(record))
+
+    def test_malformed_line_is_rejected(self) -> None:
+        """Test non-JSON input raises ValueError."""
+        with pytest.raises(ValueError, match="Malformed"):
+            PresignedTransaction.from_json("not json")
@@ -19,12 +19,22 @@
 
 """Tests for transaction receipt waiting utilities."""
 
+import asyncio
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastError,
+    BroadcastQueue,
+)
 from mech_client.infrastructure.blockchain.receipt_waiter import (
+    ReceiptWaiter,
+    estimate_block_time,
+    fetch_receipts,
+    get_receipt_waiter,
     wait_for_receipt,
+    wait_for_receipt_async,
     watch_for_marketplace_request_ids,
 )
 
@@ -64,10 +74,19 @@ class TestWaitForReceipt:
             expected_receipt,
         ]
 
-        result = wait_for_receipt(tx_hash, mock_ledger_api, timeout=5.0)
+        with patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.time.sleep"
+        ) as mock_sleep:
+            result = wait_for_receipt(
+                tx_hash, mock_ledger_api, timeout=60.0, poll_interval=2.0
+            )
 
         assert result == expected_receipt
         assert mock_ledger_api._api.eth.get_transaction_receipt.call_count == 3
+        # Exponential backoff (x1.5) with +/-20% jitter
+        first, second = (call.args[0] for call in mock_sleep.call_args_list)
+        assert 1.6 <= first <= 2.4
+        assert 2.4 <= second <= 3.6
 
     def test_timeout_exceeded(self, mock_ledger_api: MagicMock) -> None:
         """Test that timeout raises TimeoutError with detailed message."""
@@ -115,6 +134,189 @@ class TestWaitForReceipt:
         assert "RPC endpoint: unknown" in error_msg
 
 
+    def test_raises_broadcast_error_for_rejected_queued_tx(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test a queued transaction the node rejected fails fast."""
+        queue = BroadcastQueue(mock_ledger_api)
+        mock_ledger_api.api.eth.send_raw_transaction.side_effect = ValueError(
+            "intrinsic gas too low"
+        )
+        tx_hash = queue.enqueue(bytes.fromhex("02f8aa"))
+
+        with patch(
+            "mech_client.infrastructure.blockchain.broadcast._queues",
+            {mock_ledger_api._chain_id: queue},  # pylint: disable=protected-access
+        ), pytest.raises(BroadcastError, match="intrinsic gas too low"):
+            wait_for_receipt(tx_hash, mock_ledger_api, timeout=1.0)
+
+        # pylint: disable=protected-access
+        mock_ledger_api._api.eth.get_transaction_receipt.assert_not_called()
+
+
+class TestEstimateBlockTime:
+    """Tests for estimate_block_time."""
+
+    def test_known_chain(self, mock_ledger_api: MagicMock) -> None:
+        """Test that Gnosis uses its ~5s block time."""
+        mock_ledger_api._chain_id = 100
+        assert estimate_block_time(mock_ledger_api) == 5.0
+
+    def test_unknown_chain_uses_default(self, mock_ledger_api: MagicMock) -> None:
+        """Test the default block time for unknown or missing chain IDs."""
+        mock_ledger_api._chain_id = None
+        assert estimate_block_time(mock_ledger_api) == 2.0
+
+
+class TestFetchReceipts:
+    """Tests for fetch_receipts."""
+
+    def test_batch_refetches_only_mined(self, mock_ledger_api: MagicMock) -> None:
+        """Test that one batch call filters pending hashes before formatting."""
+        web3 = mock_ledger_api._api
+        web3.provider.make_batch_request.return_value = [
+            {"id": 0, "result": {"status": "0x1"}},
+            {"id": 1, "result": None},
+        ]
+        web3.eth.get_transaction_receipt.return_value = {"status": 1}
+
+        receipts = fetch_receipts(mock_ledger_api, ["0xaa", "0xbb"])
+
+        assert receipts == {"0xaa": {"status": 1}}
+        web3.provider.make_batch_request.assert_called_once_with(
+            [
+                ("eth_getTransactionReceipt", ["0xaa"]),
+                ("eth_getTransactionReceipt", ["0xbb"]),
+            ]
+        )
+        web3.eth.get_transaction_receipt.assert_called_once_with("0xaa")
+
+    def test_falls_back_when_batch_rejected(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test per-hash lookups when the RPC rejects batch requests."""
+        web3 = mock_ledger_api._api
+        web3.provider.make_batch_request.side_effect = Exception("no batches")
+        web3.eth.get_transaction_receipt.side_effect = [
+            Exception("not found"),
+            {"status": 1},
+        ]
+
+        receipts = fetch_receipts(mock_ledger_api, ["0xaa", "0xbb"])
+
+        assert receipts == {"0xbb": {"status": 1}}
+
+
+class TestReceiptWaiter:
+    """Tests for the asynchronous ReceiptWaiter."""
+
+    @pytest.mark.asyncio
+    async def test_wait_many_resolves_as_receipts_land(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test that hashes resolve on different ticks of one poll loop."""
+        ticks = [{"0xaa": {"status": 1}}, {}, {"0xbb": {"status": 1}}]
+        with patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.fetch_receipts",
+            side_effect=ticks,
+        ) as mock_fetch:
+            waiter = ReceiptWaiter(mock_ledger_api, timeout=5.0, poll_interval=0.01)
+            receipts = await waiter.wait_many(["0xaa", "0xbb", "0xaa"])
+
+        assert receipts == {"0xaa": {"status": 1}, "0xbb": {"status": 1}}
+        assert mock_fetch.call_count == 3
+        # Both hashes were polled together on the first tick
+        assert mock_fetch.call_args_list[0].args[1] == ["0xaa", "0xbb"]
+        assert mock_fetch.call_args_list[2].args[1] == ["0xbb"]
+        assert not waiter.pending
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_future(self, mock_ledger_api: MagicMock) -> None:
+        """Test that a receipt that never lands raises TimeoutError."""
+        mock_ledger_api._api.provider = MagicMock(spec=[])
+        with patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.fetch_receipts",
+            return_value={},
+        ):
+            with pytest.raises(TimeoutError) as exc_info:
+                await ReceiptWaiter(
+                    mock_ledger_api, timeout=0.05, poll_interval=0.01
+                ).wait("0xaa")
+
+        assert "Timeout (0.05s) exceeded" in str(exc_info.value)
+        assert "0xaa" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_receipt_async(self, mock_ledger_api: MagicMock) -> None:
+        """Test the single-hash convenience wrapper."""
+        with patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.fetch_receipts",
+            return_value={"0xaa": {"status": 1}},
+        ):
+            receipt = await wait_for_receipt_async("0xaa", mock_ledger_api)
+
+        assert receipt == {"status": 1}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_share_one_poll(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test concurrent wait_for_receipt_async calls join one polling task."""
+        with patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.fetch_receipts",
+            return_value={"0xaa": {"status": 1}, "0xbb": {"status": 1}},
+        ) as mock_fetch:
+            await asyncio.gather(
+                wait_for_receipt_async("0xaa", mock_ledger_api),
+                wait_for_receipt_async("0xbb", mock_ledger_api),
+            )
+
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args[1] == ["0xaa", "0xbb"]
+        waiter = get_receipt_waiter(mock_ledger_api)
+        assert waiter is get_receipt_waiter(mock_ledger_api)
+        assert not waiter._futures  # pylint: disable=protected-access
+
+    @pytest.mark.asyncio
+    async def test_waiter_shared_across_ledgers_of_a_chain(self) -> None:
+        """Test another EthereumApi on the chain joins the existing waiter."""
+        first = MagicMock(_chain_id=100)
+        waiter = get_receipt_waiter(first)
+
+        assert get_receipt_waiter(MagicMock(_chain_id=100)) is waiter
+        assert waiter.ledger_api is first
+        assert get_receipt_waiter(MagicMock(_chain_id=1)) is not waiter
+
+    @pytest.mark.asyncio
+    async def test_flushes_queued_broadcasts_first(
+        self, mock_ledger_api: MagicMock
+    ) -> None:
+        """Test queued raw transactions go out before polling, rejections fail."""
+        queue = BroadcastQueue(mock_ledger_api)
+        mock_ledger_api.api.provider.make_batch_request.return_value = [
+            {"result": "0x1"},
+            {"error": {"message": "insufficient funds"}},
+        ]
+        ok_hash = queue.enqueue(bytes.fromhex("02f8aa"))
+        bad_hash = queue.enqueue(bytes.fromhex("02f8bb"))
+        with patch(
+            "mech_client.infrastructure.blockchain.broadcast._queues",
+            {mock_ledger_api._chain_id: queue},  # pylint: disable=protected-access
+        ), patch(
+            "mech_client.infrastructure.blockchain.receipt_waiter.fetch_receipts",
+            return_value={ok_hash: {"status": 1}},
+        ) as mock_fetch:
+            waiter = ReceiptWaiter(mock_ledger_api, timeout=5.0, poll_interval=0.01)
+            ok_future = waiter.track(ok_hash)
+            bad_future = waiter.track(bad_hash)
+            assert await ok_future == {"status": 1}
+            with pytest.raises(BroadcastError, match="insufficient funds"):
+                await bad_future
+
+        assert queue.pending == 0
+        assert mock_fetch.call_args.args[1] == [ok_hash]
+
+
 class TestWatchForMarketplaceRequestIds:
     """Tests for watch_for_marketplace_request_ids function."""
 
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the request journal."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from mech_client.infrastructure.journal import (
+    PendingRequest,
+    RequestJournal,
+    default_journal_path,
+)
+
+
+class TestRequestJournal:
+    """Tests for RequestJournal."""
+
+    def test_missing_file_is_empty(self, tmp_path: Path) -> None:
+        """Test a journal that was never written has nothing pending."""
+        journal = RequestJournal(tmp_path / "missing" / "journal.jsonl")
+
+        assert not journal.records()
+        assert not journal.pending()
+
+    def test_pending_until_delivered(self, tmp_path: Path) -> None:
+        """Test submitted requests stay pending until a delivery is recorded."""
+        journal = RequestJournal(tmp_path / "state" / "journal.jsonl")
+        journal.record_submission("gnosis", "0xt1", ["0xAA", "bb"], from_block=10)
+        journal.record_submission("base", "0xt2", ["cc"], from_block=20)
+        journal.record_deliveries("gnosis", {"0xaa": "ipfs://aa"})
+
+        assert journal.pending("gnosis") == [
+            PendingRequest("gnosis", "bb", "0xt1", 10)
+        ]
+        assert [p.request_id for p in journal.pending()] == ["bb", "cc"]
+        assert journal.deliveries() == {"aa": "ipfs://aa"}
+        assert not journal.deliveries("base")
+
+    def test_duplicate_submission_is_pending_once(self, tmp_path: Path) -> None:
+        """Test a request journaled twice is reported once, from its first entry."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_submission("gnosis", "0xt1", ["aa"], from_block=10)
+        journal.record_submission("gnosis", "0xt1", ["aa"], from_block=12)
+
+        assert journal.pending() == [PendingRequest("gnosis", "aa", "0xt1", 10)]
+
+    def test_empty_deliveries_are_not_written(self, tmp_path: Path) -> None:
+        """Test recording no deliveries leaves the journal untouched."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_deliveries("gnosis", {})
+
+        assert not journal.path.exists()
+
+    def test_invalid_line_reports_location(self, tmp_path: Path) -> None:
+        """Test a corrupt line is reported with its line number."""
+        path = tmp_path / "journal.jsonl"
+        journal = RequestJournal(path)
+        journal.record_submission("gnosis", "0xt1", ["aa"], from_block=10)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\nnot json\n")
+
+        with pytest.raises(ValueError, match="journal.jsonl:3: Malformed"):
+            journal.records()
+
+    def test_torn_last_line_is_skipped_and_cut_off(self, tmp_path: Path) -> None:
+        """Test a line torn by a crash is ignored, then replaced by the next append."""
+        path = tmp_path / "journal.jsonl"
+        journal = RequestJournal(path)
+        journal.record_submission("gnosis", "0xt1", ["aa"], from_block=10)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"version": 1, "event": "subm')
+
+        assert [p.request_id for p in journal.pending()] == ["aa"]
+
+        journal.record_submission("gnosis", "0xt2", ["bb"], from_block=11)
+        assert [p.request_id for p in journal.pending()] == ["aa", "bb"]
+        assert path.read_text(encoding="utf-8").count("\n") == 2
+
+    def test_scanned_block_moves_pending_start(self, tmp_path: Path) -> None:
+        """Test a scan checkpoint is where a later watch of the request starts."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_submission("gnosis", "0xt1", ["aa", "bb"], from_block=10)
+        journal.record_scanned("gnosis", ["0xAA"], 50)
+        journal.record_scanned("gnosis", ["aa"], 40)
+
+        assert journal.pending() == [
+            PendingRequest("gnosis", "aa", "0xt1", 50),
+            PendingRequest("gnosis", "bb", "0xt1", 10),
+        ]
+
+    def test_unconfirmed_sent_transactions(self, tmp_path: Path) -> None:
+        """Test sent transactions are unconfirmed until mined or reverted."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_upload("gnosis", ["h1", "h2", "h3"])
+        journal.record_sent("gnosis", "0xt1", ["h1"])
+        journal.record_sent("gnosis", "0xt2", ["h2"])
+        journal.record_sent("gnosis", "0xt3", ["h3"])
+        journal.record_reverted("gnosis", "0xt1", ["h1"])
+        # Mined under a fee-bumped hash: matched by its metadata hashes.
+        journal.record_submission(
+            "gnosis", "0xt2b", ["aa"], from_block=10, data_hashes=["h2"]
+        )
+
+        assert [r.tx_hash for r in journal.unconfirmed()] == ["0xt3"]
+        assert not journal.unconfirmed("base")
+
+    def test_compact_keeps_resumable_state(self, tmp_path: Path) -> None:
+        """Test compaction keeps pending requests and fresh unconfirmed sends."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_upload("gnosis", ["h1", "h2"])
+        journal.record_sent("gnosis", "0xt1", ["h1"])
+        journal.record_submission(
+            "gnosis", "0xt1", ["aa", "bb"], from_block=10, data_hashes=["h1"]
+        )
+        journal.record_sent("gnosis", "0xt2", ["h2"])
+        journal.record_scanned("gnosis", ["bb"], 30)
+        journal.record_deliveries("gnosis", {"aa": "ipfs://aa"})
+        pending, unconfirmed = journal.pending(), journal.unconfirmed()
+
+        assert journal.compact() == 2
+        assert journal.pending() == pending
+        assert journal.unconfirmed() == unconfirmed
+        assert not journal.deliveries()
+        assert not (tmp_path / "journal.jsonl.compact").exists()
+
+    def test_compact_drops_stale_unconfirmed_and_keeps_deliveries(
+        self, tmp_path: Path
+    ) -> None:
+        """Test old unconfirmed sends are dropped and deliveries kept on request."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_sent("gnosis", "0xt1", ["h1"])
+        journal.record_deliveries("gnosis", {"aa": "ipfs://aa"})
+        journal.record_deliveries("gnosis", {"bb": "ipfs://bb"})
+
+        assert journal.compact(keep_deliveries=True, unconfirmed_retention=0) == 1
+        assert not journal.unconfirmed()
+        assert journal.deliveries() == {"aa": "ipfs://aa", "bb": "ipfs://bb"}
+
+    def test_outcomes_pair_mechs_with_deliveries(self, tmp_path: Path) -> None:
+        """Test requests sent to a known mech are paired with who delivered them."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_submission("gnosis", "0xt0", ["00"], from_block=5)
+        journal.record_submission(
+            "gnosis", "0xt1", ["aa", "bb"], from_block=10, mech="0xMech"
+        )
+        journal.record_deliveries(
+            "gnosis", {"0xaa": "ipfs://aa"}, delivered_by={"0xAA": "0xOther"}
+        )
+
+        outcomes = {o.request_id: o for o in journal.outcomes("gnosis")}
+        assert set(outcomes) == {"aa", "bb"}
+        assert outcomes["aa"].mech == "0xMech"
+        assert outcomes["aa"].delivered_by == "0xOther"
+        assert outcomes["aa"].delivered_at >= outcomes["aa"].submitted_at
+        assert outcomes["bb"].delivered_at is None
+        assert not journal.outcomes("base")
+
+    def test_compact_keeps_mech_and_submission_time(self, tmp_path: Path) -> None:
+        """Test compaction preserves what latency statistics rely on."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_submission("gnosis", "0xt1", ["aa"], from_block=10, mech="0xm")
+        before = journal.outcomes()
+
+        journal.compact()
+        assert journal.outcomes() == before
+
+    def test_compact_waits_for_appends(self, tmp_path: Path) -> None:
+        """Test compaction cannot rewrite the file while an append holds it."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        journal.record_sent("gnosis", "0xt1", ["h1"])
+
+        with journal._locked(exclusive=False):  # pylint: disable=protected-access
+            compaction = threading.Thread(target=journal.compact)
+            compaction.start()
+            compaction.join(timeout=0.2)
+            assert compaction.is_alive()
+            # An append racing the compaction lands in the old file...
+            with open(journal.path, "a", encoding="utf-8") as f:
+                f.write(
+                    journal.records()[0].to_json().replace("0xt1", "0xt2") + "\n"
+                )
+        compaction.join(timeout=5)
+
+        # ...and is still there once compaction has run.
+        assert not compaction.is_alive()
+        assert [r.tx_hash for r in journal.unconfirmed()] == ["0xt1", "0xt2"]
+
+    def test_compact_missing_file(self, tmp_path: Path) -> None:
+        """Test compacting a journal that was never written creates nothing."""
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+
+        assert journal.compact() == 0
+        assert not journal.path.exists()
+
+    def test_default_path_from_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test MECHX_JOURNAL_PATH overrides the default location."""
+        monkeypatch.setenv("MECHX_JOURNAL_PATH", str(tmp_path / "j.jsonl"))
+
+        assert default_journal_path() == tmp_path / "j.jsonl"
+        assert RequestJournal().path == tmp_path / "j.jsonl"
@@ -23,13 +23,20 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from hexbytes import HexBytes
+from safe_eth.safe.multi_send import MultiSend, MultiSendOperation
 
+from mech_client.infrastructure.blockchain.gas_model import GasModel
+from mech_client.infrastructure.blockchain.nonce_manager import NonceManager
 from mech_client.infrastructure.blockchain.safe_client import (
     OUTER_TX_GAS_MULTIPLIER,
     OUTER_TX_GAS_OVERHEAD_FLOOR,
     OUTER_TX_GAS_OVERHEAD_SHARE,
+    SAFE_OPERATION_DELEGATE_CALL,
     SafeClient,
 )
+from mech_client.infrastructure.blockchain.safe_nonce_manager import (
+    SafeNonceManager,
+)
 
 from tests.unit.helpers import create_mock_signer
 
@@ -386,6 +393,68 @@ class TestSafeClientSendTransaction:
             )
 
 
+class TestSafeClientSendMultiSend:
+    """Tests for bundling calls through MultiSend."""
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.MultiSend")
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_send_multisend_delegatecalls_library(
+        self, mock_safe_class: MagicMock, mock_multi_send_class: MagicMock
+    ) -> None:
+        """Test calls are encoded in order and delegatecalled in one SafeTx."""
+        multi_send = MultiSend(address=MultiSend.MULTISEND_CALL_ONLY_ADDRESSES[0])
+        mock_multi_send_class.return_value = multi_send
+        mock_safe_instance = MagicMock()
+        mock_safe_class.return_value = mock_safe_instance
+        mock_safe_instance.estimate_tx_gas_with_safe.return_value = 200000
+        mock_safe_instance.build_multisig_tx.return_value = (
+            TestSafeClientSendTransaction._make_safe_tx()  # pylint: disable=protected-access
+        )
+        client = SafeClient(MagicMock(), "0x" + "1" * 40)
+        token = "0x" + "Aa" * 20
+        marketplace = "0x" + "Bb" * 20
+
+        tx_hash = client.send_multisend(
+            [(token, "0x095ea7b3", 0), (marketplace, "0x12345678", 7)],
+            create_mock_signer(),
+        )
+
+        assert tx_hash == HexBytes("0x" + "ff" * 32)
+        build_call = mock_safe_instance.build_multisig_tx.call_args[1]
+        assert build_call["to"] == multi_send.address
+        assert build_call["value"] == 0
+        assert build_call["operation"] == SAFE_OPERATION_DELEGATE_CALL
+        assert (
+            mock_safe_instance.estimate_tx_gas_with_safe.call_args[1]["operation"]
+            == SAFE_OPERATION_DELEGATE_CALL
+        )
+        inner = MultiSend.from_transaction_data(build_call["data"])
+        assert [(tx.to.lower(), tx.value, tx.data.hex()) for tx in inner] == [
+            (token.lower(), 0, "095ea7b3"),
+            (marketplace.lower(), 7, "12345678"),
+        ]
+        assert all(tx.operation == MultiSendOperation.CALL for tx in inner)
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.MultiSend")
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_multi_send_is_detected_once(
+        self, mock_safe_class: MagicMock, mock_multi_send_class: MagicMock
+    ) -> None:
+        """Test the MultiSend deployment is probed once per client."""
+        eth_client = MagicMock()
+        client = SafeClient(eth_client, "0x" + "1" * 40)
+
+        assert client.multi_send is client.multi_send
+        mock_multi_send_class.assert_called_once_with(eth_client, call_only=True)
+
+    def test_send_multisend_rejects_empty_batch(self) -> None:
+        """Test an empty batch raises instead of sending a no-op."""
+        client = SafeClient(MagicMock(), "0x" + "1" * 40)
+
+        with pytest.raises(ValueError, match="At least one call"):
+            client.send_multisend([], create_mock_signer())
+
+
 class TestSafeClientGetNonce:
     """Tests for get_nonce method."""
 
@@ -482,3 +551,133 @@ class TestSafeClientEstimateGas:
         call_args = mock_safe_instance.estimate_tx_gas_with_safe.call_args
         assert call_args[1]["value"] == 0
         assert gas == 100000
+
+
+class TestSafeClientGasModel:
+    """Tests for reusing inner-call gas estimates."""
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_repeated_shape_reuses_estimate(self, mock_safe_class: MagicMock) -> None:
+        """Test the second call of a shape skips estimate_tx_gas_with_safe."""
+        mock_safe_instance = MagicMock()
+        mock_safe_class.return_value = mock_safe_instance
+        mock_safe_instance.estimate_tx_gas_with_safe.return_value = 100000
+        mock_safe_instance.build_multisig_tx.return_value = (
+            TestSafeClientSendTransaction._make_safe_tx()  # pylint: disable=protected-access
+        )
+        client = SafeClient(
+            MagicMock(), "0x" + "1" * 40, gas_model=GasModel(margin=2.0)
+        )
+        to_address = "0x" + "a" * 40
+
+        signer = create_mock_signer()
+
+        client.send_transaction(to_address, "0x1234abcd" + "00" * 32, signer)
+        client.send_transaction(to_address, "0x1234abcd" + "11" * 32, signer)
+        client.send_transaction(to_address, "0x1234abcd" + "00" * 64, signer)
+
+        # Same selector and length reuse the estimate (without the model's
+        # margin); a different calldata length is a new shape.
+        assert mock_safe_instance.estimate_tx_gas_with_safe.call_count == 2
+        outer = mock_safe_instance.build_multisig_tx.return_value.w3_tx
+        second_gas = outer.build_transaction.call_args_list[1][0][0]["gas"]
+        assert second_gas == (
+            int(100000 * OUTER_TX_GAS_MULTIPLIER) + OUTER_TX_GAS_OVERHEAD_FLOOR
+        )
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_outer_fees_from_oracle(self, mock_safe_class: MagicMock) -> None:
+        """Test the outer tx is priced by the fee oracle, not eth_gasPrice."""
+        mock_safe_instance = MagicMock()
+        mock_safe_class.return_value = mock_safe_instance
+        mock_safe_instance.estimate_tx_gas_with_safe.return_value = 100000
+        mock_safe_instance.build_multisig_tx.return_value = (
+            TestSafeClientSendTransaction._make_safe_tx()  # pylint: disable=protected-access
+        )
+        fee_oracle = MagicMock()
+        fee_oracle.fees.return_value = {
+            "maxFeePerGas": 30,
+            "maxPriorityFeePerGas": 3,
+        }
+        client = SafeClient(MagicMock(), "0x" + "1" * 40, fee_oracle=fee_oracle)
+
+        client.send_transaction("0x" + "a" * 40, "0x1234abcd", create_mock_signer())
+
+        outer = mock_safe_instance.build_multisig_tx.return_value.w3_tx
+        outer_params = outer.build_transaction.call_args[0][0]
+        assert outer_params["maxFeePerGas"] == 30
+        assert outer_params["maxPriorityFeePerGas"] == 3
+        assert "gasPrice" not in outer_params
+
+
+class TestSafeClientManagedNonces:
+    """Tests for locally allocated Safe and outer nonces."""
+
+    @staticmethod
+    def _client(mock_safe_class: MagicMock) -> SafeClient:
+        """Build a client with both nonce managers over a Safe at nonce 7.
+
+        :param mock_safe_class: Patched Safe class
+        :return: SafeClient
+        """
+        mock_safe_instance = MagicMock()
+        mock_safe_class.return_value = mock_safe_instance
+        mock_safe_instance.estimate_tx_gas_with_safe.return_value = 100000
+        mock_safe_instance.retrieve_nonce.return_value = 7
+        outer = TestSafeClientSendTransaction._make_safe_tx()  # pylint: disable=protected-access
+        mock_safe_instance.build_multisig_tx.side_effect = lambda **kwargs: (
+            MagicMock(
+                safe_tx_hash=HexBytes(bytes([kwargs["safe_nonce"]]) * 32),
+                w3_tx=outer.w3_tx,
+            )
+        )
+        ledger_api = MagicMock()
+        ledger_api.api.eth.get_transaction_count.return_value = 20
+        return SafeClient(
+            MagicMock(),
+            "0x" + "1" * 40,
+            safe_nonces=SafeNonceManager(),
+            nonce_manager=NonceManager(ledger_api),
+        )
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_queued_transactions_get_sequential_nonces(
+        self, mock_safe_class: MagicMock
+    ) -> None:
+        """Test back-to-back sends get sequential Safe and outer nonces."""
+        client = self._client(mock_safe_class)
+        signer = create_mock_signer()
+
+        for _ in range(3):
+            client.send_transaction("0x" + "a" * 40, "0x1234abcd", signer)
+
+        safe = mock_safe_class.return_value
+        safe_nonces = [
+            call.kwargs["safe_nonce"] for call in safe.build_multisig_tx.call_args_list
+        ]
+        outer_nonces = [
+            call.args[0]["nonce"] for call in signer.send_transaction.call_args_list
+        ]
+        assert safe_nonces == [7, 8, 9]
+        assert outer_nonces == [20, 21, 22]
+        safe.retrieve_nonce.assert_called_once()
+        assert client.get_nonce() == 10
+        assert client.safe_nonces is not None
+        assert client.safe_nonces.pending(client.safe_address) == {
+            nonce: HexBytes(bytes([nonce]) * 32).to_0x_hex() for nonce in (7, 8, 9)
+        }
+
+    @patch("mech_client.infrastructure.blockchain.safe_client.Safe")
+    def test_failed_send_frees_nonces(self, mock_safe_class: MagicMock) -> None:
+        """Test a rejected outer tx gives both nonces back."""
+        client = self._client(mock_safe_class)
+        signer = create_mock_signer()
+        signer.send_transaction.side_effect = [Exception("rejected"), "0x" + "ff" * 32]
+
+        with pytest.raises(Exception, match="rejected"):
+            client.send_transaction("0x" + "a" * 40, "0x1234abcd", signer)
+        client.send_transaction("0x" + "a" * 40, "0x1234abcd", signer)
+
+        safe = mock_safe_class.return_value
+        assert safe.build_multisig_tx.call_args.kwargs["safe_nonce"] == 7
+        assert signer.send_transaction.call_args.args[0]["nonce"] == 20
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the process-wide Safe nonce manager."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.blockchain.safe_nonce_manager import (
+    SafeNonceManager,
+    get_safe_nonce_manager,
+)
+
+SAFE = "0x" + "5" * 40
+
+
+@pytest.fixture
+def read_nonce() -> MagicMock:
+    """On-chain Safe nonce reader returning 7."""
+    return MagicMock(return_value=7)
+
+
+class TestSafeNonceManager:
+    """Tests for SafeNonceManager."""
+
+    def test_allocates_locally_after_one_read(self, read_nonce: MagicMock) -> None:
+        """Test that sequential submissions get sequential nonces."""
+        manager = SafeNonceManager()
+        nonces = []
+        for _ in range(3):
+            with manager.use(SAFE, read_nonce) as nonce:
+                nonces.append(nonce)
+
+        assert nonces == [7, 8, 9]
+        assert manager.peek(SAFE, read_nonce) == 10
+        read_nonce.assert_called_once()
+
+    def test_addresses_are_case_insensitive(self, read_nonce: MagicMock) -> None:
+        """Test that checksummed and lower-case addresses share state."""
+        manager = SafeNonceManager()
+        with manager.use(SAFE.upper().replace("0X", "0x"), read_nonce):
+            pass
+        assert manager.peek(SAFE.lower(), read_nonce) == 8
+
+    def test_failure_resyncs_without_consuming(self, read_nonce: MagicMock) -> None:
+        """Test that a failed submission re-reads the chain and frees the nonce."""
+        manager = SafeNonceManager()
+        with pytest.raises(RuntimeError):
+            with manager.use(SAFE, read_nonce):
+                raise RuntimeError("rejected")
+
+        assert read_nonce.call_count == 2
+        with manager.use(SAFE, read_nonce) as nonce:
+            assert nonce == 7
+
+    def test_track_records_safe_tx_hashes(self, read_nonce: MagicMock) -> None:
+        """Test that tracked hashes are reported as pending by nonce."""
+        manager = SafeNonceManager()
+        with manager.use(SAFE, read_nonce) as nonce:
+            manager.track(SAFE, nonce, "0xaa")
+        with manager.use(SAFE, read_nonce) as nonce:
+            manager.track(SAFE, nonce, "0xbb")
+
+        assert manager.pending(SAFE) == {7: "0xaa", 8: "0xbb"}
+
+    def test_resync_prunes_executed_nonces(self, read_nonce: MagicMock) -> None:
+        """Test that nonces the chain has passed are no longer pending."""
+        manager = SafeNonceManager()
+        for safe_tx_hash in ("0xaa", "0xbb", "0xcc"):
+            with manager.use(SAFE, read_nonce) as nonce:
+                manager.track(SAFE, nonce, safe_tx_hash)
+
+        read_nonce.return_value = 9
+        # Nonce 9 is still pending locally, so the next one stays at 10.
+        assert manager.resync(SAFE, read_nonce) == 10
+        assert manager.pending(SAFE) == {9: "0xcc"}
+
+    def test_stale_view_is_resynced(self, read_nonce: MagicMock) -> None:
+        """Test that an aged view is re-read and dropped pending entries freed."""
+        manager = SafeNonceManager(resync_interval=30.0)
+        with patch(
+            "mech_client.infrastructure.blockchain.safe_nonce_manager.time"
+        ) as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            with manager.use(SAFE, read_nonce) as nonce:
+                manager.track(SAFE, nonce, "0xaa")
+
+            # The outer transaction never landed: after the interval the
+            # chain is still at 7 and the entry is dropped.
+            mock_time.monotonic.return_value = 131.0
+            assert manager.peek(SAFE, read_nonce) == 7
+
+        assert read_nonce.call_count == 2
+        assert not manager.pending(SAFE)
+
+
+class TestGetSafeNonceManager:
+    """Tests for the per-chain registry."""
+
+    def test_shared_per_chain(self) -> None:
+        """Test that the same chain returns the same manager."""
+        gnosis, gnosis_again, base = MagicMock(), MagicMock(), MagicMock()
+        # pylint: disable=protected-access
+        gnosis._chain_id = gnosis_again._chain_id = 100
+        base._chain_id = 8453
+
+        assert get_safe_nonce_manager(gnosis) is get_safe_nonce_manager(gnosis_again)
+        assert get_safe_nonce_manager(gnosis) is not get_safe_nonce_manager(base)
@@ -19,7 +19,9 @@
 
 """Tests for subgraph client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -245,3 +247,213 @@ class TestSubgraphClientQueryMechs:
 
         with pytest.raises(Exception, match="Subgraph unreachable"):
             client.query_mechs()
+
+    @patch("mech_client.infrastructure.subgraph.client.gql")
+    def test_query_mechs_filter_and_limit(self, mock_gql: MagicMock) -> None:
+        """Test the filter and limit are pushed into the query."""
+        client = SubgraphClient(subgraph_url="https://subgraph.example.com/graphql")
+        client._client = MagicMock()
+        client._client.execute.return_value = {"meches": []}
+
+        client.query_mechs(
+            first=20,
+            where={
+                "totalDeliveriesTransactions_gt": "0",
+                "id_gt": "0xab",
+                "_change_block": {"number_gte": 7},
+            },
+        )
+
+        query_str = mock_gql.call_args[1]["request_string"]
+        assert "first: 20" in query_str
+        assert (
+            'where: {totalDeliveriesTransactions_gt: "0", id_gt: "0xab", '
+            "_change_block: {number_gte: 7}}"
+        ) in query_str
+        assert "metadata(first: 1)" in query_str
+
+
+class TestSubgraphClientIterMechs:
+    """Tests for SubgraphClient iter_mechs method."""
+
+    def test_iter_mechs_pages_by_id(self) -> None:
+        """Test pages are fetched after the last ID until a short page."""
+        client = SubgraphClient(subgraph_url="https://subgraph.example.com/graphql")
+        pages = [
+            {"meches": [{"id": "0x01"}, {"id": "0x02"}]},
+            {"meches": [{"id": "0x03"}, {"id": "0x04"}]},
+            {"meches": [{"id": "0x05"}]},
+        ]
+        with patch.object(client, "query_mechs", side_effect=pages) as query:
+            mechs = list(
+                client.iter_mechs(where={"mechFactory": "0xf"}, page_size=2)
+            )
+
+        assert [mech["id"] for mech in mechs] == [f"0x0{i}" for i in range(1, 6)]
+        assert [call.kwargs["where"] for call in query.call_args_list] == [
+            {"mechFactory": "0xf", "id_gt": ""},
+            {"mechFactory": "0xf", "id_gt": "0x02"},
+            {"mechFactory": "0xf", "id_gt": "0x04"},
+        ]
+        assert query.call_args.kwargs["order_by"] == "id"
+        assert query.call_args.kwargs["first"] == 2
+
+    def test_iter_mechs_is_lazy(self) -> None:
+        """Test no further page is fetched until the iteration needs it."""
+        client = SubgraphClient(subgraph_url="https://subgraph.example.com/graphql")
+        with patch.object(
+            client, "query_mechs", return_value={"meches": [{"id": "0x01"}]}
+        ) as query:
+            mechs = client.iter_mechs(page_size=1)
+            assert next(mechs) == {"id": "0x01"}
+
+        query.assert_called_once()
+
+
+def _async_gql_client() -> MagicMock:
+    """Create a mocked gql Client whose async session echoes its queries."""
+    session = MagicMock()
+
+    async def _execute(request: Any) -> Any:
+        await asyncio.sleep(0)
+        return {"query": request}
+
+    session.execute = AsyncMock(side_effect=_execute)
+    session.execute_batch = AsyncMock(side_effect=lambda requests: list(requests))
+    gql_client = MagicMock()
+    gql_client.connect_async = AsyncMock(return_value=session)
+    gql_client.close_async = AsyncMock()
+    return gql_client
+
+
+@patch("mech_client.infrastructure.subgraph.client.gql", side_effect=lambda q: q)
+@patch("mech_client.infrastructure.subgraph.client.AIOHTTPTransport")
+class TestSubgraphClientAsync:
+    """Tests for the SubgraphClient shared async session."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, *_mocks: MagicMock) -> None:
+        """Test several queries connect once and close on exit."""
+        gql_client = _async_gql_client()
+        with patch(
+            "mech_client.infrastructure.subgraph.client.Client",
+            return_value=gql_client,
+        ) as client_class:
+            async with SubgraphClient("https://subgraph.example.com") as client:
+                assert await client.execute_async("{ a }") == {"query": "{ a }"}
+                assert await client.execute_async("{ b }") == {"query": "{ b }"}
+
+        client_class.assert_called_once()
+        gql_client.connect_async.assert_awaited_once()
+        gql_client.close_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_many_async_keeps_order(self, *_mocks: MagicMock) -> None:
+        """Test concurrent queries return their results in query order."""
+        gql_client = _async_gql_client()
+        with patch(
+            "mech_client.infrastructure.subgraph.client.Client",
+            return_value=gql_client,
+        ):
+            client = SubgraphClient("https://subgraph.example.com")
+            results = await client.execute_many_async(["{ a }", "{ b }", "{ c }"])
+            await client.close_async()
+
+        assert results == [{"query": q} for q in ("{ a }", "{ b }", "{ c }")]
+        gql_client.connect_async.assert_awaited_once()
+        gql_client.connect_async.return_value.execute_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_many_async_batch(self, *_mocks: MagicMock) -> None:
+        """Test batch mode sends every query in one batched request."""
+        gql_client = _async_gql_client()
+        with patch(
+            "mech_client.infrastructure.subgraph.client.Client",
+            return_value=gql_client,
+        ), patch(
+            "mech_client.infrastructure.subgraph.client.GraphQLRequest",
+            side_effect=lambda document: document,
+        ):
+            client = SubgraphClient("https://subgraph.example.com")
+            results = await client.execute_many_async(["{ a }", "{ b }"], batch=True)
+
+        session = gql_client.connect_async.return_value
+        session.execute_batch.assert_awaited_once_with(["{ a }", "{ b }"])
+        session.execute.assert_not_called()
+        assert results == ["{ a }", "{ b }"]
+
+    def test_execute_many_closes_session(self, *_mocks: MagicMock) -> None:
+        """Test the synchronous wrapper shares one session and closes it."""
+        gql_client = _async_gql_client()
+        gql_client.connect_async.return_value.execute.side_effect = [
+            {"n": 1},
+            IOError("subgraph down"),
+        ]
+        with patch(
+            "mech_client.infrastructure.subgraph.client.Client",
+            return_value=gql_client,
+        ):
+            client = SubgraphClient("https://subgraph.example.com")
+            assert client.execute_many(["{ a }"]) == [{"n": 1}]
+            with pytest.raises(IOError, match="subgraph down"):
+                client.execute_many(["{ b }"])
+
+        assert gql_client.connect_async.await_count == 2
+        assert gql_client.close_async.await_count == 2
+        assert client._session is None
+
+    def test_pagination_shares_one_session(self, *_mocks: MagicMock) -> None:
+        """Test every page of iter_mechs, and nested calls, use one session."""
+        gql_client = _async_gql_client()
+        gql_client.connect_async.return_value.execute.side_effect = [
+            {"_meta": {"block": {"number": 7}}},
+            {"meches": [{"id": "0xa"}]},
+            {"meches": [{"id": "0xb"}]},
+            {"meches": []},
+        ]
+        with patch(
+            "mech_client.infrastructure.subgraph.client.Client",
+            return_value=gql_client,
+        ):
+            client = SubgraphClient("https://subgraph.example.com")
+            with client.session():
+                assert client.query_block_number() == 7
+                mechs = list(client.iter_mechs(page_size=1))
+
+        assert [m["id"] for m in mechs] == ["0xa", "0xb"]
+        assert gql_client.connect_async.await_count == 1
+        assert gql_client.close_async.await_count == 1
+        assert client._session is None
+        assert client._sync_loop is None
+
+
+class TestSubgraphClientQueryRequests:
+    """Tests for SubgraphClient query_requests method."""
+
+    def test_one_query_per_mech(self) -> None:
+        """Test each mech gets its own filtered query, run together."""
+        client = SubgraphClient(subgraph_url="https://subgraph.example.com/graphql")
+        with patch.object(
+            client,
+            "execute_many",
+            return_value=[{"requests": [{"requestId": "0x01"}]}, {}],
+        ) as execute_many:
+            result = client.query_requests(["0xAA", "0xbb"], since=1000, first=5)
+
+        assert result == {"0xAA": [{"requestId": "0x01"}], "0xbb": []}
+        queries = execute_many.call_args.args[0]
+        assert len(queries) == 2
+        assert (
+            'where: {priorityMech: "0xaa", blockTimestamp_gt: "1000"}' in queries[0]
+        )
+        assert "delivery { mech blockTimestamp }" in queries[0]
+        assert "first: 5" in queries[1]
+        assert "orderBy: blockTimestamp" in queries[1]
+
+    def test_no_mechs_no_query(self) -> None:
+        """Test nothing is queried without mechs."""
+        client = SubgraphClient(subgraph_url="https://subgraph.example.com/graphql")
+        with patch.object(client, "execute_many") as execute_many:
+            assert client.query_requests([]) == {}
+
+        execute_many.assert_not_called()
@@ -26,6 +26,7 @@ import pytest
 from mech_client.infrastructure.subgraph.queries import (
     CHAIN_TO_MECH_FACTORY_TO_MECH_TYPE,
     RESULTS_LIMIT,
+    query_mech_requests,
     query_mm_mechs_info,
 )
 
@@ -435,3 +436,113 @@ class TestQueryMmMechsInfo:
         assert result[0]["service"]["totalDeliveries"] == "5"
         assert result[0]["service"]["metadata"][0]["metadata"] == "0x1234567890abcdef"
         assert result[0]["mech_type"] == "Fixed Price Native"
+
+    @patch("mech_client.infrastructure.subgraph.queries.SubgraphClient")
+    @patch("mech_client.infrastructure.subgraph.queries.get_mech_config")
+    def test_query_mechs_pushes_filter_and_limit(
+        self, mock_get_config: MagicMock, mock_subgraph_client: MagicMock
+    ) -> None:
+        """Test the delivery filter and the limit are applied by the subgraph."""
+        mock_get_config.return_value.subgraph_url = "https://subgraph.example.com"
+        mock_subgraph_client.return_value.query_mechs.return_value = {"meches": []}
+
+        query_mm_mechs_info("gnosis", limit=5)
+
+        mock_subgraph_client.return_value.query_mechs.assert_called_once_with(
+            first=5, where={"totalDeliveriesTransactions_gt": "0"}
+        )
+
+    @patch("mech_client.infrastructure.subgraph.queries.SubgraphClient")
+    @patch("mech_client.infrastructure.subgraph.queries.get_mech_config")
+    def test_query_all_mechs_iterates_pages(
+        self, mock_get_config: MagicMock, mock_subgraph_client: MagicMock
+    ) -> None:
+        """Test an unlimited listing iterates every page, most delivered first."""
+        mock_get_config.return_value.subgraph_url = "https://subgraph.example.com"
+        mock_subgraph_client.return_value.iter_mechs.return_value = iter(
+            [
+                {
+                    "id": mech_id,
+                    "mechFactory": "0x8b299c20F87e3fcBfF0e1B86dC0acC06AB6993EF",
+                    "totalDeliveriesTransactions": deliveries,
+                }
+                for mech_id, deliveries in (("0x1", "2"), ("0x2", "9"))
+            ]
+        )
+
+        result = query_mm_mechs_info("gnosis", limit=None)
+
+        assert [item["id"] for item in result] == ["0x2", "0x1"]
+        assert result[0]["mech_type"] == "Fixed Price Native"
+        mock_subgraph_client.return_value.iter_mechs.assert_called_once_with(
+            where={"totalDeliveriesTransactions_gt": "0"}
+        )
+        mock_subgraph_client.return_value.query_mechs.assert_not_called()
+
+    @patch("mech_client.infrastructure.subgraph.queries.SubgraphSync")
+    @patch("mech_client.infrastructure.subgraph.queries.get_mech_config")
+    def test_query_mechs_from_snapshot(
+        self, mock_get_config: MagicMock, mock_sync: MagicMock
+    ) -> None:
+        """Test listing from the snapshot filters, sorts and limits locally."""
+        mock_get_config.return_value.subgraph_url = "https://subgraph.example.com"
+        factory = "0x8b299c20F87e3fcBfF0e1B86dC0acC06AB6993EF"
+        mock_sync.return_value.snapshot.return_value.mechs = {
+            mech_id: {
+                "id": mech_id,
+                "mechFactory": factory,
+                "totalDeliveriesTransactions": deliveries,
+            }
+            for mech_id, deliveries in (("0x1", "2"), ("0x2", "0"), ("0x3", "9"))
+        }
+
+        result = query_mm_mechs_info("gnosis", limit=1, snapshot=True, refresh=True)
+
+        assert [item["id"] for item in result] == ["0x3"]
+        assert result[0]["mech_type"] == "Fixed Price Native"
+        mock_sync.assert_called_once_with("gnosis", "https://subgraph.example.com")
+        mock_sync.return_value.snapshot.assert_called_once_with(force=True)
+
+
+class TestQueryMechRequests:
+    """Tests for query_mech_requests function."""
+
+    @patch("mech_client.infrastructure.subgraph.queries.SubgraphClient")
+    @patch("mech_client.infrastructure.subgraph.queries.get_mech_config")
+    def test_requests_are_normalized(
+        self, mock_get_config: MagicMock, mock_subgraph_client: MagicMock
+    ) -> None:
+        """Test requests are flattened, undelivered ones included."""
+        mock_get_config.return_value.subgraph_url = "https://subgraph.example.com"
+        mock_subgraph_client.return_value.query_requests.return_value = {
+            "0xAA": [
+                {
+                    "requestId": "0xABCD",
+                    "blockTimestamp": "1000",
+                    "delivery": {"mech": "0xBB", "blockTimestamp": "1060"},
+                },
+                {"requestId": "0xef", "blockTimestamp": "1100", "delivery": None},
+            ]
+        }
+
+        result = query_mech_requests("gnosis", ["0xAA"], since=900.5)
+
+        assert result == [
+            {
+                "request_id": "abcd",
+                "priority_mech": "0xaa",
+                "requested_at": 1000.0,
+                "delivered_by": "0xbb",
+                "delivered_at": 1060.0,
+            },
+            {
+                "request_id": "ef",
+                "priority_mech": "0xaa",
+                "requested_at": 1100.0,
+                "delivered_by": None,
+                "delivered_at": None,
+            },
+        ]
+        mock_subgraph_client.return_value.query_requests.assert_called_once_with(
+            ["0xAA"], since=900
+        )
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the incremental subgraph sync."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.subgraph.sync import SubgraphSync
+
+URL = "https://subgraph.example.com/gnosis"
+
+
+def _mech(mech_id: str, deliveries: int) -> Dict[str, Any]:
+    """Return subgraph mech data."""
+    return {"id": mech_id, "totalDeliveriesTransactions": str(deliveries)}
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary time."""
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def client() -> Iterator[MagicMock]:
+    """Patch the subgraph client."""
+    with patch("mech_client.infrastructure.subgraph.sync.SubgraphClient") as mock:
+        yield mock.return_value
+
+
+def _sync(tmp_path: Path, clock: FakeClock, url: str = URL) -> SubgraphSync:
+    """Create a sync with a 60 s interval."""
+    return SubgraphSync("gnosis", url, tmp_path, interval=60, clock=clock)
+
+
+def _iter(*mechs: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Return an iterator over mech data."""
+    return iter(list(mechs))
+
+
+class TestSubgraphSync:
+    """Tests for SubgraphSync."""
+
+    def test_first_sync_fetches_everything(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an empty snapshot is filled with every mech, then reused."""
+        clock = FakeClock()
+        client.query_block_number.return_value = 100
+        client.iter_mechs.return_value = _iter(_mech("0x1", 1), _mech("0x2", 0))
+
+        snapshot = _sync(tmp_path, clock).snapshot()
+        assert snapshot.block == 100
+        assert list(snapshot.mechs) == ["0x1", "0x2"]
+        client.iter_mechs.assert_called_once_with()
+
+        # Within the interval a new process reads the file without querying
+        clock.now += 30
+        assert _sync(tmp_path, clock).snapshot() == snapshot
+        client.query_block_number.assert_called_once()
+
+    def test_later_syncs_fetch_changes_only(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a due sync merges the mechs changed since the last block."""
+        clock = FakeClock()
+        client.query_block_number.side_effect = [100, 150]
+        client.iter_mechs.side_effect = [
+            _iter(_mech("0x1", 1), _mech("0x2", 0)),
+            _iter(_mech("0x2", 4), _mech("0x3", 1)),
+        ]
+        sync = _sync(tmp_path, clock)
+        sync.snapshot()
+
+        clock.now += 61
+        snapshot = sync.snapshot()
+
+        assert client.iter_mechs.call_args.kwargs == {
+            "where": {"_change_block": {"number_gte": 100}}
+        }
+        assert snapshot.block == 150
+        assert snapshot.mechs == {
+            "0x1": _mech("0x1", 1),
+            "0x2": _mech("0x2", 4),
+            "0x3": _mech("0x3", 1),
+        }
+
+    def test_force_syncs_within_interval(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test forcing a sync ignores the interval."""
+        client.query_block_number.side_effect = [100, 101]
+        client.iter_mechs.side_effect = [_iter(), _iter()]
+        sync = _sync(tmp_path, FakeClock())
+        sync.snapshot()
+
+        assert sync.snapshot(force=True).block == 101
+
+    def test_failed_sync_serves_previous_snapshot(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a failing subgraph falls back to the stored snapshot."""
+        client.query_block_number.side_effect = [100, IOError("subgraph down")]
+        client.iter_mechs.return_value = _iter(_mech("0x1", 1))
+        sync = _sync(tmp_path, FakeClock())
+        sync.snapshot()
+
+        assert list(sync.snapshot(force=True).mechs) == ["0x1"]
+
+    def test_failed_first_sync_raises(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test there is nothing to fall back on without a snapshot."""
+        client.query_block_number.side_effect = IOError("subgraph down")
+
+        with pytest.raises(IOError, match="subgraph down"):
+            _sync(tmp_path, FakeClock()).snapshot()
+
+    def test_snapshot_of_another_subgraph_is_ignored(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test switching the subgraph URL triggers a full sync."""
+        client.query_block_number.return_value = 100
+        mechs: List[Iterator[Dict[str, Any]]] = [_iter(_mech("0x1", 1)), _iter()]
+        client.iter_mechs.side_effect = mechs
+        clock = FakeClock()
+        _sync(tmp_path, clock).snapshot()
+
+        snapshot = _sync(tmp_path, clock, url="https://other.example.com").snapshot()
+
+        assert snapshot.mechs == {}
+        assert client.iter_mechs.call_args.kwargs == {}
+
+    def test_corrupt_snapshot_is_ignored(
+        self, client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an unreadable snapshot file is treated as missing."""
+        (tmp_path / "gnosis.json").write_text("{not json", encoding="utf-8")
+
+        assert _sync(tmp_path, FakeClock()).load().block is None
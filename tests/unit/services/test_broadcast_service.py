@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for broadcast service."""
+
+from typing import Any, Dict, List, Sequence
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.blockchain.broadcast import (
+    BroadcastResult,
+    raw_transaction_hash,
+)
+from mech_client.infrastructure.blockchain.presigned import PresignedTransaction
+from mech_client.infrastructure.config.chain_config import LedgerConfig
+from mech_client.services.broadcast_service import BroadcastService
+
+SENDER_A = "0x" + "a" * 40
+SENDER_B = "0x" + "b" * 40
+
+
+def _presigned(
+    nonce: int, sender: str = SENDER_A, kind: str = "request"
+) -> PresignedTransaction:
+    """Build a pre-signed transaction with a unique raw payload."""
+    raw = "0x02" + sender[2:4] + f"{nonce:04x}"
+    return PresignedTransaction(
+        chain_id=100,
+        sender=sender,
+        nonce=nonce,
+        tx_hash=raw_transaction_hash(raw),
+        raw_transaction=raw,
+        metadata={"kind": kind},
+    )
+
+
+@pytest.fixture
+def service() -> BroadcastService:
+    """Create a BroadcastService on a mocked chain."""
+    mech_config = MagicMock()
+    mech_config.ledger_config = LedgerConfig(
+        address="https://rpc.example.com",
+        chain_id=100,
+        poa_chain=False,
+        default_gas_price_strategy="eip1559",
+        is_gas_estimation_enabled=True,
+    )
+    mech_config.mech_marketplace_contract = "0x" + "2" * 40
+    with patch(
+        "mech_client.services.broadcast_service.get_mech_config",
+        return_value=mech_config,
+    ), patch("mech_client.services.broadcast_service.EthereumApi"):
+        return BroadcastService("gnosis")
+
+
+def _accept_all(
+    _ledger_api: Any, raws: Sequence[str], _batch_size: int
+) -> List[BroadcastResult]:
+    """Fake send_raw_transactions that accepts everything."""
+    return [BroadcastResult(raw_transaction_hash(raw)) for raw in raws]
+
+
+class TestBroadcastService:
+    """Tests for BroadcastService.broadcast."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_collects_request_ids_and_deliveries(
+        self, service: BroadcastService
+    ) -> None:
+        """Test the full path: send, receipts, request IDs, deliveries."""
+        transactions = [_presigned(0, kind="approve"), _presigned(1), _presigned(2)]
+        receipts: Dict[str, Dict] = {
+            tx.tx_hash: {"status": 1, "blockNumber": 10 + tx.nonce}
+            for tx in transactions
+        }
+        waiter = MagicMock()
+        waiter.wait = AsyncMock(side_effect=lambda tx_hash: receipts[tx_hash])
+        watcher = MagicMock()
+        watcher.watch = AsyncMock(return_value={"r1": "ipfs://1"})
+
+        with patch(
+            "mech_client.services.broadcast_service.send_raw_transactions",
+            side_effect=_accept_all,
+        ), patch(
+            "mech_client.services.broadcast_service.get_receipt_waiter",
+            return_value=waiter,
+        ), patch(
+            "mech_client.services.broadcast_service.watch_for_marketplace_request_ids",
+            side_effect=lambda _c, _api, tx_hash, tx_receipt: [
+                f"r{receipts[tx_hash]['blockNumber'] - 10}"
+            ],
+        ), patch(
+            "mech_client.services.broadcast_service.get_contract"
+        ), patch(
+            "mech_client.services.broadcast_service.OnchainDeliveryWatcher",
+            return_value=watcher,
+        ):
+            result = await service.broadcast(transactions)
+
+        assert [o.status for o in result["outcomes"]] == ["mined"] * 3
+        # Only request transactions carry request IDs.
+        assert result["request_ids"] == ["r1", "r2"]
+        watcher.watch.assert_awaited_once_with(["r1", "r2"], from_block=11)
+        assert result["delivery_results"] == {"r1": "ipfs://1"}
+
+    @pytest.mark.asyncio
+    async def test_rejection_skips_later_transactions_of_sender(
+        self, service: BroadcastService
+    ) -> None:
+        """Test a rejected nonce blocks its sender but not other senders."""
+        transactions = [
+            _presigned(0),
+            _presigned(0, sender=SENDER_B),
+            _presigned(1),
+            _presigned(1, sender=SENDER_B),
+        ]
+        rejected = transactions[0].tx_hash
+
+        def _send(
+            _api: Any, raws: Sequence[str], _size: int
+        ) -> List[BroadcastResult]:
+            return [
+                BroadcastResult(
+                    h, "insufficient funds" if h == rejected else None
+                )
+                for h in map(raw_transaction_hash, raws)
+            ]
+
+        waiter = MagicMock()
+        waiter.wait = AsyncMock(return_value={"status": 1, "blockNumber": 5})
+        with patch(
+            "mech_client.services.broadcast_service.send_raw_transactions",
+            side_effect=_send,
+        ), patch(
+            "mech_client.services.broadcast_service.get_receipt_waiter",
+            return_value=waiter,
+        ), patch(
+            "mech_client.services.broadcast_service.watch_for_marketplace_request_ids",
+            return_value=[],
+        ), patch(
+            "mech_client.services.broadcast_service.get_contract"
+        ):
+            result = await service.broadcast(transactions, batch_size=2)
+
+        statuses = [o.status for o in result["outcomes"]]
+        assert statuses == ["rejected", "mined", "skipped", "mined"]
+        assert result["outcomes"][0].error == "insufficient funds"
+
+    @pytest.mark.asyncio
+    async def test_rejection_within_a_batch_stops_its_sender(
+        self, service: BroadcastService
+    ) -> None:
+        """Test a sender's next nonce is only sent once the previous is accepted."""
+        transactions = [_presigned(0), _presigned(1), _presigned(0, sender=SENDER_B)]
+        rejected = transactions[0].tx_hash
+        batches: List[List[str]] = []
+
+        def _send(
+            _api: Any, raws: Sequence[str], _size: int
+        ) -> List[BroadcastResult]:
+            batches.append([raw_transaction_hash(raw) for raw in raws])
+            return [
+                BroadcastResult(h, "nonce too low" if h == rejected else None)
+                for h in batches[-1]
+            ]
+
+        waiter = MagicMock()
+        waiter.wait = AsyncMock(return_value={"status": 1, "blockNumber": 5})
+        with patch(
+            "mech_client.services.broadcast_service.send_raw_transactions",
+            side_effect=_send,
+        ), patch(
+            "mech_client.services.broadcast_service.get_receipt_waiter",
+            return_value=waiter,
+        ), patch(
+            "mech_client.services.broadcast_service.watch_for_marketplace_request_ids",
+            return_value=[],
+        ), patch(
+            "mech_client.services.broadcast_service.get_contract"
+        ):
+            result = await service.broadcast(transactions)
+
+        assert batches == [[rejected, transactions[2].tx_hash]]
+        statuses = [o.status for o in result["outcomes"]]
+        assert statuses == ["rejected", "skipped", "mined"]
+
+    @pytest.mark.asyncio
+    async def test_already_known_counts_as_sent(
+        self, service: BroadcastService
+    ) -> None:
+        """Test re-broadcasting a transaction the node holds is not a failure."""
+        transaction = _presigned(0, kind="approve")
+        waiter = MagicMock()
+        waiter.wait = AsyncMock(return_value={"status": 0, "blockNumber": 5})
+        with patch(
+            "mech_client.services.broadcast_service.send_raw_transactions",
+            return_value=[BroadcastResult(transaction.tx_hash, "already known")],
+        ), patch(
+            "mech_client.services.broadcast_service.get_receipt_waiter",
+            return_value=waiter,
+        ):
+            result = await service.broadcast([transaction])
+
+        assert result["outcomes"][0].status == "reverted"
+        assert result["request_ids"] == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_chunks(self, service: BroadcastService) -> None:
+        """Test a rate below the batch size shrinks chunks and sleeps between."""
+        transactions = [
+            _presigned(nonce // 2, sender=(SENDER_A, SENDER_B)[nonce % 2])
+            for nonce in range(5)
+        ]
+        chunks: List[int] = []
+
+        def _send(
+            _api: Any, raws: Sequence[str], _size: int
+        ) -> List[BroadcastResult]:
+            chunks.append(len(raws))
+            return _accept_all(_api, raws, _size)
+
+        waiter = MagicMock()
+        waiter.wait = AsyncMock(side_effect=TimeoutError("no receipt"))
+        with patch(
+            "mech_client.services.broadcast_service.send_raw_transactions",
+            side_effect=_send,
+        ), patch(
+            "mech_client.services.broadcast_service.get_receipt_waiter",
+            return_value=waiter,
+        ), patch(
+            "mech_client.services.broadcast_service.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await service.broadcast(transactions, rate=2)
+
+        assert chunks == [2, 2, 1]
+        assert mock_sleep.await_count == 2
+        assert all(o.status == "timeout" for o in result["outcomes"])
+
+    @pytest.mark.asyncio
+    async def test_rejects_other_chain(self, service: BroadcastService) -> None:
+        """Test transactions signed for another chain are refused up front."""
+        transaction = _presigned(0)
+        transaction.chain_id = 8453
+
+        with pytest.raises(ValueError, match="signed for chain 8453"):
+            await service.broadcast([transaction])
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for delivery service."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from mech_client.infrastructure.config.chain_config import LedgerConfig
+from mech_client.infrastructure.journal import PendingRequest, RequestJournal
+from mech_client.services.delivery_service import COLLECT_TIMEOUT, DeliveryService
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> RequestJournal:
+    """Journal with three gnosis requests, one already delivered."""
+    journal = RequestJournal(tmp_path / "journal.jsonl")
+    journal.record_submission("gnosis", "0xt1", ["aa", "bb"], from_block=12)
+    journal.record_submission("gnosis", "0xt2", ["cc"], from_block=10)
+    journal.record_submission("base", "0xt3", ["dd"], from_block=5)
+    journal.record_deliveries("gnosis", {"aa": "ipfs://aa"})
+    return journal
+
+
+@pytest.fixture
+def service(journal: RequestJournal) -> DeliveryService:
+    """Create a DeliveryService on a mocked chain."""
+    mech_config = MagicMock()
+    mech_config.ledger_config = LedgerConfig(
+        address="https://rpc.example.com",
+        chain_id=100,
+        poa_chain=False,
+        default_gas_price_strategy="eip1559",
+        is_gas_estimation_enabled=True,
+    )
+    mech_config.mech_marketplace_contract = "0x" + "2" * 40
+    with patch(
+        "mech_client.services.delivery_service.get_mech_config",
+        return_value=mech_config,
+    ), patch("mech_client.services.delivery_service.EthereumApi"):
+        service = DeliveryService("gnosis", journal)
+    service.ledger_api.api.eth.block_number = 40
+    return service
+
+
+class TestDeliveryService:
+    """Tests for DeliveryService."""
+
+    @pytest.mark.asyncio
+    async def test_watch_resumes_pending_from_earliest_block(
+        self, service: DeliveryService, journal: RequestJournal
+    ) -> None:
+        """Test only undelivered IDs of the chain are watched, and results kept."""
+        watcher = MagicMock()
+        watcher.watch = AsyncMock(return_value={"cc": "ipfs://cc"})
+        with patch(
+            "mech_client.services.delivery_service.OnchainDeliveryWatcher",
+            return_value=watcher,
+        ) as mock_watcher_cls, patch(
+            "mech_client.services.delivery_service.get_contract"
+        ):
+            results = await service.watch(timeout=60)
+
+        assert results == {"cc": "ipfs://cc"}
+        watcher.watch.assert_awaited_once_with(["bb", "cc"], from_block=10)
+        assert mock_watcher_cls.call_args.args[2] == 60
+        assert journal.pending("gnosis") == [
+            PendingRequest("gnosis", "bb", "0xt1", 40)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_watch_without_pending_does_nothing(
+        self, service: DeliveryService
+    ) -> None:
+        """Test nothing is watched when every request was delivered."""
+        with patch(
+            "mech_client.services.delivery_service.OnchainDeliveryWatcher"
+        ) as mock_watcher_cls:
+            assert await service.watch(request_ids=["0xAA"]) == {}
+
+        mock_watcher_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_collect_reports_all_journaled_deliveries(
+        self, service: DeliveryService
+    ) -> None:
+        """Test collect does one short pass and returns every delivery."""
+        watcher = MagicMock()
+        watcher.watch = AsyncMock(return_value={"bb": "ipfs://bb"})
+        with patch(
+            "mech_client.services.delivery_service.OnchainDeliveryWatcher",
+            return_value=watcher,
+        ) as mock_watcher_cls, patch(
+            "mech_client.services.delivery_service.get_contract"
+        ):
+            results = await service.collect()
+
+        assert results == {"aa": "ipfs://aa", "bb": "ipfs://bb"}
+        assert mock_watcher_cls.call_args.args[2] == COLLECT_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_watch_resumes_sent_transactions(
+        self, service: DeliveryService, journal: RequestJournal
+    ) -> None:
+        """Test sent transactions without a receipt are looked up, not resent."""
+        journal.record_sent("gnosis", "0xt4", ["h4"])
+        journal.record_sent("gnosis", "0xt5", ["h5"])
+        journal.record_sent("gnosis", "0xt6", ["h6"])
+        receipts = {
+            "0xt4": {"status": 1, "blockNumber": 30},
+            "0xt5": {"status": 0, "blockNumber": 31},
+        }
+
+        def _receipt(tx_hash: str) -> dict:
+            if tx_hash not in receipts:
+                raise TransactionNotFound(tx_hash)
+            return receipts[tx_hash]
+
+        service.ledger_api.api.eth.get_transaction_receipt.side_effect = _receipt
+        watcher = MagicMock()
+        watcher.watch = AsyncMock(return_value={})
+        with patch(
+            "mech_client.services.delivery_service.OnchainDeliveryWatcher",
+            return_value=watcher,
+        ), patch("mech_client.services.delivery_service.get_contract"), patch(
+            "mech_client.services.delivery_service.watch_for_marketplace_request_ids",
+            return_value=["ee"],
+        ):
+            await service.watch(timeout=1)
+
+        watcher.watch.assert_awaited_once_with(["bb", "cc", "ee"], from_block=10)
+        assert [r.tx_hash for r in journal.unconfirmed("gnosis")] == ["0xt6"]
+        assert journal.pending("gnosis")[-1] == PendingRequest(
+            "gnosis", "ee", "0xt4", 40
+        )
+
+    def test_resume_sent_follows_fee_bumped_replacement(
+        self, service: DeliveryService, journal: RequestJournal
+    ) -> None:
+        """Test a journaled replacement hash recovers the requests and mech."""
+        journal.record_sent("gnosis", "0xorig", ["h7"], mech="0xmech")
+        journal.record_sent("gnosis", "0xbump", ["h7"], mech="0xmech")
+        sent_at = journal.unconfirmed("gnosis")[-1].timestamp
+        lookups = []
+
+        def _receipt(tx_hash: str) -> dict:
+            lookups.append(tx_hash)
+            if tx_hash != "0xbump":
+                raise TransactionNotFound(tx_hash)
+            return {"status": 1, "blockNumber": 50}
+
+        service.ledger_api.api.eth.get_transaction_receipt.side_effect = _receipt
+        with patch("mech_client.services.delivery_service.get_contract"), patch(
+            "mech_client.services.delivery_service.watch_for_marketplace_request_ids",
+            return_value=["ff"],
+        ):
+            assert service.resume_sent() == ["ff"]
+
+        assert lookups == ["0xorig", "0xbump"]
+        assert not journal.unconfirmed("gnosis")
+        assert journal.pending("gnosis")[-1].tx_hash == "0xbump"
+        outcome = journal.outcomes("gnosis")[-1]
+        assert (outcome.request_id, outcome.mech) == ("ff", "0xmech")
+        assert outcome.submitted_at == sent_at
+
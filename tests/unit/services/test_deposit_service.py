@@ -23,11 +23,13 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from mech_client.domain.signing import LocalSigner
+from mech_client.domain.signing import LocalSigner, SignerPool
 from mech_client.infrastructure.config import PaymentType
 from mech_client.infrastructure.config.chain_config import LedgerConfig
 from mech_client.services.deposit_service import DepositService
 
+from tests.unit.helpers import create_mock_signer
+
 
 def create_mock_mech_config() -> MagicMock:
     """
@@ -132,6 +134,12 @@ class TestDepositServiceInitialization:
         assert service.safe_address == safe_address
         assert service.ethereum_client == mock_ethereum_client
 
+    def test_signer_pool_rejected(self) -> None:
+        """Test a SignerPool is refused: deposits do not lease one key."""
+        pool = SignerPool([create_mock_signer()])
+        with pytest.raises(ValueError, match="does not support a SignerPool"):
+            DepositService(chain_config="gnosis", agent_mode=False, signer=pool)
+
 
 class TestDepositNative:
     """Tests for deposit_native method."""
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for index service."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from eth_abi import encode as abi_encode
+
+from mech_client.domain.tools import ToolInfo, ToolsForMarketplaceMech
+from mech_client.infrastructure.config.payment_config import PaymentType
+from mech_client.infrastructure.index import MechIndex
+from mech_client.services.index_service import IndexService
+
+
+def _listed(address: str, service_id: int, deliveries: int) -> Dict[str, Any]:
+    """Return a subgraph mech item."""
+    return {
+        "address": address,
+        "mech_type": "Fixed Price Native",
+        "service": {"id": str(service_id), "totalDeliveries": str(deliveries)},
+    }
+
+
+def _mech_info(payment_type: PaymentType, price: int) -> List[Optional[bytes]]:
+    """Return encoded paymentType() and maxDeliveryRate() results."""
+    return [
+        abi_encode(["bytes32"], [bytes.fromhex(payment_type.value)]),
+        abi_encode(["uint256"], [price]),
+    ]
+
+
+def _tools(service_id: int, *names: str) -> ToolsForMarketplaceMech:
+    """Return a service's tools."""
+    return ToolsForMarketplaceMech(
+        service_id=service_id,
+        tools=[ToolInfo(name, f"{service_id}-{name}") for name in names],
+    )
+
+
+@pytest.fixture
+def network() -> Iterator[Dict[str, MagicMock]]:
+    """Patch the subgraph, tool manager and Multicall3."""
+    module = "mech_client.services.index_service"
+    with (
+        patch(f"{module}.query_mm_mechs_info") as query,
+        patch(f"{module}.ToolManager") as tool_manager,
+        patch(f"{module}.multicall") as multicall,
+        patch(f"{module}.get_contract"),
+        patch(f"{module}.get_abi"),
+    ):
+        yield {"query": query, "tool_manager": tool_manager, "multicall": multicall}
+
+
+class TestIndexService:
+    """Tests for IndexService."""
+
+    def test_refresh_and_query(
+        self, network: Dict[str, MagicMock], tmp_path: Path
+    ) -> None:
+        """Test a refresh indexes mechs that can then be queried offline."""
+        network["query"].return_value = [
+            _listed("0xaaa", 1, 10),
+            _listed("0xbbb", 2, 20),
+        ]
+        network["multicall"].return_value = [
+            *_mech_info(PaymentType.NATIVE, 10**16),
+            None,
+            None,
+        ]
+        network["tool_manager"].return_value.get_tools_for_services.return_value = {
+            1: _tools(1, "gpt", "prediction-online"),
+        }
+        service = IndexService("gnosis", MechIndex(tmp_path / "index.sqlite3"))
+
+        assert service.refresh() == (2, 2)
+
+        network["query"].assert_called_once_with(
+            "gnosis", limit=None, snapshot=True
+        )
+        network[
+            "tool_manager"
+        ].return_value.get_tools_for_services.assert_called_once_with([1, 2])
+        mechs = service.query()
+        assert [mech.address for mech in mechs] == ["0xaaa", "0xbbb"]
+        assert mechs[0].payment_type == "NATIVE"
+        assert mechs[0].max_delivery_rate == 10**16
+        assert mechs[0].tools == ("gpt", "prediction-online")
+        assert mechs[1].payment_type is None
+        assert mechs[1].total_deliveries == 20
+        assert [
+            mech.address
+            for mech in service.query(
+                tool="gpt", max_price=10**16, payment_type=PaymentType.NATIVE
+            )
+        ] == ["0xaaa"]
+        assert not service.query(payment_type=PaymentType.OLAS_TOKEN)
+
+    def test_incremental_refresh(
+        self, network: Dict[str, MagicMock], tmp_path: Path
+    ) -> None:
+        """Test only new mechs are re-read and unlisted mechs are dropped."""
+        network["query"].return_value = [
+            _listed("0xaaa", 1, 10),
+            _listed("0xbbb", 2, 20),
+        ]
+        network["multicall"].return_value = [
+            *_mech_info(PaymentType.NATIVE, 1),
+            *_mech_info(PaymentType.NATIVE, 2),
+        ]
+        get_tools = network["tool_manager"].return_value.get_tools_for_services
+        get_tools.return_value = {1: _tools(1, "gpt"), 2: _tools(2, "gpt")}
+        service = IndexService("gnosis", MechIndex(tmp_path / "index.sqlite3"))
+        service.refresh()
+
+        network["query"].return_value = [
+            _listed("0xaaa", 1, 11),
+            _listed("0xccc", 3, 0),
+        ]
+        network["multicall"].return_value = _mech_info(PaymentType.OLAS_TOKEN, 3)
+        get_tools.return_value = {3: _tools(3, "claude")}
+
+        assert service.refresh() == (2, 1)
+        assert network["multicall"].call_args.args[1][0][0] == "0xccc"
+        get_tools.assert_called_with([3])
+        mechs = {mech.address: mech for mech in service.query()}
+        assert list(mechs) == ["0xaaa", "0xccc"]
+        assert mechs["0xaaa"].total_deliveries == 11
+        assert mechs["0xaaa"].tools == ("gpt",)
+        assert mechs["0xccc"].payment_type == "OLAS_TOKEN"
+
+        # A full refresh re-reads every mech
+        network["multicall"].return_value = [
+            *_mech_info(PaymentType.NATIVE, 1),
+            *_mech_info(PaymentType.OLAS_TOKEN, 3),
+        ]
+        assert service.refresh(full=True) == (2, 2)
+
+    def test_failed_reads_are_retried(
+        self, network: Dict[str, MagicMock], tmp_path: Path
+    ) -> None:
+        """Test a mech whose on-chain reads failed is re-read next refresh."""
+        network["query"].return_value = [_listed("0xaaa", 1, 10)]
+        network["multicall"].return_value = [None, None]
+        get_tools = network["tool_manager"].return_value.get_tools_for_services
+        get_tools.return_value = {}
+        service = IndexService("gnosis", MechIndex(tmp_path / "index.sqlite3"))
+
+        assert service.refresh() == (1, 1)
+        network["multicall"].return_value = _mech_info(PaymentType.NATIVE, 5)
+        get_tools.return_value = {1: _tools(1, "gpt")}
+
+        assert service.refresh() == (1, 1)
+        assert service.query(max_price=5)[0].payment_type == "NATIVE"
+        assert service.refresh() == (1, 0)
+
+    def test_query_needs_a_refresh(self, tmp_path: Path) -> None:
+        """Test querying a chain that was never indexed is reported."""
+        service = IndexService("gnosis", MechIndex(tmp_path / "index.sqlite3"))
+
+        with pytest.raises(ValueError, match="mechx index refresh"):
+            service.query(tool="gpt")
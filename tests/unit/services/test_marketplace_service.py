@@ -19,6 +19,9 @@
 
 """Tests for marketplace service."""
 
+import asyncio
+import time
+from pathlib import Path
 from typing import Any, Dict, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -27,9 +30,11 @@ import requests
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
-from mech_client.domain.signing import LocalSigner
+from mech_client.domain.execution import ContractCall, TransactionSupervisor
+from mech_client.domain.signing import LocalSigner, SignerPool
 from mech_client.infrastructure.config import PaymentType
 from mech_client.infrastructure.config.chain_config import LedgerConfig
+from mech_client.infrastructure.journal import PendingRequest, RequestJournal
 from mech_client.services.marketplace_service import (
     MarketplaceService,
     PaymentChallenge,
@@ -135,6 +140,17 @@ class TestMarketplaceServiceInitialization:
         mock_executor_factory.create.assert_called_once()
         mock_tool_manager.assert_called_once_with("gnosis")
         mock_ipfs_client.assert_called_once()
+        # Requests are journaled by default, unless opted out
+        assert isinstance(service.journal, RequestJournal)
+        assert (
+            MarketplaceService(
+                chain_config="gnosis",
+                agent_mode=False,
+                crypto=mock_crypto,
+                use_journal=False,
+            ).journal
+            is None
+        )
 
     @patch("mech_client.services.marketplace_service.IPFSClient")
     @patch("mech_client.services.marketplace_service.ToolManager")
@@ -182,6 +198,54 @@ class TestMarketplaceServiceInitialization:
         mock_config.assert_not_called()
 
 
+class TestMarketplaceServiceSignerPool:
+    """Tests for sharding requests across a SignerPool."""
+
+    def test_signer_pool_rejected_in_agent_mode(self) -> None:
+        """Test that a pool cannot drive a Safe."""
+        pool = SignerPool([create_mock_signer()])
+        with pytest.raises(ValueError, match="only supported in client mode"):
+            MarketplaceService(
+                chain_config="gnosis",
+                agent_mode=True,
+                signer=pool,
+                safe_address="0x" + "5" * 40,
+                ethereum_client=MagicMock(),
+            )
+
+    @pytest.mark.asyncio
+    async def test_send_requests_spreads_over_pool(self) -> None:
+        """Test that concurrent requests lease different keys."""
+        pool = SignerPool(
+            [
+                create_mock_signer(address="0x" + "a" * 40),
+                create_mock_signer(address="0x" + "b" * 40),
+            ]
+        )
+        service = MagicMock(spec=MarketplaceService)
+        service.signer = pool
+        for name in ("send_requests", "send_request", "_lease_sender"):
+            setattr(
+                service,
+                name,
+                getattr(MarketplaceService, name).__get__(service, MarketplaceService),
+            )
+
+        async def _fake_send(**kwargs: Any) -> Dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return {"tx_hash": pool.address, "prompts": kwargs["prompts"]}
+
+        service._send_request = _fake_send
+
+        results = await service.send_requests(
+            [(("p1",), ("t1",)), (("p2",), ("t2",))], use_prepaid=True
+        )
+
+        assert [r["prompts"] for r in results] == [("p1",), ("p2",)]
+        assert {r["sender"] for r in results} == {"0x" + "a" * 40, "0x" + "b" * 40}
+        assert all(r["sender"] == r["tx_hash"] for r in results)
+
+
 class TestMarketplaceServiceValidation:
     """Tests for input validation in marketplace service."""
 
@@ -768,29 +832,956 @@ class TestSendMarketplaceRequestInvalidPaymentType:
         bad_payment_type.value = "ZZZZZZ"  # Invalid hex
         bad_payment_type.is_token.return_value = False
 
-        with pytest.raises(ValueError, match="Invalid payment type value"):
-            service._send_marketplace_request(  # pylint: disable=protected-access
-                marketplace_contract=MagicMock(),
-                data_hashes=["0x" + "a" * 64],
-                max_delivery_rate=10**17,
-                payment_type=bad_payment_type,
-                priority_mech="0x" + "9" * 40,
-                response_timeout=300,
-                use_prepaid=False,
-            )
+        with pytest.raises(ValueError, match="Invalid payment type value"):
+            service._send_marketplace_request(  # pylint: disable=protected-access
+                marketplace_contract=MagicMock(),
+                data_hashes=["0x" + "a" * 64],
+                max_delivery_rate=10**17,
+                payment_type=bad_payment_type,
+                priority_mech="0x" + "9" * 40,
+                response_timeout=300,
+                use_prepaid=False,
+            )
+
+
+class TestSendRequestNoPriorityMech:
+    """Test send_request raises when no priority mech is configured."""
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_raises_when_no_priority_mech(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test ValueError when no priority mech address (line 135)."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.priority_mech_address = None  # No default
+        mock_config.return_value = mock_mech_config
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+
+        # Patch the internal helpers that run before the priority mech check
+        with patch.object(
+            service,
+            "_get_marketplace_contract",
+            return_value=MagicMock(),
+        ):
+            with patch.object(
+                service,
+                "_fetch_mech_info",
+                return_value=(PaymentType.NATIVE, 1, 10**17),
+            ):
+                with patch.object(service, "_validate_tools"):
+                    with pytest.raises(ValueError, match="No priority mech address"):
+                        await service.send_request(
+                            prompts=("hello",),
+                            tools=("tool",),
+                            priority_mech=None,  # No override either
+                        )
+
+
+class TestAutoPriorityMech:
+    """Test priority_mech="auto" selects the mech by expected latency."""
+
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    def test_auto_selects_mech(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test "auto" is replaced by the selection service's pick."""
+        mock_config.return_value = create_mock_mech_config()
+        service = _build_service(
+            mock_config.return_value, mock_ledger_api_cls, mock_executor_factory
+        )
+        with patch(
+            "mech_client.services.marketplace_service.MechSelectionService"
+        ) as selection:
+            selection.return_value.select.return_value = "0x" + "a" * 40
+            chosen = service._resolve_priority_mech("AUTO", ("t1", "t2"), 10)
+
+        assert chosen == "0x" + "a" * 40
+        selection.assert_called_once_with("gnosis", journal=service.journal)
+        selection.return_value.select.assert_called_once_with(
+            ("t1", "t2"), max_price=10
+        )
+
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    def test_explicit_mech_is_kept(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test an address passes through and a price cap needs "auto"."""
+        mock_config.return_value = create_mock_mech_config()
+        service = _build_service(
+            mock_config.return_value, mock_ledger_api_cls, mock_executor_factory
+        )
+
+        assert service._resolve_priority_mech("0xabc", ("t",), None) == "0xabc"
+        assert service._resolve_priority_mech(None, ("t",), None) is None
+        with pytest.raises(ValueError, match="maximum price"):
+            service._resolve_priority_mech("0xabc", ("t",), 10)
+
+
+    @pytest.mark.asyncio
+    @patch("mech_client.infrastructure.subgraph.client.AIOHTTPTransport")
+    @patch("mech_client.infrastructure.subgraph.client.gql", side_effect=str)
+    @patch("mech_client.infrastructure.subgraph.client.Client")
+    @patch("mech_client.infrastructure.subgraph.queries.get_mech_config")
+    @patch("mech_client.services.index_service.IndexService._read_mech_info")
+    @patch("mech_client.services.index_service.ToolManager")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_auto_selects_over_subgraph_in_event_loop(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_index_tools: MagicMock,
+        mock_read_mech_info: MagicMock,
+        mock_subgraph_config: MagicMock,
+        mock_gql_client_cls: MagicMock,
+        mock_gql: MagicMock,
+        mock_transport: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test "auto" indexes the chain and ranks mechs with the subgraph client."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("MECHX_INDEX_PATH", str(tmp_path / "index.sqlite"))
+        monkeypatch.setenv("MECHX_JOURNAL_PATH", str(tmp_path / "journal.jsonl"))
+        cheap, fast = "0x" + "a" * 40, "0x" + "b" * 40
+        now = time.time()
+        mock_subgraph_config.return_value.subgraph_url = "https://subgraph.test"
+        mock_read_mech_info.return_value = {
+            cheap: (PaymentType.NATIVE.name, 1),
+            fast: (PaymentType.NATIVE.name, 2),
+        }
+        tools = MagicMock()
+        tools.tools = [MagicMock(tool_name="t")]
+        mock_index_tools.return_value.get_tools_for_services.return_value = {
+            1: tools,
+            2: tools,
+        }
+
+        async def _execute(query: str) -> Dict[str, Any]:
+            if "_meta" in query:
+                return {"_meta": {"block": {"number": 100}}}
+            if "meches" in query:
+                return {
+                    "meches": [
+                        {
+                            "id": address,
+                            "address": address,
+                            "mechFactory": "0x0",
+                            "totalDeliveriesTransactions": "10",
+                            "service": {"id": str(i), "totalDeliveries": "10"},
+                        }
+                        for i, address in enumerate((cheap, fast), start=1)
+                    ]
+                }
+            # The cheap mech never delivered; the other one within seconds
+            delivered = f'priorityMech: "{fast}"' in query
+            return {
+                "requests": [
+                    {
+                        "requestId": f"0x{int(delivered)}{i:02x}",
+                        "blockTimestamp": str(int(now) - 1000 - i),
+                        "delivery": (
+                            {"mech": fast, "blockTimestamp": str(int(now) - 990 - i)}
+                            if delivered
+                            else None
+                        ),
+                    }
+                    for i in range(20)
+                ]
+            }
+
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=_execute)
+        mock_gql_client_cls.return_value.connect_async = AsyncMock(
+            return_value=session
+        )
+        mock_gql_client_cls.return_value.close_async = AsyncMock()
+        mock_config.return_value = create_mock_mech_config()
+        service = _build_service(
+            mock_config.return_value, mock_ledger_api_cls, mock_executor_factory
+        )
+
+        with patch.object(service, "_get_marketplace_contract"), patch.object(
+            service, "_fetch_mech_info", side_effect=RuntimeError("selected")
+        ) as fetch_mech_info:
+            with pytest.raises(RuntimeError, match="selected"):
+                await service.send_request(("p",), ("t",), priority_mech="auto")
+
+        fetch_mech_info.assert_called_once_with(ensure_checksummed_address(fast))
+        queries = [call.args[0] for call in session.execute.await_args_list]
+        assert any("meches" in query for query in queries)
+        assert sum("requests(" in query for query in queries) == 2
+
+
+PRIMARY = "0x" + "1" * 40
+HEDGE = "0x" + "2" * 40
+
+
+def _submitted(request_ids: Any, **deliveries: str) -> Dict[str, Any]:
+    """Build a request result with the given deliveries."""
+    return {
+        "tx_hash": "0xtx",
+        "request_ids": list(request_ids),
+        "delivery_results": deliveries,
+        "receipt": {"blockNumber": 10},
+    }
+
+
+class TestHedgedRequests:
+    """Test requests hedged with a second mech when the first is late."""
+
+    @staticmethod
+    def _service(
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_executor_factory: MagicMock,
+    ) -> MarketplaceService:
+        """Create a service with a mocked journal."""
+        mock_config.return_value = create_mock_mech_config()
+        mock_config.return_value.priority_mech_address = PRIMARY
+        service = _build_service(
+            mock_config.return_value, mock_ledger_api_cls, mock_executor_factory
+        )
+        service.journal = MagicMock()
+        return service
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_delivered_in_time_is_not_hedged(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test a delivery within hedge_after returns without a second request."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        send = AsyncMock(return_value=_submitted(["a"]))
+        watch = AsyncMock(return_value=_submitted(["a"], a="result"))
+        with patch.object(service, "_send_request", send), patch.object(
+            service, "_watch_submitted", watch
+        ):
+            result = await service.send_request(("p",), ("t",), hedge_after=60)
+
+        assert result["delivery_results"] == {"a": "result"}
+        assert result["hedge"]["winner"] == "primary"
+        assert result["hedge"]["mech"] is None
+        send.assert_awaited_once()
+        assert send.call_args.kwargs["priority_mech"] == PRIMARY
+        assert send.call_args.kwargs["wait"] is False
+        assert watch.call_args.args[1] == 60
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.MechSelectionService")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_first_delivery_wins(  # pylint: disable=too-many-arguments
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_selection: MagicMock,
+    ) -> None:
+        """Test a late request is hedged with the next-best mech, which wins."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        mock_selection.return_value.select.return_value = HEDGE
+        send = AsyncMock(side_effect=[_submitted(["a"]), _submitted(["b"])])
+        primary_watches = []
+
+        async def watch(submitted: Dict[str, Any], timeout: float, _journal: Any):
+            if submitted["request_ids"] == ["b"]:
+                return _submitted(["b"], b="hedged")
+            primary_watches.append(timeout)
+            if len(primary_watches) > 1:
+                await asyncio.sleep(60)
+            return _submitted(["a"])
+
+        with patch.object(service, "_send_request", send), patch.object(
+            service, "_watch_submitted", watch
+        ):
+            result = await service.send_request(
+                ("p",), ("t",), hedge_after=30, timeout=100
+            )
+
+        assert result["delivery_results"] == {"b": "hedged"}
+        assert result["hedge"] == {
+            "mech": HEDGE,
+            "offchain": False,
+            "winner": "hedge",
+            "primary_request_ids": ["a"],
+            "hedge_request_ids": ["b"],
+        }
+        assert send.call_args.kwargs["priority_mech"] == HEDGE
+        mock_selection.return_value.select.assert_called_once_with(
+            ("t",), max_price=None, exclude=[PRIMARY]
+        )
+        assert primary_watches[0] == 30
+        assert 0 < primary_watches[1] <= 100
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.MechSelectionService")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_failed_hedge_selection_keeps_primary(  # pylint: disable=too-many-arguments
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_selection: MagicMock,
+    ) -> None:
+        """Test the hedge mech is selected first; a failure only skips the hedge."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        events = []
+
+        def select(*_args: Any, **_kwargs: Any) -> str:
+            events.append("select")
+            raise ValueError("No other indexed mech")
+
+        async def send(*_args: Any, **_kwargs: Any) -> Dict[str, Any]:
+            events.append("send")
+            return _submitted(["a"])
+
+        mock_selection.return_value.select.side_effect = select
+        watch = AsyncMock(
+            side_effect=[_submitted(["a"]), _submitted(["a"], a="late")]
+        )
+        with patch.object(service, "_send_request", send), patch.object(
+            service, "_watch_submitted", watch
+        ):
+            result = await service.send_request(
+                ("p",), ("t",), hedge_after=30, timeout=100
+            )
+
+        assert events == ["select", "send"]
+        assert result["delivery_results"] == {"a": "late"}
+        assert result["hedge"]["mech"] is None
+        assert result["hedge"]["winner"] == "primary"
+        assert result["hedge"]["error"] == "No other indexed mech"
+        assert watch.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_offchain_hedge_and_failure(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test an offchain hedge that fails leaves the primary's result."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        send = AsyncMock(
+            side_effect=[_submitted(["a"]), requests.ConnectionError("down")]
+        )
+        watch = AsyncMock(
+            side_effect=[_submitted(["a"]), _submitted(["a"], a="late")]
+        )
+        with patch.object(service, "_send_request", send), patch.object(
+            service, "_watch_submitted", watch
+        ):
+            result = await service.send_request(
+                ("p",),
+                ("t",),
+                hedge_after=30,
+                hedge_mech=HEDGE,
+                hedge_offchain=True,
+            )
+
+        assert result["delivery_results"] == {"a": "late"}
+        assert result["hedge"]["winner"] == "primary"
+        assert send.call_args.kwargs["use_offchain"] is True
+        assert send.call_args.kwargs["priority_mech"] == HEDGE
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_invalid_hedges(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test hedges that cannot be watched or target the primary are rejected."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        with pytest.raises(ValueError, match="positive"):
+            await service.send_request(("p",), ("t",), hedge_after=0)
+        with pytest.raises(ValueError, match="on-chain"):
+            await service.send_request(
+                ("p",), ("t",), hedge_after=5, use_offchain=True
+            )
+        with pytest.raises(ValueError, match="on-chain"):
+            await service.send_request(("p",), ("t",), hedge_after=5, wait=False)
+        with pytest.raises(ValueError, match="maximum price"):
+            await service.send_request(
+                ("p",), ("t",), hedge_after=5, hedge_mech=HEDGE, max_price=1
+            )
+        with pytest.raises(ValueError, match="differ"):
+            service._hedge_target(PRIMARY.upper(), PRIMARY, ("t",), None)
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_watch_submitted(  # pylint: disable=too-many-arguments
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_watcher_cls: MagicMock,
+    ) -> None:
+        """Test submitted requests are watched from their block and journaled."""
+        service = self._service(
+            mock_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        watcher = mock_watcher_cls.return_value
+        watcher.watch = AsyncMock(return_value={"a": "0xdata"})
+        watcher.delivered_by = {"a": HEDGE}
+        journal = MagicMock()
+        with patch.object(service, "_get_marketplace_contract"):
+            result = await service._watch_submitted(_submitted(["a"]), 12, journal)
+
+        assert result["delivery_results"] == {"a": "0xdata"}
+        assert mock_watcher_cls.call_args.args[2] == 12
+        watcher.watch.assert_awaited_once_with(["a"], from_block=10)
+        journal.record_deliveries.assert_called_once_with(
+            "gnosis", {"a": "0xdata"}, delivered_by={"a": HEDGE}
+        )
+
+
+class TestSendRequestOnchainFlow:
+    """Test send_request on-chain flow (lines 122-228)."""
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_onchain_native_payment_flow(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+    ) -> None:
+        """Test full on-chain native payment flow (lines 122-228)."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
+        mock_mech_config.priority_mech_address = "0x" + "9" * 40
+        mock_config.return_value = mock_mech_config
+
+        mock_executor = MagicMock()
+        mock_executor.execute_transaction.return_value = "0xtxhash"
+        mock_executor.get_sender_address.return_value = "0x" + "a" * 40
+        mock_executor_factory.create.return_value = mock_executor
+
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+
+        # Patch internal service methods
+        mock_contract = MagicMock()
+        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
+        mock_wait_receipt.return_value = {"status": 1}
+        mock_watch_request_ids.return_value = ["req-1"]
+
+        mock_watcher = AsyncMock()
+        mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
+        mock_onchain_watcher_cls.return_value = mock_watcher
+
+        # Mock payment strategy (NATIVE — not token, so no approval needed)
+        mock_strategy = MagicMock()
+        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
+        mock_payment_factory.create.return_value = mock_strategy
+
+        with patch.object(
+            service, "_get_marketplace_contract", return_value=mock_contract
+        ):
+            with patch.object(
+                service,
+                "_fetch_mech_info",
+                return_value=(PaymentType.NATIVE, 1, 10**17),
+            ):
+                with patch.object(service, "_validate_tools"):
+                    with patch.object(
+                        service,
+                        "_send_marketplace_request",
+                        return_value="0xtxhash",
+                    ):
+                        result = await service.send_request(
+                            prompts=("hello",),
+                            tools=("some-tool",),
+                        )
+
+        assert result["tx_hash"] == "0xtxhash"
+        assert result["request_ids"] == ["req-1"]
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_onchain_token_payment_flow(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+    ) -> None:
+        """Test on-chain token payment flow including approval (lines 174-195)."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
+        mock_mech_config.priority_mech_address = "0x" + "9" * 40
+        mock_mech_config.price = 10**18
+        mock_config.return_value = mock_mech_config
+
+        mock_executor = MagicMock()
+        mock_executor.execute_transaction.return_value = "0xtxhash"
+        mock_executor.get_sender_address.return_value = "0x" + "a" * 40
+        mock_executor_factory.create.return_value = mock_executor
+
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        # Client mode: approve and request are separate transactions.
+        service.executor.supports_batching = False
+
+        # Mock payment strategy with is_token() = True, sufficient balance
+        mock_strategy = MagicMock()
+        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
+        mock_strategy.check_balance.return_value = True  # Sufficient balance
+        mock_payment_factory.create.return_value = mock_strategy
+
+        mock_contract = MagicMock()
+        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
+        # Approve returns a distinct hash so we can verify wait_for_receipt
+        # is called with it before the request transaction is built.
+        mock_strategy.approve_if_needed.return_value = "0xapprovehash"
+        mock_watch_request_ids.return_value = ["req-1"]
+
+        mock_watcher = AsyncMock()
+        mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
+        mock_onchain_watcher_cls.return_value = mock_watcher
+
+        # Use TOKEN payment type (is_token() returns True)
+        token_payment_type = PaymentType.USDC_TOKEN
+        max_delivery_rate = 10**17
+
+        # Track call order between approval-receipt wait and request send.
+        call_order: list[str] = []
+        mock_wait_receipt.side_effect = lambda tx_hash, _api: (
+            call_order.append(f"wait:{tx_hash}") or {"status": 1}
+        )
+
+        with patch.object(
+            service, "_get_marketplace_contract", return_value=mock_contract
+        ):
+            with patch.object(
+                service,
+                "_fetch_mech_info",
+                return_value=(token_payment_type, 1, max_delivery_rate),
+            ):
+                with patch.object(service, "_validate_tools"):
+                    with patch.object(
+                        service,
+                        "_send_marketplace_request",
+                        side_effect=lambda **_: (
+                            call_order.append("send_request") or "0xtxhash"
+                        ),
+                    ):
+                        result = await service.send_request(
+                            prompts=("hello",),
+                            tools=("some-tool",),
+                            use_prepaid=False,
+                        )
+
+        # Verify approval was triggered with the per-mech rate, not mech_config.price
+        mock_strategy.approve_if_needed.assert_called_once()
+        approve_kwargs = mock_strategy.approve_if_needed.call_args.kwargs
+        assert approve_kwargs["amount"] == max_delivery_rate * 1
+        # Approve receipt must be awaited before the request tx is sent.
+        assert call_order[0] == "wait:0xapprovehash"
+        assert "send_request" in call_order
+        assert call_order.index("wait:0xapprovehash") < call_order.index(
+            "send_request"
+        )
+        assert result["tx_hash"] == "0xtxhash"
+
+    @pytest.mark.asyncio
+    @patch.dict("os.environ", {"MECHX_TOKEN_ALLOWANCE_REQUESTS": "10"})
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_onchain_token_payment_standing_allowance(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+    ) -> None:
+        """Test the standing approval size and that a covered request skips it."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
+        mock_mech_config.priority_mech_address = "0x" + "9" * 40
+        mock_config.return_value = mock_mech_config
+
+        mock_executor = MagicMock()
+        mock_executor.get_sender_address.return_value = "0x" + "a" * 40
+        mock_executor_factory.create.return_value = mock_executor
+
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        # Client mode: approve and request are separate transactions.
+        service.executor.supports_batching = False
+
+        mock_strategy = MagicMock()
+        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
+        mock_strategy.check_balance.return_value = True
+        # The allowance already covers the request: no approval is sent.
+        mock_strategy.approve_if_needed.return_value = None
+        mock_payment_factory.create.return_value = mock_strategy
+
+        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
+        mock_watch_request_ids.return_value = ["req-1"]
+        mock_wait_receipt.return_value = {"status": 1}
+        mock_watcher = AsyncMock()
+        mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
+        mock_onchain_watcher_cls.return_value = mock_watcher
+        max_delivery_rate = 10**17
+
+        with patch.object(service, "_get_marketplace_contract"), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.OLAS_TOKEN, 1, max_delivery_rate),
+        ), patch.object(service, "_validate_tools"), patch.object(
+            service, "_send_marketplace_request", return_value="0xtxhash"
+        ):
+            result = await service.send_request(
+                prompts=("hello",), tools=("some-tool",), use_prepaid=False
+            )
+
+        approve_kwargs = mock_strategy.approve_if_needed.call_args.kwargs
+        assert approve_kwargs["amount"] == max_delivery_rate
+        assert approve_kwargs["approve_amount"] == max_delivery_rate * 10
+        # Only the request receipt is awaited.
+        assert [c.args[0] for c in mock_wait_receipt.call_args_list] == ["0xtxhash"]
+        assert result["tx_hash"] == "0xtxhash"
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_onchain_token_payment_bundled_in_agent_mode(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+    ) -> None:
+        """Test a batching executor sends approve + request as one transaction."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
+        mock_mech_config.priority_mech_address = "0x" + "9" * 40
+        mock_config.return_value = mock_mech_config
+
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        service.executor.supports_batching = True
+        service.executor.get_sender_address.return_value = "0x" + "a" * 40
+        service.executor.execute_batch.return_value = "0xbatchhash"
+
+        approval = ContractCall(MagicMock(), "approve", {"_value": 10**17})
+        mock_strategy = MagicMock()
+        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
+        mock_strategy.check_balance.return_value = True
+        mock_strategy.approval_call.return_value = approval
+        mock_payment_factory.create.return_value = mock_strategy
+
+        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
+        mock_watch_request_ids.return_value = ["req-1"]
+        mock_wait_receipt.return_value = {"status": 1}
+        mock_watcher = AsyncMock()
+        mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
+        mock_onchain_watcher_cls.return_value = mock_watcher
+        marketplace = MagicMock()
+
+        with patch.object(
+            service, "_get_marketplace_contract", return_value=marketplace
+        ), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.USDC_TOKEN, 1, 10**17),
+        ), patch.object(
+            service, "_validate_tools"
+        ):
+            result = await service.send_request(
+                prompts=("hello",), tools=("some-tool",), use_prepaid=False
+            )
+
+        mock_strategy.approve_if_needed.assert_not_called()
+        (calls,), _ = service.executor.execute_batch.call_args
+        assert calls[0] is approval
+        assert calls[1].contract is marketplace
+        assert calls[1].method_name == "request"
+        assert calls[1].value == 0
+        service.executor.execute_transaction.assert_not_called()
+        # One transaction, one receipt.
+        assert [c.args[0] for c in mock_wait_receipt.call_args_list] == [
+            "0xbatchhash"
+        ]
+        assert result["tx_hash"] == "0xbatchhash"
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.RequestBatchPlanner")
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_large_batch_is_split_into_chunks(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+        mock_planner_cls: MagicMock,
+    ) -> None:
+        """Test planned chunks are sent back to back and their results merged."""
+        mock_mech_config = create_mock_mech_config()
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
+        mock_config.return_value = mock_mech_config
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+
+        hashes = ["0x" + c * 64 for c in "abc"]
+        mock_push_metadata.side_effect = [(h, "ipfs://hash") for h in hashes]
+        planner = mock_planner_cls.return_value
+        planner.plan.return_value = [hashes[:2], hashes[2:]]
+        receipts = {
+            "0xchunk1": {"status": 1, "blockNumber": 11, "gasUsed": 600_000},
+            "0xchunk2": {"status": 1, "blockNumber": 10, "gasUsed": 300_000},
+        }
+        mock_wait_receipt.side_effect = lambda tx_hash, _api: receipts[tx_hash]
+        mock_watch_request_ids.side_effect = [["req-1", "req-2"], ["req-3"]]
+        mock_watcher = AsyncMock()
+        mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
+        mock_onchain_watcher_cls.return_value = mock_watcher
 
+        with patch.object(
+            service, "_get_marketplace_contract", return_value=MagicMock()
+        ), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.NATIVE, 1, 10**17),
+        ), patch.object(
+            service, "_validate_tools"
+        ), patch.object(
+            service,
+            "_send_marketplace_request",
+            side_effect=["0xchunk1", "0xchunk2"],
+        ) as mock_send:
+            result = await service.send_request(
+                prompts=("a", "b", "c"), tools=("tool",) * 3
+            )
 
-class TestSendRequestNoPriorityMech:
-    """Test send_request raises when no priority mech is configured."""
+        sent = [c.kwargs["data_hashes"] for c in mock_send.call_args_list]
+        assert sent == [hashes[:2], hashes[2:]]
+        assert result["tx_hash"] == "0xchunk1"
+        assert result["tx_hashes"] == ["0xchunk1", "0xchunk2"]
+        assert result["request_ids"] == ["req-1", "req-2", "req-3"]
+        mock_watcher.watch.assert_awaited_once_with(
+            ["req-1", "req-2", "req-3"], from_block=10
+        )
+        assert [c.args[2] for c in planner.observe.call_args_list] == [2, 1]
 
     @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.RequestBatchPlanner")
+    @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
+    @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
     @patch("mech_client.services.marketplace_service.ToolManager")
     @patch("mech_client.services.base_service.ExecutorFactory")
     @patch("mech_client.services.marketplace_service.EthereumCrypto")
     @patch("mech_client.services.base_service.EthereumApi")
     @patch("mech_client.services.base_service.get_mech_config")
-    async def test_raises_when_no_priority_mech(
+    async def test_reverted_chunk_reports_created_requests(
         self,
         mock_config: MagicMock,
         mock_ledger_api_cls: MagicMock,
@@ -798,42 +1789,50 @@ class TestSendRequestNoPriorityMech:
         mock_executor_factory: MagicMock,
         mock_tool_manager: MagicMock,
         mock_ipfs_client: MagicMock,
+        mock_payment_factory: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_wait_receipt: MagicMock,
+        mock_watch_request_ids: MagicMock,
+        mock_onchain_watcher_cls: MagicMock,
+        mock_planner_cls: MagicMock,
     ) -> None:
-        """Test ValueError when no priority mech address (line 135)."""
+        """Test a reverted chunk raises and names the requests others created."""
         mock_mech_config = create_mock_mech_config()
-        mock_mech_config.priority_mech_address = None  # No default
+        mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
         mock_config.return_value = mock_mech_config
         service = _build_service(
             mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
 
-        # Patch the internal helpers that run before the priority mech check
+        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
+        mock_planner_cls.return_value.plan.return_value = [["0x01"], ["0x02"]]
+        receipts = {"0xchunk1": {"status": 1}, "0xchunk2": {"status": 0}}
+        mock_wait_receipt.side_effect = lambda tx_hash, _api: receipts[tx_hash]
+        mock_watch_request_ids.return_value = ["req-1"]
+
         with patch.object(
+            service, "_get_marketplace_contract", return_value=MagicMock()
+        ), patch.object(
             service,
-            "_get_marketplace_contract",
-            return_value=MagicMock(),
+            "_fetch_mech_info",
+            return_value=(PaymentType.NATIVE, 1, 10**17),
+        ), patch.object(
+            service, "_validate_tools"
+        ), patch.object(
+            service,
+            "_send_marketplace_request",
+            side_effect=["0xchunk1", "0xchunk2"],
         ):
-            with patch.object(
-                service,
-                "_fetch_mech_info",
-                return_value=(PaymentType.NATIVE, 1, 10**17),
-            ):
-                with patch.object(service, "_validate_tools"):
-                    with pytest.raises(ValueError, match="No priority mech address"):
-                        await service.send_request(
-                            prompts=("hello",),
-                            tools=("tool",),
-                            priority_mech=None,  # No override either
-                        )
+            with pytest.raises(ValueError, match="Hash: 0xchunk2") as excinfo:
+                await service.send_request(prompts=("a", "b"), tools=("tool",) * 2)
 
-
-class TestSendRequestOnchainFlow:
-    """Test send_request on-chain flow (lines 122-228)."""
+        assert "['req-1']" in str(excinfo.value)
+        mock_onchain_watcher_cls.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -842,7 +1841,7 @@ class TestSendRequestOnchainFlow:
     @patch("mech_client.services.marketplace_service.EthereumCrypto")
     @patch("mech_client.services.base_service.EthereumApi")
     @patch("mech_client.services.base_service.get_mech_config")
-    async def test_onchain_native_payment_flow(
+    async def test_no_wait_journals_request_ids(
         self,
         mock_config: MagicMock,
         mock_ledger_api_cls: MagicMock,
@@ -855,63 +1854,48 @@ class TestSendRequestOnchainFlow:
         mock_wait_receipt: MagicMock,
         mock_watch_request_ids: MagicMock,
         mock_onchain_watcher_cls: MagicMock,
+        tmp_path: Path,
     ) -> None:
-        """Test full on-chain native payment flow (lines 122-228)."""
+        """Test wait=False returns after mining and journals the request IDs."""
         mock_mech_config = create_mock_mech_config()
         mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
-        mock_mech_config.priority_mech_address = "0x" + "9" * 40
         mock_config.return_value = mock_mech_config
-
-        mock_executor = MagicMock()
-        mock_executor.execute_transaction.return_value = "0xtxhash"
-        mock_executor.get_sender_address.return_value = "0x" + "a" * 40
-        mock_executor_factory.create.return_value = mock_executor
-
         service = _build_service(
             mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
+        service.journal = RequestJournal(tmp_path / "journal.jsonl")
 
-        # Patch internal service methods
-        mock_contract = MagicMock()
         mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
-        mock_wait_receipt.return_value = {"status": 1}
-        mock_watch_request_ids.return_value = ["req-1"]
-
-        mock_watcher = AsyncMock()
-        mock_watcher.watch.return_value = {"req-1": "result"}
-        mock_onchain_watcher_cls.return_value = mock_watcher
-
-        # Mock payment strategy (NATIVE — not token, so no approval needed)
-        mock_strategy = MagicMock()
-        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
-        mock_payment_factory.create.return_value = mock_strategy
+        mock_wait_receipt.return_value = {"status": 1, "blockNumber": 42}
+        mock_watch_request_ids.return_value = ["req1"]
 
         with patch.object(
-            service, "_get_marketplace_contract", return_value=mock_contract
+            service, "_get_marketplace_contract", return_value=MagicMock()
+        ), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.NATIVE, 1, 10**17),
+        ), patch.object(
+            service, "_validate_tools"
+        ), patch.object(
+            service, "_send_marketplace_request", return_value="0xtxhash"
         ):
-            with patch.object(
-                service,
-                "_fetch_mech_info",
-                return_value=(PaymentType.NATIVE, 1, 10**17),
-            ):
-                with patch.object(service, "_validate_tools"):
-                    with patch.object(
-                        service,
-                        "_send_marketplace_request",
-                        return_value="0xtxhash",
-                    ):
-                        result = await service.send_request(
-                            prompts=("hello",),
-                            tools=("some-tool",),
-                        )
+            result = await service.send_request(
+                prompts=("hello",), tools=("some-tool",), wait=False
+            )
 
-        assert result["tx_hash"] == "0xtxhash"
-        assert result["request_ids"] == ["req-1"]
+        mock_onchain_watcher_cls.assert_not_called()
+        assert result["request_ids"] == ["req1"]
+        assert result["delivery_results"] == {}
+        assert result["journal"] == str(tmp_path / "journal.jsonl")
+        assert service.journal.pending() == [
+            PendingRequest("gnosis", "req1", "0xtxhash", 42)
+        ]
 
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -920,7 +1904,7 @@ class TestSendRequestOnchainFlow:
     @patch("mech_client.services.marketplace_service.EthereumCrypto")
     @patch("mech_client.services.base_service.EthereumApi")
     @patch("mech_client.services.base_service.get_mech_config")
-    async def test_onchain_token_payment_flow(
+    async def test_journal_records_every_stage(
         self,
         mock_config: MagicMock,
         mock_ledger_api_cls: MagicMock,
@@ -933,88 +1917,124 @@ class TestSendRequestOnchainFlow:
         mock_wait_receipt: MagicMock,
         mock_watch_request_ids: MagicMock,
         mock_onchain_watcher_cls: MagicMock,
+        tmp_path: Path,
     ) -> None:
-        """Test on-chain token payment flow including approval (lines 174-195)."""
+        """Test a waited request journals upload, send, receipt and delivery."""
         mock_mech_config = create_mock_mech_config()
         mock_mech_config.mech_marketplace_contract = "0x" + "2" * 40
-        mock_mech_config.priority_mech_address = "0x" + "9" * 40
-        mock_mech_config.price = 10**18
         mock_config.return_value = mock_mech_config
-
-        mock_executor = MagicMock()
-        mock_executor.execute_transaction.return_value = "0xtxhash"
-        mock_executor.get_sender_address.return_value = "0x" + "a" * 40
-        mock_executor_factory.create.return_value = mock_executor
-
         service = _build_service(
             mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
-
-        # Mock payment strategy with is_token() = True, sufficient balance
-        mock_strategy = MagicMock()
-        mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
-        mock_strategy.check_balance.return_value = True  # Sufficient balance
-        mock_payment_factory.create.return_value = mock_strategy
-
-        mock_contract = MagicMock()
-        mock_push_metadata.return_value = ("0x" + "b" * 64, "ipfs://hash")
-        # Approve returns a distinct hash so we can verify wait_for_receipt
-        # is called with it before the request transaction is built.
-        mock_strategy.approve_if_needed.return_value = "0xapprovehash"
-        mock_watch_request_ids.return_value = ["req-1"]
-
-        mock_watcher = AsyncMock()
-        mock_watcher.watch.return_value = {"req-1": "result"}
-        mock_onchain_watcher_cls.return_value = mock_watcher
-
-        # Use TOKEN payment type (is_token() returns True)
-        token_payment_type = PaymentType.USDC_TOKEN
-        max_delivery_rate = 10**17
-
-        # Track call order between approval-receipt wait and request send.
-        call_order: list[str] = []
-        mock_wait_receipt.side_effect = lambda tx_hash, _api: (
-            call_order.append(f"wait:{tx_hash}") or {"status": 1}
+        service.journal = RequestJournal(tmp_path / "journal.jsonl")
+        data_hash = "0x" + "b" * 64
+
+        mock_push_metadata.return_value = (data_hash, "ipfs://hash")
+        mock_wait_receipt.return_value = {"status": 1, "blockNumber": 42}
+        mock_watch_request_ids.return_value = ["req1"]
+        mock_onchain_watcher_cls.return_value.watch = AsyncMock(
+            return_value={"req1": "ipfs://result"}
         )
 
         with patch.object(
-            service, "_get_marketplace_contract", return_value=mock_contract
+            service, "_get_marketplace_contract", return_value=MagicMock()
+        ), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.NATIVE, 1, 10**17),
+        ), patch.object(
+            service, "_validate_tools"
+        ), patch.object(
+            service, "_send_marketplace_request", return_value="0xtxhash"
         ):
-            with patch.object(
-                service,
-                "_fetch_mech_info",
-                return_value=(token_payment_type, 1, max_delivery_rate),
-            ):
-                with patch.object(service, "_validate_tools"):
-                    with patch.object(
-                        service,
-                        "_send_marketplace_request",
-                        side_effect=lambda **_: (
-                            call_order.append("send_request") or "0xtxhash"
-                        ),
-                    ):
-                        result = await service.send_request(
-                            prompts=("hello",),
-                            tools=("some-tool",),
-                            use_prepaid=False,
-                        )
+            await service.send_request(prompts=("hello",), tools=("some-tool",))
+
+        records = service.journal.records()
+        assert [r.event for r in records] == [
+            "uploaded",
+            "sent",
+            "submitted",
+            "delivered",
+        ]
+        assert records[1].tx_hash == "0xtxhash"
+        assert records[2].data_hashes == [data_hash]
+        assert not service.journal.pending()
+        assert not service.journal.unconfirmed()
 
-        # Verify approval was triggered with the per-mech rate, not mech_config.price
-        mock_strategy.approve_if_needed.assert_called_once()
-        approve_kwargs = mock_strategy.approve_if_needed.call_args.kwargs
-        assert approve_kwargs["amount"] == max_delivery_rate * 1
-        # Approve receipt must be awaited before the request tx is sent.
-        assert call_order[0] == "wait:0xapprovehash"
-        assert "send_request" in call_order
-        assert call_order.index("wait:0xapprovehash") < call_order.index(
-            "send_request"
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    def test_journal_records_fee_bumped_replacements(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test replacement hashes are journaled under the same data hashes."""
+        mock_mech_config = create_mock_mech_config()
+        mock_config.return_value = mock_mech_config
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
+        )
+        journal = RequestJournal(tmp_path / "journal.jsonl")
+        signer = create_mock_signer()
+        signer.send_transaction.return_value = "0xorig"
+        supervisor = TransactionSupervisor(service.ledger_api, signer)
+        service.executor.supervisor = supervisor
+        tx_hash = supervisor.submit({"nonce": 1, "gasPrice": 1})
+
+        service._journal_sent(  # pylint: disable=protected-access
+            journal, tx_hash, ["h1"], "0xmech"
+        )
+        for callback in supervisor.get(tx_hash).on_replaced:
+            callback("0xbump")
+
+        assert [
+            (r.tx_hash, r.data_hashes, r.mech) for r in journal.unconfirmed()
+        ] == [
+            ("0xorig", ["h1"], "0xmech"),
+            ("0xbump", ["h1"], "0xmech"),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("mech_client.services.marketplace_service.IPFSClient")
+    @patch("mech_client.services.marketplace_service.ToolManager")
+    @patch("mech_client.services.base_service.ExecutorFactory")
+    @patch("mech_client.services.marketplace_service.EthereumCrypto")
+    @patch("mech_client.services.base_service.EthereumApi")
+    @patch("mech_client.services.base_service.get_mech_config")
+    async def test_no_wait_rejects_offchain(
+        self,
+        mock_config: MagicMock,
+        mock_ledger_api_cls: MagicMock,
+        mock_crypto: MagicMock,
+        mock_executor_factory: MagicMock,
+        mock_tool_manager: MagicMock,
+        mock_ipfs_client: MagicMock,
+    ) -> None:
+        """Test offchain requests cannot be journaled."""
+        mock_mech_config = create_mock_mech_config()
+        mock_config.return_value = mock_mech_config
+        service = _build_service(
+            mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
-        assert result["tx_hash"] == "0xtxhash"
+
+        with pytest.raises(ValueError, match="Offchain requests"):
+            await service.send_request(
+                prompts=("hello",), tools=("tool",), use_offchain=True, wait=False
+            )
 
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -1078,7 +2098,7 @@ class TestSendRequestOnchainFlow:
 
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -1148,7 +2168,7 @@ class TestSendRequestOnchainFlow:
 
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -1184,6 +2204,8 @@ class TestSendRequestOnchainFlow:
         service = _build_service(
             mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
+        # Client mode: approve and request are separate transactions.
+        service.executor.supports_batching = False
 
         mock_strategy = MagicMock()
         mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
@@ -1228,7 +2250,7 @@ class TestSendRequestOnchainFlow:
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -1280,6 +2302,7 @@ class TestSendRequestOnchainFlow:
 
         mock_watcher = AsyncMock()
         mock_watcher.watch.return_value = {"req-1": "result"}
+        mock_watcher.delivered_by = {}
         mock_onchain_watcher_cls.return_value = mock_watcher
 
         mock_contract = MagicMock()
@@ -1313,7 +2336,7 @@ class TestSendRequestOnchainFlow:
     @pytest.mark.asyncio
     @patch("mech_client.services.marketplace_service.OnchainDeliveryWatcher")
     @patch("mech_client.services.marketplace_service.watch_for_marketplace_request_ids")
-    @patch("mech_client.services.marketplace_service.wait_for_receipt")
+    @patch("mech_client.services.marketplace_service.wait_for_receipt_async")
     @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
     @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
     @patch("mech_client.services.marketplace_service.IPFSClient")
@@ -1351,6 +2374,8 @@ class TestSendRequestOnchainFlow:
         service = _build_service(
             mock_mech_config, mock_ledger_api_cls, mock_executor_factory
         )
+        # Client mode: approve and request are separate transactions.
+        service.executor.supports_batching = False
 
         mock_strategy = MagicMock()
         mock_strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
@@ -1364,6 +2389,7 @@ class TestSendRequestOnchainFlow:
 
         mock_watcher = AsyncMock()
         mock_watcher.watch.return_value = {"req-1": "r1", "req-2": "r2"}
+        mock_watcher.delivered_by = {}
         mock_onchain_watcher_cls.return_value = mock_watcher
 
         max_delivery_rate = 10**17
@@ -1466,21 +2492,21 @@ class TestSendOffchainRequest:
         # Mock watcher
         mock_watcher = AsyncMock()
         mock_watcher.watch.return_value = {"0" * 64: "offchain-result"}
+        mock_watcher.delivered_by = {}
         mock_offchain_watcher_cls.return_value = mock_watcher
 
-        # Patch fetch_ipfs_hash and requests.post
+        # Patch fetch_ipfs_hash and the pooled HTTP registry
         with patch(
             "mech_client.infrastructure.ipfs.metadata.fetch_ipfs_hash",
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hello"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 mock_response = MagicMock()
                 mock_response.ok = True
                 mock_response.json.return_value = {"status": "ok"}
-                mock_requests.post.return_value = mock_response
-                mock_requests.exceptions.RequestException = Exception
+                mock_registry.return_value.post.return_value = mock_response
 
                 result = await service._send_offchain_request(  # pylint: disable=protected-access
                     marketplace_contract=mock_contract,
@@ -1545,6 +2571,7 @@ class TestSendOffchainRequest:
 
         mock_watcher = AsyncMock()
         mock_watcher.watch.return_value = {request_id_bytes.hex(): "ok"}
+        mock_watcher.delivered_by = {}
         mock_offchain_watcher_cls.return_value = mock_watcher
 
         with patch(
@@ -1552,13 +2579,12 @@ class TestSendOffchainRequest:
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hi"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 mock_response = MagicMock()
                 mock_response.ok = True
                 mock_response.json.return_value = {"status": "ok"}
-                mock_requests.post.return_value = mock_response
-                mock_requests.exceptions.RequestException = Exception
+                mock_registry.return_value.post.return_value = mock_response
 
                 await service._send_offchain_request(  # pylint: disable=protected-access
                     marketplace_contract=mock_contract,
@@ -1580,7 +2606,7 @@ class TestSendOffchainRequest:
         assert (
             mock_contract.functions.getRequestId.call_args.args[1] == expected_sender
         )
-        posted_payload = mock_requests.post.call_args.kwargs["data"]
+        posted_payload = mock_registry.return_value.post.call_args.kwargs["data"]
         assert posted_payload["sender"] == expected_sender
 
         # Safe-wrapped signing path is not exercised in client mode
@@ -1642,6 +2668,7 @@ class TestSendOffchainRequest:
 
         mock_watcher = AsyncMock()
         mock_watcher.watch.return_value = {request_id_bytes.hex(): "ok"}
+        mock_watcher.delivered_by = {}
         mock_offchain_watcher_cls.return_value = mock_watcher
 
         with patch(
@@ -1649,13 +2676,12 @@ class TestSendOffchainRequest:
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hi"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 mock_response = MagicMock()
                 mock_response.ok = True
                 mock_response.json.return_value = {"status": "ok"}
-                mock_requests.post.return_value = mock_response
-                mock_requests.exceptions.RequestException = Exception
+                mock_registry.return_value.post.return_value = mock_response
 
                 await service._send_offchain_request(  # pylint: disable=protected-access
                     marketplace_contract=mock_contract,
@@ -1687,7 +2713,7 @@ class TestSendOffchainRequest:
         )
 
         # 4. The payload posted to the mech advertised the Safe as sender
-        posted_payload = mock_requests.post.call_args.kwargs["data"]
+        posted_payload = mock_registry.return_value.post.call_args.kwargs["data"]
         assert posted_payload["sender"] == expected_sender
         assert posted_payload["signature"] == "0x" + ("dd" * 64) + "1b"
 
@@ -1736,13 +2762,10 @@ class TestSendOffchainRequest:
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hello"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 # Simulate HTTP error
-                mock_requests.exceptions.RequestException = (
-                    requests.exceptions.RequestException
-                )
-                mock_requests.post.side_effect = requests.exceptions.RequestException(
+                mock_registry.return_value.post.side_effect = requests.exceptions.RequestException(
                     "connection refused"
                 )
 
@@ -1805,17 +2828,14 @@ class TestSendOffchainRequest:
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hello"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 mock_response = MagicMock()
                 mock_response.ok = False
                 mock_response.status_code = 400
                 mock_response.reason = "Bad Request"
                 mock_response.json.return_value = {"reason": "invalid signature"}
-                mock_requests.post.return_value = mock_response
-                mock_requests.exceptions.RequestException = (
-                    requests.exceptions.RequestException
-                )
+                mock_registry.return_value.post.return_value = mock_response
 
                 with pytest.raises(
                     ValueError, match="Offchain request rejected: invalid signature"
@@ -1878,17 +2898,14 @@ class TestSendOffchainRequest:
             return_value=("0x" + "b" * 64, "full-hash", '{"prompt":"hello"}'),
         ):
             with patch(
-                "mech_client.services.marketplace_service.requests"
-            ) as mock_requests:
+                "mech_client.services.marketplace_service.get_http_registry"
+            ) as mock_registry:
                 mock_response = MagicMock()
                 mock_response.ok = False
                 mock_response.status_code = 502
                 mock_response.reason = "Bad Gateway"
                 mock_response.json.side_effect = ValueError("No JSON")
-                mock_requests.post.return_value = mock_response
-                mock_requests.exceptions.RequestException = (
-                    requests.exceptions.RequestException
-                )
+                mock_registry.return_value.post.return_value = mock_response
 
                 with pytest.raises(
                     ValueError, match="Offchain request rejected: Bad Gateway"
@@ -2437,7 +3454,7 @@ class TestOffchain402Handling:
         """A direct 200 returns the response (no deposit attempted)."""
         service = _build_offchain_service()
         with patch(
-            "mech_client.services.marketplace_service.requests.post",
+            "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
             return_value=_mock_http_response(200, headers={"Payment-Receipt": "r"}),
         ) as mock_post:
             resp = service._post_offchain_request(
@@ -2454,7 +3471,7 @@ class TestOffchain402Handling:
         """A 402 without auto-deposit raises an error naming the amount + payTo."""
         service = _build_offchain_service()
         with patch(
-            "mech_client.services.marketplace_service.requests.post",
+            "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
             return_value=_mock_http_response(
                 402, {"required": "100", "currentBalance": "0", "payTo": "0xbt"}
             ),
@@ -2477,7 +3494,7 @@ class TestOffchain402Handling:
         ]
         with (
             patch(
-                "mech_client.services.marketplace_service.requests.post",
+                "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
                 side_effect=responses,
             ) as mock_post,
             patch("mech_client.services.deposit_service.DepositService") as mock_ds,
@@ -2508,7 +3525,7 @@ class TestOffchain402Handling:
         service = _build_offchain_service()
         with (
             patch(
-                "mech_client.services.marketplace_service.requests.post",
+                "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
                 return_value=_mock_http_response(
                     402,
                     {"required": "100", "currentBalance": "100", "payTo": "0xbt"},
@@ -2537,7 +3554,7 @@ class TestOffchain402Handling:
         service = _build_offchain_service()
         with (
             patch(
-                "mech_client.services.marketplace_service.requests.post",
+                "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
                 return_value=_mock_http_response(
                     402,
                     {"required": "10001", "currentBalance": "0", "payTo": "0xbt"},
@@ -2581,7 +3598,7 @@ class TestOffchain402Handling:
         ]
         with (
             patch(
-                "mech_client.services.marketplace_service.requests.post",
+                "mech_client.infrastructure.http.sessions.HttpSessionRegistry.post",
                 side_effect=responses,
             ) as mock_post,
             patch("mech_client.services.deposit_service.DepositService") as mock_ds,
@@ -2601,3 +3618,158 @@ class TestOffchain402Handling:
         mock_ds.return_value.deposit_native.assert_called_once()
         # Surface the still-outstanding shortfall in the message.
         assert "remaining shortfall 50" in str(exc_info.value)
+
+
+class _RecordingExecutor:
+    """ClientExecutor stand-in that hands out sequential nonces."""
+
+    def __init__(self, _ledger_api: Any, signer: Any, gas_fallback: bool) -> None:
+        """Record the signer and start nonces at 40."""
+        self.signer = signer
+        self.gas_fallback = gas_fallback
+        self.next_nonce = 40
+        self.methods: list = []
+
+    def get_sender_address(self) -> str:
+        """Return the signer address."""
+        return self.signer.address
+
+    def execute_transaction(self, **kwargs: Any) -> str:
+        """Send a transaction with the next nonce through the signer."""
+        self.methods.append(kwargs["method_name"])
+        nonce, self.next_nonce = self.next_nonce, self.next_nonce + 1
+        return self.signer.send_transaction({"nonce": nonce, "maxFeePerGas": 30})
+
+
+class TestPresignRequests:
+    """Tests for MarketplaceService.presign_requests."""
+
+    @staticmethod
+    def _service(agent_mode: bool = False) -> MarketplaceService:
+        """Build a service whose signer signs without broadcasting."""
+        signer = create_mock_signer(address="0x" + "a" * 40)
+        signer.sign_transaction.side_effect = lambda tx: bytes([2, tx["nonce"]])
+        with patch(
+            "mech_client.services.base_service.get_mech_config",
+            return_value=create_mock_mech_config(),
+        ), patch("mech_client.services.base_service.EthereumApi"), patch(
+            "mech_client.services.base_service.ExecutorFactory"
+        ), patch(
+            "mech_client.services.marketplace_service.ToolManager"
+        ), patch(
+            "mech_client.services.marketplace_service.IPFSClient"
+        ):
+            return MarketplaceService(
+                chain_config="gnosis",
+                agent_mode=agent_mode,
+                signer=signer,
+                safe_address="0x" + "5" * 40 if agent_mode else None,
+                ethereum_client=MagicMock() if agent_mode else None,
+            )
+
+    def test_agent_mode_is_rejected(self) -> None:
+        """Test Safe requests cannot be pre-signed."""
+        service = self._service(agent_mode=True)
+
+        with pytest.raises(ValueError, match="only supported in client mode"):
+            service.presign_requests([(("p",), ("t",))])
+
+    @pytest.mark.parametrize(
+        "payment_type,expected_kinds",
+        [
+            (PaymentType.NATIVE, ["request", "request"]),
+            (PaymentType.OLAS_TOKEN, ["approve", "request", "request"]),
+        ],
+    )
+    @patch("mech_client.services.marketplace_service.PaymentStrategyFactory")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.ClientExecutor")
+    def test_signs_one_transaction_per_request(
+        self,
+        mock_executor_cls: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_payment_factory: MagicMock,
+        payment_type: PaymentType,
+        expected_kinds: list,
+    ) -> None:
+        """Test requests are signed in nonce order with one shared approval."""
+        service = self._service()
+        executors: list = []
+
+        def _make_executor(*args: Any, **kwargs: Any) -> _RecordingExecutor:
+            executors.append(_RecordingExecutor(*args, **kwargs))
+            return executors[-1]
+
+        mock_executor_cls.side_effect = _make_executor
+        mock_push_metadata.side_effect = lambda prompt, tool, extra: (
+            f"0x{prompt}",
+            "ipfs://x",
+        )
+        strategy = MagicMock()
+        strategy.get_balance_tracker_address.return_value = "0x" + "c" * 40
+        strategy.check_balance.return_value = True
+        strategy.approve_if_needed.side_effect = (
+            lambda executor, **_: executor.execute_transaction(method_name="approve")
+        )
+        mock_payment_factory.create.return_value = strategy
+
+        with patch.object(service, "_get_marketplace_contract"), patch.object(
+            service, "_fetch_mech_info", return_value=(payment_type, 1, 10**17)
+        ), patch.object(service, "_validate_tools") as mock_validate:
+            transactions = service.presign_requests(
+                [(("a1", "a2"), ("t1", "t2")), (("b1",), ("t1",))]
+            )
+
+        assert [tx.kind for tx in transactions] == expected_kinds
+        assert [tx.nonce for tx in transactions] == list(
+            range(40, 40 + len(expected_kinds))
+        )
+        assert all(tx.max_fee_per_gas == 30 for tx in transactions)
+        assert executors[0].gas_fallback is True
+        mock_validate.assert_called_once_with(("t1", "t2"), 1)
+        requests_ = [tx for tx in transactions if tx.kind == "request"]
+        assert requests_[0].metadata["data_hashes"] == ["0xa1", "0xa2"]
+        assert requests_[1].metadata["prompts"] == ["b1"]
+        assert executors[0].methods[-2:] == ["requestBatch", "request"]
+        if payment_type.is_token():
+            approve_kwargs = strategy.approve_if_needed.call_args.kwargs
+            assert approve_kwargs["amount"] == 3 * 10**17
+            assert transactions[0].metadata["amount"] == 3 * 10**17
+        else:
+            strategy.approve_if_needed.assert_not_called()
+
+    @patch("mech_client.services.marketplace_service.get_nonce_manager")
+    @patch("mech_client.services.marketplace_service.push_metadata_to_ipfs")
+    @patch("mech_client.services.marketplace_service.ClientExecutor")
+    def test_failure_resyncs_nonces(
+        self,
+        mock_executor_cls: MagicMock,
+        mock_push_metadata: MagicMock,
+        mock_get_nonce_manager: MagicMock,
+    ) -> None:
+        """Test a failure after some signatures realigns the nonce manager."""
+        service = self._service()
+        mock_executor_cls.side_effect = _RecordingExecutor
+        mock_push_metadata.return_value = ("0x01", "ipfs://x")
+        calls = {"count": 0}
+        original = MarketplaceService._send_marketplace_request
+
+        def _second_fails(**kwargs: Any) -> str:
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise ValueError("build failed")
+            return original(service, **kwargs)
+
+        with patch.object(service, "_get_marketplace_contract"), patch.object(
+            service,
+            "_fetch_mech_info",
+            return_value=(PaymentType.NATIVE, 1, 10**17),
+        ), patch.object(service, "_validate_tools"), patch.object(
+            service, "_send_marketplace_request", side_effect=_second_fails
+        ):
+            with pytest.raises(ValueError, match="build failed"):
+                service.presign_requests([(("a",), ("t",)), (("b",), ("t",))])
+
+        mock_get_nonce_manager.return_value.resync.assert_called_once_with(
+            "0x" + "a" * 40
+        )
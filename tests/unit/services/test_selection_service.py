@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for selection service."""
+
+from pathlib import Path
+from typing import Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mech_client.infrastructure.index import IndexedMech
+from mech_client.infrastructure.journal import JournalRecord, RequestJournal
+from mech_client.services.selection_service import MechSelectionService
+
+NOW = 1_000_000.0
+FAST = "0x00000000000000000000000000000000000000aa"
+SLOW = "0x00000000000000000000000000000000000000bb"
+
+
+def _indexed(*addresses: str) -> List[IndexedMech]:
+    """Return indexed mechs."""
+    return [IndexedMech("gnosis", address, i) for i, address in enumerate(addresses)]
+
+
+def _journal_request(  # pylint: disable=too-many-arguments
+    journal: RequestJournal,
+    request_id: str,
+    mech: str,
+    submitted_at: float,
+    delivered_at: float = 0.0,
+    delivered_by: str = "",
+) -> None:
+    """Journal a request sent to ``mech`` and, optionally, its delivery."""
+    journal.append(
+        JournalRecord(
+            event="submitted",
+            chain_config="gnosis",
+            request_ids=[request_id],
+            timestamp=submitted_at,
+            mech=mech,
+        )
+    )
+    if delivered_at:
+        journal.append(
+            JournalRecord(
+                event="delivered",
+                chain_config="gnosis",
+                request_ids=[request_id],
+                deliveries={request_id: "ipfs://x"},
+                delivered_by={request_id: delivered_by or mech},
+                timestamp=delivered_at,
+            )
+        )
+
+
+@pytest.fixture
+def subgraph() -> Iterator[MagicMock]:
+    """Patch the subgraph request query."""
+    with patch(
+        "mech_client.services.selection_service.query_mech_requests",
+        return_value=[],
+    ) as query:
+        yield query
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> RequestJournal:
+    """Create an empty journal."""
+    return RequestJournal(tmp_path / "journal.jsonl")
+
+
+def _service(journal: RequestJournal, *indexed: str) -> MechSelectionService:
+    """Create a service over an index listing ``indexed`` for every tool."""
+    index_service = MagicMock()
+    index_service.index.refreshed_at.return_value = NOW
+    index_service.query.return_value = _indexed(*indexed)
+    return MechSelectionService(
+        "gnosis", journal=journal, index_service=index_service, clock=lambda: NOW
+    )
+
+
+class TestMechSelectionService:
+    """Tests for MechSelectionService."""
+
+    def test_journal_samples(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test deliveries, step-ins and timeouts are read from the journal."""
+        _journal_request(journal, "01", FAST, NOW - 100, NOW - 90)
+        _journal_request(journal, "02", FAST, NOW - 80, NOW - 20, delivered_by=SLOW)
+        _journal_request(journal, "03", FAST, NOW - 1000)
+        _journal_request(journal, "04", FAST, NOW - 10)
+
+        samples = {
+            s.requested_at: s for s in _service(journal).samples([FAST.upper()])
+        }
+
+        assert sorted(samples) == [NOW - 1000, NOW - 100, NOW - 80]
+        assert samples[NOW - 100].latency == 10
+        assert samples[NOW - 80].stepped_in
+        assert samples[NOW - 1000].latency is None
+        subgraph.assert_called_once()
+
+    def test_subgraph_samples_take_precedence(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test subgraph block times replace the journal's for the same request."""
+        _journal_request(journal, "01", FAST, NOW - 100, NOW - 10)
+        subgraph.return_value = [
+            {
+                "request_id": "01",
+                "priority_mech": FAST,
+                "requested_at": NOW - 100,
+                "delivered_by": FAST,
+                "delivered_at": NOW - 95,
+            },
+            {
+                "request_id": "02",
+                "priority_mech": "0xelse",
+                "requested_at": NOW - 50,
+                "delivered_by": FAST,
+                "delivered_at": NOW - 40,
+            },
+        ]
+
+        samples = _service(journal).samples([FAST])
+
+        assert [s.latency for s in samples] == [5]
+
+    def test_subgraph_undelivered_and_stepped_in_requests(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test every subgraph request to a mech is sampled, delivered or not."""
+        _journal_request(journal, "04", FAST, NOW - 900, NOW - 890)
+
+        def _request(request_id: str, requested_at: float, by: str = "") -> dict:
+            return {
+                "request_id": request_id,
+                "priority_mech": FAST,
+                "requested_at": requested_at,
+                "delivered_by": by or None,
+                "delivered_at": requested_at + 30 if by else None,
+            }
+
+        subgraph.return_value = [
+            _request("01", NOW - 100, by=SLOW),
+            _request("02", NOW - 1000),
+            _request("03", NOW - 10),
+            _request("04", NOW - 900),
+        ]
+
+        samples = {
+            s.requested_at: s for s in _service(journal).samples([FAST])
+        }
+
+        assert sorted(samples) == [NOW - 1000, NOW - 900, NOW - 100]
+        assert samples[NOW - 1000].latency is None
+        assert samples[NOW - 900].latency == 10
+        assert samples[NOW - 100].latency == 30
+        assert samples[NOW - 100].stepped_in
+
+    def test_subgraph_failure_falls_back_to_journal(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test an unavailable subgraph leaves the journal samples."""
+        _journal_request(journal, "01", FAST, NOW - 100, NOW - 90)
+        subgraph.side_effect = IOError("subgraph down")
+
+        assert len(_service(journal).samples([FAST])) == 1
+
+    def test_select_fastest(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test the mech with the lowest expected latency is selected."""
+        for i in range(10):
+            _journal_request(journal, f"a{i}", FAST, NOW - 500 + i, NOW - 480 + i)
+            _journal_request(journal, f"b{i}", SLOW, NOW - 500 + i, NOW - 300 + i)
+        service = _service(journal, SLOW, FAST)
+
+        assert service.select(["tool1"]).lower() == FAST
+        subgraph.assert_called_once_with(
+            "gnosis", [FAST, SLOW], since=NOW - 7 * 86400
+        )
+
+    def test_candidates_offer_every_tool(self, journal: RequestJournal) -> None:
+        """Test candidates must publish every requested tool within the cap."""
+        service = _service(journal)
+        service.index_service.query.side_effect = [
+            _indexed(SLOW, FAST),
+            _indexed(FAST),
+        ]
+
+        assert service.candidates(["t1", "t2", "t1"], max_price=10) == [FAST]
+        assert service.index_service.query.call_args.kwargs["max_price"] == 10
+
+    def test_unindexed_chain_is_refreshed(self, journal: RequestJournal) -> None:
+        """Test a chain that was never indexed is indexed before selecting."""
+        service = _service(journal, FAST)
+        service.index_service.index.refreshed_at.return_value = None
+
+        service.candidates(["tool1"])
+
+        service.index_service.refresh.assert_called_once_with()
+
+    def test_no_candidates(self, journal: RequestJournal) -> None:
+        """Test selecting without a matching mech fails."""
+        with pytest.raises(ValueError, match="offers tool1 at most 5 wei"):
+            _service(journal).select(["tool1"], max_price=5)
+
+    def test_select_excludes(
+        self, journal: RequestJournal, subgraph: MagicMock
+    ) -> None:
+        """Test excluded mechs are skipped, e.g. when hedging against one."""
+        for i in range(10):
+            _journal_request(journal, f"a{i}", FAST, NOW - 500 + i, NOW - 480 + i)
+        service = _service(journal, SLOW, FAST)
+
+        assert service.select(["tool1"], exclude=[FAST.upper()]).lower() == SLOW
+        with pytest.raises(ValueError, match="No other indexed mech"):
+            _service(journal, FAST).select(["tool1"], exclude=[FAST])
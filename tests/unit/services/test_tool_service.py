@@ -111,6 +111,56 @@ class TestToolServiceOperations:
             service.get_tools_info(service_id=999)
 
 
+class TestToolServiceBulkDiscovery:
+    """Tests for discovering the tools of many mechs."""
+
+    @patch("mech_client.services.tool_service.ToolManager")
+    def test_get_tools_for_services(self, mock_tool_manager: MagicMock) -> None:
+        """Test bulk discovery is delegated to the tool manager."""
+        catalogue = {1: ToolsForMarketplaceMech(service_id=1, tools=[])}
+        mock_tool_manager.return_value.get_tools_for_services.return_value = (
+            catalogue
+        )
+
+        service = ToolService(chain_config="gnosis")
+
+        assert service.get_tools_for_services([1, 2], max_workers=3) == catalogue
+        mock_tool_manager.return_value.get_tools_for_services.assert_called_once_with(
+            [1, 2], 3
+        )
+
+    @patch("mech_client.services.tool_service.query_mm_mechs_info")
+    @patch("mech_client.services.tool_service.ToolManager")
+    def test_get_marketplace_tools(
+        self, mock_tool_manager: MagicMock, mock_query: MagicMock
+    ) -> None:
+        """Test every marketplace mech's service is looked up once."""
+        mock_query.return_value = [
+            {"service": {"id": "7"}},
+            {"service": {"id": "3"}},
+            {"service": {"id": "7"}},
+        ]
+
+        service = ToolService(chain_config="gnosis")
+        service.get_marketplace_tools()
+
+        mock_query.assert_called_once_with("gnosis", limit=None, snapshot=True)
+        mock_tool_manager.return_value.get_tools_for_services.assert_called_once_with(
+            [7, 3], 16
+        )
+
+    @patch("mech_client.services.tool_service.query_mm_mechs_info")
+    @patch("mech_client.services.tool_service.ToolManager")
+    def test_get_marketplace_tools_no_mechs(
+        self, mock_tool_manager: MagicMock, mock_query: MagicMock
+    ) -> None:
+        """Test an empty marketplace is reported."""
+        mock_query.return_value = []
+
+        with pytest.raises(ValueError, match="No marketplace mechs"):
+            ToolService(chain_config="gnosis").get_marketplace_tools()
+
+
 class TestToolServiceFormatting:
     """Tests for schema formatting methods."""
 